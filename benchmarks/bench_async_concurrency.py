@@ -0,0 +1,190 @@
+"""Benchmark synchronous and asynchronous reads under database latency.
+
+Reads `EntityExample` entities by identifier, each read in its own unit of work as in
+a request, from a local SQLite file whose queries are slowed down by `--latency`
+milliseconds to stand in for the round trip to a database server. The reads go
+through a view calling a `sleep_ms()` function registered on each connection, so that
+the latency is spent in the database driver, like the wait of a network round trip,
+rather than in the benchmark.
+
+Compares the reads per second of:
+
+- synchronous units of work, one read after the other;
+- synchronous units of work on a pool of threads, one connection per thread;
+- asynchronous units of work on aiosqlite, `--concurrency` reads awaited at once.
+
+Usage:
+    python benchmarks/bench_async_concurrency.py [--reads 400] [--latency 5] [--concurrency 8,32,128]
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar
+
+from common import best_of, print_table
+from sqlalchemy import Column, Engine, MetaData, Table, create_engine, event, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from flask_boilerplate.infrastructure.persistence import AsyncSqlAlchemyUnitOfWork, SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.configurations import metadata
+from flask_boilerplate.infrastructure.persistence.configurations.entity_example_configuration import (
+    entity_examples_table,
+)
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+# A view of the table whose rows each cost a call to `sleep_ms()`.
+slow_entity_examples_view = Table(
+    "slow_entity_examples",
+    MetaData(),
+    *(Column(column.name, column.type, primary_key=column.primary_key) for column in entity_examples_table.columns),
+)
+
+
+class SlowEntityExampleRepository(EntityExampleRepository):
+    """Repository reading the `EntityExample` entities through the slowed-down view."""
+
+    table: ClassVar[Table] = slow_entity_examples_view
+
+
+def register_latency(engine: Engine, latency: float) -> None:
+    """Register the `sleep_ms()` function on each new connection of an engine.
+
+    Args:
+        engine (Engine): The engine, or the synchronous engine of an asyncio engine.
+        latency (float): The latency of each call, in milliseconds.
+    """
+
+    def sleep_ms(milliseconds: float) -> int:
+        time.sleep(milliseconds / 1000)
+        return 1
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.create_function("sleep_ms", 1, sleep_ms)
+
+
+def sync_reads(engine: Engine, ids: list[uuid.UUID], threads: int) -> Callable[[], None]:
+    """Build a run reading each identifier in its own synchronous unit of work.
+
+    Args:
+        engine (Engine): The engine to read with.
+        ids (list[uuid.UUID]): The identifiers to read.
+        threads (int): The number of threads reading at once, 1 to read sequentially.
+
+    Returns:
+        Callable[[], None]: The run to time.
+    """
+
+    def read(id: uuid.UUID) -> None:
+        with SqlAlchemyUnitOfWork(engine, {"entities": SlowEntityExampleRepository}) as unit_of_work:
+            unit_of_work.repositories()["entities"].get(id)
+
+    def run() -> None:
+        if threads == 1:
+            for id in ids:
+                read(id)
+            return
+        with ThreadPoolExecutor(threads) as executor:
+            for _ in executor.map(read, ids):
+                pass
+
+    return run
+
+
+def async_reads(path: str, latency: float, ids: list[uuid.UUID], concurrency: int) -> Callable[[], None]:
+    """Build a run reading each identifier in its own asynchronous unit of work.
+
+    The connections of an asyncio engine belong to the event loop that opened them, so
+    each run creates its engine on its own loop.
+
+    Args:
+        path (str): The path of the database.
+        latency (float): The latency of each query, in milliseconds.
+        ids (list[uuid.UUID]): The identifiers to read.
+        concurrency (int): The maximum number of reads awaited at once, and connections.
+
+    Returns:
+        Callable[[], None]: The run to time.
+    """
+
+    async def read(engine: AsyncEngine, semaphore: asyncio.Semaphore, id: uuid.UUID) -> None:
+        async with (
+            semaphore,
+            AsyncSqlAlchemyUnitOfWork(engine, {"entities": SlowEntityExampleRepository}) as unit_of_work,
+        ):
+            await unit_of_work.repositories()["entities"].get(id)
+
+    async def main() -> None:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=concurrency, max_overflow=0)
+        register_latency(engine.sync_engine, latency)
+        semaphore = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(read(engine, semaphore, id) for id in ids))
+        await engine.dispose()
+
+    def run() -> None:
+        asyncio.run(main())
+
+    return run
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--reads", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=5.0)
+    parser.add_argument("--concurrency", default="8,32,128")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    ids = [uuid.uuid4() for _ in range(args.entities)]
+    read_ids = ids[:: max(args.entities // args.reads, 1)][: args.reads]
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        engine = create_engine(f"sqlite:///{path}")
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                insert(entity_examples_table),
+                [{"id": id, "name": f"name {index}", "description": "description"} for index, id in enumerate(ids)],
+            )
+            connection.execute(
+                text(
+                    f"CREATE VIEW slow_entity_examples AS SELECT * FROM entity_examples WHERE sleep_ms({args.latency})"
+                )
+            )
+        engine.dispose()
+
+        # Each thread holds a connection of its own, so size the pool for them.
+        sync_engine = create_engine(f"sqlite:///{path}", pool_size=max(levels), max_overflow=0)
+        register_latency(sync_engine, args.latency)
+
+        gc.disable()
+        seconds = best_of(sync_reads(sync_engine, read_ids, 1), args.repeat)
+        rows.append(["sync, sequential", 1, int(args.reads / seconds)])
+        for level in levels:
+            seconds = best_of(sync_reads(sync_engine, read_ids, level), args.repeat)
+            rows.append(["sync, thread pool", level, int(args.reads / seconds)])
+        for level in levels:
+            seconds = best_of(async_reads(path, args.latency, read_ids, level), args.repeat)
+            rows.append(["async, aiosqlite", level, int(args.reads / seconds)])
+        gc.enable()
+        sync_engine.dispose()
+
+    print(f"{args.reads:,} reads, {args.latency:g} ms of latency per query, SQLite {sqlite3.sqlite_version}\n")
+    print_table(["reads", "concurrency", "reads / s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark the bulk writes of the unit of work on a local SQLite database.
+
+Adds many `EntityExample` entities, then removes them, in a single transaction:
+once with a repository executing one statement per entity, and once through a
+`SqlAlchemyUnitOfWork`, which writes them in chunks when it commits. Reports the
+rows written per second for several chunk sizes.
+
+Usage:
+    python benchmarks/bench_bulk_writes.py [--entities 20000] [--repeat 3]
+"""
+
+import argparse
+import os
+import tempfile
+import uuid
+from collections.abc import Callable
+
+from common import best_of, print_table
+from sqlalchemy import Engine, create_engine, delete
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.infrastructure.persistence import SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.configurations import metadata
+from flask_boilerplate.infrastructure.persistence.configurations.entity_example_configuration import (
+    entity_examples_table,
+)
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+
+def per_entity(engine: Engine, entities: list[EntityExample], remove: bool) -> Callable[[], None]:
+    """Build a run writing one statement per entity, in a single transaction.
+
+    Args:
+        engine (Engine): The engine to write with.
+        entities (list[EntityExample]): The entities to add.
+        remove (bool): Whether to remove the entities once they are added, and time that.
+
+    Returns:
+        Callable[[], None]: The run to time.
+    """
+
+    def run() -> None:
+        with engine.begin() as connection:
+            repository = EntityExampleRepository(connection)
+            if remove:
+                for entity in entities:
+                    repository.remove(entity)
+            else:
+                for entity in entities:
+                    repository.add(entity)
+
+    return run
+
+
+def batched(engine: Engine, entities: list[EntityExample], remove: bool, chunk_size: int) -> Callable[[], None]:
+    """Build a run writing the entities through a unit of work, in chunks.
+
+    Args:
+        engine (Engine): The engine to write with.
+        entities (list[EntityExample]): The entities to add.
+        remove (bool): Whether to remove the entities once they are added, and time that.
+        chunk_size (int): The maximum number of rows per statement.
+
+    Returns:
+        Callable[[], None]: The run to time.
+    """
+
+    def run() -> None:
+        with SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, chunk_size=chunk_size) as unit:
+            repository = unit.repositories()["entities"]
+            if remove:
+                for entity in entities:
+                    repository.remove(entity)
+            else:
+                for entity in entities:
+                    repository.add(entity)
+            unit.commit()
+
+    return run
+
+
+def run(engine: Engine, entities: list[EntityExample], remove: bool, chunk_size: int | None) -> Callable[[], None]:
+    """Build a run of a case.
+
+    Args:
+        engine (Engine): The engine to write with.
+        entities (list[EntityExample]): The entities to add.
+        remove (bool): Whether to remove the entities once they are added, and time that.
+        chunk_size (int | None): The maximum number of rows per statement, None to write
+            one statement per entity.
+
+    Returns:
+        Callable[[], None]: The run to time.
+    """
+    if chunk_size is None:
+        return per_entity(engine, entities, remove)
+    return batched(engine, entities, remove, chunk_size)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    entities = [
+        EntityExample(id=uuid.uuid4(), name=f"name {index}", description=f"description {index}")
+        for index in range(args.entities)
+    ]
+    # The chunk size of each case, None for one statement per entity.
+    cases: dict[str, int | None] = {"per entity": None}
+    for size in (100, 500, 2000):
+        cases[f"unit of work, chunks of {size}"] = size
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        metadata.create_all(engine)
+        for label, chunk_size in cases.items():
+            insert_seconds = delete_seconds = float("inf")
+            for _ in range(args.repeat):
+                with engine.begin() as connection:
+                    connection.execute(delete(entity_examples_table))
+                insert_seconds = min(insert_seconds, best_of(run(engine, entities, False, chunk_size), 1))
+                delete_seconds = min(delete_seconds, best_of(run(engine, entities, True, chunk_size), 1))
+            rows.append([label, int(args.entities / insert_seconds), int(args.entities / delete_seconds)])
+        engine.dispose()
+
+    print(f"{args.entities:,} entities, local SQLite file\n")
+    print_table(["writes", "inserts / s", "deletes / s"], rows)
+
+
+if __name__ == "__main__":
+    main()
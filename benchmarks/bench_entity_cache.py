@@ -0,0 +1,94 @@
+"""Benchmark the read-through entity cache on skewed reads of a local SQLite database.
+
+Reads `EntityExample` entities by identifier, drawn from a Zipf-like distribution so
+that a small hot set gets most reads, each read in its own unit of work as in a
+request: once without cache, and once through a `CachingRepository` for several cache
+sizes. Reports the reads per second, the hit ratio and the evictions.
+
+Usage:
+    python benchmarks/bench_entity_cache.py [--entities 100000] [--reads 20000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import os
+import random
+import tempfile
+import uuid
+from collections.abc import Callable
+
+from common import best_of, print_table
+from sqlalchemy import Engine, create_engine, insert
+
+from flask_boilerplate.infrastructure.persistence import EntityCache, SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.configurations import metadata
+from flask_boilerplate.infrastructure.persistence.configurations.entity_example_configuration import (
+    entity_examples_table,
+)
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+
+def reads(engine: Engine, ids: list[uuid.UUID], cache: EntityCache[object, uuid.UUID] | None) -> Callable[[], None]:
+    """Build a run reading each identifier in its own unit of work.
+
+    Args:
+        engine (Engine): The engine to read with.
+        ids (list[uuid.UUID]): The identifiers to read, in order.
+        cache (EntityCache[object, uuid.UUID] | None): The cache of the entities, None
+            to read without cache.
+
+    Returns:
+        Callable[[], None]: The run to time.
+    """
+    caches = {} if cache is None else {"entities": cache}
+
+    def run() -> None:
+        for id in ids:
+            with SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, caches=caches) as unit_of_work:
+                unit_of_work.repositories()["entities"].get(id)
+
+    return run
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ids = [uuid.uuid4() for _ in range(args.entities)]
+    generator = random.Random(42)
+    # Zipf-like ranks: the identifier of rank k is read about 1/k as often as the first.
+    weights = [1 / rank for rank in range(1, args.entities + 1)]
+    read_ids = generator.choices(ids, weights, k=args.reads)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(
+                insert(entity_examples_table),
+                [{"id": id, "name": f"name {index}", "description": "description"} for index, id in enumerate(ids)],
+            )
+
+        gc.disable()
+        seconds = best_of(reads(engine, read_ids, None), args.repeat)
+        rows.append(["no cache", int(args.reads / seconds), "-", "-"])
+        for maxsize in (100, 1_000, 10_000):
+            seconds = float("inf")
+            for _ in range(args.repeat):
+                cache = EntityCache[object, uuid.UUID](maxsize=maxsize, ttl=60.0)
+                seconds = min(seconds, best_of(reads(engine, read_ids, cache), 1))
+            rows.append([f"cache of {maxsize}", int(args.reads / seconds), f"{cache.hit_ratio:.1%}", cache.evictions])
+        gc.enable()
+        engine.dispose()
+
+    print(f"{args.reads:,} reads of {args.entities:,} entities, local SQLite file\n")
+    print_table(["reads", "reads / s", "hit ratio", "evictions"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark the trusted hydration of entities and value objects.
+
+Rebuilds many `EntityExample` and `ValueObjectExample` instances from row mappings,
+as the persistence layer does, comparing the validating constructors with
+`from_primitives_trusted()` and `hydrate_many()`.
+
+Usage:
+    python benchmarks/bench_hydration.py [--objects 1000000] [--distinct 1000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import uuid
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from common import best_of, print_table
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.value_objects.value_object_example import ValueObjectExample
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    entity_rows: list[Mapping[str, Any]] = [
+        {"id": uuid.UUID(int=index), "name": f"name {index}", "description": f"description {index}"}
+        for index in range(args.objects)
+    ]
+    value_rows: list[Mapping[str, Any]] = [
+        {"name": f"name {index % args.distinct}", "description": "description"} for index in range(args.objects)
+    ]
+    # Keep one instance of each distinct value alive, as a real workload would.
+    alive = ValueObjectExample.hydrate_many(value_rows[: args.distinct])
+
+    cases: dict[str, Callable[[], Any]] = {
+        "EntityExample(**row)": lambda: [EntityExample(**row) for row in entity_rows],
+        "EntityExample.from_primitives_trusted": lambda: [
+            EntityExample.from_primitives_trusted(row) for row in entity_rows
+        ],
+        "EntityExample.hydrate_many": lambda: EntityExample.hydrate_many(entity_rows),
+        "ValueObjectExample(**row)": lambda: [ValueObjectExample(**row) for row in value_rows],
+        "ValueObjectExample.from_primitives_trusted": lambda: [
+            ValueObjectExample.from_primitives_trusted(row) for row in value_rows
+        ],
+        "ValueObjectExample.hydrate_many": lambda: ValueObjectExample.hydrate_many(value_rows),
+    }
+
+    # The cyclic garbage collector runs many times while millions of objects are being
+    # created, which adds more noise than the differences being measured.
+    gc.disable()
+    rows = []
+    for label, case in cases.items():
+        seconds = best_of(case, args.repeat)
+        rows.append([label, seconds, int(args.objects / seconds)])
+    print(f"{args.objects:,} rows, {len(alive):,} distinct value objects\n")
+    print_table(["construction", "time (s)", "objects / s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark inserts keyed by random (v4) and time-ordered (v7) UUIDs.
+
+Inserts rows into the `entity_examples` table of a fresh SQLite database file, in
+batches of one transaction each, once with `UuidV4Generator` identifiers and once with
+`UuidV7Generator` identifiers. Reports the generation time, the insert time of the
+whole run and of the last batch, which shows how throughput degrades as the
+primary-key index grows beyond the page cache, and the size of the database file.
+
+Usage:
+    python benchmarks/bench_ids.py [--rows 1000000] [--batch 10000] [--cache-kib 2000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from common import print_table
+from sqlalchemy import create_engine, insert
+
+from flask_boilerplate.domain.primitives.id_generator import IdGenerator, UuidV4Generator, UuidV7Generator
+from flask_boilerplate.infrastructure.persistence.configurations import entity_examples_table, metadata
+
+
+def run(generator: IdGenerator, rows: int, batch: int, cache_kib: int, directory: str) -> list[float]:
+    """Insert rows keyed by the identifiers of a generator into a new database.
+
+    Args:
+        generator (IdGenerator): The generator of the primary keys.
+        rows (int): The number of rows to insert.
+        batch (int): The number of rows per transaction.
+        cache_kib (int): The size of the SQLite page cache, in KiB.
+        directory (str): The directory of the database file.
+
+    Returns:
+        list[float]: The generation time, the total insert time and the insert time of
+        the last batch, in seconds, then the size of the database file, in MiB.
+    """
+    path = os.path.join(directory, f"{type(generator).__name__}.sqlite3")
+    engine = create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+
+    start = time.perf_counter()
+    ids = generator.new_ids(rows)
+    generation = time.perf_counter() - start
+
+    total = last = 0.0
+    with engine.connect() as connection:
+        connection.exec_driver_sql(f"PRAGMA cache_size = -{cache_kib}")
+        for offset in range(0, rows, batch):
+            values = [
+                {"id": id, "name": f"name {offset + index}", "description": "description"}
+                for index, id in enumerate(ids[offset : offset + batch])
+            ]
+            start = time.perf_counter()
+            connection.execute(insert(entity_examples_table), values)
+            connection.commit()
+            last = time.perf_counter() - start
+            total += last
+    engine.dispose()
+    return [generation, total, last, os.path.getsize(path) / 2**20]
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--cache-kib", type=int, default=2_000)
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for label, generator in (("uuid4", UuidV4Generator()), ("uuid7", UuidV7Generator())):
+            generation, total, last, size = run(generator, args.rows, args.batch, args.cache_kib, directory)
+            results.append([label, generation, total, int(args.rows / total), int(args.batch / last), size])
+
+    print(f"{args.rows:,} rows in batches of {args.batch:,}, {args.cache_kib:,} KiB page cache\n")
+    print_table(
+        ["keys", "generation (s)", "insert (s)", "rows / s", "last batch rows / s", "file (MiB)"],
+        results,
+    )
+
+
+if __name__ == "__main__":
+    main()
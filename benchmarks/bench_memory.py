@@ -0,0 +1,116 @@
+"""Benchmark the memory footprint and construction time of entities and value objects.
+
+Compares the slotted `EntityExample` and `ValueObjectExample` with equivalent classes
+using the previous layout: a per-instance `__dict__`, and for the entity a
+`__post_init__` re-running `Entity.__init__`. Reports the bytes allocated per instance,
+measured with tracemalloc, and the construction time.
+
+Usage:
+    python benchmarks/bench_memory.py [--objects 1000000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import tracemalloc
+import uuid
+from abc import ABC
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from common import best_of, print_table
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.value_objects.value_object_example import ValueObjectExample
+
+
+class DictEntity(ABC):  # noqa: B024
+    """Entity base class with the previous, dict-based layout."""
+
+    def __init__(self, id: uuid.UUID | None = None) -> None:
+        self.id: uuid.UUID = id or uuid.uuid4()
+
+
+@dataclass
+class DictEntityExample(DictEntity):
+    """`EntityExample` with the previous, dict-based layout."""
+
+    name: str
+    description: str
+    id: uuid.UUID = field(default_factory=uuid.uuid4)
+
+    def __post_init__(self) -> None:
+        super().__init__(id=self.id)
+
+
+@dataclass(frozen=True)
+class DictValueObjectExample:
+    """`ValueObjectExample` with the previous, dict-based layout."""
+
+    name: str
+    description: str
+
+    def __post_init__(self) -> None:
+        if not self.name or len(self.name.strip()) == 0:
+            raise ValueError("Name cannot be empty.")
+        if not self.description or len(self.description.strip()) == 0:
+            raise ValueError("Description cannot be empty.")
+
+
+def bytes_per_instance(factory: Callable[[int], Any], count: int) -> float:
+    """Measure the memory allocated per instance, excluding the list holding them.
+
+    Args:
+        factory (Callable[[int], Any]): Creates the instance of a given index.
+        count (int): The number of instances to create.
+
+    Returns:
+        float: The number of bytes allocated per instance.
+    """
+    holder: list[Any] = [None] * count
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for index in range(count):
+            holder[index] = factory(index)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del holder
+    return allocated / count
+
+
+def construct_all(factory: Callable[[int], Any], count: int) -> Callable[[], Sequence[Any]]:
+    """Build a function creating all the instances, for timing."""
+    return lambda: [factory(index) for index in range(count)]
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Identifiers and strings are created up front and shared, so that only the
+    # instances themselves are measured.
+    ids = [uuid.UUID(int=index) for index in range(args.objects)]
+    name, description = "name", "description"
+    factories: dict[str, Callable[[int], Any]] = {
+        "EntityExample (dict)": lambda index: DictEntityExample(name=name, description=description, id=ids[index]),
+        "EntityExample (slots)": lambda index: EntityExample(name=name, description=description, id=ids[index]),
+        "ValueObjectExample (dict)": lambda index: DictValueObjectExample(name=name, description=description),
+        "ValueObjectExample (slots)": lambda index: ValueObjectExample(name=name, description=description),
+    }
+
+    rows = []
+    for label, factory in factories.items():
+        size = bytes_per_instance(factory, args.objects)
+        seconds = best_of(construct_all(factory, args.objects), args.repeat)
+        rows.append([label, size, size * args.objects / 2**20, seconds, int(args.objects / seconds)])
+    print(f"{args.objects:,} instances\n")
+    print_table(["class", "bytes / instance", "MiB total", "construction (s)", "instances / s"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Benchmark optimistic and pessimistic concurrency control on hot aggregates.
+
+Threads deposit on a few hot accounts of a local SQLite file, each deposit in its own
+unit of work, reading the account, changing its balance and committing:
+
+- unchecked: no concurrency control, concurrent deposits overwrite each other;
+- optimistic: the account is versioned, a conflicting commit raises a
+  `ConcurrencyError` and the deposit is retried by `retry_on_conflict()`;
+- pessimistic: the unit of work takes the write lock before reading, with
+  `BEGIN IMMEDIATE`, the SQLite counterpart of `SELECT ... FOR UPDATE`.
+
+Reports the deposits per second, the retries and the lost deposits.
+
+Usage:
+    python benchmarks/bench_optimistic_concurrency.py [--threads 8] [--accounts 4] [--deposits 200]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from common import print_table
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    Integer,
+    MetaData,
+    Row,
+    Table,
+    Uuid,
+    create_engine,
+    event,
+    func,
+    select,
+)
+
+from flask_boilerplate.application.behaviors import retry_on_conflict
+from flask_boilerplate.domain.primitives import AggregateRoot
+from flask_boilerplate.infrastructure.persistence import SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.repositories import SqlAlchemyRepository
+
+metadata = MetaData()
+versioned_accounts_table = Table(
+    "versioned_accounts",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("balance", Integer, nullable=False),
+    Column("version", Integer, nullable=False),
+)
+accounts_table = Table(
+    "accounts",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("balance", Integer, nullable=False),
+)
+
+
+@dataclass(slots=True)
+class Account(AggregateRoot):
+    """Account whose balance changes are tracked."""
+
+    track_changes: ClassVar[bool] = True
+
+    id: uuid.UUID
+    balance: int
+
+    def deposit(self, amount: int) -> None:
+        previous, self.balance = self.balance, self.balance + amount
+        self._attribute_changed("balance", previous)
+
+    def _get_identifier(self) -> uuid.UUID:
+        return self.id
+
+
+class AccountRepository(SqlAlchemyRepository[Account, uuid.UUID]):
+    """Repository of the accounts, without version."""
+
+    table = accounts_table
+
+    def _to_entity(self, row: Row[Any]) -> Account:
+        return Account(row.id, row.balance)
+
+    def _to_row(self, entity: Account) -> Mapping[str, Any]:
+        return {"id": entity.id, "balance": entity.balance}
+
+
+class VersionedAccountRepository(AccountRepository):
+    """Repository of the accounts, versioned."""
+
+    table = versioned_accounts_table
+
+    def _to_entity(self, row: Row[Any]) -> Account:
+        return Account(row.id, row.balance, version=row.version)
+
+    def _to_row(self, entity: Account) -> Mapping[str, Any]:
+        return {"id": entity.id, "balance": entity.balance, "version": entity.version}
+
+
+def lock_on_begin(engine: Engine) -> None:
+    """Make the transactions of an engine take the write lock when they begin.
+
+    Args:
+        engine (Engine): The engine of a SQLite database.
+    """
+
+    @event.listens_for(engine, "connect")
+    def connect(dbapi_connection: Any, connection_record: Any) -> None:
+        # Let SQLAlchemy emit BEGIN itself, instead of the driver.
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def deposits(
+    engine: Engine,
+    repository: type[AccountRepository],
+    ids: list[uuid.UUID],
+    threads: int,
+    count: int,
+    optimistic: bool,
+) -> Callable[[], int]:
+    """Build a run of `count` deposits per thread, spread over the accounts.
+
+    Args:
+        engine (Engine): The engine to write with.
+        repository (type[AccountRepository]): The class of the repository of the accounts.
+        ids (list[uuid.UUID]): The identifiers of the accounts.
+        threads (int): The number of threads depositing at once.
+        count (int): The number of deposits of each thread.
+        optimistic (bool): Whether to retry the deposits on a concurrent change.
+
+    Returns:
+        Callable[[], int]: The run to time, returning the number of retries.
+    """
+    retries = 0
+    lock = threading.Lock()
+
+    def backoff(delay: float) -> None:
+        nonlocal retries
+        with lock:
+            retries += 1
+        time.sleep(delay)
+
+    def deposit(id: uuid.UUID) -> None:
+        with SqlAlchemyUnitOfWork(engine, {"accounts": repository}) as unit_of_work:
+            account = unit_of_work.repositories()["accounts"].get(id)
+            assert account is not None
+            account.deposit(1)
+            unit_of_work.commit()
+
+    if optimistic:
+        deposit = retry_on_conflict(attempts=100, base_delay=0.0005, max_delay=0.02, sleep=backoff)(deposit)
+
+    def work(thread: int) -> None:
+        for index in range(count):
+            deposit(ids[(thread + index) % len(ids)])
+
+    def run() -> int:
+        with ThreadPoolExecutor(threads) as executor:
+            for _ in executor.map(work, range(threads)):
+                pass
+        return retries
+
+    return run
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--accounts", type=int, default=4)
+    parser.add_argument("--deposits", type=int, default=200)
+    args = parser.parse_args()
+    ids = [uuid.uuid4() for _ in range(args.accounts)]
+    total = args.threads * args.deposits
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bench.db")
+        setup = create_engine(f"sqlite:///{path}")
+        metadata.create_all(setup)
+        with setup.begin() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+            connection.execute(accounts_table.insert(), [{"id": id, "balance": 0} for id in ids])
+            connection.execute(
+                versioned_accounts_table.insert(), [{"id": id, "balance": 0, "version": 0} for id in ids]
+            )
+        setup.dispose()
+
+        runs = [
+            ("unchecked", AccountRepository, False),
+            ("optimistic", VersionedAccountRepository, True),
+            ("pessimistic", AccountRepository, False),
+        ]
+        for name, repository, optimistic in runs:
+            engine = create_engine(f"sqlite:///{path}", pool_size=args.threads)
+            if name == "pessimistic":
+                lock_on_begin(engine)
+            with engine.begin() as connection:
+                connection.execute(repository.table.update().values(balance=0))
+            gc.disable()
+            start = time.perf_counter()
+            retries = deposits(engine, repository, ids, args.threads, args.deposits, optimistic)()
+            seconds = time.perf_counter() - start
+            gc.enable()
+            with engine.connect() as connection:
+                balance = connection.execute(select(func.sum(repository.table.c.balance))).scalar_one()
+            engine.dispose()
+            rows.append([name, int(total / seconds), retries, total - balance])
+
+    print(f"{args.threads} threads x {args.deposits} deposits on {args.accounts} accounts, local SQLite file (WAL)\n")
+    print_table(["control", "deposits / s", "retries", "lost deposits"], rows)
+
+
+if __name__ == "__main__":
+    main()
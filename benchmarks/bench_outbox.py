@@ -0,0 +1,263 @@
+"""Benchmark the transactional outbox and its relay.
+
+Uses a local SQLite file (WAL) and a simulated broker taking `--latency-ms` per batch
+round trip:
+
+- write path: commits of an aggregate raising a domain event, with the event published
+  inline by a dispatcher handler after the commit, and with the event recorded in the
+  outbox in the transaction instead; reports the commits per second;
+- drain: relays publishing a backlog of `--messages` messages, by batch size and
+  number of relays; reports the messages per second;
+- lag: a producer records messages at `--rate` messages per second while the relays
+  run; reports the mean and maximum publish lag, from the commit of a message to its
+  publication.
+
+Usage:
+    python benchmarks/bench_outbox.py [--latency-ms 2] [--commits 300] [--messages 20000] [--rate 2000]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from common import print_table
+from sqlalchemy import Engine, Row, create_engine, delete, func, select
+
+from flask_boilerplate.domain.domain_events import DomainEventDispatcher
+from flask_boilerplate.domain.primitives import AggregateRoot, DomainEventBase
+from flask_boilerplate.infrastructure.background_jobs import OutboxRelay, RelayMetrics
+from flask_boilerplate.infrastructure.persistence import Outbox, SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.configurations import (
+    entity_examples_table,
+    metadata,
+    outbox_messages_table,
+)
+from flask_boilerplate.infrastructure.persistence.repositories import SqlAlchemyRepository
+from flask_boilerplate.infrastructure.services.messaging import Message, MessagePublisher
+
+
+@dataclass(frozen=True, slots=True)
+class Registered(DomainEventBase):
+    """Event raised by a new aggregate."""
+
+    id: uuid.UUID
+    name: str
+
+    @property
+    def event_name(self) -> str:
+        return "registered"
+
+
+@dataclass(slots=True)
+class Registration(AggregateRoot):
+    """Aggregate raising an event when it is created, stored like `EntityExample`."""
+
+    id: uuid.UUID
+    name: str
+    description: str
+
+    @classmethod
+    def register(cls, name: str) -> "Registration":
+        registration = cls(uuid.uuid4(), name, "description")
+        registration.add_domain_event(Registered(datetime.now(UTC), registration.id, name))
+        return registration
+
+
+class RegistrationRepository(SqlAlchemyRepository[Registration, uuid.UUID]):
+    """Repository of the aggregates, in the table of `EntityExample` entities."""
+
+    table = entity_examples_table
+
+    def _to_entity(self, row: Row[Any]) -> Registration:
+        return Registration(row.id, row.name, row.description)
+
+    def _to_row(self, entity: Registration) -> Mapping[str, Any]:
+        return {"id": entity.id, "name": entity.name, "description": entity.description}
+
+
+class SlowPublisher(MessagePublisher):
+    """Publisher simulating the round trip of a batch to a broker."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def publish_batch(self, messages: Sequence[Message]) -> None:
+        time.sleep(self.latency)
+
+
+def commits(engine: Engine, count: int, outbox: Outbox | None, latency: float) -> Callable[[], None]:
+    """Build a run of `count` units of work, each registering an aggregate.
+
+    Args:
+        engine (Engine): The engine to write with.
+        count (int): The number of units of work.
+        outbox (Outbox | None): The outbox to record the events in, None to publish them
+            inline.
+        latency (float): The round trip of the broker, in seconds.
+
+    Returns:
+        Callable[[], None]: The run to time.
+    """
+    dispatcher = None
+    if outbox is None:
+        publisher = SlowPublisher(latency)
+        dispatcher = DomainEventDispatcher()
+        dispatcher.register(Registered, lambda events: publisher.publish_batch([]))
+
+    def run() -> None:
+        for index in range(count):
+            with SqlAlchemyUnitOfWork(
+                engine, {"registrations": RegistrationRepository}, dispatcher, outbox=outbox
+            ) as unit_of_work:
+                unit_of_work.repositories()["registrations"].add(Registration.register(f"name {index}"))
+                unit_of_work.commit()
+
+    return run
+
+
+def run_relays(
+    engine: Engine, count: int, batch_size: int, latency: float, until: Callable[[int], bool]
+) -> tuple[float, list[RelayMetrics]]:
+    """Run relays until a condition on the number of published messages holds.
+
+    Args:
+        engine (Engine): The engine of the outbox.
+        count (int): The number of relays.
+        batch_size (int): The batch size of the relays.
+        latency (float): The round trip of the broker, in seconds.
+        until (Callable[[int], bool]): The condition stopping the relays.
+
+    Returns:
+        tuple[float, list[RelayMetrics]]: The duration of the run, in seconds, and the
+            metrics of the relays.
+    """
+    relays = [OutboxRelay(engine, SlowPublisher(latency), batch_size, poll_interval=0.005) for _ in range(count)]
+    stop = threading.Event()
+    threads = [threading.Thread(target=relay.run, args=(stop,)) for relay in relays]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    while not until(sum(relay.metrics.published for relay in relays)):
+        time.sleep(0.001)
+    seconds = time.perf_counter() - start
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return seconds, [relay.metrics for relay in relays]
+
+
+def produce(engine: Engine, rate: int, seconds: float) -> int:
+    """Record messages in the outbox at a steady rate, in transactions of 10 messages.
+
+    Args:
+        engine (Engine): The engine of the outbox.
+        rate (int): The number of messages per second.
+        seconds (float): The duration of the production, in seconds.
+
+    Returns:
+        int: The number of messages recorded.
+    """
+    outbox = Outbox()
+    events = [Registered(datetime.now(UTC), uuid.uuid4(), "name") for _ in range(10)]
+    produced = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        with engine.begin() as connection:
+            produced += outbox.write(connection, events)
+        time.sleep(max(0.0, start + produced / rate - time.perf_counter()))
+    return produced
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--commits", type=int, default=300)
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--rate", type=int, default=2000)
+    args = parser.parse_args()
+    latency = args.latency_ms / 1000
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}", connect_args={"timeout": 30})
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+        write_rows = []
+        for name, outbox in [("inline publish", None), ("outbox", Outbox())]:
+            gc.disable()
+            start = time.perf_counter()
+            commits(engine, args.commits, outbox, latency)()
+            seconds = time.perf_counter() - start
+            gc.enable()
+            write_rows.append([name, int(args.commits / seconds)])
+
+        drain_rows = []
+        for batch_size, relays in [(1, 1), (10, 1), (100, 1), (500, 1), (100, 4)]:
+            with engine.begin() as connection:
+                connection.execute(delete(outbox_messages_table))
+            outbox = Outbox()
+            events = [Registered(datetime.now(UTC), uuid.uuid4(), "name") for _ in range(1000)]
+            with engine.begin() as connection:
+                for _ in range(args.messages // 1000):
+                    outbox.write(connection, events)
+            total = args.messages // 1000 * 1000
+
+            def drained(published: int, total: int = total) -> bool:
+                return published >= total
+
+            seconds, _ = run_relays(engine, relays, batch_size, latency, drained)
+            drain_rows.append([batch_size, relays, int(total / seconds)])
+
+        lag_rows = []
+        for batch_size, relays in [(10, 1), (100, 1), (100, 4)]:
+            with engine.begin() as connection:
+                connection.execute(delete(outbox_messages_table))
+            done = threading.Event()
+            produced = [0]
+
+            def producer(produced: list[int] = produced, done: threading.Event = done) -> None:
+                produced[0] = produce(engine, args.rate, 2.0)
+                done.set()
+
+            def caught_up(published: int, produced: list[int] = produced, done: threading.Event = done) -> bool:
+                return done.is_set() and published >= produced[0]
+
+            thread = threading.Thread(target=producer)
+            thread.start()
+            _, metrics = run_relays(engine, relays, batch_size, latency, caught_up)
+            thread.join()
+            published = sum(metric.published for metric in metrics)
+            mean = sum(metric.publish_lag_seconds for metric in metrics) / published
+            worst = max(metric.max_publish_lag_seconds for metric in metrics)
+            lag_rows.append([batch_size, relays, mean * 1000, worst * 1000])
+
+        with engine.connect() as connection:
+            assert (
+                connection.execute(
+                    select(func.count()).where(outbox_messages_table.c.published_at.is_(None))
+                ).scalar_one()
+                == 0
+            )
+        engine.dispose()
+
+    print(f"Local SQLite file (WAL), broker round trip {args.latency_ms} ms per batch\n")
+    print_table(["write path", "commits / s"], write_rows)
+    print()
+    print_table(["batch size", "relays", "messages / s"], drain_rows)
+    print()
+    print(f"Producer at {args.rate:,} messages / s for 2 s\n")
+    print_table(["batch size", "relays", "mean lag (ms)", "max lag (ms)"], lag_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""Benchmark the per-call overhead of reading an entity by identifier.
+
+Fills an in-memory SQLite database with `EntityExample` rows, then reads them one by
+one, by identifier, in several ways:
+
+- raw DB-API: a prepared SQL string on the sqlite3 cursor, the floor of the driver;
+- fresh select: `select(table).where(table.c.id == id)` built on every call, with the
+  conversion written by hand, as `EntityExampleRepository.get()` did before;
+- lambda statement: `lambda_stmt()`, whose construction SQLAlchemy caches by the code
+  of the lambda;
+- repository: `EntityExampleRepository.get()`, with its statement prebuilt once per
+  table and its `EntityMapping` hydrating the entity.
+
+All the SQLAlchemy runs reuse the compiled SQL from the cache of the engine; they
+differ by the cost of building the statement and its cache key on each call. Reports
+the time per call in microseconds.
+
+Usage:
+    python benchmarks/bench_repository_get.py [--entities 1000] [--repeat 5]
+"""
+
+import argparse
+import gc
+import sqlite3
+import uuid
+from collections.abc import Callable
+
+from common import best_of, print_table
+from sqlalchemy import Connection, StatementLambdaElement, create_engine, insert, lambda_stmt, select
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.infrastructure.persistence.configurations import entity_examples_table, metadata
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+
+def raw(connection: Connection, ids: list[uuid.UUID]) -> Callable[[], None]:
+    """Build a run reading the entities through the DB-API cursor.
+
+    Args:
+        connection (Connection): The connection to read with.
+        ids (list[uuid.UUID]): The identifiers to read.
+
+    Returns:
+        Callable[[], None]: The run.
+    """
+    dbapi_connection = connection.connection.dbapi_connection
+    assert isinstance(dbapi_connection, sqlite3.Connection)
+    cursor = dbapi_connection.cursor()
+    # The Uuid type stores the identifiers as 32 hexadecimal characters on SQLite.
+    keys = [id.hex for id in ids]
+
+    def run() -> None:
+        for key in keys:
+            id, name, description = cursor.execute(
+                "SELECT id, name, description FROM entity_examples WHERE id = ?", (key,)
+            ).fetchone()
+            EntityExample(id=uuid.UUID(id), name=name, description=description)
+
+    return run
+
+
+def fresh_select(connection: Connection, ids: list[uuid.UUID]) -> Callable[[], None]:
+    """Build a run building a new statement on every call.
+
+    Args:
+        connection (Connection): The connection to read with.
+        ids (list[uuid.UUID]): The identifiers to read.
+
+    Returns:
+        Callable[[], None]: The run.
+    """
+    table = entity_examples_table
+
+    def run() -> None:
+        for id in ids:
+            row = connection.execute(select(table).where(table.c.id == id)).one()
+            EntityExample(id=row.id, name=row.name, description=row.description)
+
+    return run
+
+
+def lambda_statement(connection: Connection, ids: list[uuid.UUID]) -> Callable[[], None]:
+    """Build a run building the statement with `lambda_stmt()`.
+
+    Args:
+        connection (Connection): The connection to read with.
+        ids (list[uuid.UUID]): The identifiers to read.
+
+    Returns:
+        Callable[[], None]: The run.
+    """
+    table = entity_examples_table
+
+    def statement(id: uuid.UUID) -> StatementLambdaElement:
+        return lambda_stmt(lambda: select(table)) + (lambda s: s.where(table.c.id == id))
+
+    def run() -> None:
+        for id in ids:
+            row = connection.execute(statement(id)).one()
+            EntityExample(id=row.id, name=row.name, description=row.description)
+
+    return run
+
+
+def repository_get(connection: Connection, ids: list[uuid.UUID]) -> Callable[[], None]:
+    """Build a run reading the entities with `EntityExampleRepository.get()`.
+
+    Args:
+        connection (Connection): The connection to read with.
+        ids (list[uuid.UUID]): The identifiers to read.
+
+    Returns:
+        Callable[[], None]: The run.
+    """
+    repository = EntityExampleRepository(connection)
+
+    def run() -> None:
+        for id in ids:
+            repository.get(id)
+
+    return run
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    ids = [uuid.uuid4() for _ in range(args.entities)]
+
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    rows = []
+    with engine.begin() as connection:
+        connection.execute(
+            insert(entity_examples_table),
+            [{"id": id, "name": f"name {index}", "description": "description"} for index, id in enumerate(ids)],
+        )
+        runs = [
+            ("raw DB-API", raw),
+            ("fresh select", fresh_select),
+            ("lambda statement", lambda_statement),
+            ("repository (prebuilt statement + mapping)", repository_get),
+        ]
+        for name, build in runs:
+            run = build(connection, ids)
+            run()  # Warm the compiled cache.
+            gc.disable()
+            seconds = best_of(run, args.repeat)
+            gc.enable()
+            rows.append([name, seconds / len(ids) * 1e6])
+    engine.dispose()
+
+    print(f"get() of {args.entities:,} entities, in-memory SQLite, best of {args.repeat}\n")
+    print_table(["statement", "us / call"], rows)
+
+
+if __name__ == "__main__":
+    main()
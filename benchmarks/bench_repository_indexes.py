@@ -0,0 +1,112 @@
+"""Benchmark the secondary indexes of the in-memory repository.
+
+Loads many `EntityExample` entities into an `InMemoryRepository` with hash and sorted
+indexes on their name, and into one without indexes, then compares equality, range
+and prefix lookups with the scans they replace, and measures the cost of keeping the
+indexes up to date through `add()`, `remove()` and `update_name()`.
+
+Usage:
+    python benchmarks/bench_repository_indexes.py [--entities 1000000] [--lookups 10000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import random
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from common import best_of, print_table
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.infrastructure.persistence.repositories import InMemoryRepository
+
+Repository = InMemoryRepository[EntityExample, uuid.UUID]
+
+
+def lookups(repository: Repository, names: list[str], prefixes: list[str]) -> dict[str, Callable[[], Any]]:
+    """Build the lookups to time on a repository.
+
+    Args:
+        repository (Repository): The repository to query.
+        names (list[str]): The names to look up by equality.
+        prefixes (list[str]): The prefixes to look up, each matching about 100 names.
+
+    Returns:
+        dict[str, Callable[[], Any]]: The lookups, by label.
+    """
+
+    def find_by() -> None:
+        for name in names:
+            repository.find_by("name", name)
+
+    def find_range() -> None:
+        for prefix in prefixes:
+            repository.find_range("name", prefix, prefix + "5")
+
+    def find_prefix() -> None:
+        for prefix in prefixes:
+            repository.find_prefix("name", prefix, limit=20)
+
+    return {"find_by": find_by, "find_range": find_range, "find_prefix (limit 20)": find_prefix}
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    generator = random.Random(42)
+    entities = [
+        EntityExample(id=uuid.UUID(int=index), name=f"user-{index:07d}", description=f"description {index}")
+        for index in generator.sample(range(args.entities), args.entities)
+    ]
+    names = [entity.name for entity in generator.sample(entities, args.lookups)]
+    # A prefix dropping the last two digits matches 100 names.
+    prefixes = [name[:-2] for name in names]
+    scans = max(1, args.lookups // 1000)
+
+    # The cyclic garbage collector runs many times while millions of objects are being
+    # created, which adds more noise than the differences being measured.
+    gc.disable()
+    rows: list[list[Any]] = []
+    for label, indexes in {"indexed": ["name"], "scanned": []}.items():
+        start = time.perf_counter()
+        repository = Repository(entities, hash_indexes=indexes, sorted_indexes=indexes)
+        seconds = time.perf_counter() - start
+        rows.append([f"{label}: load", args.entities, seconds, seconds * 1e6 / args.entities])
+        # A scan takes seconds at a million entities: time a few of them only.
+        count = args.lookups if label == "indexed" else scans
+        for name, lookup in lookups(repository, names[:count], prefixes[:count]).items():
+            seconds = best_of(lookup, args.repeat)
+            rows.append([f"{label}: {name}", count, seconds, seconds * 1e6 / count])
+        # Release the entities, which accept a single observing repository.
+        for entity in entities:
+            repository.remove(entity)
+
+    repository = Repository(entities, hash_indexes=["name"], sorted_indexes=["name"])
+    sample = generator.sample(entities, args.lookups)
+
+    def rename() -> None:
+        for entity in sample:
+            entity.update_name(entity.name + "x")
+
+    def remove_and_add() -> None:
+        for entity in sample:
+            repository.remove(entity)
+            repository.add(entity)
+
+    for label, case in {"indexed: update_name": rename, "indexed: remove + add": remove_and_add}.items():
+        seconds = best_of(case, args.repeat)
+        rows.append([label, args.lookups, seconds, seconds * 1e6 / args.lookups])
+
+    print(f"{args.entities:,} entities\n")
+    print_table(["operation", "calls", "time (s)", "µs / call"], rows)
+
+
+if __name__ == "__main__":
+    main()
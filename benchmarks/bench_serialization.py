@@ -0,0 +1,131 @@
+"""Benchmark the streaming JSON serializer against `to_dict()` and `json.dumps()`.
+
+Serializes a list of `EntityExample` entities, and of view models with UUID, enum and
+datetime fields, as a JSON array and as NDJSON. The baseline converts every object
+with `to_dict()` (or `dataclasses.asdict()`) and encodes the whole list with
+`json.dumps()`. Reports the time and the peak memory allocated while serializing.
+
+Usage:
+    python benchmarks/bench_serialization.py [--objects 50000] [--chunk-size 1000] [--repeat 3]
+"""
+
+import argparse
+import dataclasses
+import datetime
+import enum
+import json
+import tracemalloc
+import uuid
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from common import best_of, print_table
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.infrastructure.serialization import JsonSerializer
+
+
+class Status(enum.Enum):
+    """Status of a view model."""
+
+    ACTIVE = "active"
+    ARCHIVED = "archived"
+
+
+@dataclasses.dataclass(slots=True)
+class ItemViewModel:
+    """View model with UUID, enum and datetime fields."""
+
+    id: uuid.UUID
+    name: str
+    status: Status
+    created_at: datetime.datetime
+    quantity: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the view model to a dictionary of JSON-compatible values."""
+        return {
+            "id": str(self.id),
+            "name": self.name,
+            "status": self.status.value,
+            "created_at": self.created_at.isoformat(),
+            "quantity": self.quantity,
+        }
+
+
+def peak_bytes(function: Callable[[], Any]) -> int:
+    """Measure the peak memory allocated while a function runs.
+
+    Args:
+        function (Callable[[], Any]): The function to measure.
+
+    Returns:
+        int: The peak number of bytes allocated.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def consume(chunks: Iterable[bytes]) -> int:
+    """Consume a stream of chunks, as a WSGI server writing them to a socket would."""
+    return sum(map(len, chunks))
+
+
+def serialization_cases(objects: list[Any], serializer: JsonSerializer) -> dict[str, Callable[[], Any]]:
+    """Build the serializations to compare for a list of objects.
+
+    Args:
+        objects (list[Any]): The objects to serialize, implementing `to_dict()`.
+        serializer (JsonSerializer): The streaming serializer.
+
+    Returns:
+        dict[str, Callable[[], Any]]: The serializations, by label.
+    """
+    return {
+        "to_dict + json.dumps": lambda: json.dumps([item.to_dict() for item in objects]).encode(),
+        "JsonSerializer.iter_json": lambda: consume(serializer.iter_json(objects)),
+        "to_dict + json.dumps per line": lambda: "\n".join(json.dumps(item.to_dict()) for item in objects).encode(),
+        "JsonSerializer.iter_ndjson": lambda: consume(serializer.iter_ndjson(objects)),
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    datasets: dict[str, list[Any]] = {
+        "EntityExample": [
+            EntityExample(name=f"name {index}", description=f"description {index}") for index in range(args.objects)
+        ],
+        "ItemViewModel": [
+            ItemViewModel(
+                uuid.uuid4(), f"item {index}", Status.ACTIVE, start + datetime.timedelta(seconds=index), index
+            )
+            for index in range(args.objects)
+        ],
+    }
+    serializer = JsonSerializer(chunk_size=args.chunk_size)
+
+    rows = []
+    for dataset, objects in datasets.items():
+        cases = serialization_cases(objects, serializer)
+        for label, case in cases.items():
+            seconds = best_of(case, args.repeat)
+            rows.append([dataset, label, seconds, int(args.objects / seconds), peak_bytes(case) / 2**20])
+
+    print(f"{args.objects:,} objects, chunks of {args.chunk_size:,} objects\n")
+    print_table(["objects", "serialization", "time (s)", "objects / s", "peak MiB"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Benchmark the streaming and the keyset pagination of `SqlAlchemyRepository.list()`.
+
+Fills a local SQLite database with `EntityExample` rows, then:
+
+- iterates over all entities with the streaming `list()`, on a bare connection and
+  within a unit of work, and with a fully buffered list of them, as `list()` returned
+  before, reporting the peak memory allocated while iterating, measured with
+  tracemalloc, and the entities left in the identity map;
+- reads pages of entities at increasing depths, with keyset pagination
+  (`list(after=..., limit=...)`) and with `LIMIT ... OFFSET ...`, reporting the time
+  per page.
+
+Usage:
+    python benchmarks/bench_streaming_list.py [--entities 200000] [--page 100] [--repeat 3]
+"""
+
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+import uuid
+from collections.abc import Callable, Iterable
+
+from common import best_of, print_table
+from sqlalchemy import Connection, create_engine, insert, select
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.infrastructure.persistence import SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.configurations import metadata
+from flask_boilerplate.infrastructure.persistence.configurations.entity_example_configuration import (
+    entity_examples_table,
+)
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+
+def peak_memory(iterate: Callable[[], Iterable[EntityExample]]) -> int:
+    """Measure the peak memory allocated while iterating over entities.
+
+    Args:
+        iterate (Callable[[], Iterable[EntityExample]]): The function returning the
+            entities to iterate over.
+
+    Returns:
+        int: The peak of allocated bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    for _ in iterate():
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def buffered(repository: EntityExampleRepository) -> Callable[[], Iterable[EntityExample]]:
+    """Build a run loading all entities in a list before iterating.
+
+    Args:
+        repository (EntityExampleRepository): The repository to read.
+
+    Returns:
+        Callable[[], Iterable[EntityExample]]: The run.
+    """
+
+    def run() -> Iterable[EntityExample]:
+        return list(repository.list())
+
+    return run
+
+
+def keyset_page(repository: EntityExampleRepository, after: uuid.UUID, size: int) -> Callable[[], object]:
+    """Build a run reading a page with keyset pagination.
+
+    Args:
+        repository (EntityExampleRepository): The repository to read.
+        after (uuid.UUID): The identifier of the last entity of the previous page.
+        size (int): The number of entities per page.
+
+    Returns:
+        Callable[[], object]: The run.
+    """
+
+    def run() -> object:
+        return repository.list(after=after, limit=size)
+
+    return run
+
+
+def offset_page(connection: Connection, offset: int, size: int) -> Callable[[], object]:
+    """Build a run reading a page with `LIMIT ... OFFSET ...`.
+
+    Args:
+        connection (Connection): The connection to read with.
+        offset (int): The number of rows of the previous pages.
+        size (int): The number of rows per page.
+
+    Returns:
+        Callable[[], object]: The run.
+    """
+    statement = select(entity_examples_table).order_by(entity_examples_table.c.id).offset(offset).limit(size)
+
+    def run() -> object:
+        return EntityExample.hydrate_many(row._mapping for row in connection.execute(statement))
+
+    return run
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=200_000)
+    parser.add_argument("--page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    ids = sorted(uuid.uuid4() for _ in range(args.entities))
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        metadata.create_all(engine)
+        with engine.begin() as connection:
+            rows = [{"id": id, "name": f"name {index}", "description": "description"} for index, id in enumerate(ids)]
+            connection.execute(insert(entity_examples_table), rows)
+            del rows
+
+        memory_rows = []
+        with SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}) as unit_of_work:
+            tracked = unit_of_work.repositories()["entities"]
+            memory_rows.append(["streamed, in a unit of work", peak_memory(tracked.list) // 1024])
+            memory_rows[-1].append(len(unit_of_work.identity_map))
+
+        with engine.connect() as connection:
+            repository = EntityExampleRepository(connection)
+            memory_rows += [
+                ["streamed", peak_memory(repository.list) // 1024, "-"],
+                ["buffered", peak_memory(buffered(repository)) // 1024, "-"],
+            ]
+
+            page_rows = []
+            for depth in (0, args.entities // 2, args.entities - args.page - 1):
+                gc.disable()
+                keyset = best_of(keyset_page(repository, ids[depth], args.page), args.repeat)
+                offset = best_of(offset_page(connection, depth + 1, args.page), args.repeat)
+                gc.enable()
+                page_rows.append([depth, keyset * 1000, offset * 1000])
+        engine.dispose()
+
+    print(f"{args.entities:,} entities, local SQLite file\n")
+    print_table(["iteration over all entities", "peak KiB", "identity map entities"], memory_rows)
+    print()
+    print_table([f"page of {args.page} after row", "keyset ms", "offset ms"], page_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Benchmark interning and cached hashing of value objects.
+
+Builds many value objects from a small set of repeated values, then counts them with a
+dictionary, comparing `ValueObjectExample` (cached hash), an interned subclass of it, and
+a class using the previous implementation, whose `__eq__` and `__hash__` rebuild the
+attribute tuple on every call. Reports the memory kept alive and the time of the dictionary workload.
+
+Usage:
+    python benchmarks/bench_value_objects.py [--objects 1000000] [--distinct 1000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from common import best_of, print_table
+
+from flask_boilerplate.domain.value_objects.value_object_example import ValueObjectExample
+
+
+@dataclass(frozen=True)
+class UncachedValueObjectExample:
+    """`ValueObjectExample` with the previous equality and hashing."""
+
+    name: str
+    description: str
+
+    def _attributes(self) -> tuple[Any, ...]:
+        return self.name, self.description
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, UncachedValueObjectExample):
+            return NotImplemented
+        return self._attributes() == other._attributes()
+
+    def __hash__(self) -> int:
+        return hash(self._attributes())
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class InternedValueObjectExample(ValueObjectExample):
+    """`ValueObjectExample` with interning."""
+
+    interned = True
+
+
+def kept_bytes(build: Callable[[], list[Any]]) -> int:
+    """Measure the memory kept alive by the result of a function.
+
+    Args:
+        build (Callable[[], list[Any]]): Builds the objects to measure.
+
+    Returns:
+        int: The number of bytes still allocated once the function returned.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        objects = build()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del objects
+    return allocated
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=1_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    values = [(f"name {index}", f"description {index}") for index in range(args.distinct)]
+    indexes = [index % args.distinct for index in range(args.objects)]
+    classes: dict[str, Callable[..., Any]] = {
+        "previous implementation": UncachedValueObjectExample,
+        "cached hash": ValueObjectExample,
+        "interned, cached hash": InternedValueObjectExample,
+    }
+
+    rows = []
+    for label, cls in classes.items():
+
+        def build(cls: Callable[..., Any] = cls) -> list[Any]:
+            return [cls(*values[index]) for index in indexes]
+
+        memory = kept_bytes(build)
+        objects = build()
+        probes = objects[: args.distinct]
+        construction = best_of(build, args.repeat)
+
+        def count(objects: list[Any] = objects) -> Counter[Any]:
+            return Counter(objects)
+
+        def look_up(objects: list[Any] = objects, probes: list[Any] = probes) -> list[bool]:
+            return [probe in set(objects) for probe in probes[:10]]
+
+        counting = best_of(count, args.repeat)
+        lookups = best_of(look_up, args.repeat)
+        rows.append([label, memory / 2**20, construction, counting, lookups])
+
+    print(f"{args.objects:,} value objects, {args.distinct:,} distinct values\n")
+    print_table(["implementation", "MiB kept", "construction (s)", "Counter (s)", "set build + lookups (s)"], rows)
+
+
+if __name__ == "__main__":
+    main()
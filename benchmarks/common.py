@@ -0,0 +1,59 @@
+"""Shared helpers for the benchmark scripts.
+
+The benchmarks are standalone scripts, run from the repository root:
+
+    python benchmarks/bench_specification.py --help
+
+They are not collected by pytest and print their results as a plain-text table.
+"""
+
+import os
+import sys
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+# Make the sources importable without installing the package, like tests/conftest.py.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")))
+
+
+def best_of(function: Callable[[], Any], repeat: int = 3) -> float:
+    """Run a function several times and return the fastest wall-clock duration.
+
+    Args:
+        function (Callable[[], Any]): The function to time.
+        repeat (int): The number of runs.
+
+    Returns:
+        float: The fastest duration, in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def print_table(headers: Sequence[str], rows: Sequence[Sequence[Any]]) -> None:
+    """Print rows as an aligned plain-text table.
+
+    Args:
+        headers (Sequence[str]): The column headers.
+        rows (Sequence[Sequence[Any]]): The rows, one value per column.
+    """
+    cells = [[str(header) for header in headers]] + [[_format(value) for value in row] for row in rows]
+    widths = [max(len(row[index]) for row in cells) for index in range(len(headers))]
+    for line, row in enumerate(cells):
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)))
+        if line == 0:
+            print("  ".join("-" * width for width in widths))
+
+
+def _format(value: Any) -> str:
+    """Format a table cell, with thousands separators for numbers."""
+    if isinstance(value, float):
+        return f"{value:,.3f}"
+    if isinstance(value, int):
+        return f"{value:,}"
+    return str(value)
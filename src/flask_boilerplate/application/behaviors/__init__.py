@@ -0,0 +1,11 @@
+"""Module exporting the behaviors shared by the handlers of the application layer.
+
+`retry_on_conflict()` retries a command handler whose unit of work failed on a
+concurrent change of an aggregate, with a jittered exponential backoff.
+"""
+
+from .retry import retry_on_conflict
+
+__all__ = [
+    "retry_on_conflict",
+]
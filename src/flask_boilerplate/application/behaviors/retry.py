@@ -0,0 +1,82 @@
+"""Module defining the retry of the operations failing on a concurrent change.
+
+Aggregates are written with optimistic concurrency control: instead of locking the
+rows it reads, a unit of work raises a `ConcurrencyError` at commit if another one
+changed the same aggregate in the meantime. The operation is then retried from the
+start, reading the aggregate again, in a new unit of work.
+
+`retry_on_conflict()` wraps a command handler to do so. It waits between attempts
+with an exponential backoff and full jitter, a random delay up to the backoff, so that
+the handlers that conflicted do not retry in lockstep and conflict again.
+"""
+
+import functools
+import random
+import time
+from collections.abc import Callable
+from typing import ParamSpec, TypeVar
+
+from flask_boilerplate.domain.errors.concurrency_error import ConcurrencyError
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def retry_on_conflict(
+    attempts: int = 5,
+    base_delay: float = 0.005,
+    max_delay: float = 0.2,
+    sleep: Callable[[float], None] = time.sleep,
+    jitter: Callable[[float, float], float] = random.uniform,
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Create a decorator retrying a function while it raises a `ConcurrencyError`.
+
+    The function must run a whole unit of work, so that each attempt reads the
+    aggregates again. Before attempt `n + 1`, it waits a random delay between 0 and
+    `min(max_delay, base_delay * 2 ** n)`.
+
+    Example:
+        >>> @retry_on_conflict(attempts=5)
+        ... def rename_user(command: RenameUser) -> None:
+        ...     with unit_of_work_factory() as unit_of_work:
+        ...         user = unit_of_work.repositories()["users"].get(command.user_id)
+        ...         user.rename(command.name)
+        ...         unit_of_work.commit()
+
+    Args:
+        attempts (int): The maximum number of calls of the function.
+        base_delay (float): The backoff after the first conflict, in seconds.
+        max_delay (float): The maximum backoff, in seconds.
+        sleep (Callable[[float], None]): The function waiting a delay, in seconds.
+        jitter (Callable[[float, float], float]): The function drawing a random delay
+            between two bounds.
+
+    Returns:
+        Callable[[Callable[P, R]], Callable[P, R]]: The decorator. The decorated function
+            raises the last `ConcurrencyError` once the attempts are exhausted.
+
+    Raises:
+        ValueError: If the number of attempts is not positive, or a delay is negative.
+    """
+    if attempts <= 0:
+        raise ValueError(f"The number of attempts must be positive, got {attempts}.")
+    if base_delay < 0 or max_delay < 0:
+        raise ValueError(f"The delays must not be negative, got {base_delay} and {max_delay}.")
+
+    def decorator(function: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(function)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            for attempt in range(attempts - 1):
+                try:
+                    return function(*args, **kwargs)
+                except ConcurrencyError:
+                    sleep(jitter(0.0, min(max_delay, base_delay * 2**attempt)))
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Add the function to __all__ for re-export in the parent module.
+__all__ = ["retry_on_conflict"]
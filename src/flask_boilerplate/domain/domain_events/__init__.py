@@ -0,0 +1,25 @@
+"""Module exporting the domain events subsystem of the domain layer.
+
+Aggregates buffer the domain events they raise in a bounded `EventBuffer`. Within a
+unit of work, a `DomainEventCollector` tracks the aggregates that were touched, and
+once the transaction is committed, hands their events to a `DomainEventDispatcher`,
+which calls the registered handlers with batches of events.
+
+Example:
+    >>> from flask_boilerplate.domain.domain_events import DomainEventCollector, DomainEventDispatcher
+    >>> dispatcher = DomainEventDispatcher()
+    >>> dispatcher.register(UserRenamed, update_search_index)
+    >>> collector = DomainEventCollector(dispatcher)
+"""
+
+from .collector import DomainEventCollector
+from .dispatcher import DomainEventDispatcher, EventHandler
+from .event_buffer import EventBuffer, OverflowPolicy
+
+__all__ = [
+    "DomainEventCollector",
+    "DomainEventDispatcher",
+    "EventHandler",
+    "EventBuffer",
+    "OverflowPolicy",
+]
@@ -0,0 +1,104 @@
+"""Module defining the collector of the domain events raised within a unit of work.
+
+A unit of work tracks the aggregates it loads or adds. Once its transaction is
+committed, the collector drains the event buffers of all these aggregates and hands
+the events to a `DomainEventDispatcher`. If the transaction is rolled back, the events
+describe changes that never happened, and the collector discards them.
+"""
+
+from typing import TYPE_CHECKING, TypeVar
+
+from .dispatcher import DomainEventDispatcher
+
+if TYPE_CHECKING:
+    from flask_boilerplate.domain.primitives.aggregate_root import AggregateRoot
+    from flask_boilerplate.domain.primitives.interface_domain_event import DomainEvent
+
+A = TypeVar("A", bound="AggregateRoot")
+
+
+class DomainEventCollector:
+    """Collector of the domain events of the aggregates touched in a unit of work.
+
+    Example:
+        >>> collector = DomainEventCollector(dispatcher)
+        >>> user = collector.track(repository.get(user_id))
+        >>> user.rename("New name")
+        >>> unit_of_work.commit()
+        >>> collector.publish()
+
+    Attributes:
+        dispatcher (DomainEventDispatcher | None): The dispatcher of the collected events.
+    """
+
+    def __init__(self, dispatcher: DomainEventDispatcher | None = None) -> None:
+        """Initialize a collector tracking no aggregate.
+
+        Args:
+            dispatcher (DomainEventDispatcher | None): The dispatcher of the collected
+                events, required by `publish()`.
+        """
+        self.dispatcher = dispatcher
+        # Aggregates are tracked by identity: their equality may rely on an identifier
+        # that is not assigned yet.
+        self._aggregates: dict[int, AggregateRoot] = {}
+
+    def track(self, aggregate: A) -> A:
+        """Track an aggregate, so that its events are collected.
+
+        Args:
+            aggregate (A): The aggregate loaded or added in the unit of work.
+
+        Returns:
+            A: The aggregate, for chaining.
+        """
+        self._aggregates[id(aggregate)] = aggregate
+        return aggregate
+
+    def __len__(self) -> int:
+        """Get the number of tracked aggregates.
+
+        Returns:
+            int: The number of tracked aggregates.
+        """
+        return len(self._aggregates)
+
+    def collect(self) -> list["DomainEvent"]:
+        """Drain the events of the tracked aggregates, and stop tracking them.
+
+        Returns:
+            list[DomainEvent]: The events, grouped by aggregate in tracking order, and in
+            the order they were raised within an aggregate.
+        """
+        events: list[DomainEvent] = []
+        for aggregate in self._aggregates.values():
+            events.extend(aggregate.pull_domain_events())
+        self._aggregates.clear()
+        return events
+
+    def discard(self) -> None:
+        """Drop the events of the tracked aggregates, and stop tracking them."""
+        for aggregate in self._aggregates.values():
+            aggregate.clear_domain_events()
+        self._aggregates.clear()
+
+    def publish(self) -> list["DomainEvent"]:
+        """Collect the events of the tracked aggregates and dispatch them.
+
+        Call this once the transaction of the unit of work is committed.
+
+        Returns:
+            list[DomainEvent]: The dispatched events.
+
+        Raises:
+            ValueError: If the collector has no dispatcher.
+        """
+        if self.dispatcher is None:
+            raise ValueError("Publishing domain events requires a dispatcher.")
+        events = self.collect()
+        self.dispatcher.dispatch(events)
+        return events
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["DomainEventCollector"]
@@ -0,0 +1,128 @@
+"""Module defining the batch dispatcher of domain events.
+
+Handlers are registered for an event type, and receive the events of that type, or of
+its subclasses, in batches rather than one call per event. A handler writing the
+events to a message broker or a read model can then process a whole batch in a
+single round trip.
+"""
+
+from collections.abc import Callable, Iterable, Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from flask_boilerplate.domain.primitives.interface_domain_event import DomainEvent
+
+E = TypeVar("E", bound="DomainEvent")
+
+EventHandler = Callable[[Sequence[E]], None]
+
+
+class DomainEventDispatcher:
+    """Dispatcher calling the handlers of domain events with batches of events.
+
+    Events are grouped by type: each handler receives the events of one concrete type at
+    a time, in the order they were raised, split into batches of at most `batch_size`
+    events. If a handler raises an exception, it propagates and the remaining batches
+    are not dispatched.
+
+    Example:
+        >>> dispatcher = DomainEventDispatcher(batch_size=100)
+        >>> dispatcher.register(UserRegistered, send_welcome_emails)
+        >>> dispatcher.dispatch(collector.collect())
+
+    Attributes:
+        batch_size (int): The maximum number of events passed to a handler at once.
+    """
+
+    def __init__(self, batch_size: int = 100) -> None:
+        """Initialize a dispatcher without handlers.
+
+        Args:
+            batch_size (int): The maximum number of events passed to a handler at once.
+
+        Raises:
+            ValueError: If the batch size is not positive.
+        """
+        if batch_size <= 0:
+            raise ValueError(f"The batch size must be positive, got {batch_size}.")
+        self.batch_size = batch_size
+        self._handlers: dict[type, list[EventHandler[Any]]] = {}
+        # The handlers of each concrete event type, including those of its base classes.
+        self._resolved: dict[type, tuple[EventHandler[Any], ...]] = {}
+
+    def register(self, event_type: type[E], handler: EventHandler[E]) -> None:
+        """Register a handler for a type of events and its subclasses.
+
+        Args:
+            event_type (type[E]): The type of events to handle.
+            handler (EventHandler[E]): The function receiving batches of events.
+        """
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._resolved.clear()
+
+    def handlers_for(self, event_type: type) -> tuple[EventHandler[Any], ...]:
+        """Get the handlers of a type of events, including those of its base classes.
+
+        Args:
+            event_type (type): The concrete type of the events.
+
+        Returns:
+            tuple[EventHandler[Any], ...]: The handlers, from the most specific type to the
+            most generic one, in registration order for each type.
+        """
+        try:
+            return self._resolved[event_type]
+        except KeyError:
+            handlers = tuple(handler for base in event_type.__mro__ for handler in self._handlers.get(base, ()))
+            self._resolved[event_type] = handlers
+            return handlers
+
+    def dispatch(self, events: Iterable["DomainEvent"]) -> int:
+        """Dispatch events to their handlers, in batches.
+
+        Args:
+            events (Iterable[DomainEvent]): The events to dispatch.
+
+        Returns:
+            int: The number of handler calls.
+        """
+        groups: dict[type, list[DomainEvent]] = {}
+        for event in events:
+            kind = type(event)
+            group = groups.get(kind)
+            if group is None:
+                groups[kind] = [event]
+            else:
+                group.append(event)
+
+        calls = 0
+        for kind, group in groups.items():
+            handlers = self.handlers_for(kind)
+            if not handlers:
+                continue
+            for batch in _batches(group, self.batch_size):
+                for handler in handlers:
+                    handler(batch)
+                    calls += 1
+        return calls
+
+
+def _batches(events: list["DomainEvent"], size: int) -> Iterable[Sequence["DomainEvent"]]:
+    """Split events into consecutive batches.
+
+    Args:
+        events (list[DomainEvent]): The events to split.
+        size (int): The maximum size of a batch.
+
+    Returns:
+        Iterable[Sequence[DomainEvent]]: The batches, the list itself if it fits in one.
+    """
+    if len(events) <= size:
+        return (events,)
+    iterator = iter(events)
+    return iter(lambda: list(islice(iterator, size)), [])
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["DomainEventDispatcher", "EventHandler"]
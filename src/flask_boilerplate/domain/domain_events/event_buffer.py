@@ -0,0 +1,168 @@
+"""Module defining the bounded buffer of the domain events raised by an aggregate.
+
+An aggregate root keeps the events it raises until the unit of work collects them
+after a commit. A long-lived aggregate that is never committed, or whose events are
+never collected, would otherwise keep every event it ever raised.
+
+`EventBuffer` holds at most `capacity` events, and applies an `OverflowPolicy` when a
+new event does not fit. Events of a type that sets `coalesce = True` supersede the
+pending event of the same type instead of being added next to it, so that an
+aggregate renamed a thousand times only publishes its last rename.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from enum import Enum
+from typing import TYPE_CHECKING, Any, overload
+
+from flask_boilerplate.domain.errors.domain_events_error import DomainEventsError
+
+if TYPE_CHECKING:
+    from flask_boilerplate.domain.primitives.interface_domain_event import DomainEvent
+
+
+class OverflowPolicy(Enum):
+    """What an `EventBuffer` does with a new event when it is full.
+
+    Attributes:
+        RAISE: Reject the new event with a `DomainEventsError`.
+        DROP_OLDEST: Drop the oldest pending event to make room for the new one.
+        DROP_NEWEST: Drop the new event.
+    """
+
+    RAISE = "raise"
+    DROP_OLDEST = "drop_oldest"
+    DROP_NEWEST = "drop_newest"
+
+
+class EventBuffer(Sequence["DomainEvent"]):
+    """Bounded, coalescing buffer of pending domain events, in the order they were raised.
+
+    Example:
+        >>> buffer = EventBuffer(capacity=2, overflow=OverflowPolicy.DROP_OLDEST)
+        >>> buffer.append(first)
+        >>> buffer.append(second)
+        >>> buffer.append(third)
+        >>> list(buffer) == [second, third], buffer.dropped
+        (True, 1)
+
+    Attributes:
+        capacity (int): The maximum number of pending events.
+        overflow (OverflowPolicy): What to do with a new event when the buffer is full.
+        dropped (int): The number of events dropped by the overflow policy so far.
+    """
+
+    __slots__ = ("capacity", "overflow", "dropped", "_events", "_sequence")
+
+    def __init__(self, capacity: int = 1000, overflow: OverflowPolicy = OverflowPolicy.RAISE) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            capacity (int): The maximum number of pending events.
+            overflow (OverflowPolicy): What to do with a new event when the buffer is full.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError(f"The capacity of an event buffer must be positive, got {capacity}.")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.dropped = 0
+        # Coalescing events are keyed by their type, other events by a sequence number.
+        self._events: OrderedDict[Any, DomainEvent] = OrderedDict()
+        self._sequence = 0
+
+    def append(self, event: "DomainEvent") -> None:
+        """Add an event to the buffer.
+
+        A coalescing event replaces the pending event of the same type, and moves to the
+        end of the buffer. Other events are added at the end, applying the overflow
+        policy if the buffer is full.
+
+        Args:
+            event (DomainEvent): The event to add.
+
+        Raises:
+            DomainEventsError: If the buffer is full and its policy is `RAISE`.
+        """
+        events = self._events
+        if event.coalesce:
+            key: Any = type(event)
+            if key in events:
+                events.move_to_end(key)
+                events[key] = event
+                return
+        else:
+            key = self._sequence
+            self._sequence += 1
+
+        if len(events) >= self.capacity:
+            if self.overflow is OverflowPolicy.RAISE:
+                raise DomainEventsError(
+                    f"Cannot buffer {type(event).__name__}: {self.capacity} domain events are already pending."
+                )
+            self.dropped += 1
+            if self.overflow is OverflowPolicy.DROP_NEWEST:
+                return
+            events.popitem(last=False)
+        events[key] = event
+
+    def drain(self) -> list["DomainEvent"]:
+        """Remove and return all the pending events.
+
+        Returns:
+            list[DomainEvent]: The pending events, in the order they were raised.
+        """
+        events = list(self._events.values())
+        self._events.clear()
+        return events
+
+    def clear(self) -> None:
+        """Remove all the pending events."""
+        self._events.clear()
+
+    def __len__(self) -> int:
+        """Get the number of pending events.
+
+        Returns:
+            int: The number of pending events.
+        """
+        return len(self._events)
+
+    def __iter__(self) -> Iterator["DomainEvent"]:
+        """Iterate over the pending events, in the order they were raised.
+
+        Returns:
+            Iterator[DomainEvent]: The pending events.
+        """
+        return iter(self._events.values())
+
+    @overload
+    def __getitem__(self, index: int) -> "DomainEvent": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list["DomainEvent"]: ...
+
+    def __getitem__(self, index: int | slice) -> "DomainEvent | list[DomainEvent]":
+        """Get pending events by position.
+
+        Args:
+            index (int | slice): The position(s) of the events.
+
+        Returns:
+            DomainEvent | list[DomainEvent]: The event, or the list of events of a slice.
+        """
+        return list(self._events.values())[index]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the buffer.
+
+        Returns:
+            str: The pending events and the configuration of the buffer.
+        """
+        return f"EventBuffer({list(self)!r}, capacity={self.capacity}, overflow={self.overflow.name})"
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["EventBuffer", "OverflowPolicy"]
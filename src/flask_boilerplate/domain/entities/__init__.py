@@ -11,47 +11,17 @@ Example:
     >>> entity = EntityExample(id=UUID("..."), name="Example", description="An example entity")
 """
 
-import logging
-import re
-from typing import Any
+from typing import TYPE_CHECKING
 
-from .entity_example import EntityExample
+from flask_boilerplate.domain.shared.lazy_exports import lazy_exports
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+if TYPE_CHECKING:
+    from .entity_example import EntityExample
 
 # Re-export all entities for easy access.
 __all__ = [
     "EntityExample",
 ]
 
-
-def __getattr__(name: str) -> Any:
-    """Lazy-loading mechanism to avoid circular imports.
-    This function dynamically imports entities when they are accessed,
-    ensuring that dependencies are resolved only when needed.
-
-    Args:
-        name (str): The name of the entity to load.
-
-    Returns:
-        Any: The requested entity.
-
-    Raises:
-        AttributeError: If the entity does not exist.
-    """
-
-    def camel_to_snake(name: str) -> str:
-        # Convertit "ExampleEntity" en "example_entity"
-        name = re.sub("(.)([A-Z][a-z]+)", r"\1_\2", name)
-        return re.sub("([a-z0-9])([A-Z])", r"\1_\2", name).lower()
-
-    if not isinstance(name, str):
-        raise TypeError(f"Expected a string for entity name, got {type(name).__name__}")
-    if name in __all__:
-        logger.debug(f"Lazy-loading value object: {name}")
-        # Dynamically import the entity to avoid circular imports.
-        module_name = camel_to_snake(name)
-        module = __import__(f"flask_boilerplate.domain.entities.{module_name}", fromlist=[name])
-        return getattr(module, name)
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+# The module defining each entity, imported on first access.
+__getattr__, __dir__ = lazy_exports(__name__, {"EntityExample": ".entity_example"}, kind="entity")
@@ -10,19 +10,25 @@ that represent their state.
 """
 
 from dataclasses import dataclass, field
-from uuid import UUID, uuid4
+from typing import ClassVar
+from uuid import UUID
 
 from flask_boilerplate.domain.errors.entities_error import EntitiesError
 from flask_boilerplate.domain.primitives.entity import Entity  # Import de la classe abstraite Entity
+from flask_boilerplate.domain.primitives.id_generator import new_id
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityExample(Entity):
     """An example entity in the domain layer.
 
     This entity represents a domain object with a unique identity and attributes.
     It encapsulates business logic related to its identity and state.
 
+    The entity is slotted: its attributes are stored without a per-instance `__dict__`.
+    It tracks the attributes changed by its mutation methods, so that only the changed
+    columns are written back.
+
     Attributes:
         name (str): The name of the entity.
         description (str): A description of the entity.
@@ -31,14 +37,9 @@ class EntityExample(Entity):
 
     name: str
     description: str
-    id: UUID = field(default_factory=uuid4)  # Génère un UUID par défaut
+    id: UUID = field(default_factory=new_id)  # Génère un UUID v7 par défaut
 
-    def __post_init__(self) -> None:
-        """
-        Post-initialization hook to ensure the entity is properly initialized.
-        If no ID is provided, it will be generated by the parent class `Entity`.
-        """
-        super().__init__(id=self.id)  # Assure que l'ID est initialisé par Entity
+    track_changes: ClassVar[bool] = True
 
     def __eq__(self, other: object) -> bool:
         """
@@ -80,7 +81,8 @@ class EntityExample(Entity):
         Args:
             new_name (str): The new name for the entity.
         """
-        self.name = new_name
+        previous, self.name = self.name, new_name
+        self._attribute_changed("name", previous)
 
     def update_description(self, new_description: str) -> None:
         """Update the description of the entity.
@@ -88,7 +90,8 @@ class EntityExample(Entity):
         Args:
             new_description (str): The new description for the entity.
         """
-        self.description = new_description
+        previous, self.description = self.description, new_description
+        self._attribute_changed("description", previous)
 
     def to_dict(self) -> dict[str, str]:
         """
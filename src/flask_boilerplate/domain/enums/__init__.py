@@ -14,33 +14,19 @@ Example:
     MyEnum.VALUE1
 """
 
-from typing import Any
+from typing import TYPE_CHECKING
 
-from .enum_example import EnumExample
+from flask_boilerplate.domain.shared.lazy_exports import lazy_exports
 
-# Re-export all enums here to make them accessible from this module.
-# This allows for a cleaner import structure in other parts of the application.
-# Example:
-# from .my_enum import MyEnum
-# __all__ = ["MyEnum"]
-
-__all__ = ["EnumExample"]
-
-
-def __getattr__(name: str) -> Any:
-    """Lazy-load enums to avoid circular imports.
+if TYPE_CHECKING:
+    from .enum_example import EnumExample
 
-    Args:
-        name (str): The name of the enum to load.
-
-    Returns:
-        Any: The requested enum.
-
-    Raises:
-        AttributeError: If the enum does not exist.
-    """
-    if name in __all__:
-        # Dynamically import the enum to avoid circular imports.
-        module = __import__(f"flask_boilerplate.domain.enums.{name}", fromlist=[name])
-        return getattr(module, name)
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+# Re-export all enums here to make them accessible from this module.
+# Add the module of a new enum to the `lazy_exports()` table below, for example:
+# "MyEnum": ".my_enum"
+__all__ = [
+    "EnumExample",
+]
+
+# The module defining each enum, imported on first access.
+__getattr__, __dir__ = lazy_exports(__name__, {"EnumExample": ".enum_example"}, kind="enum")
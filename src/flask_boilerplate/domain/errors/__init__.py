@@ -1,5 +1,9 @@
+from flask_boilerplate.domain.errors.concurrency_error import ConcurrencyError
+from flask_boilerplate.domain.errors.domain_events_error import DomainEventsError
 from flask_boilerplate.domain.errors.value_objects_error import ValueObjectsError
 
 __all__ = [
+    "ConcurrencyError",
+    "DomainEventsError",
     "ValueObjectsError",
 ]
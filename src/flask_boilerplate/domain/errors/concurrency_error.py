@@ -0,0 +1,27 @@
+from collections.abc import Sequence
+from typing import Any
+
+
+class ConcurrencyError(Exception):
+    """Exception raised when an aggregate was changed concurrently since it was loaded.
+
+    Aggregates are versioned: a change is only written if the stored version is still
+    the version the aggregate was loaded with. Otherwise another transaction changed or
+    deleted it in the meantime, and writing would lose its update. The operation can
+    be retried with a fresh copy of the aggregate.
+
+    Attributes:
+        message (str): The error message describing the issue.
+        ids (list[Any]): The identifiers of the aggregates that may have been changed
+            concurrently, when several were written at once.
+    """
+
+    def __init__(self, message: str, ids: Sequence[Any] = ()) -> None:
+        """Initialize a new ConcurrencyError with a specific message.
+
+        Args:
+            message (str): The error message describing the issue.
+            ids (Sequence[Any]): The identifiers of the aggregates changed concurrently.
+        """
+        super().__init__(message)
+        self.ids = list(ids)
@@ -0,0 +1,17 @@
+class DomainEventsError(Exception):
+    """Base class for exceptions related to Domain Events in the domain layer.
+
+    This class serves as the base exception for all domain event-related errors
+    within the domain layer, such as the overflow of the event buffer of an aggregate.
+
+    Attributes:
+        message (str): The error message describing the issue.
+    """
+
+    def __init__(self, message: str) -> None:
+        """Initialize a new DomainEventsError with a specific message.
+
+        Args:
+            message (str): The error message describing the issue.
+        """
+        super().__init__(message)
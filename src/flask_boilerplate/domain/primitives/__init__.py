@@ -4,20 +4,42 @@ This module serves as the entry point for all primitive domain constructs, such
 value objects, specifications, repositories, domain events, and aggregate roots.
 It re-exports these constructs to make them easily accessible from a single location.
 
+The submodules are imported on first access, with `lazy_exports()`.
+
 Example:
     >>> from flask_boilerplate.domain.primitives import ValueObject, Specification, Repository
     >>> class MyValueObject(ValueObject):
     ...     pass
 """
 
-from typing import Any
+from typing import TYPE_CHECKING
+
+from flask_boilerplate.domain.shared.lazy_exports import lazy_exports
 
-from .aggregate_root import AggregateRoot
-from .domain_service import DomainService
-from .interface_domain_event import DomainEvent, DomainEventBase
-from .repository import Repository, UnitOfWork
-from .specification import AndSpecification, NotSpecification, OrSpecification, Specification
-from .value_object import ValueObject
+if TYPE_CHECKING:
+    from .aggregate_root import AggregateRoot
+    from .async_repository import AsyncRepository, AsyncUnitOfWork
+    from .domain_service import DomainService
+    from .id_generator import (
+        IdGenerator,
+        UuidV4Generator,
+        UuidV7Generator,
+        get_id_generator,
+        new_id,
+        new_ids,
+        set_id_generator,
+    )
+    from .identity_map import IdentityMap
+    from .interface_domain_event import DomainEvent, DomainEventBase
+    from .repository import GetManyResult, Repository, UnitOfWork
+    from .specification import (
+        AndSpecification,
+        CompiledSpecification,
+        NotSpecification,
+        OrSpecification,
+        Specification,
+    )
+    from .value_object import ValueObject
 
 # Re-export all primitive domain constructs for easy access.
 __all__ = [
@@ -26,29 +48,53 @@ __all__ = [
     "AndSpecification",
     "OrSpecification",
     "NotSpecification",
+    "CompiledSpecification",
     "Repository",
+    "GetManyResult",
     "UnitOfWork",
+    "AsyncRepository",
+    "AsyncUnitOfWork",
+    "IdentityMap",
     "DomainEvent",
     "DomainEventBase",
     "AggregateRoot",
     "DomainService",
+    "IdGenerator",
+    "UuidV4Generator",
+    "UuidV7Generator",
+    "get_id_generator",
+    "set_id_generator",
+    "new_id",
+    "new_ids",
 ]
 
-
-def __getattr__(name: str) -> Any:
-    """Lazy-load primitive domain constructs to avoid circular imports.
-
-    Args:
-        name (str): The name of the primitive domain construct to load.
-
-    Returns:
-        Any: The requested primitive domain construct.
-
-    Raises:
-        AttributeError: If the primitive domain construct does not exist.
-    """
-    if name in __all__:
-        # Dynamically import the primitive domain construct to avoid circular imports.
-        module = __import__(f"flask_boilerplate.domain.primitives.{name}", fromlist=[name])
-        return getattr(module, name)
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+# The module defining each primitive domain construct, imported on first access.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ValueObject": ".value_object",
+        "Specification": ".specification",
+        "AndSpecification": ".specification",
+        "OrSpecification": ".specification",
+        "NotSpecification": ".specification",
+        "CompiledSpecification": ".specification",
+        "Repository": ".repository",
+        "GetManyResult": ".repository",
+        "UnitOfWork": ".repository",
+        "AsyncRepository": ".async_repository",
+        "AsyncUnitOfWork": ".async_repository",
+        "IdentityMap": ".identity_map",
+        "DomainEvent": ".interface_domain_event",
+        "DomainEventBase": ".interface_domain_event",
+        "AggregateRoot": ".aggregate_root",
+        "DomainService": ".domain_service",
+        "IdGenerator": ".id_generator",
+        "UuidV4Generator": ".id_generator",
+        "UuidV7Generator": ".id_generator",
+        "get_id_generator": ".id_generator",
+        "set_id_generator": ".id_generator",
+        "new_id": ".id_generator",
+        "new_ids": ".id_generator",
+    },
+    kind="primitive domain construct",
+)
@@ -7,16 +7,26 @@ The aggregate root is the only entry point for modifying the aggregate.
 This module provides the base class `AggregateRoot` that can be inherited to create
 custom aggregate roots. Aggregate roots typically contain entities, value objects, and
 domain events.
+
+The domain events raised by an aggregate are kept in a bounded `EventBuffer` until a
+`DomainEventCollector` collects them, after the unit of work is committed.
+
+Aggregates carry a `version`, for optimistic concurrency control: the persistence
+layer only writes the changes of an aggregate if its stored version is still the one
+it was loaded with, and increments it. A concurrent change raises a
+`ConcurrencyError` instead of being silently overwritten.
 """
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, ClassVar
 from uuid import UUID
 
+from flask_boilerplate.domain.domain_events.event_buffer import EventBuffer, OverflowPolicy
+
 from .interface_domain_event import DomainEvent
 
 
-@dataclass
+@dataclass(slots=True)
 class AggregateRoot:
     """Base class for aggregate roots in the domain layer.
 
@@ -24,11 +34,38 @@ class AggregateRoot:
     It is responsible for maintaining consistency and enforcing invariants within the aggregate.
     The aggregate root is the only entry point for modifying the aggregate.
 
+    The class is slotted, so that subclasses declared with `@dataclass(slots=True)` get
+    a compact, dict-free layout.
+
+    The event buffer is created when the first event is raised, so that aggregates that
+    raise none do not pay for it. Subclasses can change its capacity and overflow policy
+    with the `domain_events_capacity` and `domain_events_overflow` class attributes.
+
     Attributes:
-        domain_events (list[DomainEvent]): A list of domain events raised by the aggregate root.
+        domain_events (EventBuffer): The pending domain events raised by the aggregate root.
+        domain_events_capacity (int): The maximum number of pending domain events.
+        domain_events_overflow (OverflowPolicy): What to do with a new domain event when
+            the maximum number of pending events is reached.
     """
 
-    domain_events: list[DomainEvent] = field(default_factory=list, init=False)
+    domain_events_capacity: ClassVar[int] = 1000
+    domain_events_overflow: ClassVar[OverflowPolicy] = OverflowPolicy.RAISE
+    track_changes: ClassVar[bool] = False
+
+    _domain_events: EventBuffer | None = field(default=None, init=False, repr=False, compare=False)
+    version: int = field(default=0, kw_only=True, compare=False)
+    _changes: set[str] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def domain_events(self) -> EventBuffer:
+        """Get the pending domain events raised by the aggregate root.
+
+        Returns:
+            EventBuffer: The pending domain events, in the order they were raised.
+        """
+        if self._domain_events is None:
+            self._domain_events = EventBuffer(self.domain_events_capacity, self.domain_events_overflow)
+        return self._domain_events
 
     def add_domain_event(self, event: DomainEvent) -> None:
         """Add a domain event to the aggregate root.
@@ -38,15 +75,59 @@ class AggregateRoot:
 
         Args:
             event (DomainEvent): The domain event to add.
+
+        Raises:
+            DomainEventsError: If the buffer of pending events is full and the overflow
+                policy is `OverflowPolicy.RAISE`.
         """
         self.domain_events.append(event)
 
+    def pull_domain_events(self) -> list[DomainEvent]:
+        """Remove and return the pending domain events of the aggregate root.
+
+        Returns:
+            list[DomainEvent]: The pending domain events, in the order they were raised.
+        """
+        if self._domain_events is None:
+            return []
+        return self._domain_events.drain()
+
     def clear_domain_events(self) -> None:
         """Clear all domain events from the aggregate root.
 
         This method is typically called after the domain events have been processed.
         """
-        self.domain_events.clear()
+        if self._domain_events is not None:
+            self._domain_events.clear()
+
+    def changed_attributes(self) -> frozenset[str]:
+        """Get the attributes changed since the aggregate was loaded or last marked clean.
+
+        Returns:
+            frozenset[str]: The names of the changed attributes, always empty if the class
+                does not track changes.
+        """
+        return frozenset(self._changes or ())
+
+    def mark_clean(self) -> None:
+        """Forget the changed attributes, once they are written."""
+        self._changes = None
+
+    def _attribute_changed(self, name: str, previous: Any) -> None:
+        """Record that an attribute changed.
+
+        Mutation methods call this after assigning the new value.
+
+        Args:
+            name (str): The name of the changed attribute.
+            previous (Any): The previous value of the attribute.
+        """
+        if not self.track_changes:
+            return
+        if self._changes is None:
+            self._changes = {name}
+        else:
+            self._changes.add(name)
 
     def __eq__(self, other: Any) -> bool:
         """Compare two aggregate roots for equality.
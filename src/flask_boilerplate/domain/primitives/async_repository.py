@@ -0,0 +1,198 @@
+"""Module defining the asynchronous interfaces of repositories in the domain layer.
+
+`AsyncRepository` and `AsyncUnitOfWork` are the counterparts of `Repository` and
+`UnitOfWork` for asynchronous code: their operations are coroutines, so that a worker
+serving requests on an event loop can keep many queries in flight instead of
+blocking on each of them.
+
+They follow the same contracts: `get_many()` returns a `GetManyResult`, `list()`
+returns all entities or a page of them sorted by identifier, and a unit of work keeps
+an `IdentityMap` of the entities loaded or added within it. `list()` returns an
+asynchronous iterator, so that all entities can be streamed.
+"""
+
+import builtins
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Iterable, Sequence
+from itertools import islice
+from typing import Generic, TypeVar
+
+from .identity_map import IdentityMap
+from .repository import GetManyResult, _sort_by_attributes
+from .specification import Specification
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+
+
+class AsyncRepository(Generic[T, ID], ABC):
+    """Base interface for asynchronous repositories in the domain layer.
+
+    Example:
+        >>> class UserRepository(AsyncRepository[User, UUID]):
+        ...     async def add(self, user: User) -> None:
+        ...         pass
+        ...
+        ...     async def get(self, user_id: UUID) -> User | None:
+        ...         pass
+        ...
+        ...     async def list(self, after: UUID | None = None, limit: int | None = None) -> AsyncIterator[User]:
+        ...         yield user
+        ...
+        ...     async def remove(self, user: User) -> None:
+        ...         pass
+        >>> async for user in repository.list():
+        ...     print(user)
+    """
+
+    @abstractmethod
+    async def add(self, entity: T) -> None:
+        """Add a new entity to the repository.
+
+        Args:
+            entity (T): The entity to add.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(self, id: ID) -> T | None:
+        """Retrieve an entity by its unique identifier.
+
+        Args:
+            id (ID): The unique identifier of the entity.
+
+        Returns:
+            T | None: The entity if found, otherwise None.
+        """
+        raise NotImplementedError
+
+    async def get_many(self, ids: Iterable[ID]) -> GetManyResult[T, ID]:
+        """Retrieve several entities by their unique identifiers.
+
+        The default implementation awaits `get()` once per distinct identifier.
+        Implementations backed by a query engine should override it to load the
+        entities at once.
+
+        Args:
+            ids (Iterable[ID]): The unique identifiers of the entities.
+
+        Returns:
+            GetManyResult[T, ID]: The entities found, in the order of their identifiers,
+                and the identifiers not found.
+        """
+        ids = builtins.list(ids)
+        found = {id: await self.get(id) for id in dict.fromkeys(ids)}
+        return GetManyResult(
+            [entity for entity in map(found.__getitem__, ids) if entity is not None],
+            [id for id, entity in found.items() if entity is None],
+        )
+
+    @abstractmethod
+    def list(self, after: ID | None = None, limit: int | None = None) -> AsyncIterator[T]:
+        """Iterate over the entities of the repository, all of them or a page.
+
+        Without `after` and `limit`, all entities are returned, in no particular order,
+        and should be streamed as they are iterated. With `after` or `limit`, a page of
+        entities is returned, sorted by identifier: see `Repository.list()`.
+
+        Args:
+            after (ID | None): The identifier after which the page starts, None for the
+                first page.
+            limit (int | None): The maximum number of entities of the page.
+
+        Returns:
+            AsyncIterator[T]: The entities.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def remove(self, entity: T) -> None:
+        """Remove an entity from the repository.
+
+        Args:
+            entity (T): The entity to remove.
+        """
+        raise NotImplementedError
+
+    async def find(
+        self,
+        specification: Specification[T],
+        limit: int | None = None,
+        order_by: str | Sequence[str] | None = None,
+    ) -> builtins.list[T]:
+        """Retrieve the entities satisfying a specification.
+
+        The default implementation filters `list()` in Python. Implementations backed by
+        a query engine should override it to push the specification down to storage.
+
+        Args:
+            specification (Specification[T]): The specification to satisfy.
+            limit (int | None): The maximum number of entities to return.
+            order_by (str | Sequence[str] | None): The attribute name(s) to sort by,
+                prefixed with "-" for a descending order.
+
+        Returns:
+            builtins.list[T]: The satisfying entities.
+        """
+        compiled = specification.compile()
+        candidates: Iterable[T] = [entity async for entity in self.list() if compiled.is_satisfied_by(entity)]
+        if order_by:
+            candidates = _sort_by_attributes(candidates, order_by)
+        return builtins.list(islice(candidates, limit))
+
+
+class AsyncUnitOfWork(Generic[T, ID], ABC):
+    """Base interface for the asynchronous Unit of Work pattern in the domain layer.
+
+    Its repositories should look entities up in `identity_map` before querying
+    storage, and `commit()` and `rollback()` should clear it.
+
+    Example:
+        >>> class UserUnitOfWork(AsyncUnitOfWork[User, UUID]):
+        ...     async def commit(self) -> None:
+        ...         pass
+        ...
+        ...     async def rollback(self) -> None:
+        ...         pass
+        ...
+        ...     def repositories(self) -> dict[str, AsyncRepository[User, UUID]]:
+        ...         pass
+    """
+
+    _identity_map: IdentityMap
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Get the identity map of the unit of work, created on first access.
+
+        Returns:
+            IdentityMap: The entities loaded or added within the unit of work.
+        """
+        try:
+            return self._identity_map
+        except AttributeError:
+            self._identity_map = IdentityMap()
+            return self._identity_map
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commit all changes made within the unit of work."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Roll back all changes made within the unit of work."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def repositories(self) -> dict[str, AsyncRepository[T, ID]]:
+        """Get the repositories managed by this unit of work.
+
+        Returns:
+            dict[str, AsyncRepository[T, ID]]: A dictionary of repositories, keyed by name.
+        """
+        raise NotImplementedError
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["AsyncRepository", "AsyncUnitOfWork"]
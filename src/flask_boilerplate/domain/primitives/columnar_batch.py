@@ -0,0 +1,284 @@
+"""Module defining columnar batches and the vectorized evaluation of specifications.
+
+Evaluating a specification one candidate at a time costs several Python-level calls per
+candidate. A `ColumnarBatch` stores the attributes of many candidates as one NumPy array
+per attribute, so that leaf specifications implementing `Specification.array_mask()` can
+evaluate the whole batch with a few array operations. `AndSpecification`,
+`OrSpecification` and `NotSpecification` map to `&`, `|` and `~` on the resulting
+boolean masks.
+
+Leaf specifications without an array implementation are still supported: they are
+evaluated one candidate at a time, and only on the rows that the vectorized operands
+have not already decided.
+
+This module requires NumPy, which is installed with the `vectorized` extra.
+"""
+
+from collections.abc import Iterable, Mapping, Sequence
+from operator import attrgetter
+from typing import Any, Generic, TypeVar
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .specification import (
+    AndSpecification,
+    CompiledSpecification,
+    NotSpecification,
+    OrSpecification,
+    Specification,
+)
+
+T = TypeVar("T")
+
+Mask = NDArray[np.bool_]
+
+
+class ColumnarBatch(Generic[T]):
+    """Batch of candidates whose attributes are stored as arrays.
+
+    Columns are accessible by attribute name, either as items or as attributes, which
+    lets leaf specifications write `batch.score > 10` in `array_mask()`.
+
+    Example:
+        >>> batch = ColumnarBatch.from_entities(users, ["age", "country"])
+        >>> mask = (IsAdult() & LivesIn("FR")).evaluate_batch(batch)
+        >>> adults_in_france = batch.select(mask)
+
+    Attributes:
+        columns (Mapping[str, NDArray[Any]]): The attribute arrays, keyed by attribute name.
+        entities (Sequence[T] | None): The candidates the columns were extracted from, if
+            known. They are required to evaluate specifications without an array
+            implementation, and to select candidates from a mask.
+    """
+
+    def __init__(self, columns: Mapping[str, NDArray[Any]], entities: Sequence[T] | None = None) -> None:
+        """Initialize the batch.
+
+        Args:
+            columns (Mapping[str, NDArray[Any]]): The attribute arrays, keyed by attribute name.
+            entities (Sequence[T] | None): The candidates the columns were extracted from.
+
+        Raises:
+            ValueError: If the columns and the entities do not have the same length.
+        """
+        lengths = {len(column) for column in columns.values()}
+        if entities is not None:
+            lengths.add(len(entities))
+        if len(lengths) > 1:
+            raise ValueError(f"All columns of a batch must have the same length, got {sorted(lengths)}.")
+        self.columns = dict(columns)
+        self.entities = entities
+        self._length = lengths.pop() if lengths else 0
+
+    @classmethod
+    def from_entities(
+        cls,
+        entities: Sequence[T],
+        attributes: Iterable[str],
+        dtypes: Mapping[str, Any] | None = None,
+    ) -> "ColumnarBatch[T]":
+        """Build a batch by extracting attributes from candidates.
+
+        Args:
+            entities (Sequence[T]): The candidates.
+            attributes (Iterable[str]): The names of the attributes to extract.
+            dtypes (Mapping[str, Any] | None): The NumPy dtype of some columns. Other
+                columns use the dtype inferred by NumPy.
+
+        Returns:
+            ColumnarBatch[T]: The batch, keeping a reference to the candidates.
+        """
+        dtypes = dtypes or {}
+        columns = {
+            attribute: np.array(list(map(attrgetter(attribute), entities)), dtype=dtypes.get(attribute))
+            for attribute in attributes
+        }
+        return cls(columns, entities)
+
+    def __len__(self) -> int:
+        """Get the number of candidates in the batch.
+
+        Returns:
+            int: The number of candidates.
+        """
+        return self._length
+
+    def __getitem__(self, attribute: str) -> NDArray[Any]:
+        """Get the array of an attribute.
+
+        Args:
+            attribute (str): The attribute name.
+
+        Returns:
+            NDArray[Any]: The attribute values of all candidates.
+        """
+        return self.columns[attribute]
+
+    def __getattr__(self, attribute: str) -> NDArray[Any]:
+        """Get the array of an attribute.
+
+        Args:
+            attribute (str): The attribute name.
+
+        Returns:
+            NDArray[Any]: The attribute values of all candidates.
+
+        Raises:
+            AttributeError: If the batch has no such column.
+        """
+        try:
+            return self.__dict__["columns"][attribute]  # type: ignore[no-any-return]
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no column {attribute!r}") from None
+
+    def select(self, mask: Mask) -> list[T]:
+        """Get the candidates selected by a mask.
+
+        Args:
+            mask (Mask): The boolean mask, one value per candidate.
+
+        Returns:
+            list[T]: The selected candidates, in batch order.
+        """
+        entities = self._require_entities()
+        return [entities[index] for index in np.flatnonzero(mask).tolist()]
+
+    def _require_entities(self) -> Sequence[T]:
+        """Get the candidates of the batch.
+
+        Returns:
+            Sequence[T]: The candidates.
+
+        Raises:
+            ValueError: If the batch was built without its candidates.
+        """
+        if self.entities is None:
+            raise ValueError("This operation requires a batch built with its entities.")
+        return self.entities
+
+
+def evaluate_mask(specification: Specification[T], batch: ColumnarBatch[T]) -> Mask:
+    """Evaluate a specification over a columnar batch.
+
+    Args:
+        specification (Specification[T]): The specification to evaluate.
+        batch (ColumnarBatch[T]): The candidates.
+
+    Returns:
+        Mask: One boolean per candidate, True if the candidate satisfies the specification.
+    """
+    return _evaluate(specification, batch, np.ones(len(batch), dtype=np.bool_), {})
+
+
+def _vectorized(specification: Specification[T], batch: ColumnarBatch[T], cache: dict[int, Mask | None]) -> Mask | None:
+    """Evaluate a specification over the whole batch if all its leaves are vectorizable.
+
+    Args:
+        specification (Specification[T]): The specification to evaluate.
+        batch (ColumnarBatch[T]): The candidates.
+        cache (dict[int, Mask | None]): The results already computed, by node identity.
+
+    Returns:
+        Mask | None: The mask, or None if a leaf has no array implementation.
+    """
+    key = id(specification)
+    if key in cache:
+        return cache[key]
+
+    kind = type(specification)
+    mask: Mask | None
+    if isinstance(specification, CompiledSpecification):
+        mask = _vectorized(specification.specification, batch, cache)
+    elif kind is AndSpecification or kind is OrSpecification:
+        first = _vectorized(specification.first, batch, cache)  # type: ignore[attr-defined]
+        second = _vectorized(specification.second, batch, cache)  # type: ignore[attr-defined]
+        if first is None or second is None:
+            mask = None
+        else:
+            mask = first & second if kind is AndSpecification else first | second
+    elif kind is NotSpecification:
+        inner = _vectorized(specification.specification, batch, cache)  # type: ignore[attr-defined]
+        mask = None if inner is None else ~inner
+    else:
+        result = specification.array_mask(batch)
+        mask = None if result is None else np.asarray(result, dtype=np.bool_)
+
+    cache[key] = mask
+    return mask
+
+
+def _evaluate(
+    specification: Specification[T],
+    batch: ColumnarBatch[T],
+    active: Mask,
+    cache: dict[int, Mask | None],
+) -> Mask:
+    """Evaluate a specification on the active rows of a batch.
+
+    Vectorizable operands are evaluated first, so that the operands evaluated one
+    candidate at a time only run on the rows they can still change.
+
+    Args:
+        specification (Specification[T]): The specification to evaluate.
+        batch (ColumnarBatch[T]): The candidates.
+        active (Mask): The rows to evaluate. The result is unspecified on other rows.
+        cache (dict[int, Mask | None]): The vectorized results already computed.
+
+    Returns:
+        Mask: The result, valid on the active rows.
+    """
+    mask = _vectorized(specification, batch, cache)
+    if mask is not None:
+        return mask
+
+    if isinstance(specification, CompiledSpecification):
+        return _evaluate(specification.specification, batch, active, cache)
+
+    kind = type(specification)
+    if kind is AndSpecification:
+        operands = (specification.first, specification.second)  # type: ignore[attr-defined]
+        deferred = []
+        for operand in operands:
+            operand_mask = _vectorized(operand, batch, cache)
+            if operand_mask is None:
+                deferred.append(operand)
+            else:
+                active = active & operand_mask
+        for operand in deferred:
+            if not active.any():
+                break
+            active = active & _evaluate(operand, batch, active, cache)
+        return active
+
+    if kind is OrSpecification:
+        operands = (specification.first, specification.second)  # type: ignore[attr-defined]
+        satisfied = np.zeros(len(batch), dtype=np.bool_)
+        deferred = []
+        for operand in operands:
+            operand_mask = _vectorized(operand, batch, cache)
+            if operand_mask is None:
+                deferred.append(operand)
+            else:
+                satisfied |= operand_mask
+        pending = active & ~satisfied
+        for operand in deferred:
+            if not pending.any():
+                break
+            satisfied |= _evaluate(operand, batch, pending, cache) & pending
+            pending &= ~satisfied
+        return satisfied
+
+    if kind is NotSpecification:
+        return ~_evaluate(specification.specification, batch, active, cache)  # type: ignore[attr-defined]
+
+    entities = batch._require_entities()
+    predicate = specification.is_satisfied_by
+    result = np.zeros(len(batch), dtype=np.bool_)
+    for index in np.flatnonzero(active).tolist():
+        result[index] = predicate(entities[index])
+    return result
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["ColumnarBatch", "evaluate_mask"]
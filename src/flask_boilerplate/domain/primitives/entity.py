@@ -1,6 +1,36 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import suppress
+from functools import cache
+from typing import Any, ClassVar, Optional, TypeVar
+
+from .hydration import hydrator
+from .id_generator import new_id
+
+E = TypeVar("E", bound="Entity")
+
+# A function called with the entity, the name of the changed attribute and its previous value.
+AttributeObserver = Callable[["Entity", str, Any], None]
+
+
+@cache
+def _copied_slots(cls: type) -> tuple[str, ...]:
+    """Get the slots of an entity class copied by `Entity.__copy__()`.
+
+    Args:
+        cls (type): The entity class.
+
+    Returns:
+        tuple[str, ...]: The slots of the class and of its bases, except the observers
+            and the recorded changes.
+    """
+    names: dict[str, None] = {}
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            names[name] = None
+    return tuple(name for name in names if name not in ("__dict__", "__weakref__", "_observers", "_changes"))
 
 
 class Entity(ABC):
@@ -10,18 +40,151 @@ class Entity(ABC):
     An entity is an object that is defined by its identity rather than its attributes.
     Entities have a unique identifier and can be compared based on this identifier.
 
+    The identifier is stored in a slot, so that subclasses declared with
+    `@dataclass(slots=True)` (or their own `__slots__`) get a compact, dict-free layout.
+    Subclasses without slots keep a regular `__dict__` for their other attributes.
+
+    Dataclass subclasses read back from the persistence layer can be rebuilt without
+    running their constructor with `from_primitives_trusted()` and `hydrate_many()`.
+
+    An entity can have several observers, such as the in-memory repositories keeping
+    indexes on its attributes, for instance a primary repository and a read model.
+    Mutation methods report the attributes they change with
+    `_attribute_changed()`; plain attribute assignments are not observed, so that
+    constructing and hydrating entities stays free of any hook.
+
+    Subclasses can opt in to change tracking by setting `track_changes` to True: the
+    names of the attributes reported by `_attribute_changed()` are then recorded until
+    `mark_clean()` is called, so that the persistence layer only writes the changed
+    columns. The record is created on the first change, so that unchanged entities do
+    not pay for it.
+
     Attributes:
         id (uuid.UUID): The unique identifier of the entity.
+        track_changes (bool): Whether the changed attributes are recorded.
     """
 
+    __slots__ = ("id", "_observers", "_changes")
+
+    track_changes: ClassVar[bool] = False
+
+    _observers: tuple[AttributeObserver, ...]
+    _changes: set[str]
+
     def __init__(self, id: Optional[uuid.UUID] = None) -> None:
         """
         Initialize a new entity with a unique identifier.
 
         Args:
-            id (Optional[uuid.UUID]): The unique identifier of the entity. If not provided, a new UUID is generated.
+            id (Optional[uuid.UUID]): The unique identifier of the entity. If not provided, a new UUID
+                is generated by `new_id()`.
+        """
+        self.id: uuid.UUID = id or new_id()
+
+    @classmethod
+    def from_primitives_trusted(cls: type[E], primitives: Mapping[Any, Any]) -> E:
+        """Rebuild an entity from trusted attribute values, without validation.
+
+        Only use this for data read back from the persistence layer, which was validated
+        when it was written. The class must be a dataclass.
+
+        Args:
+            primitives (Mapping[Any, Any]): The attribute values, keyed by field name.
+
+        Returns:
+            E: The entity.
+        """
+        return hydrator(cls)(primitives)
+
+    @classmethod
+    def hydrate_many(cls: type[E], rows: Iterable[Mapping[Any, Any]]) -> list[E]:
+        """Rebuild entities from trusted attribute values, without validation.
+
+        Args:
+            rows (Iterable[Mapping[Any, Any]]): The attribute values of each entity, keyed
+                by field name.
+
+        Returns:
+            list[E]: The entities, in the order of the rows.
+        """
+        return list(map(hydrator(cls), rows))
+
+    def attach_observer(self, observer: AttributeObserver) -> None:
+        """Register a function notified when a mutation method changes an attribute.
+
+        Registering an observer that is already registered does nothing.
+
+        Args:
+            observer (AttributeObserver): The function to notify.
+        """
+        observers = getattr(self, "_observers", ())
+        if observer not in observers:
+            self._observers = (*observers, observer)
+
+    def detach_observer(self, observer: AttributeObserver) -> None:
+        """Unregister an observer of the entity, if it is registered.
+
+        Args:
+            observer (AttributeObserver): The function to stop notifying.
+        """
+        observers = getattr(self, "_observers", ())
+        if observer in observers:
+            remaining = tuple(current for current in observers if current != observer)
+            if remaining:
+                self._observers = remaining
+            else:
+                del self._observers
+
+    def changed_attributes(self) -> frozenset[str]:
+        """Get the attributes changed since the entity was loaded or last marked clean.
+
+        Returns:
+            frozenset[str]: The names of the changed attributes, always empty if the class
+                does not track changes.
+        """
+        return frozenset(getattr(self, "_changes", ()))
+
+    def mark_clean(self) -> None:
+        """Forget the changed attributes, once they are written."""
+        if hasattr(self, "_changes"):
+            del self._changes
+
+    def _attribute_changed(self, name: str, previous: Any) -> None:
+        """Record that an attribute changed, and notify the observers of the entity.
+
+        Mutation methods call this after assigning the new value.
+
+        Args:
+            name (str): The name of the changed attribute.
+            previous (Any): The previous value of the attribute.
+        """
+        if self.track_changes:
+            try:
+                self._changes.add(name)
+            except AttributeError:
+                self._changes = {name}
+        for observer in getattr(self, "_observers", ()):
+            observer(self, name, previous)
+
+    def __copy__(self: E) -> E:
+        """Copy the entity, without its observers and its recorded changes.
+
+        Caches hand out copies of the entities they keep, so that the copies can be
+        changed and tracked independently of the kept entity.
+
+        Returns:
+            E: A shallow copy of the entity.
         """
-        self.id: uuid.UUID = id or uuid.uuid4()
+        cls = type(self)
+        copied = cls.__new__(cls)
+        for name in _copied_slots(cls):
+            # Slots that were never set stay unset in the copy.
+            with suppress(AttributeError):
+                object.__setattr__(copied, name, object.__getattribute__(self, name))
+        state = getattr(self, "__dict__", None)
+        if state:
+            copied.__dict__.update(state)
+        return copied
 
     @abstractmethod
     def __eq__(self, other: Any) -> bool:
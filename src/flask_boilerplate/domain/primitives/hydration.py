@@ -0,0 +1,101 @@
+"""Module implementing the trusted hydration of entities and value objects.
+
+Data read back from our own persistence layer was validated when it was written.
+Rebuilding it through the regular constructors runs the validation again, along with
+`__post_init__` hooks and default factories whose values are immediately replaced.
+
+`hydrator()` generates, once per dataclass, a function building an instance from a
+mapping of attribute values without calling `__init__`: it allocates the instance and
+stores each field directly, through its slot descriptor when the class overrides
+`__setattr__`. Like the code generated by `dataclasses` and `CompiledSpecification`, it
+is plain Python source compiled with `exec()`, so each field costs a few opcodes.
+
+The hydrated values are trusted: they must already have the types of the fields. Use
+the regular constructors for any input that does not come from the persistence layer.
+"""
+
+from collections.abc import Callable, Mapping
+from dataclasses import MISSING, fields, is_dataclass
+from inspect import getattr_static
+from types import MemberDescriptorType
+from typing import Any, TypeVar
+
+H = TypeVar("H")
+
+Hydrator = Callable[[Mapping[Any, Any]], H]
+
+# The generated hydrators, by class. A plain dictionary keeps the lookup cheap enough
+# for `from_primitives_trusted()` to be called once per row.
+_hydrators: dict[type, Callable[[Mapping[Any, Any]], Any]] = {}
+
+
+def hydrator(cls: type[H]) -> Hydrator[H]:
+    """Get the function building instances of a dataclass without validation.
+
+    The function takes a mapping of field values, keyed by field name. Fields with a
+    default value or a default factory may be missing from the mapping; other fields
+    are required.
+
+    Args:
+        cls (type[H]): The dataclass to hydrate.
+
+    Returns:
+        Hydrator[H]: The hydration function of the class.
+
+    Raises:
+        TypeError: If the class is not a dataclass.
+    """
+    try:
+        return _hydrators[cls]
+    except KeyError:
+        hydrate = _hydrators[cls] = _build_hydrator(cls)
+        return hydrate
+
+
+def _build_hydrator(cls: type[H]) -> Hydrator[H]:
+    """Generate the hydration function of a dataclass.
+
+    Args:
+        cls (type[H]): The dataclass to hydrate.
+
+    Returns:
+        Hydrator[H]: The hydration function of the class.
+
+    Raises:
+        TypeError: If the class is not a dataclass.
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"Trusted hydration requires a dataclass, got {cls.__qualname__}.")
+
+    namespace: dict[str, Any] = {"__builtins__": {}, "new": object.__new__, "setattr": object.__setattr__, "cls": cls}
+    lines = ["def hydrate(row):", "    self = new(cls)"]
+    plain = cls.__setattr__ is object.__setattr__
+    for index, field in enumerate(fields(cls)):
+        name = repr(field.name)
+        if field.default is not MISSING:
+            namespace[f"default_{index}"] = field.default
+            value = f"row[{name}] if {name} in row else default_{index}"
+        elif field.default_factory is not MISSING:
+            namespace[f"factory_{index}"] = field.default_factory
+            value = f"row[{name}] if {name} in row else factory_{index}()"
+        else:
+            value = f"row[{name}]"
+
+        # Classes overriding `__setattr__`, such as frozen dataclasses which override it
+        # to raise, are stored into through their slot descriptors or `object.__setattr__`.
+        descriptor = getattr_static(cls, field.name, None)
+        if plain:
+            lines.append(f"    self.{field.name} = {value}")
+        elif isinstance(descriptor, MemberDescriptorType):
+            namespace[f"set_{index}"] = descriptor.__set__
+            lines.append(f"    set_{index}(self, {value})")
+        else:
+            lines.append(f"    setattr(self, {name}, {value})")
+    lines.append("    return self")
+
+    exec("\n".join(lines), namespace)  # nosec B102
+    return namespace["hydrate"]  # type: ignore[no-any-return]
+
+
+# Add the function to __all__ for re-export in the parent module.
+__all__ = ["Hydrator", "hydrator"]
@@ -0,0 +1,152 @@
+"""Module defining the identity map of a unit of work.
+
+Within a unit of work, loading the same entity twice should neither go back to
+storage nor return two objects: changes made through one of them would be invisible
+through the other, and the last one saved would silently win.
+
+`IdentityMap` keeps the entities loaded or added within a unit of work, by kind and
+identifier. Repositories look an entity up in the map before querying storage, and
+register the entities they load, so that every load of an identifier returns the
+same instance. The unit of work clears the map when its transaction ends.
+
+The entities removed from the map are kept aside until then, so that the unit of work
+still collects the domain events raised by aggregates deleted in its transaction.
+"""
+
+from collections.abc import Hashable, Iterator
+from typing import Any
+
+
+class IdentityMap:
+    """Map of the entities loaded within a unit of work, by kind and identifier.
+
+    The kind separates the identifiers of different types of entities, typically the
+    table or the class of the entities.
+
+    Example:
+        >>> identity_map = IdentityMap()
+        >>> identity_map.add(users_table, user.id, user)
+        >>> identity_map.get(users_table, user.id) is user
+        True
+        >>> identity_map.hits, identity_map.misses
+        (1, 0)
+
+    Attributes:
+        hits (int): The number of lookups that found an entity, since the map was created.
+        misses (int): The number of lookups that found none, since the map was created.
+    """
+
+    __slots__ = ("_entities", "_removed", "hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize an empty identity map."""
+        self._entities: dict[Hashable, dict[Any, Any]] = {}
+        self._removed: list[Any] = []
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, kind: Hashable, id: Any) -> Any | None:
+        """Look an entity up, counting a hit or a miss.
+
+        Args:
+            kind (Hashable): The kind of the entity.
+            id (Any): The identifier of the entity.
+
+        Returns:
+            Any | None: The entity if it is in the map, otherwise None.
+        """
+        entities = self._entities.get(kind)
+        entity = None if entities is None else entities.get(id)
+        if entity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entity
+
+    def entities(self, kind: Hashable) -> dict[Any, Any]:
+        """Get the entities of a kind, without counting lookups.
+
+        Repositories use it to look up many identifiers at once.
+
+        Args:
+            kind (Hashable): The kind of the entities.
+
+        Returns:
+            dict[Any, Any]: The entities of the kind, by identifier. Changing the dictionary
+            changes the map.
+        """
+        entities = self._entities.get(kind)
+        if entities is None:
+            entities = self._entities[kind] = {}
+        return entities
+
+    def add(self, kind: Hashable, id: Any, entity: Any) -> Any:
+        """Register an entity, unless the map already has one with the same identifier.
+
+        Args:
+            kind (Hashable): The kind of the entity.
+            id (Any): The identifier of the entity.
+            entity (Any): The entity to register.
+
+        Returns:
+            Any: The entity of the map for this identifier: the registered entity, or
+            the one the map already had.
+        """
+        return self.entities(kind).setdefault(id, entity)
+
+    def remove(self, kind: Hashable, id: Any, entity: Any = None) -> None:
+        """Unregister an entity, if the map has it, and keep it among the removed entities.
+
+        Args:
+            kind (Hashable): The kind of the entity.
+            id (Any): The identifier of the entity.
+            entity (Any): The removed entity, kept even if the map did not have it. By
+                default, the entity the map had for this identifier.
+        """
+        entities = self._entities.get(kind)
+        registered = None if entities is None else entities.pop(id, None)
+        for removed in (registered, entity):
+            if removed is not None and all(removed is not other for other in self._removed):
+                self._removed.append(removed)
+
+    def removed(self) -> list[Any]:
+        """Get the entities removed since the map was last cleared.
+
+        Returns:
+            list[Any]: The removed entities, in the order of their removal.
+        """
+        return list(self._removed)
+
+    def clear(self) -> None:
+        """Unregister all the entities, and forget the removed ones. The counters are kept."""
+        self._entities.clear()
+        self._removed.clear()
+
+    def __len__(self) -> int:
+        """Get the number of registered entities.
+
+        Returns:
+            int: The number of registered entities.
+        """
+        return sum(map(len, self._entities.values()))
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the registered entities.
+
+        Returns:
+            Iterator[Any]: The entities, grouped by kind.
+        """
+        for entities in self._entities.values():
+            yield from entities.values()
+
+    def __repr__(self) -> str:
+        """Return a string representation of the identity map.
+
+        Returns:
+            str: The size and the counters of the map.
+        """
+        return f"IdentityMap(entities={len(self)}, hits={self.hits}, misses={self.misses})"
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["IdentityMap"]
@@ -10,8 +10,9 @@ information necessary to describe the event.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import ClassVar
 
 
 class DomainEvent(ABC):
@@ -34,8 +35,15 @@ class DomainEvent(ABC):
         ...     @property
         ...     def event_name(self) -> str:
         ...         return "user_registered"
+
+    Attributes:
+        coalesce (bool): Whether an event of this type supersedes the pending event of
+            the same type raised by the same aggregate, such as a change of state of
+            which only the latest matters.
     """
 
+    coalesce: ClassVar[bool] = False
+
     @property
     @abstractmethod
     def event_name(self) -> str:
@@ -60,7 +68,7 @@ class DomainEvent(ABC):
         raise NotImplementedError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEventBase(DomainEvent):
     """Base implementation of the `DomainEvent` interface.
 
@@ -78,7 +86,9 @@ class DomainEventBase(DomainEvent):
         ...         return "user_registered"
     """
 
-    timestamp: datetime
+    # The explicit `field()` keeps dataclasses from taking the inherited abstract property
+    # as the default value, and the slot overrides that property on the instances.
+    timestamp: datetime = field()
 
     @property
     def event_name(self) -> str:
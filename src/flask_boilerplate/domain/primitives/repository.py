@@ -6,16 +6,58 @@ the details of the underlying data storage.
 
 This module provides the base interfaces `Repository` and `UnitOfWork` that can be
 implemented to create custom repositories and transaction management mechanisms.
+
+A unit of work keeps an `IdentityMap` of the entities loaded or added within it, so
+that repositories return the same instance for repeated loads of an entity.
+
+`Repository.get_many()` resolves a list of identifiers at once, instead of one `get()`
+per identifier, and returns a `GetManyResult`: the entities found, in the order of the
+identifiers, along with the identifiers that were not found.
 """
 
+import builtins
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
-from typing import Generic, Optional, TypeVar
+from collections.abc import Iterable, Sequence
+from itertools import islice
+from operator import attrgetter
+from typing import Generic, TypeVar
+
+from .identity_map import IdentityMap
+from .specification import Specification
 
 T = TypeVar("T")
 ID = TypeVar("ID")
 
 
+class GetManyResult(builtins.list[T], Generic[T, ID]):
+    """The entities found by `Repository.get_many()`, in the order of their identifiers.
+
+    The result is a list of the entities found, so that callers that do not care about
+    the missing identifiers can use it as such.
+
+    Example:
+        >>> result = repository.get_many([first_id, unknown_id, second_id])
+        >>> [entity.id for entity in result]
+        [first_id, second_id]
+        >>> result.missing
+        [unknown_id]
+
+    Attributes:
+        missing (builtins.list[ID]): The identifiers that were not found, in the order of
+            their first occurrence.
+    """
+
+    def __init__(self, entities: Iterable[T] = (), missing: Iterable[ID] = ()) -> None:
+        """Initialize the result.
+
+        Args:
+            entities (Iterable[T]): The entities found.
+            missing (Iterable[ID]): The identifiers that were not found.
+        """
+        super().__init__(entities)
+        self.missing: builtins.list[ID] = builtins.list(missing)
+
+
 class Repository(Generic[T, ID], ABC):
     """Base interface for repositories in the domain layer.
 
@@ -30,10 +72,10 @@ class Repository(Generic[T, ID], ABC):
         ...     def add(self, user: User) -> None:
         ...         pass
         ...
-        ...     def get(self, user_id: UUID) -> Optional[User]:
+        ...     def get(self, user_id: UUID) -> User | None:
         ...         pass
         ...
-        ...     def list(self) -> Iterable[User]:
+        ...     def list(self, after: UUID | None = None, limit: int | None = None) -> Iterable[User]:
         ...         pass
         ...
         ...     def remove(self, user: User) -> None:
@@ -50,23 +92,59 @@ class Repository(Generic[T, ID], ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def get(self, id: ID) -> Optional[T]:
+    def get(self, id: ID) -> T | None:
         """Retrieve an entity by its unique identifier.
 
         Args:
             id (ID): The unique identifier of the entity.
 
         Returns:
-            Optional[T]: The entity if found, otherwise None.
+            T | None: The entity if found, otherwise None.
         """
         raise NotImplementedError
 
+    def get_many(self, ids: Iterable[ID]) -> GetManyResult[T, ID]:
+        """Retrieve several entities by their unique identifiers.
+
+        The default implementation calls `get()` once per distinct identifier.
+        Implementations backed by a query engine should override it to load the
+        entities at once.
+
+        Args:
+            ids (Iterable[ID]): The unique identifiers of the entities. An identifier
+                given several times yields its entity as many times.
+
+        Returns:
+            GetManyResult[T, ID]: The entities found, in the order of their identifiers,
+                and the identifiers not found.
+        """
+        ids = builtins.list(ids)
+        found = {id: self.get(id) for id in dict.fromkeys(ids)}
+        return GetManyResult(
+            [entity for entity in map(found.__getitem__, ids) if entity is not None],
+            [id for id, entity in found.items() if entity is None],
+        )
+
     @abstractmethod
-    def list(self) -> Iterable[T]:
-        """Retrieve all entities from the repository.
+    def list(self, after: ID | None = None, limit: int | None = None) -> Iterable[T]:
+        """Retrieve the entities of the repository, all of them or a page.
+
+        Without `after` and `limit`, all entities are returned, in no particular order.
+        Implementations backed by a large storage should stream them as the result is
+        iterated, rather than load them all at once.
+
+        With `after` or `limit`, a page of entities is returned, sorted by identifier:
+        the entities whose identifier is greater than `after`. Passing the identifier of
+        the last entity of a page as `after` gets the next page (keyset pagination),
+        whose cost does not depend on how deep the page is.
+
+        Args:
+            after (ID | None): The identifier after which the page starts, None for the
+                first page.
+            limit (int | None): The maximum number of entities of the page.
 
         Returns:
-            Iterable[T]: A collection of all entities.
+            Iterable[T]: The entities.
         """
         raise NotImplementedError
 
@@ -79,6 +157,52 @@ class Repository(Generic[T, ID], ABC):
         """
         raise NotImplementedError
 
+    def find(
+        self,
+        specification: Specification[T],
+        limit: int | None = None,
+        order_by: str | Sequence[str] | None = None,
+    ) -> builtins.list[T]:
+        """Retrieve the entities satisfying a specification.
+
+        The default implementation filters `list()` in Python. Implementations backed by
+        a query engine should override it to push the specification down to storage.
+
+        Args:
+            specification (Specification[T]): The specification to satisfy.
+            limit (int | None): The maximum number of entities to return.
+            order_by (str | Sequence[str] | None): The attribute name(s) to sort by,
+                prefixed with "-" for a descending order.
+
+        Returns:
+            builtins.list[T]: The satisfying entities.
+        """
+        candidates: Iterable[T] = specification.compile().filter_many(self.list())
+        if order_by:
+            candidates = _sort_by_attributes(candidates, order_by)
+        return list(islice(candidates, limit))
+
+
+def _sort_by_attributes(entities: Iterable[T], order_by: str | Sequence[str]) -> list[T]:
+    """Sort entities by one or several attributes.
+
+    Args:
+        entities (Iterable[T]): The entities to sort.
+        order_by (str | Sequence[str]): The attribute name(s) to sort by, prefixed with
+            "-" for a descending order.
+
+    Returns:
+        list[T]: The sorted entities.
+    """
+    keys = [order_by] if isinstance(order_by, str) else list(order_by)
+    result = list(entities)
+    # Sorting is stable, so sorting by the least significant key first yields a
+    # lexicographic order whatever the direction of each key.
+    for key in reversed(keys):
+        descending = key.startswith("-")
+        result.sort(key=attrgetter(key.lstrip("-")), reverse=descending)
+    return result
+
 
 class UnitOfWork(Generic[T, ID], ABC):
     """Base interface for the Unit of Work pattern in the domain layer.
@@ -88,6 +212,8 @@ class UnitOfWork(Generic[T, ID], ABC):
     a single unit.
 
     Subclasses should implement the methods to provide specific transaction management.
+    Their repositories should look entities up in `identity_map` before querying
+    storage, and `commit()` and `rollback()` should clear it.
 
     Example:
         >>> class UserUnitOfWork(UnitOfWork[User, UUID]):
@@ -101,6 +227,21 @@ class UnitOfWork(Generic[T, ID], ABC):
         ...         pass
     """
 
+    _identity_map: IdentityMap
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Get the identity map of the unit of work, created on first access.
+
+        Returns:
+            IdentityMap: The entities loaded or added within the unit of work.
+        """
+        try:
+            return self._identity_map
+        except AttributeError:
+            self._identity_map = IdentityMap()
+            return self._identity_map
+
     @abstractmethod
     def commit(self) -> None:
         """Commit all changes made within the unit of work."""
@@ -122,4 +263,4 @@ class UnitOfWork(Generic[T, ID], ABC):
 
 
 # Add the classes to __all__ for re-export in the parent module.
-__all__ = ["Repository", "UnitOfWork"]
+__all__ = ["GetManyResult", "Repository", "UnitOfWork"]
@@ -7,10 +7,20 @@ pattern, which allows for reusable and composable business logic.
 This module provides a base class `Specification` that can be inherited to create
 custom specifications. Specifications can be combined using logical operators
 (`&`, `|`, `~`) to create complex conditions.
+
+Composite specifications are evaluated recursively, one method call per node and per
+candidate. Hot paths that evaluate the same rule tree over many candidates should call
+`Specification.compile()` once and reuse the resulting `CompiledSpecification`, which
+flattens the tree into a single evaluator and orders its operands by declared cost and
+selectivity.
 """
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from .columnar_batch import ColumnarBatch, Mask
 
 T = TypeVar("T")
 
@@ -34,8 +44,18 @@ class Specification(ABC, Generic[T]):
         >>> user = User(is_active=True)
         >>> active_spec.is_satisfied_by(user)
         True
+
+    Attributes:
+        cost (float): Relative cost of one evaluation of the specification. Used by
+            `compile()` to evaluate cheap operands first.
+        selectivity (float): Estimated fraction of candidates satisfying the
+            specification, between 0 and 1. Used by `compile()` to evaluate the
+            operands most likely to short-circuit first.
     """
 
+    cost: float = 1.0
+    selectivity: float = 0.5
+
     @abstractmethod
     def is_satisfied_by(self, candidate: T) -> bool:
         """Check if the candidate satisfies the specification.
@@ -48,6 +68,64 @@ class Specification(ABC, Generic[T]):
         """
         raise NotImplementedError
 
+    def column_expression(self, columns: Any) -> Any:
+        """Translate the specification into a criterion over storage columns.
+
+        Persistence adapters call this method to push the specification down to the
+        storage engine instead of evaluating it in Python. The `columns` argument exposes
+        the columns storing the candidates by attribute name, and their operators build
+        the criterion, which keeps the domain layer free of any persistence import.
+
+        Example:
+            >>> class NameIs(Specification[User]):
+            ...     def column_expression(self, columns: Any) -> Any:
+            ...         return columns.name == self.name
+
+        Args:
+            columns (Any): The storage columns, accessible by attribute name.
+
+        Returns:
+            Any: The criterion, or None if the specification cannot be translated.
+        """
+        return None
+
+    def array_mask(self, batch: "ColumnarBatch[T]") -> Any:
+        """Evaluate the specification over a whole columnar batch at once.
+
+        Leaf specifications implement this method to support the vectorized evaluation
+        of `evaluate_batch()`, using the NumPy arrays of the batch columns.
+
+        Example:
+            >>> class IsAdult(Specification[User]):
+            ...     def array_mask(self, batch: ColumnarBatch[User]) -> Any:
+            ...         return batch.age >= 18
+
+        Args:
+            batch (ColumnarBatch[T]): The candidates, with one array per attribute.
+
+        Returns:
+            Any: A boolean array with one value per candidate, or None if the
+            specification has no array implementation.
+        """
+        return None
+
+    def evaluate_batch(self, batch: "ColumnarBatch[T]") -> "Mask":
+        """Evaluate the specification over a columnar batch.
+
+        Leaves implementing `array_mask()` are evaluated with array operations, and the
+        other leaves one candidate at a time, on the rows left undecided.
+
+        Args:
+            batch (ColumnarBatch[T]): The candidates, with one array per attribute.
+
+        Returns:
+            Mask: One boolean per candidate, True if it satisfies the specification.
+        """
+        # Imported here so that NumPy is only required by the vectorized evaluation.
+        from .columnar_batch import evaluate_mask
+
+        return evaluate_mask(self, batch)
+
     def __and__(self, other: "Specification[T]") -> "AndSpecification[T]":
         """Combine two specifications using the logical AND operator.
 
@@ -78,6 +156,23 @@ class Specification(ABC, Generic[T]):
         """
         return NotSpecification(self)
 
+    def compile(self, reorder: bool = True) -> "CompiledSpecification[T]":
+        """Flatten the specification tree into a single evaluator.
+
+        Nested `AndSpecification` and `OrSpecification` nodes are merged into n-ary
+        conjunctions and disjunctions, double negations are removed, and the whole tree
+        is turned into one function calling the leaf specifications directly.
+
+        Reordering assumes that leaf specifications are free of side effects.
+
+        Args:
+            reorder (bool): Whether to reorder operands by declared cost and selectivity.
+
+        Returns:
+            CompiledSpecification[T]: The compiled specification.
+        """
+        return CompiledSpecification(self, reorder=reorder)
+
 
 class AndSpecification(Specification[T]):
     """Specification representing the logical AND of two specifications."""
@@ -152,5 +247,191 @@ class NotSpecification(Specification[T]):
         return not self.specification.is_satisfied_by(candidate)
 
 
+class CompiledSpecification(Specification[T]):
+    """Specification tree flattened into a single evaluator.
+
+    Instances are created by `Specification.compile()`. The compiled evaluator keeps the
+    short-circuit semantics of the original tree, and exposes bulk helpers that avoid
+    one Python-level call per node and per candidate. A tree nested too deeply for the
+    parser is evaluated recursively instead.
+
+    Attributes:
+        specification (Specification[T]): The specification that was compiled.
+        source (str): The generated boolean expression, useful for debugging.
+        cost (float): Expected cost of one evaluation, derived from the operands.
+        selectivity (float): Estimated fraction of satisfying candidates.
+    """
+
+    def __init__(self, specification: Specification[T], reorder: bool = True) -> None:
+        """Initialize the CompiledSpecification.
+
+        Args:
+            specification (Specification[T]): The specification to compile.
+            reorder (bool): Whether to reorder operands by declared cost and selectivity.
+        """
+        namespace: dict[str, Any] = {"__builtins__": {}}
+        source, cost, selectivity = _emit(specification, namespace, {}, reorder)
+        self.specification = specification
+        self.source = source
+        self.cost = cost
+        self.selectivity = selectivity
+        try:
+            # The generated source only references the names bound to the leaf predicates.
+            predicate = eval(f"lambda c: {source}", namespace)  # nosec B307
+        except (SyntaxError, RecursionError):
+            # The parser limits the nesting of an expression, reached by trees about 200
+            # levels deep, which the recursive evaluation of the tree handles.
+            predicate = specification.is_satisfied_by
+        self._predicate: Callable[[T], bool] = predicate
+
+    def is_satisfied_by(self, candidate: T) -> bool:
+        """Check if the candidate satisfies the compiled specification.
+
+        Args:
+            candidate (T): The domain object to evaluate.
+
+        Returns:
+            bool: True if the candidate satisfies the specification, False otherwise.
+        """
+        return self._predicate(candidate)
+
+    def compile(self, reorder: bool = True) -> "CompiledSpecification[T]":
+        """Return the specification itself, as it is already compiled.
+
+        Args:
+            reorder (bool): Ignored, the operand order is fixed at compile time.
+
+        Returns:
+            CompiledSpecification[T]: This compiled specification.
+        """
+        return self
+
+    def filter_many(self, candidates: Iterable[T]) -> Iterator[T]:
+        """Lazily yield the candidates satisfying the specification.
+
+        Args:
+            candidates (Iterable[T]): The domain objects to evaluate.
+
+        Returns:
+            Iterator[T]: The satisfying candidates, in input order.
+        """
+        return filter(self._predicate, candidates)
+
+    def partition(self, candidates: Iterable[T]) -> tuple[list[T], list[T]]:
+        """Split the candidates into satisfying and non-satisfying ones.
+
+        Args:
+            candidates (Iterable[T]): The domain objects to evaluate.
+
+        Returns:
+            tuple[list[T], list[T]]: The satisfying and the non-satisfying candidates,
+            each in input order.
+        """
+        predicate = self._predicate
+        satisfied: list[T] = []
+        rejected: list[T] = []
+        accept = satisfied.append
+        reject = rejected.append
+        for candidate in candidates:
+            if predicate(candidate):
+                accept(candidate)
+            else:
+                reject(candidate)
+        return satisfied, rejected
+
+
+def _operands(specification: Specification[T]) -> list[Specification[T]]:
+    """Collect the operands of a chain of same-kind binary specifications.
+
+    Args:
+        specification (Specification[T]): An `AndSpecification` or `OrSpecification`.
+
+    Returns:
+        list[Specification[T]]: The operands, left to right.
+    """
+    kind = type(specification)
+    operands: list[Specification[T]] = []
+    stack: list[Specification[T]] = [specification]
+    while stack:
+        node = stack.pop()
+        if type(node) is kind:
+            stack.append(node.second)  # type: ignore[attr-defined]
+            stack.append(node.first)  # type: ignore[attr-defined]
+        else:
+            operands.append(node)
+    return operands
+
+
+def _emit(
+    specification: Specification[T],
+    namespace: dict[str, Any],
+    names: dict[int, str],
+    reorder: bool,
+) -> tuple[str, float, float]:
+    """Generate the boolean expression evaluating a specification tree.
+
+    Args:
+        specification (Specification[T]): The specification to translate.
+        namespace (dict[str, Any]): Receives the leaf predicates, keyed by generated name.
+        names (dict[int, str]): Generated names of the leaves already bound, by identity.
+        reorder (bool): Whether to reorder operands by declared cost and selectivity.
+
+    Returns:
+        tuple[str, float, float]: The expression over the candidate `c`, its expected
+        cost and its estimated selectivity.
+    """
+    kind = type(specification)
+    if kind is NotSpecification:
+        inner = specification.specification  # type: ignore[attr-defined]
+        if type(inner) is NotSpecification:
+            return _emit(inner.specification, namespace, names, reorder)
+        source, cost, selectivity = _emit(inner, namespace, names, reorder)
+        return f"(not {source})", cost, 1.0 - selectivity
+
+    if kind is AndSpecification or kind is OrSpecification:
+        conjunction = kind is AndSpecification
+        operands = [_emit(operand, namespace, names, reorder) for operand in _operands(specification)]
+        if reorder:
+            # Classic predicate ordering: evaluate first the operands with the lowest cost
+            # per short-circuit, i.e. cheap and likely to fail (AND) or to pass (OR).
+            operands.sort(key=_and_rank if conjunction else _or_rank)
+        cost = 0.0
+        reached = 1.0
+        for _, operand_cost, operand_selectivity in operands:
+            cost += reached * operand_cost
+            reached *= operand_selectivity if conjunction else 1.0 - operand_selectivity
+        selectivity = reached if conjunction else 1.0 - reached
+        operator = " and " if conjunction else " or "
+        return f"({operator.join(source for source, _, _ in operands)})", cost, selectivity
+
+    if isinstance(specification, CompiledSpecification):
+        predicate = specification._predicate
+    else:
+        predicate = specification.is_satisfied_by
+    name = names.get(id(specification))
+    if name is None:
+        name = names[id(specification)] = f"_p{len(names)}"
+        namespace[name] = predicate
+    return f"{name}(c)", specification.cost, specification.selectivity
+
+
+def _and_rank(operand: tuple[str, float, float]) -> float:
+    """Rank a conjunct: cost divided by its probability of short-circuiting (failing)."""
+    _, cost, selectivity = operand
+    return cost / (1.0 - selectivity) if selectivity < 1.0 else float("inf")
+
+
+def _or_rank(operand: tuple[str, float, float]) -> float:
+    """Rank a disjunct: cost divided by its probability of short-circuiting (passing)."""
+    _, cost, selectivity = operand
+    return cost / selectivity if selectivity > 0.0 else float("inf")
+
+
 # Add the classes to __all__ for re-export in the parent module.
-__all__ = ["Specification", "AndSpecification", "OrSpecification", "NotSpecification"]
+__all__ = [
+    "Specification",
+    "AndSpecification",
+    "OrSpecification",
+    "NotSpecification",
+    "CompiledSpecification",
+]
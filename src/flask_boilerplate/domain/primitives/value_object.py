@@ -7,17 +7,122 @@ and validity of data within the domain.
 This module provides a base class `ValueObject` that can be inherited to create
 custom value objects. Value objects are compared based on their attributes rather
 than their identity.
+
+Since value objects are immutable, their hash is computed once and cached. Subclasses
+whose values repeat a lot can also opt in to interning: equal value objects then share
+a single instance, held by a weak-value table so that unused values are still garbage
+collected. Interning saves memory, not time: each value object is still built and
+validated before the shared instance is looked up.
+
+Value objects read back from the persistence layer can skip validation with
+`from_primitives_trusted()` and `hydrate_many()`.
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar, TypeVar
+from weakref import WeakValueDictionary
 
 from flask_boilerplate.domain.errors import ValueObjectsError
 
+from .hydration import hydrator
+
+V = TypeVar("V", bound="ValueObject")
+
+
+class ValueObjectMeta(ABCMeta):
+    """Metaclass of value objects, implementing the opt-in interning.
+
+    Classes setting `interned = True` are created with `InterningValueObjectMeta`, whose
+    constructor returns the live instance equal to the new one. Other classes keep the
+    default constructor and pay nothing for interning.
+
+    Attributes:
+        interned (bool): Whether equal instances of the class share a single instance.
+        _interned_instances (WeakValueDictionary[tuple[Any, ...], Any]): The live instances
+            of an interned class, keyed by their attributes and the types of these.
+    """
+
+    interned: bool
+    _interned_instances: WeakValueDictionary[tuple[Any, ...], Any]
+
+    def __new__(
+        mcls: type["ValueObjectMeta"],
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, Any],
+        **kwargs: Any,
+    ) -> "ValueObjectMeta":
+        """Create a value object class, with the interning metaclass if it is interned.
+
+        Args:
+            name (str): The name of the class.
+            bases (tuple[type, ...]): The base classes.
+            namespace (dict[str, Any]): The class namespace.
+            **kwargs (Any): The class keyword arguments.
+
+        Returns:
+            ValueObjectMeta: The new class.
+        """
+        interned = namespace.get("interned", any(getattr(base, "interned", False) for base in bases))
+        if interned and not issubclass(mcls, InterningValueObjectMeta):
+            mcls = InterningValueObjectMeta
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        if interned:
+            # Each class has its own table, so that instances of a subclass are never
+            # returned for its base class.
+            cls._interned_instances = WeakValueDictionary()
+        return cls
+
+    def intern(cls, instance: V) -> V:
+        """Get the shared instance equal to a value object of an interned class.
+
+        The types of the attributes are part of the key: `1`, `1.0` and `True` are equal
+        and hash alike, but a value object built with one of them is never replaced by
+        one holding another.
+
+        Args:
+            instance (V): The value object.
+
+        Returns:
+            V: The live instance equal to the value object, which becomes the shared
+            instance if there is none.
+        """
+        table = cls._interned_instances
+        attributes = instance._attributes()
+        key = (attributes, tuple(type(value) for value in attributes))
+        shared = table.get(key)
+        if shared is None:
+            object.__setattr__(instance, "_hash", hash(attributes))
+            shared = table.setdefault(key, instance)
+        return shared  # type: ignore[no-any-return]
+
+
+class InterningValueObjectMeta(ValueObjectMeta):
+    """Metaclass of the value object classes setting `interned = True`.
+
+    Subclasses of an interned class inherit this metaclass, so the constructor still
+    checks the `interned` flag, which a subclass may reset to False.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """Create a value object, or return the live instance equal to it.
+
+        Args:
+            *args (Any): The positional arguments of the constructor.
+            **kwargs (Any): The keyword arguments of the constructor.
+
+        Returns:
+            Any: The shared instance equal to the new value object, or the new value
+            object if the class is not interned.
+        """
+        instance = super().__call__(*args, **kwargs)
+        return cls.intern(instance) if cls.interned else instance
 
-@dataclass(frozen=True)
-class ValueObject(ABC):
+
+@dataclass(frozen=True, eq=False)
+class ValueObject(ABC, metaclass=ValueObjectMeta):
     """Abstract base class for all value objects in the domain layer.
 
     A value object is an immutable object that is defined by its attributes.
@@ -30,15 +135,18 @@ class ValueObject(ABC):
     - Serialization/deserialization
 
     Subclasses should define their attributes using dataclass fields. The `frozen=True`
-    parameter ensures immutability.
+    parameter ensures immutability, and `slots=True` stores the attributes without a
+    per-instance `__dict__`. Subclasses should also pass `eq=False`, so that dataclasses
+    keep the cached `__eq__` and `__hash__` of this class instead of generating new ones.
 
     Inheriting classes must implement:
     - _validate() method
     - to_primitives() method
 
     Example:
-        >>> @dataclass(frozen=True)
+        >>> @dataclass(frozen=True, slots=True, eq=False)
         >>> class Money(ValueObject):
+        ...     interned = True
         ...     amount: float
         ...     currency: str
         ...
@@ -46,35 +154,97 @@ class ValueObject(ABC):
         >>> money2 = Money(amount=100.0, currency="USD")
         >>> money1 == money2
         True
+        >>> money1 is money2
+        True
+
+    Attributes:
+        interned (bool): Whether equal instances of the class share a single instance.
     """
 
+    # The cached hash, and the weak reference support required by interning.
+    __slots__ = ("_hash", "__weakref__")
+
+    interned: ClassVar[bool] = False
+
+    @classmethod
+    def from_primitives_trusted(cls: type[V], primitives: Mapping[Any, Any]) -> V:
+        """Rebuild a value object from trusted attribute values, without validation.
+
+        Only use this for data read back from the persistence layer, which was validated
+        when it was written. Interned classes still return the shared instance.
+
+        Args:
+            primitives (Mapping[Any, Any]): The attribute values, keyed by field name.
+
+        Returns:
+            V: The value object.
+        """
+        instance = hydrator(cls)(primitives)
+        return cls.intern(instance) if cls.interned else instance
+
+    @classmethod
+    def hydrate_many(cls: type[V], rows: Iterable[Mapping[Any, Any]]) -> list[V]:
+        """Rebuild value objects from trusted attribute values, without validation.
+
+        Args:
+            rows (Iterable[Mapping[Any, Any]]): The attribute values of each value object,
+                keyed by field name.
+
+        Returns:
+            list[V]: The value objects, in the order of the rows.
+        """
+        hydrate = hydrator(cls)
+        if not cls.interned:
+            return list(map(hydrate, rows))
+        intern = cls.intern
+        return [intern(hydrate(row)) for row in rows]
+
     def __post_init__(self) -> None:
         """
         Post-initialization hook to ensure the value object is properly validated.
         """
         self.validate()
 
-    @abstractmethod
     def __eq__(self, other: Any) -> bool:
         """
         Compare two value objects based on their attributes.
+
+        Identical instances are equal without comparing their attributes, and the hashes,
+        once cached on both instances, reject most unequal instances before the
+        attributes are compared. The hashes are not computed here, so that value objects
+        with unhashable attributes can still be compared.
+
         Args:
             other (Any): The other value object to compare with.
         Returns:
             bool: True if the value objects have the same attributes, False otherwise.
         """
-        if not isinstance(other, ValueObject):
-            return False
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        self_hash = getattr(self, "_hash", None)
+        if self_hash is not None:
+            other_hash = getattr(other, "_hash", None)
+            if other_hash is not None and self_hash != other_hash:
+                return False
         return self._attributes() == other._attributes()
 
-    @abstractmethod
     def __hash__(self) -> int:
         """
         Generate a hash value for the value object based on its attributes.
+
+        The hash is computed on first use and cached, since the attributes never change.
+
         Returns:
             int: The hash value of the value object.
         """
-        return hash(self._attributes())
+        try:
+            return self._hash  # type: ignore[attr-defined,no-any-return]
+        except AttributeError:
+            value = hash(self._attributes())
+            object.__setattr__(self, "_hash", value)
+            return value
 
     @abstractmethod
     def _attributes(self) -> tuple[Any, ...]:
@@ -96,4 +266,4 @@ class ValueObject(ABC):
 
 
 # Add the class to __all__ for re-export in the parent module.
-__all__ = ["ValueObject"]
+__all__ = ["ValueObject", "ValueObjectMeta", "InterningValueObjectMeta"]
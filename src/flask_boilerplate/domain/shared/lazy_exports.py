@@ -0,0 +1,83 @@
+"""Module implementing the lazy re-exports of the domain packages.
+
+The `__init__` module of a domain package re-exports the classes of its submodules,
+so that they can be imported from the package. Importing all the submodules up front
+makes every process pay for the whole package, even when it uses a single class, and
+creates circular imports between packages.
+
+`lazy_exports()` builds the module-level `__getattr__` and `__dir__` of a package
+(PEP 562) from a table of exported names. A submodule is imported the first time one
+of its names is accessed, and the name is then stored in the package globals, so that
+later accesses are plain attribute lookups that no longer go through `__getattr__`.
+
+Example:
+    >>> from typing import TYPE_CHECKING
+    >>>
+    >>> if TYPE_CHECKING:
+    ...     from .entity_example import EntityExample
+    >>>
+    >>> __all__ = ["EntityExample"]
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {"EntityExample": ".entity_example"}, kind="entity")
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, str],
+    kind: str = "attribute",
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build the `__getattr__` and `__dir__` functions of a package with lazy exports.
+
+    Args:
+        package (str): The name of the package, usually `__name__`.
+        exports (Mapping[str, str]): The module defining each exported name, relative to
+            the package (such as ".entity_example") or absolute.
+        kind (str): What the exported names are, for error messages.
+
+    Returns:
+        tuple[Callable[[str], Any], Callable[[], list[str]]]: The `__getattr__` and
+        `__dir__` functions of the package.
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        """Import an exported name from its module, and cache it in the package.
+
+        Args:
+            name (str): The name to import.
+
+        Returns:
+            Any: The exported object.
+
+        Raises:
+            TypeError: If the name is not a string.
+            AttributeError: If the package does not export the name.
+        """
+        if not isinstance(name, str):
+            raise TypeError(f"Expected a string for {kind} name, got {type(name).__name__}")
+        try:
+            module = exports[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """List the names of the package, including the exports not imported yet.
+
+        Returns:
+            list[str]: The sorted names.
+        """
+        return sorted(namespace.keys() | exports.keys())
+
+    return __getattr__, __dir__
+
+
+# Add the function to __all__ for re-export in the parent module.
+__all__ = ["lazy_exports"]
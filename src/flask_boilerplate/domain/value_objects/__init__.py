@@ -13,37 +13,17 @@ Example:
     "value1"
 """
 
-import logging
-from typing import Any
+from typing import TYPE_CHECKING
 
-from .value_object_example import ValueObjectExample
+from flask_boilerplate.domain.shared.lazy_exports import lazy_exports
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+if TYPE_CHECKING:
+    from .value_object_example import ValueObjectExample
 
 # Re-export all value objects for easy access.
 __all__ = [
     "ValueObjectExample",
 ]
 
-
-def __getattr__(name: str) -> Any:
-    """Lazy-load value objects to avoid circular imports.
-
-    Args:
-        name (str): The name of the value object to load.
-
-    Returns:
-        Any: The requested value object.
-
-    Raises:
-        AttributeError: If the value object does not exist.
-    """
-    if not isinstance(name, str):
-        raise TypeError(f"Expected a string for value object name, got {type(name).__name__}")
-    if name in __all__:
-        logger.debug(f"Lazy-loading value object: {name}")
-        # Dynamically import the value object to avoid circular imports.
-        module = __import__(f"flask_boilerplate.domain.value_objects.{name}", fromlist=[name])
-        return getattr(module, name)
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+# The module defining each value object, imported on first access.
+__getattr__, __dir__ = lazy_exports(__name__, {"ValueObjectExample": ".value_object_example"}, kind="value object")
@@ -5,13 +5,15 @@ from flask_boilerplate.domain.errors.value_objects_error import ValueObjectsErro
 from flask_boilerplate.domain.primitives.value_object import ValueObject
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class ValueObjectExample(ValueObject):
     """
     An example value object in the domain layer.
     This value object represents a domain object with attributes that define its state.
     It encapsulates business logic related to its attributes.
 
+    Its equality and hash are inherited from `ValueObject`, which caches the hash.
+
     Attributes:
         name (str): The name of the value object.
         description (str): A description of the value object.
@@ -29,29 +31,6 @@ class ValueObjectExample(ValueObject):
         """
         return self.name, self.description
 
-    def __eq__(self, other: Any) -> bool:
-        """
-        Compare two value objects based on their attributes.
-
-        Args:
-            other (Any): The other value object to compare with.
-
-        Returns:
-            bool: True if the value objects have the same attributes, False otherwise.
-        """
-        if not isinstance(other, ValueObjectExample):
-            return NotImplemented
-        return self._attributes() == other._attributes()
-
-    def __hash__(self) -> int:
-        """
-        Generate a hash value for the value object based on its attributes.
-
-        Returns:
-            int: The hash value of the value object.
-        """
-        return hash(self._attributes())
-
     def validate(self) -> None:
         """
         Validate the value object's data.
@@ -0,0 +1,9 @@
+"""Module exporting the background jobs of the infrastructure.
+
+`OutboxRelay` publishes the domain events recorded in the transactional outbox, in
+batches, and reports its `RelayMetrics`.
+"""
+
+from .outbox_relay import OutboxRelay, RelayMetrics
+
+__all__ = ["OutboxRelay", "RelayMetrics"]
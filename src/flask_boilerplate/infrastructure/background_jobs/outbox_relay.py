@@ -0,0 +1,320 @@
+"""Module defining the relay publishing the messages of the transactional outbox.
+
+`OutboxRelay` polls the `outbox_messages` table written by the `Outbox` of the units
+of work, and publishes the messages through a `MessagePublisher`, in batches:
+
+1. It claims a batch of the oldest unpublished messages, setting `claimed_by` to a
+   token of its own and `claimed_until` to the end of a lease, with a single UPDATE
+   whose WHERE clause only matches the unclaimed messages, or those whose lease
+   expired. The database serializes the updates of a row, so two relays running at
+   once never claim the same message, and the candidates are selected with
+   `FOR UPDATE SKIP LOCKED` where the database supports it, so that they do not wait
+   for each other either.
+2. It publishes the batch, then marks all its messages as published with a single
+   UPDATE on its token. A batch that fails to publish is released at once, and a relay
+   that stops mid-batch leaves a claim that expires with its lease: the messages are
+   published again, at least once.
+
+`RelayMetrics` records the batches, the failures of the publisher, the errors of the
+outbox itself, and the publish lag of the messages: the time from their commit into
+the outbox to their publication.
+"""
+
+import logging
+import threading
+import uuid
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import Engine, Table, and_, delete, or_, select, update
+
+from flask_boilerplate.infrastructure.persistence.configurations.outbox_message_configuration import (
+    outbox_messages_table,
+)
+from flask_boilerplate.infrastructure.persistence.outbox import utc_now
+from flask_boilerplate.infrastructure.services.messaging.message_publisher import Message, MessagePublisher
+
+logger = logging.getLogger(__name__)
+
+# The dialects selecting the candidates of a claim with `FOR UPDATE SKIP LOCKED`.
+_SKIP_LOCKED_DIALECTS = frozenset({"postgresql", "mysql", "mariadb", "oracle"})
+
+
+class RelayMetrics:
+    """Metrics of an outbox relay.
+
+    Attributes:
+        batches (int): The number of batches published.
+        published (int): The number of messages published.
+        failures (int): The number of batches whose publication failed.
+        errors (int): The number of batches that failed on the outbox rather than on the
+            publisher: to be claimed, released, or marked as published.
+        publish_lag_seconds (float): The total time from the commit of the messages
+            into the outbox to their publication, in seconds.
+        max_publish_lag_seconds (float): The longest publish lag of a message, in
+            seconds.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics, all zero."""
+        self.batches = 0
+        self.published = 0
+        self.failures = 0
+        self.errors = 0
+        self.publish_lag_seconds = 0.0
+        self.max_publish_lag_seconds = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def mean_publish_lag_seconds(self) -> float:
+        """Get the mean publish lag of the messages.
+
+        Returns:
+            float: The mean time from the commit of a message to its publication, in
+                seconds.
+        """
+        return self.publish_lag_seconds / self.published if self.published else 0.0
+
+    def record_batch(self, lags: Sequence[float]) -> None:
+        """Record a published batch.
+
+        Args:
+            lags (Sequence[float]): The publish lag of each message, in seconds.
+        """
+        with self._lock:
+            self.batches += 1
+            self.published += len(lags)
+            self.publish_lag_seconds += sum(lags)
+            self.max_publish_lag_seconds = max(self.max_publish_lag_seconds, *lags)
+
+    def record_failure(self) -> None:
+        """Record a batch whose publication failed."""
+        with self._lock:
+            self.failures += 1
+
+    def record_error(self) -> None:
+        """Record a batch that failed to be claimed, released, or marked as published."""
+        with self._lock:
+            self.errors += 1
+
+    def snapshot(self) -> dict[str, float]:
+        """Get the current values of the metrics, to export them.
+
+        Returns:
+            dict[str, float]: The values, keyed by metric name.
+        """
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "published": self.published,
+                "failures": self.failures,
+                "errors": self.errors,
+                "publish_lag_seconds": self.publish_lag_seconds,
+                "mean_publish_lag_seconds": self.mean_publish_lag_seconds,
+                "max_publish_lag_seconds": self.max_publish_lag_seconds,
+            }
+
+
+class OutboxRelay:
+    """Relay claiming the messages of the outbox, and publishing them in batches.
+
+    Several relays, in as many threads or processes, can run on the same outbox.
+
+    Example:
+        >>> relay = OutboxRelay(engine, KafkaMessagePublisher(producer), batch_size=500)
+        >>> stop = threading.Event()
+        >>> threading.Thread(target=relay.run, args=(stop,), daemon=True).start()
+        >>> relay.metrics.snapshot()
+        {'batches': 12, 'published': 5800, ...}
+
+    Attributes:
+        engine (Engine): The engine of the database of the outbox.
+        publisher (MessagePublisher): The publisher of the messages.
+        batch_size (int): The maximum number of messages claimed and published at once.
+        lease (timedelta): The time a claim lasts, after which the messages of a relay
+            that stopped are claimed again.
+        poll_interval (float): The time waited when the outbox is empty, or after a
+            failure, in seconds.
+        table (Table): The outbox table.
+        metrics (RelayMetrics): The metrics of the relay.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        publisher: MessagePublisher,
+        batch_size: int = 100,
+        lease_seconds: float = 30.0,
+        poll_interval: float = 0.5,
+        table: Table = outbox_messages_table,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        """Initialize the relay.
+
+        Args:
+            engine (Engine): The engine of the database of the outbox.
+            publisher (MessagePublisher): The publisher of the messages.
+            batch_size (int): The maximum number of messages claimed and published at
+                once.
+            lease_seconds (float): The time a claim lasts, in seconds. It must exceed the
+                time to publish a batch.
+            poll_interval (float): The time waited when the outbox is empty, or after a
+                failure, in seconds.
+            table (Table): The outbox table, with the columns of `outbox_messages_table`.
+            clock (Callable[[], datetime]): The function returning the current time, in
+                UTC.
+
+        Raises:
+            ValueError: If the batch size or the lease is not positive.
+        """
+        if batch_size < 1 or lease_seconds <= 0:
+            raise ValueError("The batch size and the lease of a relay must be positive.")
+        self.engine = engine
+        self.publisher = publisher
+        self.batch_size = batch_size
+        self.lease = timedelta(seconds=lease_seconds)
+        self.poll_interval = poll_interval
+        self.table = table
+        self.metrics = RelayMetrics()
+        self._clock = clock
+
+    def claim(self) -> tuple[str, list[Message]]:
+        """Claim a batch of the oldest unpublished messages.
+
+        Returns:
+            tuple[str, list[Message]]: The token of the claim, and the claimed messages,
+                in the order of their identifiers.
+        """
+        table = self.table
+        token = uuid.uuid4().hex
+        now = self._clock()
+        claimable = and_(
+            table.c.published_at.is_(None),
+            or_(table.c.claimed_until.is_(None), table.c.claimed_until < now),
+        )
+        candidates = select(table.c.id).where(claimable).order_by(table.c.id).limit(self.batch_size)
+        if self.engine.dialect.name in _SKIP_LOCKED_DIALECTS:
+            candidates = candidates.with_for_update(skip_locked=True)
+        with self.engine.begin() as connection:
+            ids = connection.execute(candidates).scalars().all()
+            if not ids:
+                return token, []
+            # The claimable condition is evaluated again on the rows to update, so that
+            # the messages claimed by another relay in the meantime are left out.
+            connection.execute(
+                update(table)
+                .where(table.c.id.in_(ids), claimable)
+                .values(claimed_by=token, claimed_until=now + self.lease)
+            )
+            rows = connection.execute(
+                select(table.c.id, table.c.topic, table.c.payload, table.c.created_at)
+                .where(table.c.claimed_by == token)
+                .order_by(table.c.id)
+            ).all()
+        return token, [Message(row.id, row.topic, row.payload, _as_utc(row.created_at)) for row in rows]
+
+    def relay_once(self) -> int:
+        """Claim a batch of messages, publish it, and mark its messages as published.
+
+        Returns:
+            int: The number of messages published, 0 if the outbox has none to claim.
+
+        Raises:
+            Exception: The error of the publisher, once the claim is released, or the
+                error of the database of the outbox.
+        """
+        try:
+            token, messages = self.claim()
+        except Exception:
+            self.metrics.record_error()
+            raise
+        if not messages:
+            return 0
+        try:
+            self.publisher.publish_batch(messages)
+        except Exception:
+            self.metrics.record_failure()
+            self._release(token)
+            raise
+        now = self._clock()
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(
+                    update(self.table)
+                    .where(self.table.c.claimed_by == token, self.table.c.published_at.is_(None))
+                    .values(published_at=now, claimed_until=None)
+                )
+        except Exception:
+            # The messages are published again once the claim expires.
+            self.metrics.record_error()
+            raise
+        self.metrics.record_batch([(now - message.created_at).total_seconds() for message in messages])
+        return len(messages)
+
+    def run(self, stop: threading.Event) -> None:
+        """Relay the messages until stopped.
+
+        The outbox is drained batch after batch, and polled every `poll_interval` once
+        empty. A failed batch is logged and counted in the metrics, and retried after
+        the poll interval.
+
+        Args:
+            stop (threading.Event): The event stopping the relay once set.
+        """
+        while not stop.is_set():
+            try:
+                published = self.relay_once()
+            except Exception:
+                logger.exception("The outbox relay failed to relay a batch.")
+                published = 0
+            if not published:
+                stop.wait(self.poll_interval)
+
+    def purge(self, older_than: timedelta) -> int:
+        """Delete the messages published before a given age.
+
+        Args:
+            older_than (timedelta): The age of the published messages to delete.
+
+        Returns:
+            int: The number of messages deleted.
+        """
+        with self.engine.begin() as connection:
+            return connection.execute(
+                delete(self.table).where(self.table.c.published_at < self._clock() - older_than)
+            ).rowcount
+
+    def _release(self, token: str) -> None:
+        """Release the messages of a claim, for them to be claimed again at once.
+
+        Args:
+            token (str): The token of the claim.
+        """
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(
+                    update(self.table)
+                    .where(self.table.c.claimed_by == token, self.table.c.published_at.is_(None))
+                    .values(claimed_by=None, claimed_until=None)
+                )
+        except Exception:
+            # The messages are claimed again once the claim expires.
+            self.metrics.record_error()
+            raise
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Make a time read from the database timezone-aware.
+
+    Args:
+        value (datetime): The time, naive on the databases storing times without their
+            timezone, such as SQLite, where it is in UTC.
+
+    Returns:
+        datetime: The time, in UTC.
+    """
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["OutboxRelay", "RelayMetrics"]
@@ -0,0 +1,42 @@
+"""Module exporting the persistence layer of the infrastructure.
+
+The persistence layer stores the domain objects with SQLAlchemy. Table declarations
+live in `configurations`, repository implementations in `repositories`, and
+`SqlAlchemyUnitOfWork` runs repositories within a transaction, writing their changes
+in bulk with a `WriteBatch`. `EntityCache` keeps the entities most read across units
+of work. `EngineFactory` creates the engine of each worker process, with a pool sized
+by `pool_settings_for_workers()` and instrumented by `PoolMetrics`, and
+`RoutingUnitOfWorkFactory` opens the units of work of the queries on a read replica.
+`AsyncSqlAlchemyUnitOfWork` is the counterpart of `SqlAlchemyUnitOfWork` on an
+asyncio engine. `ShardedUnitOfWork` spreads the entities over several databases, and
+`migrations` backfills the data of the schema migrations and reshards the tables.
+`Outbox` records the domain events in the transaction of the aggregates.
+"""
+
+from .async_unit_of_work import AsyncSqlAlchemyUnitOfWork
+from .engine_factory import EngineFactory, PoolMetrics, PoolSettings, pool_settings_for_workers
+from .entity_cache import EntityCache
+from .outbox import Outbox
+from .parameter_limits import max_bind_parameters
+from .routing import RoutingUnitOfWorkFactory
+from .sharded_unit_of_work import ShardedUnitOfWork
+from .specification_translator import SpecificationTranslation, translate_specification
+from .unit_of_work import SqlAlchemyUnitOfWork
+from .write_batch import WriteBatch
+
+__all__ = [
+    "SpecificationTranslation",
+    "translate_specification",
+    "SqlAlchemyUnitOfWork",
+    "AsyncSqlAlchemyUnitOfWork",
+    "WriteBatch",
+    "EntityCache",
+    "max_bind_parameters",
+    "EngineFactory",
+    "PoolMetrics",
+    "PoolSettings",
+    "pool_settings_for_workers",
+    "RoutingUnitOfWorkFactory",
+    "ShardedUnitOfWork",
+    "Outbox",
+]
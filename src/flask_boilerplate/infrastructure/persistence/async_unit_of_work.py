@@ -0,0 +1,182 @@
+"""Module defining the asynchronous SQLAlchemy implementation of the unit of work.
+
+`AsyncSqlAlchemyUnitOfWork` is entered with `async with`: it opens a connection of an
+asyncio engine, such as `create_async_engine("sqlite+aiosqlite:///app.db")`, and
+creates its repositories as `AsyncSqlAlchemyRepository` instances.
+
+The transaction itself is managed by a `SqlAlchemyUnitOfWork` opened on the
+synchronous side of the connection, whose `commit()` and `rollback()` run in a
+greenlet through `AsyncConnection.run_sync()`. Both units of work therefore share
+their behaviour: identity map, bulk writes, updates of the changed columns, cache
+invalidation and dispatch of the domain events after a commit.
+"""
+
+from collections.abc import Mapping
+from types import TracebackType
+from typing import Any, Self, cast
+
+from sqlalchemy import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from flask_boilerplate.domain.domain_events.dispatcher import DomainEventDispatcher
+from flask_boilerplate.domain.primitives.async_repository import AsyncRepository, AsyncUnitOfWork
+from flask_boilerplate.domain.primitives.identity_map import IdentityMap
+
+from .entity_cache import EntityCache
+from .outbox import Outbox
+from .repositories.async_sqlalchemy_repository import AsyncSqlAlchemyRepository
+from .repositories.sqlalchemy_repository import SqlAlchemyRepository
+from .unit_of_work import SqlAlchemyUnitOfWork
+
+
+class AsyncSqlAlchemyUnitOfWork(AsyncUnitOfWork[Any, Any]):
+    """Unit of work running its repositories in a transaction on a single asyncio connection.
+
+    Example:
+        >>> engine = create_async_engine("sqlite+aiosqlite:///app.db")
+        >>> async with AsyncSqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}) as unit_of_work:
+        ...     repository = unit_of_work.repositories()["entities"]
+        ...     await repository.add(entity)
+        ...     await unit_of_work.commit()
+
+    Attributes:
+        engine (AsyncEngine): The engine to connect to.
+        connection (AsyncConnection | None): The connection of the unit of work, while
+            it is entered.
+        unit_of_work (SqlAlchemyUnitOfWork): The synchronous unit of work managing the
+            transaction on the synchronous side of the connection.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        repositories: Mapping[str, type[SqlAlchemyRepository[Any, Any]]],
+        dispatcher: DomainEventDispatcher | None = None,
+        chunk_size: int = 500,
+        caches: Mapping[str, EntityCache[Any, Any]] | None = None,
+        outbox: Outbox | None = None,
+    ) -> None:
+        """Initialize the unit of work, without connecting yet.
+
+        Args:
+            engine (AsyncEngine): The engine to connect to.
+            repositories (Mapping[str, type[SqlAlchemyRepository[Any, Any]]]): The classes
+                of the synchronous repositories run by the repositories of the unit of
+                work, keyed by name.
+            dispatcher (DomainEventDispatcher | None): The dispatcher of the domain events
+                raised by the aggregates, after a commit.
+            chunk_size (int): The maximum number of rows written per statement.
+            caches (Mapping[str, EntityCache[Any, Any]] | None): The caches of the
+                entities of the repositories to cache, keyed by repository name.
+            outbox (Outbox | None): The outbox to record the domain events in, within the
+                transaction of the aggregates.
+        """
+        self.engine = engine
+        self.connection: AsyncConnection | None = None
+        self.unit_of_work = SqlAlchemyUnitOfWork(
+            engine.sync_engine, repositories, dispatcher, chunk_size, caches, outbox
+        )
+        self._repositories: dict[str, AsyncRepository[Any, Any]] = {}
+
+    @property
+    def identity_map(self) -> IdentityMap:
+        """Get the identity map of the unit of work.
+
+        Returns:
+            IdentityMap: The entities loaded or added within the unit of work.
+        """
+        return self.unit_of_work.identity_map
+
+    async def __aenter__(self) -> Self:
+        """Connect, and create the repositories on the connection.
+
+        Returns:
+            Self: The unit of work.
+        """
+        self.connection = await self.engine.connect()
+        # The connection is started by `connect()`, so its synchronous side is set.
+        self.unit_of_work._open(cast(Connection, self.connection.sync_connection))
+        self._repositories = {
+            name: AsyncSqlAlchemyRepository(self.connection, repository)
+            for name, repository in self.unit_of_work.repositories().items()
+        }
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Roll back the uncommitted changes, and close the connection.
+
+        Args:
+            exc_type (type[BaseException] | None): The type of the exception raised in the
+                block, if any.
+            exc_value (BaseException | None): The exception raised in the block, if any.
+            traceback (TracebackType | None): The traceback of the exception, if any.
+        """
+        try:
+            await self.rollback()
+        finally:
+            await self._connected().close()
+            self.unit_of_work._release()
+            self.connection = None
+            self._repositories = {}
+
+    async def commit(self) -> None:
+        """Write the pending writes and changes, commit, and dispatch the domain events."""
+        await self._connected().run_sync(_commit, self.unit_of_work)
+
+    async def rollback(self) -> None:
+        """Drop the pending writes, roll back, and drop the domain events."""
+        await self._connected().run_sync(_rollback, self.unit_of_work)
+
+    def repositories(self) -> dict[str, AsyncRepository[Any, Any]]:
+        """Get the repositories of the unit of work.
+
+        Returns:
+            dict[str, AsyncRepository[Any, Any]]: The repositories, keyed by name.
+
+        Raises:
+            RuntimeError: If the unit of work is not entered.
+        """
+        self._connected()
+        return dict(self._repositories)
+
+    def _connected(self) -> AsyncConnection:
+        """Get the connection of the unit of work.
+
+        Returns:
+            AsyncConnection: The connection.
+
+        Raises:
+            RuntimeError: If the unit of work is not entered.
+        """
+        if self.connection is None:
+            raise RuntimeError("The unit of work must be entered with an `async with` statement first.")
+        return self.connection
+
+
+def _commit(connection: Connection, unit_of_work: SqlAlchemyUnitOfWork) -> None:
+    """Commit a synchronous unit of work, in a greenlet.
+
+    Args:
+        connection (Connection): The synchronous connection of the unit of work.
+        unit_of_work (SqlAlchemyUnitOfWork): The unit of work to commit.
+    """
+    unit_of_work.commit()
+
+
+def _rollback(connection: Connection, unit_of_work: SqlAlchemyUnitOfWork) -> None:
+    """Roll back a synchronous unit of work, in a greenlet.
+
+    Args:
+        connection (Connection): The synchronous connection of the unit of work.
+        unit_of_work (SqlAlchemyUnitOfWork): The unit of work to roll back.
+    """
+    unit_of_work.rollback()
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["AsyncSqlAlchemyUnitOfWork"]
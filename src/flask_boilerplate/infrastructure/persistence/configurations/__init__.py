@@ -0,0 +1,22 @@
+"""Module exporting the storage configurations of the persistence layer.
+
+Configurations declare the tables storing the domain objects, against the shared
+`metadata`, and map the entities onto them with `map_imperatively()`.
+"""
+
+from .backfill_checkpoint_configuration import backfill_checkpoints_table
+from .entity_example_configuration import entity_example_mapping, entity_examples_table
+from .entity_mapping import EntityMapping, map_imperatively, mapping_for
+from .metadata import metadata
+from .outbox_message_configuration import outbox_messages_table
+
+__all__ = [
+    "metadata",
+    "entity_examples_table",
+    "entity_example_mapping",
+    "backfill_checkpoints_table",
+    "outbox_messages_table",
+    "EntityMapping",
+    "map_imperatively",
+    "mapping_for",
+]
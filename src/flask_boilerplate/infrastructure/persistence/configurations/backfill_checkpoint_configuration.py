@@ -0,0 +1,20 @@
+"""Module declaring the storage of the checkpoints of the data backfills.
+
+Each backfill records, in the same transaction as each of its chunks, the primary key
+of the last row it processed, so that an interrupted backfill resumes after it.
+"""
+
+from sqlalchemy import BigInteger, Column, String, Table
+
+from .metadata import metadata
+
+backfill_checkpoints_table = Table(
+    "backfill_checkpoints",
+    metadata,
+    Column("name", String(255), primary_key=True),
+    Column("last_id", String(255), nullable=True),
+    Column("rows", BigInteger, nullable=False),
+)
+
+# Add the table to __all__ for re-export in the parent module.
+__all__ = ["backfill_checkpoints_table"]
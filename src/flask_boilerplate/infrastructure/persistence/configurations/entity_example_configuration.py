@@ -0,0 +1,26 @@
+"""Module declaring the storage of `EntityExample` entities.
+
+The table is declared with SQLAlchemy Core, and the entity is mapped onto it
+imperatively, outside of the domain layer, so that the entity itself stays free of any
+persistence concern.
+"""
+
+from sqlalchemy import Column, String, Table, Uuid
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+
+from .entity_mapping import map_imperatively
+from .metadata import metadata
+
+entity_examples_table = Table(
+    "entity_examples",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("name", String(255), nullable=False),
+    Column("description", String(1024), nullable=False),
+)
+
+entity_example_mapping = map_imperatively(EntityExample, entity_examples_table)
+
+# Add the table and the mapping to __all__ for re-export in the parent module.
+__all__ = ["entity_examples_table", "entity_example_mapping"]
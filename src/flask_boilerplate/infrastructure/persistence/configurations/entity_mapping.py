@@ -0,0 +1,180 @@
+"""Module defining the imperative mappings between domain entities and tables.
+
+The domain layer knows nothing of SQLAlchemy: entities are plain dataclasses, and the
+tables are declared in this package. A mapping is declared here too, imperatively,
+next to the table: `map_imperatively(EntityExample, entity_examples_table)` maps each
+column of the table onto the field of the same name, or of the name given in
+`attributes`.
+
+Unlike a classical mapping of the SQLAlchemy ORM, the mapping does not instrument the
+entity class, which keeps its slots and its plain attribute access. It converts rows
+and entities with functions built once per mapping:
+
+- `to_entity()` hydrates an entity from a row of `select(table)` by position, through
+  the trusted hydrator of the class, without running its constructor;
+- `to_row()` reads the mapped attributes with a single `operator.attrgetter()`.
+"""
+
+from collections.abc import Mapping, Sequence
+from dataclasses import fields, is_dataclass
+from operator import attrgetter
+from typing import Any, Generic, TypeVar
+
+from sqlalchemy import Table
+
+from flask_boilerplate.domain.primitives.hydration import hydrator
+
+E = TypeVar("E")
+
+# The mappings declared with `map_imperatively()`, by entity class.
+_mappings: dict[type, "EntityMapping[Any]"] = {}
+
+
+class EntityMapping(Generic[E]):
+    """Mapping of the fields of a dataclass entity onto the columns of a table.
+
+    Example:
+        >>> mapping = EntityMapping(User, users_table, {"email_address": "email"})
+        >>> user = mapping.to_entity(connection.execute(select(users_table)).first())
+        >>> mapping.to_row(user)
+        {'id': UUID('...'), 'email_address': 'ada@example.com'}
+
+    Attributes:
+        entity (type[E]): The entity class.
+        table (Table): The table storing the entities.
+        columns (tuple[str, ...]): The names of the columns, in the order of the table.
+        attributes (tuple[str, ...]): The names of the fields mapped onto the columns, in
+            the same order.
+    """
+
+    def __init__(self, entity: type[E], table: Table, attributes: Mapping[str, str] | None = None) -> None:
+        """Map an entity class onto a table.
+
+        Args:
+            entity (type[E]): The entity class, a dataclass.
+            table (Table): The table storing the entities.
+            attributes (Mapping[str, str] | None): The names of the fields mapped onto
+                the columns whose name differs, keyed by column name.
+
+        Raises:
+            TypeError: If the entity class is not a dataclass.
+            ValueError: If a column is not mapped onto a field of the entity.
+        """
+        if not is_dataclass(entity):
+            raise TypeError(f"Only dataclasses can be mapped, got {entity.__qualname__}.")
+        renamed = dict(attributes or {})
+        unknown = set(renamed) - set(table.c.keys())
+        if unknown:
+            raise ValueError(f"{table.name!r} has no column {sorted(unknown)}.")
+        self.entity = entity
+        self.table = table
+        self.columns = tuple(table.c.keys())
+        self.attributes = tuple(renamed.get(column, column) for column in self.columns)
+        missing = set(self.attributes) - {field.name for field in fields(entity)}
+        if missing:
+            raise ValueError(f"{entity.__qualname__} has no field {sorted(missing)} to map onto {table.name!r}.")
+        self._columns_by_attribute = dict(zip(self.attributes, self.columns, strict=True))
+        self._hydrate = hydrator(entity)
+        getter = attrgetter(*self.attributes)
+        # A single attribute is not returned in a tuple.
+        self._values = getter if len(self.attributes) > 1 else lambda entity: (getter(entity),)
+        self._identifier = attrgetter(self.attributes[self.columns.index("id")]) if "id" in self.columns else None
+
+    def to_entity(self, row: Sequence[Any]) -> E:
+        """Hydrate an entity from a row, without validation.
+
+        Args:
+            row (Sequence[Any]): The row, with the values of all the columns of the table
+                in their order, as selected by `select(table)`.
+
+        Returns:
+            E: The entity.
+        """
+        return self._hydrate(dict(zip(self.attributes, row, strict=True)))
+
+    def to_row(self, entity: E) -> dict[str, Any]:
+        """Convert an entity into the column values of its row.
+
+        Args:
+            entity (E): The entity.
+
+        Returns:
+            dict[str, Any]: The column values, keyed by column name.
+        """
+        return dict(zip(self.columns, self._values(entity), strict=True))
+
+    def column_for(self, attribute: str) -> str:
+        """Get the name of the column an attribute is mapped onto.
+
+        Args:
+            attribute (str): The name of the attribute.
+
+        Returns:
+            str: The name of the column.
+
+        Raises:
+            ValueError: If the attribute is not mapped onto a column.
+        """
+        try:
+            return self._columns_by_attribute[attribute]
+        except KeyError:
+            raise ValueError(
+                f"{self.entity.__qualname__}.{attribute} is not mapped onto a column of {self.table.name!r}."
+            ) from None
+
+    def identifier(self, entity: E) -> Any:
+        """Get the identifier of an entity, the attribute mapped onto the `id` column.
+
+        Args:
+            entity (E): The entity.
+
+        Returns:
+            Any: The identifier.
+
+        Raises:
+            ValueError: If the table has no `id` column.
+        """
+        if self._identifier is None:
+            raise ValueError(f"{self.table.name!r} has no id column.")
+        return self._identifier(entity)
+
+
+def map_imperatively(entity: type[E], table: Table, attributes: Mapping[str, str] | None = None) -> EntityMapping[E]:
+    """Declare the mapping of an entity class onto a table.
+
+    Args:
+        entity (type[E]): The entity class, a dataclass.
+        table (Table): The table storing the entities.
+        attributes (Mapping[str, str] | None): The names of the fields mapped onto the
+            columns whose name differs, keyed by column name.
+
+    Returns:
+        EntityMapping[E]: The mapping.
+
+    Raises:
+        ValueError: If the class is already mapped, or a column is not mapped onto a
+            field of the entity.
+    """
+    if entity in _mappings:
+        raise ValueError(f"{entity.__qualname__} is already mapped onto {_mappings[entity].table.name!r}.")
+    mapping = _mappings[entity] = EntityMapping(entity, table, attributes)
+    return mapping
+
+
+def mapping_for(entity: type[E]) -> EntityMapping[E]:
+    """Get the mapping declared for an entity class.
+
+    Args:
+        entity (type[E]): The entity class.
+
+    Returns:
+        EntityMapping[E]: The mapping.
+
+    Raises:
+        KeyError: If the class is not mapped.
+    """
+    return _mappings[entity]
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["EntityMapping", "map_imperatively", "mapping_for"]
@@ -0,0 +1,12 @@
+"""Module defining the SQLAlchemy metadata shared by the persistence layer.
+
+Every table of the application is declared against this `MetaData` instance, so that
+the schema can be created, inspected or migrated as a whole.
+"""
+
+from sqlalchemy import MetaData
+
+metadata = MetaData()
+
+# Add the metadata to __all__ for re-export in the parent module.
+__all__ = ["metadata"]
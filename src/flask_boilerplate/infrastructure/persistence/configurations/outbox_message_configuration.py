@@ -0,0 +1,27 @@
+"""Module declaring the storage of the outbox of the domain events.
+
+Each message of the outbox is a domain event recorded in the transaction of the
+aggregates that raised it, waiting for a relay to claim and publish it.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String, Table, Text
+
+from .metadata import metadata
+
+outbox_messages_table = Table(
+    "outbox_messages",
+    metadata,
+    # SQLite only assigns the identifiers of INTEGER primary keys.
+    Column("id", BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True),
+    Column("topic", String(255), nullable=False),
+    Column("payload", Text, nullable=False),
+    Column("created_at", DateTime(timezone=True), nullable=False),
+    Column("claimed_by", String(32), nullable=True),
+    Column("claimed_until", DateTime(timezone=True), nullable=True),
+    Column("published_at", DateTime(timezone=True), nullable=True),
+    # The relays look for the unpublished messages, in the order of their identifiers.
+    Index("ix_outbox_messages_published_at_id", "published_at", "id"),
+)
+
+# Add the table to __all__ for re-export in the parent module.
+__all__ = ["outbox_messages_table"]
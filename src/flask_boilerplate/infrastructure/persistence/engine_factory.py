@@ -0,0 +1,380 @@
+"""Module defining the factory of the SQLAlchemy engine and the metrics of its pool.
+
+The application is served by several pre-forked gunicorn workers, each with a pool of
+connections of its own. The pools share the connection limit of the database server,
+so their size is derived from it: `pool_settings_for_workers()` splits the connections
+between the workers, and sizes the pool of each worker for its threads, with the rest
+of its share as overflow.
+
+A connection must never be used by two processes, so `EngineFactory` creates its
+engine lazily, on first use in a process. If the engine was created before the fork,
+by a gunicorn master preloading the application, a worker drops the inherited
+connections without closing them, since they belong to the master, and creates an
+engine of its own.
+
+The pool of the engine is instrumented by `PoolMetrics`, to size the pools from data:
+
+- the time spent waiting for a connection at checkout, and the checkouts that timed
+  out;
+- the saturation of the pool, the share of its capacity checked out, now and at peak;
+- the churn of the connections, opened, closed and invalidated.
+"""
+
+import os
+import threading
+import time
+from typing import Any, NamedTuple
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+
+class PoolSettings(NamedTuple):
+    """Settings of the pool of connections of a worker.
+
+    Attributes:
+        pool_size (int): The number of connections kept open.
+        max_overflow (int): The number of connections opened beyond `pool_size` under
+            load, and closed when they are checked in.
+        pool_timeout (float): The time to wait for a connection at checkout before
+            giving up, in seconds.
+        pool_recycle (int): The age after which a connection is replaced, in seconds,
+            to outlive the idle timeouts of the server and of the proxies.
+        pool_pre_ping (bool): Whether to test a connection at checkout, to replace the
+            connections closed by the server.
+    """
+
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+
+
+def pool_settings_for_workers(
+    max_connections: int,
+    workers: int,
+    threads: int = 1,
+    pool_timeout: float = 10.0,
+    pool_recycle: int = 1800,
+    pool_pre_ping: bool = True,
+) -> PoolSettings:
+    """Size the pool of each worker so that the workers share the connection limit.
+
+    Each worker gets an equal share of `max_connections`. Its pool keeps one connection
+    per thread open, as a thread uses one connection at a time, and opens the rest of
+    its share only under load.
+
+    Example:
+        >>> pool_settings_for_workers(max_connections=40, workers=4, threads=2)
+        PoolSettings(pool_size=2, max_overflow=8, pool_timeout=10.0, pool_recycle=1800, pool_pre_ping=True)
+
+    Args:
+        max_connections (int): The connections the application may open on the
+            database server, across all workers.
+        workers (int): The number of worker processes.
+        threads (int): The number of threads of each worker.
+        pool_timeout (float): The time to wait for a connection at checkout, in seconds.
+        pool_recycle (int): The age after which a connection is replaced, in seconds.
+        pool_pre_ping (bool): Whether to test a connection at checkout.
+
+    Returns:
+        PoolSettings: The settings of the pool of each worker.
+
+    Raises:
+        ValueError: If there are fewer connections than workers, or no worker or thread.
+    """
+    if workers <= 0 or threads <= 0:
+        raise ValueError(f"The numbers of workers and threads must be positive, got {workers} and {threads}.")
+    share = max_connections // workers
+    if share < 1:
+        raise ValueError(f"{max_connections} connections cannot be shared between {workers} workers.")
+    pool_size = min(threads, share)
+    return PoolSettings(pool_size, share - pool_size, pool_timeout, pool_recycle, pool_pre_ping)
+
+
+class PoolMetrics:
+    """Metrics of a pool of connections, updated by the events of the pool.
+
+    Example:
+        >>> metrics = PoolMetrics(capacity=10)
+        >>> metrics.attach(engine)
+        >>> metrics.snapshot()
+        {'checkouts': 120, 'checkout_wait_seconds': 0.05, ...}
+
+    Attributes:
+        capacity (int): The maximum number of connections of the pool, overflow included.
+        checkouts (int): The number of connections checked out.
+        checkout_wait_seconds (float): The total time spent waiting for a connection at
+            checkout, in seconds.
+        max_checkout_wait_seconds (float): The longest wait for a connection, in seconds.
+        checkout_timeouts (int): The number of checkouts that gave up waiting.
+        checked_out (int): The number of connections currently checked out.
+        peak_checked_out (int): The largest number of connections checked out at once.
+        connects (int): The number of connections opened.
+        closes (int): The number of connections closed.
+        invalidations (int): The number of connections invalidated, after an error or
+            a failed pre-ping.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize the metrics, all zero.
+
+        Args:
+            capacity (int): The maximum number of connections of the pool.
+        """
+        self.capacity = capacity
+        self.checkouts = 0
+        self.checkout_wait_seconds = 0.0
+        self.max_checkout_wait_seconds = 0.0
+        self.checkout_timeouts = 0
+        self.checked_out = 0
+        self.peak_checked_out = 0
+        self.connects = 0
+        self.closes = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    @property
+    def saturation(self) -> float:
+        """Get the share of the capacity of the pool currently checked out.
+
+        Returns:
+            float: The ratio of the connections checked out to the capacity.
+        """
+        return self.checked_out / self.capacity if self.capacity else 0.0
+
+    @property
+    def peak_saturation(self) -> float:
+        """Get the largest share of the capacity of the pool checked out at once.
+
+        Returns:
+            float: The ratio of the peak of connections checked out to the capacity.
+        """
+        return self.peak_checked_out / self.capacity if self.capacity else 0.0
+
+    @property
+    def mean_checkout_wait_seconds(self) -> float:
+        """Get the mean time spent waiting for a connection at checkout.
+
+        Returns:
+            float: The mean wait, in seconds, 0 before the first checkout.
+        """
+        return self.checkout_wait_seconds / self.checkouts if self.checkouts else 0.0
+
+    def attach(self, engine: Engine) -> None:
+        """Listen to the events of the pool of an engine.
+
+        The listeners stay attached when the pool is recreated by `engine.dispose()`.
+        The wait at checkout is only measured by an `InstrumentedQueuePool`.
+
+        Args:
+            engine (Engine): The engine, or the synchronous engine of an asyncio engine.
+        """
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "close_detached", self._on_close)
+        event.listen(engine, "invalidate", self._on_invalidate)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "checkin", self._on_checkin)
+        if isinstance(engine.pool, InstrumentedQueuePool):
+            engine.pool.metrics = self
+
+    def record_wait(self, seconds: float, timed_out: bool) -> None:
+        """Record the wait for a connection at checkout.
+
+        Args:
+            seconds (float): The time waited, in seconds.
+            timed_out (bool): Whether the wait gave up.
+        """
+        with self._lock:
+            self.checkout_wait_seconds += seconds
+            self.max_checkout_wait_seconds = max(self.max_checkout_wait_seconds, seconds)
+            self.checkout_timeouts += timed_out
+
+    def snapshot(self) -> dict[str, float]:
+        """Get the current values of the metrics, to export them.
+
+        Returns:
+            dict[str, float]: The values, keyed by metric name.
+        """
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "checkouts": self.checkouts,
+                "checkout_wait_seconds": self.checkout_wait_seconds,
+                "mean_checkout_wait_seconds": self.mean_checkout_wait_seconds,
+                "max_checkout_wait_seconds": self.max_checkout_wait_seconds,
+                "checkout_timeouts": self.checkout_timeouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "saturation": self.saturation,
+                "peak_saturation": self.peak_saturation,
+                "connects": self.connects,
+                "closes": self.closes,
+                "invalidations": self.invalidations,
+            }
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def _on_close(self, dbapi_connection: Any, *args: Any) -> None:
+        with self._lock:
+            self.closes += 1
+
+    def _on_invalidate(self, dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def _on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def _on_checkin(self, dbapi_connection: Any, connection_record: Any) -> None:
+        with self._lock:
+            self.checked_out -= 1
+
+
+class InstrumentedQueuePool(QueuePool):
+    """Queue pool recording the time spent waiting for a connection in `PoolMetrics`.
+
+    Attributes:
+        metrics (PoolMetrics | None): The metrics to record the waits in, if any.
+    """
+
+    metrics: PoolMetrics | None = None
+    _waiting = threading.local()
+
+    def recreate(self) -> QueuePool:
+        """Create a new pool with the same settings, recording in the same metrics.
+
+        Returns:
+            QueuePool: The new pool.
+        """
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool):
+            pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        """Get a connection of the pool, timing the wait.
+
+        Returns:
+            ConnectionPoolEntry: The connection.
+        """
+        # The queue pool retries by calling `_do_get()` again: only time the outer call.
+        if self.metrics is None or getattr(self._waiting, "active", False):
+            return super()._do_get()
+        self._waiting.active = True
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self._waiting.active = False
+            self.metrics.record_wait(time.perf_counter() - start, timed_out)
+
+
+class EngineFactory:
+    """Factory of the engine of a process, created lazily and again after a fork.
+
+    Example:
+        >>> settings = pool_settings_for_workers(max_connections=40, workers=4, threads=2)
+        >>> engines = EngineFactory("postgresql+psycopg://app@db/app", settings)
+        >>> with SqlAlchemyUnitOfWork(engines.engine, repositories) as unit_of_work:
+        ...     ...
+        >>> engines.metrics.snapshot()
+
+    Attributes:
+        url (str): The URL of the database.
+        settings (PoolSettings): The settings of the pool.
+        options (dict[str, Any]): The other arguments of `create_engine()`.
+    """
+
+    def __init__(self, url: str, settings: PoolSettings | None = None, **options: Any) -> None:
+        """Initialize the factory, without creating the engine yet.
+
+        Args:
+            url (str): The URL of the database. In-memory SQLite databases are not
+                supported, as each connection of a queue pool has a database of its own.
+            settings (PoolSettings | None): The settings of the pool, the defaults of
+                `PoolSettings` if None.
+            **options (Any): The other arguments of `create_engine()`.
+        """
+        self.url = url
+        self.settings = settings or PoolSettings()
+        self.options = options
+        self._engine: Engine | None = None
+        self._metrics: PoolMetrics | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def engine(self) -> Engine:
+        """Get the engine of the current process, creating it on first use.
+
+        Returns:
+            Engine: The engine.
+        """
+        return self._current()[0]
+
+    @property
+    def metrics(self) -> PoolMetrics:
+        """Get the metrics of the pool of the engine of the current process.
+
+        Returns:
+            PoolMetrics: The metrics.
+        """
+        return self._current()[1]
+
+    def dispose(self) -> None:
+        """Close the connections of the engine of the current process, if any."""
+        with self._lock:
+            if self._engine is not None and self._pid == os.getpid():
+                self._engine.dispose()
+
+    def _current(self) -> tuple[Engine, PoolMetrics]:
+        """Get the engine of the current process and its metrics, creating them on first use.
+
+        Returns:
+            tuple[Engine, PoolMetrics]: The engine and the metrics of its pool.
+        """
+        engine, metrics = self._engine, self._metrics
+        if engine is None or metrics is None or self._pid != os.getpid():
+            with self._lock:
+                if self._engine is None or self._pid != os.getpid():
+                    self._create()
+                engine, metrics = self._engine, self._metrics
+        assert engine is not None and metrics is not None
+        return engine, metrics
+
+    def _create(self) -> None:
+        """Create the engine of the current process, dropping the one inherited by a fork."""
+        if self._engine is not None:
+            # The connections belong to the parent process: forget them without closing.
+            self._engine.dispose(close=False)
+        settings = self.settings
+        engine = create_engine(
+            self.url,
+            poolclass=InstrumentedQueuePool,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_recycle=settings.pool_recycle,
+            pool_pre_ping=settings.pool_pre_ping,
+            **self.options,
+        )
+        metrics = PoolMetrics(settings.pool_size + settings.max_overflow)
+        metrics.attach(engine)
+        self._engine, self._metrics, self._pid = engine, metrics, os.getpid()
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["EngineFactory", "InstrumentedQueuePool", "PoolMetrics", "PoolSettings", "pool_settings_for_workers"]
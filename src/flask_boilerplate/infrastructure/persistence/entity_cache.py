@@ -0,0 +1,175 @@
+"""Module defining the process-wide cache of the entities read by repositories.
+
+Repositories live as long as a unit of work, but the entities most read are the same
+from one request to the next. `EntityCache` keeps them across units of work, so that
+`CachingRepository` can answer reads without querying the database:
+
+- the cache holds at most `maxsize` entries, and evicts the least recently used one
+  when it is full;
+- each entry expires `ttl` seconds after it was stored, so that changes made outside
+  the process are eventually seen;
+- identifiers that were not found are cached too, for `negative_ttl` seconds, so that
+  repeated lookups of missing identifiers do not reach the database either.
+
+The cache is shared by the threads of a worker, and guarded by a lock. It counts its
+hits, misses, evictions and expirations, to monitor its efficiency.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+
+
+class EntityCache(Generic[T, ID]):
+    """Bounded cache of entities by identifier, with least-recently-used eviction and expiry.
+
+    An entry maps an identifier to an entity, or to None for an identifier that was
+    not found.
+
+    Example:
+        >>> cache = EntityCache[User, UUID](maxsize=10_000, ttl=60.0, negative_ttl=5.0)
+        >>> cache.store(user.id, user)
+        >>> cache.lookup(user.id)
+        (True, User(...))
+        >>> cache.lookup(other_id)
+        (False, None)
+        >>> cache.hit_ratio
+        0.5
+
+    Attributes:
+        maxsize (int): The maximum number of entries.
+        ttl (float): The lifetime of the entries of entities, in seconds.
+        negative_ttl (float): The lifetime of the entries of identifiers not found, in
+            seconds; 0 to not cache them.
+        hits (int): The number of lookups that found a live entry.
+        misses (int): The number of lookups that found none.
+        evictions (int): The number of entries evicted to make room for new ones.
+        expirations (int): The number of entries dropped because they expired.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: float = 60.0,
+        negative_ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of entries.
+            ttl (float): The lifetime of the entries of entities, in seconds.
+            negative_ttl (float): The lifetime of the entries of identifiers not found,
+                in seconds; 0 to not cache them.
+            clock (Callable[[], float]): The function returning the current time, in
+                seconds.
+
+        Raises:
+            ValueError: If the maximum size or a lifetime is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"The maximum size must be positive, got {maxsize}.")
+        if ttl <= 0 or negative_ttl < 0:
+            raise ValueError(f"The lifetimes must be positive, got {ttl} and {negative_ttl}.")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        # The entity, or None, and the time it expires at, by identifier, from the least
+        # to the most recently used.
+        self._entries: OrderedDict[ID, tuple[T | None, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Get the number of entries, including the expired ones not dropped yet.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Get the share of the lookups that found a live entry.
+
+        Returns:
+            float: The ratio of hits to lookups, 0 before the first lookup.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def lookup(self, id: ID) -> tuple[bool, T | None]:
+        """Look an identifier up, counting a hit or a miss.
+
+        Args:
+            id (ID): The identifier.
+
+        Returns:
+            tuple[bool, T | None]: Whether the identifier has a live entry, and its
+                entity, None if the identifier was not found in storage.
+        """
+        with self._lock:
+            entry = self._entries.get(id)
+            if entry is not None:
+                if entry[1] > self._clock():
+                    self._entries.move_to_end(id)
+                    self.hits += 1
+                    return True, entry[0]
+                del self._entries[id]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def store(self, id: ID, entity: T | None) -> None:
+        """Store the entity of an identifier, or None if it was not found.
+
+        Args:
+            id (ID): The identifier.
+            entity (T | None): The entity, None if the identifier was not found.
+        """
+        ttl = self.ttl if entity is not None else self.negative_ttl
+        if ttl == 0:
+            return
+        with self._lock:
+            self._entries[id] = (entity, self._clock() + ttl)
+            self._entries.move_to_end(id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, id: ID) -> None:
+        """Drop the entry of an identifier, if any.
+
+        Args:
+            id (ID): The identifier.
+        """
+        with self._lock:
+            self._entries.pop(id, None)
+
+    def invalidate_many(self, ids: Iterable[ID]) -> None:
+        """Drop the entries of several identifiers.
+
+        Args:
+            ids (Iterable[ID]): The identifiers.
+        """
+        with self._lock:
+            for id in ids:
+                self._entries.pop(id, None)
+
+    def clear(self) -> None:
+        """Drop all the entries, keeping the counters."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["EntityCache"]
@@ -0,0 +1,12 @@
+"""Module exporting the tools of the database migrations.
+
+Schema migrations are run by Alembic. `Backfill` migrates the data of large tables
+alongside, by chunks of primary keys committed one at a time, throttled and resumable,
+and `run_backfill()` runs it from a migration. `reshard()` moves the rows of a sharded
+table when the number of shards changes.
+"""
+
+from .backfill import Backfill, BackfillChange, BackfillProgress, run_backfill
+from .resharding import ReshardProgress, reshard
+
+__all__ = ["Backfill", "BackfillChange", "BackfillProgress", "run_backfill", "ReshardProgress", "reshard"]
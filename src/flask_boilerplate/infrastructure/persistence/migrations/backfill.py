@@ -0,0 +1,288 @@
+"""Module defining the chunked, throttled and resumable data backfills of the migrations.
+
+A schema change often comes with a data backfill, such as filling a new column from
+the existing ones. Run as a single UPDATE over a large table, the backfill locks the
+rows for the whole statement and writes them to the WAL in one transaction, which the
+replicas then replay at once.
+
+`Backfill` walks the table by ranges of its primary key instead, and commits each
+range in its own transaction:
+
+- the upper bound of each range is read from the primary key index, so that each chunk
+  changes at most `chunk_size` rows, whatever the distribution of the keys;
+- after each chunk, it pauses for `pause_ratio` times the duration of the chunk, to
+  leave the table to the application and let the replicas catch up. A chunk slower
+  than `target_chunk_seconds` halves the size of the next ones, and a chunk faster
+  than half of it doubles it again, up to `chunk_size`;
+- the last key of each chunk is recorded in the `backfill_checkpoints` table, in the
+  transaction of the chunk: a backfill interrupted at any point resumes after its
+  last committed chunk when run again under the same name.
+
+In an Alembic migration, run the backfill with `run_backfill()`, which commits the
+transaction of the migration first, so that the backfill can commit its chunks.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from alembic import op
+from sqlalchemy import Column, ColumnElement, Connection, Table, Update, and_, func, insert, select, update
+
+from ..configurations.backfill_checkpoint_configuration import backfill_checkpoints_table
+
+# The change of a chunk: an UPDATE statement, restricted to the rows of the chunk, or a
+# function applying the change to the rows matching a condition and returning their count.
+BackfillChange = Update | Callable[[Connection, ColumnElement[bool]], int]
+
+
+class BackfillProgress(NamedTuple):
+    """Progress of a backfill, reported after each chunk.
+
+    Attributes:
+        name (str): The name of the backfill.
+        last_id (Any): The primary key of the last row processed, None before the first.
+        rows (int): The number of rows changed since the backfill started, across runs.
+        run_rows (int): The number of rows changed by the current run.
+        chunks (int): The number of chunks committed by the current run.
+        seconds (float): The time elapsed since the current run started, in seconds.
+    """
+
+    name: str
+    last_id: Any
+    rows: int
+    run_rows: int
+    chunks: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """float: The throughput of the current run, in rows per second."""
+        return self.run_rows / self.seconds if self.seconds > 0 else 0.0
+
+
+class Backfill:
+    """Backfill of a table by chunks of primary keys, each committed in its own transaction.
+
+    Example:
+        >>> backfill = Backfill(
+        ...     "20250101_fill_slugs",
+        ...     users_table,
+        ...     update(users_table).values(slug=func.lower(users_table.c.name)),
+        ...     chunk_size=5000,
+        ...     on_progress=lambda progress: print(f"{progress.rows:,} rows, {progress.rows_per_second:,.0f} / s"),
+        ... )
+        >>> with engine.connect() as connection:
+        ...     backfill.run(connection)
+
+    Attributes:
+        name (str): The name of the backfill, identifying its checkpoint.
+        table (Table): The table to backfill. Its primary key must be a single column
+            whose values round-trip through `str()`, such as integers or UUIDs.
+        change (BackfillChange): The change to apply to the rows of each chunk.
+        chunk_size (int): The maximum number of rows of a chunk.
+        pause_ratio (float): The pause after each chunk, relative to its duration.
+        max_pause (float): The maximum pause after a chunk, in seconds.
+        target_chunk_seconds (float | None): The duration above which chunks are made
+            smaller, in seconds; None to keep `chunk_size`.
+        on_progress (Callable[[BackfillProgress], None] | None): The function called
+            with the progress after each chunk.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        table: Table,
+        change: BackfillChange,
+        chunk_size: int = 1000,
+        pause_ratio: float = 1.0,
+        max_pause: float = 5.0,
+        target_chunk_seconds: float | None = 0.5,
+        on_progress: Callable[[BackfillProgress], None] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the backfill.
+
+        Args:
+            name (str): The name of the backfill, identifying its checkpoint.
+            table (Table): The table to backfill, with a single-column primary key.
+            change (BackfillChange): The UPDATE statement to apply to the rows of each
+                chunk, or a function applying the change to the rows matching a condition
+                on a connection and returning their count.
+            chunk_size (int): The maximum number of rows of a chunk.
+            pause_ratio (float): The pause after each chunk, relative to its duration;
+                0 not to pause.
+            max_pause (float): The maximum pause after a chunk, in seconds.
+            target_chunk_seconds (float | None): The duration above which chunks are
+                made smaller, in seconds; None to keep `chunk_size`.
+            on_progress (Callable[[BackfillProgress], None] | None): The function called
+                with the progress after each chunk.
+            sleep (Callable[[float], None]): The function waiting a delay, in seconds.
+            clock (Callable[[], float]): The function returning the current time, in
+                seconds.
+
+        Raises:
+            ValueError: If the primary key of the table is not a single column, the
+                chunk size is not positive, or a duration is negative.
+        """
+        if len(table.primary_key.columns) != 1:
+            raise ValueError(f"{table.name!r} must have a single-column primary key to be backfilled.")
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be positive, got {chunk_size}.")
+        if pause_ratio < 0 or max_pause < 0 or (target_chunk_seconds is not None and target_chunk_seconds <= 0):
+            raise ValueError("The pauses must not be negative, and the target duration must be positive.")
+        self.name = name
+        self.table = table
+        self.change = change
+        self.chunk_size = chunk_size
+        self.pause_ratio = pause_ratio
+        self.max_pause = max_pause
+        self.target_chunk_seconds = target_chunk_seconds
+        self.on_progress = on_progress
+        self._sleep = sleep
+        self._clock = clock
+        self._key: Column[Any] = next(iter(table.primary_key.columns))
+
+    def run(self, connection: Connection) -> BackfillProgress:
+        """Run the backfill, from its checkpoint, until all the rows are processed.
+
+        Args:
+            connection (Connection): The connection to run the backfill on, outside of
+                any transaction: the backfill begins and commits its own.
+
+        Returns:
+            BackfillProgress: The progress at the end of the run.
+
+        Raises:
+            ValueError: If the connection is within a transaction.
+        """
+        if connection.in_transaction():
+            raise ValueError("A backfill commits each chunk, and must run outside of a transaction.")
+        with connection.begin():
+            last_id, rows = self._load_checkpoint(connection)
+        size = self.chunk_size
+        run_rows = chunks = 0
+        start = self._clock()
+        last = False
+        while not last:
+            chunk_start = self._clock()
+            with connection.begin():
+                upper, last = self._upper_bound(connection, last_id, size)
+                if upper is None:
+                    break
+                condition = self._key <= upper if last_id is None else and_(self._key > last_id, self._key <= upper)
+                changed = self._apply(connection, condition)
+                last_id, rows, run_rows, chunks = upper, rows + changed, run_rows + changed, chunks + 1
+                connection.execute(
+                    update(backfill_checkpoints_table)
+                    .where(backfill_checkpoints_table.c.name == self.name)
+                    .values(last_id=str(last_id), rows=rows)
+                )
+            now = self._clock()
+            elapsed = now - chunk_start
+            if self.on_progress is not None:
+                self.on_progress(BackfillProgress(self.name, last_id, rows, run_rows, chunks, now - start))
+            size = self._next_size(size, elapsed)
+            if not last and self.pause_ratio > 0:
+                self._sleep(min(self.max_pause, elapsed * self.pause_ratio))
+        return BackfillProgress(self.name, last_id, rows, run_rows, chunks, self._clock() - start)
+
+    def _load_checkpoint(self, connection: Connection) -> tuple[Any, int]:
+        """Read the checkpoint of the backfill, creating it on the first run.
+
+        Args:
+            connection (Connection): The connection, within a transaction.
+
+        Returns:
+            tuple[Any, int]: The primary key of the last row processed, None if none
+                was, and the number of rows changed so far.
+        """
+        backfill_checkpoints_table.create(connection, checkfirst=True)
+        checkpoint = connection.execute(
+            select(backfill_checkpoints_table.c.last_id, backfill_checkpoints_table.c.rows).where(
+                backfill_checkpoints_table.c.name == self.name
+            )
+        ).first()
+        if checkpoint is None:
+            connection.execute(insert(backfill_checkpoints_table).values(name=self.name, last_id=None, rows=0))
+            return None, 0
+        last_id = None if checkpoint.last_id is None else self._key.type.python_type(checkpoint.last_id)
+        return last_id, checkpoint.rows
+
+    def _upper_bound(self, connection: Connection, last_id: Any, size: int) -> tuple[Any, bool]:
+        """Find the upper bound of the next chunk, from the primary key index.
+
+        Args:
+            connection (Connection): The connection, within a transaction.
+            last_id (Any): The primary key of the last row processed, None if none was.
+            size (int): The number of rows of the chunk.
+
+        Returns:
+            tuple[Any, bool]: The primary key of the last row of the chunk, None if no
+                row is left, and whether the chunk holds the last rows of the table.
+        """
+        remaining = select(self._key) if last_id is None else select(self._key).where(self._key > last_id)
+        upper = connection.execute(remaining.order_by(self._key).offset(size - 1).limit(1)).scalar()
+        if upper is not None:
+            return upper, False
+        return connection.execute(remaining.with_only_columns(func.max(self._key))).scalar(), True
+
+    def _apply(self, connection: Connection, condition: ColumnElement[bool]) -> int:
+        """Apply the change to the rows of a chunk.
+
+        Args:
+            connection (Connection): The connection, within a transaction.
+            condition (ColumnElement[bool]): The condition on the primary key selecting
+                the rows of the chunk.
+
+        Returns:
+            int: The number of rows changed.
+        """
+        if isinstance(self.change, Update):
+            return connection.execute(self.change.where(condition)).rowcount
+        return self.change(connection, condition)
+
+    def _next_size(self, size: int, elapsed: float) -> int:
+        """Adapt the size of the next chunk to the duration of the last one.
+
+        Args:
+            size (int): The size of the last chunk.
+            elapsed (float): The duration of the last chunk, in seconds.
+
+        Returns:
+            int: The size of the next chunk.
+        """
+        if self.target_chunk_seconds is None:
+            return size
+        if elapsed > self.target_chunk_seconds:
+            return max(1, size // 2)
+        if elapsed < self.target_chunk_seconds / 2:
+            return min(self.chunk_size, size * 2)
+        return size
+
+
+def run_backfill(backfill: Backfill) -> BackfillProgress:
+    """Run a backfill from the `upgrade()` of an Alembic migration.
+
+    The transaction of the migration is committed first, with the schema changes made so
+    far, and the backfill runs on a connection of its own, committing each chunk. The
+    rest of the migration runs in a new transaction.
+
+    Example:
+        >>> def upgrade() -> None:
+        ...     op.add_column("users", sa.Column("slug", sa.String(255)))
+        ...     run_backfill(Backfill("fill_users_slug", users_table, fill_slugs))
+
+    Args:
+        backfill (Backfill): The backfill to run.
+
+    Returns:
+        BackfillProgress: The progress at the end of the backfill.
+    """
+    with op.get_context().autocommit_block(), op.get_bind().engine.connect() as connection:
+        return backfill.run(connection)
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["Backfill", "BackfillChange", "BackfillProgress", "run_backfill"]
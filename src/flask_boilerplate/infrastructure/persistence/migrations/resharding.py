@@ -0,0 +1,143 @@
+"""Module defining the moves of the rows of a sharded table when the shards change.
+
+A `ShardedRepository` places each row on the shard `shard_for(id, N)` of its
+identifier. When the number of shards changes, `reshard()` walks each source shard by
+chunks of primary keys, and moves the rows whose shard changed to their new shard.
+With the jump consistent hash of `shard_for()`, going from N to N + 1 shards moves
+only 1 / (N + 1) of the rows, all of them to the new shard.
+
+Each chunk is first written to the target shards, replacing any copy left there by an
+interrupted run, and only then deleted from its source shard, each step in its own
+transaction: a move interrupted at any point is completed by running `reshard()`
+again, and no row is ever lost, though a row may briefly exist on both shards.
+
+The writes to the table should be paused while it runs, and the repositories switched
+to the new shards once it returns.
+"""
+
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, NamedTuple
+
+from sqlalchemy import Connection, Engine, Table, delete, insert, select
+
+from ..parameter_limits import max_bind_parameters
+from ..repositories.sharded_repository import shard_for
+
+
+class ReshardProgress(NamedTuple):
+    """Progress of a resharding, reported after each chunk.
+
+    Attributes:
+        source (int): The index of the source shard being walked.
+        scanned (int): The number of rows read from the source shards.
+        moved (int): The number of rows moved to another shard.
+        seconds (float): The time elapsed since the resharding started, in seconds.
+    """
+
+    source: int
+    scanned: int
+    moved: int
+    seconds: float
+
+
+def reshard(
+    table: Table,
+    sources: Sequence[Engine],
+    targets: Sequence[Engine],
+    chunk_size: int = 1000,
+    on_progress: Callable[[ReshardProgress], None] | None = None,
+    clock: Callable[[], float] = time.monotonic,
+) -> ReshardProgress:
+    """Move the rows of a sharded table from the current shards to the new ones.
+
+    A source and a target are the same shard when they are the same engine or have the
+    same URL: the rows staying on their shard are not written.
+
+    Example:
+        >>> reshard(entity_examples_table, engines, [*engines, new_engine])
+
+    Args:
+        table (Table): The table, with a single-column primary key named `id`. It must
+            exist on all the shards.
+        sources (Sequence[Engine]): The engines of the current shards, by index.
+        targets (Sequence[Engine]): The engines of the new shards, by index.
+        chunk_size (int): The maximum number of rows read and moved at once. Their
+            deletes are split further to stay within the parameter limit of each shard.
+        on_progress (Callable[[ReshardProgress], None] | None): The function called with
+            the progress after each chunk.
+        clock (Callable[[], float]): The function returning the current time, in seconds.
+
+    Returns:
+        ReshardProgress: The progress at the end of the resharding.
+
+    Raises:
+        ValueError: If there is no target, or the chunk size is not positive.
+    """
+    if not targets:
+        raise ValueError("The rows must be moved to at least one shard.")
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be positive, got {chunk_size}.")
+    id = table.c.id
+    start = clock()
+    scanned = moved = 0
+    progress = ReshardProgress(0, 0, 0, 0.0)
+    for index, source in enumerate(sources):
+        last_id: Any = None
+        while True:
+            statement = select(table).order_by(id).limit(chunk_size)
+            if last_id is not None:
+                statement = statement.where(id > last_id)
+            with source.connect() as connection:
+                rows = connection.execute(statement).all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+            scanned += len(rows)
+            moves: dict[int, list[dict[str, Any]]] = {}
+            for row in rows:
+                shard = shard_for(row.id, len(targets))
+                if not _same_database(source, targets[shard]):
+                    moves.setdefault(shard, []).append(dict(row._mapping))
+            for shard, values in moves.items():
+                with targets[shard].begin() as connection:
+                    _delete_ids(connection, table, [value["id"] for value in values])
+                    connection.execute(insert(table), values)
+            if moves:
+                with source.begin() as connection:
+                    _delete_ids(connection, table, [value["id"] for values in moves.values() for value in values])
+                moved += sum(map(len, moves.values()))
+            progress = ReshardProgress(index, scanned, moved, clock() - start)
+            if on_progress is not None:
+                on_progress(progress)
+    return progress._replace(seconds=clock() - start)
+
+
+def _delete_ids(connection: Connection, table: Table, ids: list[Any]) -> None:
+    """Delete rows by identifier, in chunks within the parameter limit of the database.
+
+    Args:
+        connection (Connection): The connection, within a transaction.
+        table (Table): The table of the rows.
+        ids (list[Any]): The identifiers of the rows.
+    """
+    size = max_bind_parameters(connection)
+    for start in range(0, len(ids), size):
+        connection.execute(delete(table).where(table.c.id.in_(ids[start : start + size])))
+
+
+def _same_database(first: Engine, second: Engine) -> bool:
+    """Tell whether two engines connect to the same database.
+
+    Args:
+        first (Engine): The first engine.
+        second (Engine): The second engine.
+
+    Returns:
+        bool: Whether the engines are the same, or have the same URL.
+    """
+    return first is second or first.url == second.url
+
+
+# Add the function to __all__ for re-export in the parent module.
+__all__ = ["ReshardProgress", "reshard"]
@@ -0,0 +1,88 @@
+"""Module defining the transactional outbox of the domain events.
+
+Publishing the domain events to a broker during the request adds the latency of the
+broker to every write, and loses the events of a process stopping between its commit
+and its publication. A `SqlAlchemyUnitOfWork` given an `Outbox` instead inserts the
+events raised by its aggregates into the `outbox_messages` table, in the transaction
+of the aggregates: the events are recorded if and only if the changes are committed.
+
+An `OutboxRelay` of the background jobs then claims the recorded messages, publishes
+them in batches, and marks them as published.
+"""
+
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Connection, Table, insert
+
+from flask_boilerplate.domain.primitives.interface_domain_event import DomainEvent
+from flask_boilerplate.infrastructure.serialization.json_encoder import encode_value
+
+from .configurations.outbox_message_configuration import outbox_messages_table
+
+
+def utc_now() -> datetime:
+    """Get the current time, in UTC.
+
+    Returns:
+        datetime: The current time, timezone-aware.
+    """
+    return datetime.now(UTC)
+
+
+class Outbox:
+    """Writer of the domain events into the outbox table, within a transaction.
+
+    Example:
+        >>> unit_of_work = SqlAlchemyUnitOfWork(engine, {"users": UserRepository}, outbox=Outbox())
+        >>> with unit_of_work:
+        ...     unit_of_work.repositories()["users"].add(User.register(email))
+        ...     unit_of_work.commit()  # Inserts the user and its `UserRegistered` event.
+
+    Attributes:
+        table (Table): The outbox table.
+    """
+
+    def __init__(
+        self,
+        table: Table = outbox_messages_table,
+        encode: Callable[[Any], str] = encode_value,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        """Initialize the outbox.
+
+        Args:
+            table (Table): The outbox table, with the columns of `outbox_messages_table`.
+            encode (Callable[[Any], str]): The function encoding an event as JSON text.
+            clock (Callable[[], datetime]): The function returning the current time, in
+                UTC.
+        """
+        self.table = table
+        self._encode = encode
+        self._clock = clock
+
+    def write(self, connection: Connection, events: Sequence[DomainEvent]) -> int:
+        """Insert events into the outbox, with a single executemany INSERT.
+
+        Args:
+            connection (Connection): The connection, within the transaction of the
+                aggregates that raised the events.
+            events (Sequence[DomainEvent]): The events, in the order they were raised.
+
+        Returns:
+            int: The number of messages inserted.
+        """
+        if not events:
+            return 0
+        now = self._clock()
+        encode = self._encode
+        connection.execute(
+            insert(self.table),
+            [{"topic": event.event_name, "payload": encode(event), "created_at": now} for event in events],
+        )
+        return len(events)
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["Outbox", "utc_now"]
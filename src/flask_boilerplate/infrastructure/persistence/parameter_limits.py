@@ -0,0 +1,52 @@
+"""Module defining the maximum number of bound parameters of a statement per database.
+
+Databases cap the number of bound parameters a single statement can carry, or the
+number of values of an `IN` list, and reject the statements exceeding it. Repositories
+querying many identifiers at once, as `get_many()` does, split them into chunks that
+stay under the limit returned by `max_bind_parameters()`.
+
+SQLite reports its compile-time limit on the connection itself. For the other
+databases, the documented limits are used, and a conservative default for the
+dialects not listed.
+"""
+
+import sqlite3
+
+from sqlalchemy import Connection
+
+# The documented maximum number of bound parameters of a statement, by dialect name.
+# Oracle caps the number of expressions of an IN list rather than the parameters.
+_MAX_BIND_PARAMETERS = {
+    "postgresql": 32767,
+    "mysql": 65535,
+    "mariadb": 65535,
+    "mssql": 2100,
+    "oracle": 1000,
+}
+
+# The limit assumed for the dialects not listed: the historical default of SQLite,
+# below the limits of all the listed databases.
+DEFAULT_MAX_BIND_PARAMETERS = 999
+
+
+def max_bind_parameters(connection: Connection) -> int:
+    """Get the maximum number of bound parameters of a statement on a connection.
+
+    Args:
+        connection (Connection): The connection the statements are executed on.
+
+    Returns:
+        int: The maximum number of bound parameters.
+    """
+    dialect = connection.dialect.name
+    if dialect == "sqlite":
+        getlimit = getattr(connection.connection.dbapi_connection, "getlimit", None)
+        if getlimit is not None:
+            return int(getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER))
+        # The default limit was raised from 999 to 32766 in SQLite 3.32.
+        return 32766 if sqlite3.sqlite_version_info >= (3, 32) else DEFAULT_MAX_BIND_PARAMETERS
+    return _MAX_BIND_PARAMETERS.get(dialect, DEFAULT_MAX_BIND_PARAMETERS)
+
+
+# Add the constant and the function to __all__ for re-export in the parent module.
+__all__ = ["DEFAULT_MAX_BIND_PARAMETERS", "max_bind_parameters"]
@@ -0,0 +1,30 @@
+"""Module exporting the repositories of the persistence layer.
+
+Repositories implement the `Repository` interface of the domain layer on top of
+SQLAlchemy, or in memory with secondary indexes. `CachingRepository` decorates any of
+them with a read-through cache, and `AsyncSqlAlchemyRepository` runs them on an
+asyncio connection. `ShardedRepository` spreads the entities over the repositories of
+several databases, by a stable hash of their identifier.
+"""
+
+from .async_sqlalchemy_repository import AsyncSqlAlchemyRepository
+from .caching_repository import CachingRepository
+from .entity_example_repository import EntityExampleRepository
+from .in_memory_indexes import HashIndex, Index, SortedIndex
+from .in_memory_repository import InMemoryRepository
+from .sharded_repository import ShardedRepository, jump_hash, shard_for
+from .sqlalchemy_repository import SqlAlchemyRepository
+
+__all__ = [
+    "SqlAlchemyRepository",
+    "EntityExampleRepository",
+    "InMemoryRepository",
+    "Index",
+    "HashIndex",
+    "SortedIndex",
+    "CachingRepository",
+    "AsyncSqlAlchemyRepository",
+    "ShardedRepository",
+    "jump_hash",
+    "shard_for",
+]
@@ -0,0 +1,195 @@
+"""Module defining the asynchronous SQLAlchemy repositories.
+
+`AsyncSqlAlchemyRepository` implements the `AsyncRepository` interface of the domain
+layer on a SQLAlchemy `AsyncConnection`, such as one of an aiosqlite or asyncpg
+engine. Rather than duplicating the SQLAlchemy repositories, it runs the repository
+created on the synchronous side of the connection through `AsyncConnection.run_sync()`:
+the repository code runs in a greenlet, and each time it waits for the database, the
+event loop is free to serve other tasks.
+
+The asynchronous repositories therefore behave exactly like the synchronous ones,
+identity map, write batch, change tracking and caching included. Streaming all the
+entities with `list()` runs the synchronous stream one batch of `stream_batch_size`
+entities at a time.
+"""
+
+import builtins
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Sequence
+from itertools import islice
+from typing import Any, ParamSpec, TypeVar
+
+from sqlalchemy import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from flask_boilerplate.domain.primitives.async_repository import AsyncRepository
+from flask_boilerplate.domain.primitives.repository import GetManyResult, Repository
+from flask_boilerplate.domain.primitives.specification import Specification
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+R = TypeVar("R")
+P = ParamSpec("P")
+
+
+class AsyncSqlAlchemyRepository(AsyncRepository[T, ID]):
+    """Asynchronous repository running a synchronous repository on an `AsyncConnection`.
+
+    Example:
+        >>> async with engine.connect() as connection:
+        ...     repository = AsyncSqlAlchemyRepository(
+        ...         connection, EntityExampleRepository(connection.sync_connection)
+        ...     )
+        ...     entity = await repository.get(entity_id)
+
+    Attributes:
+        connection (AsyncConnection): The connection the repository executes its
+            statements on.
+        repository (Repository[T, ID]): The synchronous repository, created on the
+            synchronous connection of `connection`.
+        stream_batch_size (int): The number of entities loaded at once when all the
+            entities are streamed.
+    """
+
+    def __init__(self, connection: AsyncConnection, repository: Repository[T, ID]) -> None:
+        """Initialize the repository.
+
+        Args:
+            connection (AsyncConnection): The connection to execute statements on.
+            repository (Repository[T, ID]): The synchronous repository, created on
+                `connection.sync_connection`.
+        """
+        self.connection = connection
+        self.repository = repository
+        self.stream_batch_size: int = getattr(repository, "stream_batch_size", 1000)
+
+    async def add(self, entity: T) -> None:
+        """Add a new entity, or record its insertion in the write batch.
+
+        Args:
+            entity (T): The entity to add.
+        """
+        await self._run(self.repository.add, entity)
+
+    async def get(self, id: ID) -> T | None:
+        """Retrieve an entity by its unique identifier.
+
+        Args:
+            id (ID): The unique identifier of the entity.
+
+        Returns:
+            T | None: The entity if found, otherwise None.
+        """
+        return await self._run(self.repository.get, id)
+
+    async def get_many(self, ids: Iterable[ID]) -> GetManyResult[T, ID]:
+        """Retrieve several entities by their unique identifiers, with chunked `IN` queries.
+
+        Args:
+            ids (Iterable[ID]): The unique identifiers of the entities.
+
+        Returns:
+            GetManyResult[T, ID]: The entities found, in the order of their identifiers,
+                and the identifiers not found.
+        """
+        return await self._run(self.repository.get_many, builtins.list(ids))
+
+    async def list(self, after: ID | None = None, limit: int | None = None) -> AsyncIterator[T]:
+        """Iterate over all entities, streamed in batches, or over a page of entities.
+
+        Args:
+            after (ID | None): The identifier after which the page starts, None for the
+                first page.
+            limit (int | None): The maximum number of entities of the page.
+
+        Yields:
+            T: The entities.
+        """
+        if after is not None or limit is not None:
+            for entity in await self._run(_materialize, self.repository.list, after, limit):
+                yield entity
+            return
+        entities = iter(await self._run(self.repository.list))
+        try:
+            while batch := await self._run(_take, entities, self.stream_batch_size):
+                for entity in batch:
+                    yield entity
+        finally:
+            # Closing the stream closes its result, which has to run in a greenlet too.
+            close = getattr(entities, "close", None)
+            if close is not None:
+                await self._run(close)
+
+    async def remove(self, entity: T) -> None:
+        """Delete an entity, or record its deletion in the write batch.
+
+        Args:
+            entity (T): The entity to remove.
+        """
+        await self._run(self.repository.remove, entity)
+
+    async def find(
+        self,
+        specification: Specification[T],
+        limit: int | None = None,
+        order_by: str | Sequence[str] | None = None,
+    ) -> builtins.list[T]:
+        """Retrieve the entities satisfying a specification, with a single query.
+
+        Args:
+            specification (Specification[T]): The specification to satisfy.
+            limit (int | None): The maximum number of entities to return.
+            order_by (str | Sequence[str] | None): The attribute name(s) to sort by,
+                prefixed with "-" for a descending order.
+
+        Returns:
+            builtins.list[T]: The satisfying entities.
+        """
+        return await self._run(self.repository.find, specification, limit, order_by)
+
+    async def _run(self, function: Callable[P, R], *args: P.args, **kwargs: P.kwargs) -> R:
+        """Call a function of the synchronous repository in a greenlet.
+
+        Args:
+            function (Callable[P, R]): The function to call.
+            *args (P.args): The positional arguments of the function.
+            **kwargs (P.kwargs): The keyword arguments of the function.
+
+        Returns:
+            R: The result of the function.
+        """
+
+        def call(connection: Connection) -> R:
+            return function(*args, **kwargs)
+
+        return await self.connection.run_sync(call)
+
+
+def _materialize(page: Callable[[Any, Any], Iterable[T]], after: Any, limit: Any) -> builtins.list[T]:
+    """Get a page of entities as a list.
+
+    Args:
+        page (Callable[[Any, Any], Iterable[T]]): The `list()` method of the repository.
+        after (Any): The identifier after which the page starts.
+        limit (Any): The maximum number of entities of the page.
+
+    Returns:
+        builtins.list[T]: The entities of the page.
+    """
+    return builtins.list(page(after, limit))
+
+
+def _take(entities: Iterator[T], size: int) -> builtins.list[T]:
+    """Take the next entities of an iterator.
+
+    Args:
+        entities (Iterator[T]): The iterator.
+        size (int): The maximum number of entities to take.
+
+    Returns:
+        builtins.list[T]: The entities, none once the iterator is exhausted.
+    """
+    return builtins.list(islice(entities, size))
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["AsyncSqlAlchemyRepository"]
@@ -0,0 +1,255 @@
+"""Module defining the read-through caching decorator of repositories.
+
+`CachingRepository` wraps any `Repository` and answers `get()` and `get_many()` from
+a process-wide `EntityCache` when it can, reading through to the wrapped repository
+otherwise and caching what it read, including the identifiers that were not found.
+
+The cache keeps copies of the entities (see `Entity.__copy__()`), and hands out
+copies of them, so that an entity changed within a unit of work never changes the
+cached one seen by the other units of work. Within a unit of work, the copies are
+registered in its identity map, so that the changes made to them are written like
+those made to the entities loaded from the database.
+
+The entries of the entities added or removed through the decorator are invalidated
+at once. A `SqlAlchemyUnitOfWork` created with caches also invalidates the entries of
+all the rows it wrote, including the updates of changed entities, once its
+transaction is committed. Other writes are seen when the entries expire.
+
+Given the `WriteBatch` of its unit of work, the decorator bypasses the cache for the
+rows the unit of work writes: their uncommitted state, read through the transaction,
+is neither cached for the other units of work nor shadowed by the committed state the
+cache holds.
+"""
+
+import builtins
+from collections.abc import Hashable, Iterable, Sequence
+from copy import copy
+from operator import attrgetter
+from typing import TypeVar, cast
+
+from sqlalchemy import Table
+
+from flask_boilerplate.domain.primitives.identity_map import IdentityMap
+from flask_boilerplate.domain.primitives.repository import GetManyResult, Repository
+from flask_boilerplate.domain.primitives.specification import Specification
+
+from ..entity_cache import EntityCache
+from ..write_batch import WriteBatch
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+
+
+class CachingRepository(Repository[T, ID]):
+    """Repository decorator caching the entities read by identifier.
+
+    Example:
+        >>> cache = EntityCache[EntityExample, UUID](maxsize=10_000, ttl=60.0)
+        >>> repository = CachingRepository(EntityExampleRepository(connection), cache)
+        >>> repository.get(entity_id)  # Reads the database, and caches the entity.
+        >>> repository.get(entity_id)  # Reads the cache.
+        >>> cache.hits, cache.misses
+        (1, 1)
+
+    Attributes:
+        repository (Repository[T, ID]): The wrapped repository.
+        cache (EntityCache[T, ID]): The cache of the entities.
+        identity_map (IdentityMap | None): The identity map of the unit of work the
+            repository belongs to, if any.
+        kind (Hashable): The kind of the entities in the identity map.
+        id_attribute (str): The name of the identifier attribute of the entities.
+        write_batch (WriteBatch | None): The write batch of the unit of work the
+            repository belongs to, if any.
+    """
+
+    def __init__(
+        self,
+        repository: Repository[T, ID],
+        cache: EntityCache[T, ID],
+        identity_map: IdentityMap | None = None,
+        kind: Hashable = None,
+        id_attribute: str = "id",
+        write_batch: WriteBatch | None = None,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            repository (Repository[T, ID]): The repository to wrap.
+            cache (EntityCache[T, ID]): The cache of the entities, shared by the
+                decorators of the repositories of the same entities.
+            identity_map (IdentityMap | None): The identity map of the unit of work the
+                repository belongs to, if any.
+            kind (Hashable): The kind of the entities in the identity map, such as the
+                table of a `SqlAlchemyRepository`.
+            id_attribute (str): The name of the identifier attribute of the entities.
+            write_batch (WriteBatch | None): The write batch of the unit of work the
+                repository belongs to, if any: the rows it writes are not cached, since
+                the transaction reads their uncommitted state.
+        """
+        self.repository = repository
+        self.cache = cache
+        self.identity_map = identity_map
+        self.kind = kind
+        self.id_attribute = id_attribute
+        self.write_batch = write_batch
+        self._identifier = attrgetter(id_attribute)
+
+    def add(self, entity: T) -> None:
+        """Add an entity to the wrapped repository, and invalidate its entry.
+
+        Args:
+            entity (T): The entity to add.
+        """
+        self.repository.add(entity)
+        self.cache.invalidate(self._identifier(entity))
+
+    def get(self, id: ID) -> T | None:
+        """Retrieve an entity from the identity map, the cache or the wrapped repository.
+
+        Args:
+            id (ID): The unique identifier of the entity.
+
+        Returns:
+            T | None: The entity if found, otherwise None.
+        """
+        entity = self._mapped(id)
+        if entity is not None:
+            return entity
+        if self._is_written(id):
+            return self.repository.get(id)
+        hit, cached = self.cache.lookup(id)
+        if hit:
+            return None if cached is None else self._register(id, copy(cached))
+        entity = self.repository.get(id)
+        if not self._is_written(id):
+            self.cache.store(id, None if entity is None else copy(entity))
+        return entity
+
+    def get_many(self, ids: Iterable[ID]) -> GetManyResult[T, ID]:
+        """Retrieve several entities, reading the ones not cached with a single call.
+
+        Args:
+            ids (Iterable[ID]): The unique identifiers of the entities.
+
+        Returns:
+            GetManyResult[T, ID]: The entities found, in the order of their identifiers,
+                and the identifiers not found.
+        """
+        ids = builtins.list(ids)
+        found: dict[ID, T] = {}
+        uncached: builtins.list[ID] = []
+        for id in dict.fromkeys(ids):
+            entity = self._mapped(id)
+            if entity is None:
+                if self._is_written(id):
+                    uncached.append(id)
+                    continue
+                hit, cached = self.cache.lookup(id)
+                if not hit:
+                    uncached.append(id)
+                    continue
+                if cached is not None:
+                    entity = self._register(id, copy(cached))
+            if entity is not None:
+                found[id] = entity
+        if uncached:
+            result = self.repository.get_many(uncached)
+            # The result holds one entity per identifier found, in the order of the
+            # identifiers.
+            absent = set(result.missing)
+            for id, entity in zip([id for id in uncached if id not in absent], result, strict=True):
+                found[id] = entity
+                if not self._is_written(id):
+                    self.cache.store(id, copy(entity))
+            for id in result.missing:
+                if not self._is_written(id):
+                    self.cache.store(id, None)
+        return GetManyResult(
+            [found[id] for id in ids if id in found],
+            [id for id in dict.fromkeys(ids) if id not in found],
+        )
+
+    def list(self, after: ID | None = None, limit: int | None = None) -> Iterable[T]:
+        """Retrieve the entities from the wrapped repository, without caching them.
+
+        Args:
+            after (ID | None): The identifier after which the page starts, None for the
+                first page.
+            limit (int | None): The maximum number of entities of the page.
+
+        Returns:
+            Iterable[T]: The entities.
+        """
+        return self.repository.list(after, limit)
+
+    def remove(self, entity: T) -> None:
+        """Remove an entity from the wrapped repository, and invalidate its entry.
+
+        Args:
+            entity (T): The entity to remove.
+        """
+        self.repository.remove(entity)
+        self.cache.invalidate(self._identifier(entity))
+
+    def find(
+        self,
+        specification: Specification[T],
+        limit: int | None = None,
+        order_by: str | Sequence[str] | None = None,
+    ) -> builtins.list[T]:
+        """Retrieve the entities satisfying a specification from the wrapped repository.
+
+        Args:
+            specification (Specification[T]): The specification to satisfy.
+            limit (int | None): The maximum number of entities to return.
+            order_by (str | Sequence[str] | None): The attribute name(s) to sort by,
+                prefixed with "-" for a descending order.
+
+        Returns:
+            builtins.list[T]: The satisfying entities.
+        """
+        return self.repository.find(specification, limit, order_by)
+
+    def _mapped(self, id: ID) -> T | None:
+        """Get the entity of an identifier from the identity map, without counting the lookup.
+
+        Args:
+            id (ID): The identifier.
+
+        Returns:
+            T | None: The entity if it is in the identity map, otherwise None.
+        """
+        if self.identity_map is None:
+            return None
+        entity: T | None = self.identity_map.entities(self.kind).get(id)
+        return entity
+
+    def _is_written(self, id: ID) -> bool:
+        """Tell whether the unit of work writes the row of an identifier, bypassing the cache.
+
+        Args:
+            id (ID): The identifier.
+
+        Returns:
+            bool: True if the row has a pending write, or was written by the transaction.
+        """
+        return self.write_batch is not None and self.write_batch.is_written(cast(Table, self.kind), id)
+
+    def _register(self, id: ID, entity: T) -> T:
+        """Register a copy of a cached entity in the identity map, if any.
+
+        Args:
+            id (ID): The identifier of the entity.
+            entity (T): The copy of the cached entity.
+
+        Returns:
+            T: The entity of the identifier in the identity map.
+        """
+        if self.identity_map is None:
+            return entity
+        registered: T = self.identity_map.add(self.kind, id, entity)
+        return registered
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["CachingRepository"]
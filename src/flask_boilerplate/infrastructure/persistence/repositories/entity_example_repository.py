@@ -0,0 +1,31 @@
+"""Module defining the SQLAlchemy repository of `EntityExample` entities."""
+
+from typing import Any, ClassVar
+from uuid import UUID
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+
+from .sqlalchemy_repository import SqlAlchemyRepository
+from ..configurations.entity_example_configuration import entity_example_mapping
+from ..configurations.entity_mapping import EntityMapping
+
+
+class EntityExampleRepository(SqlAlchemyRepository[EntityExample, UUID]):
+    """Repository storing `EntityExample` entities in the `entity_examples` table."""
+
+    mapping: ClassVar[EntityMapping[Any] | None] = entity_example_mapping
+
+    def _identifier(self, entity: EntityExample) -> UUID:
+        """Get the identifier of an entity.
+
+        Args:
+            entity (EntityExample): The entity.
+
+        Returns:
+            UUID: The identifier of the entity.
+        """
+        return entity.id
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["EntityExampleRepository"]
@@ -0,0 +1,432 @@
+"""Module defining the secondary indexes of the in-memory repository.
+
+An index maps the value of one attribute of the entities, its key, to the entities
+having that value, so that looking them up does not scan the whole repository.
+
+- `HashIndex` answers equality lookups in constant time. Its keys must be hashable.
+- `SortedIndex` keeps its keys ordered, and answers equality, range and prefix
+  lookups in logarithmic time. Its keys must be mutually comparable.
+
+Both indexes track entities by identity: the entity passed to `remove()` must be the
+one passed to `insert()`, with the key it was inserted with.
+
+The sorted index stores its keys in a list of sorted buckets of about `bucket_size`
+keys, rather than in a single list: inserting into a bucket moves at most a few
+thousand references, where inserting into a single list of a million keys would move
+half a million of them.
+"""
+
+import builtins
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from operator import attrgetter
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class Index(ABC, Generic[T]):
+    """Base class for the secondary indexes of entities on one attribute.
+
+    Attributes:
+        attribute (str): The name of the indexed attribute.
+        key (Callable[[T], Any]): The function getting the key of an entity.
+    """
+
+    def __init__(self, attribute: str) -> None:
+        """Initialize an empty index.
+
+        Args:
+            attribute (str): The name of the indexed attribute.
+        """
+        self.attribute = attribute
+        self.key = attrgetter(attribute)
+
+    @abstractmethod
+    def insert(self, key: Any, entity: T) -> None:
+        """Add an entity to the index.
+
+        Args:
+            key (Any): The value of the indexed attribute of the entity.
+            entity (T): The entity to add.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove(self, key: Any, entity: T) -> None:
+        """Remove an entity from the index.
+
+        Args:
+            key (Any): The value of the indexed attribute when the entity was inserted.
+            entity (T): The entity to remove.
+
+        Raises:
+            KeyError: If the entity is not indexed under this key.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def equal(self, key: Any) -> builtins.list[T]:
+        """Get the entities whose indexed attribute equals a key.
+
+        Args:
+            key (Any): The value to look up.
+
+        Returns:
+            builtins.list[T]: The entities, in insertion order for a hash index and in
+            key order for a sorted index.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def build(self, entities: Iterable[T]) -> None:
+        """Replace the content of the index with the given entities, in bulk.
+
+        Args:
+            entities (Iterable[T]): The entities to index.
+        """
+        raise NotImplementedError
+
+
+class _Bucket(list[Any]):
+    """The entities sharing a key in a hash index, when there are several of them."""
+
+    __slots__ = ()
+
+
+class HashIndex(Index[T]):
+    """Index answering equality lookups in constant time.
+
+    A key shared by a single entity, the common case for attributes such as names or
+    emails, maps directly to it, without a list.
+
+    Example:
+        >>> index = HashIndex("name")
+        >>> index.insert(entity.name, entity)
+        >>> index.equal("Example")
+        [EntityExample(...)]
+    """
+
+    def __init__(self, attribute: str) -> None:
+        """Initialize an empty index.
+
+        Args:
+            attribute (str): The name of the indexed attribute.
+        """
+        super().__init__(attribute)
+        self._entries: dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        """Get the number of distinct keys.
+
+        Returns:
+            int: The number of distinct keys.
+        """
+        return len(self._entries)
+
+    def insert(self, key: Any, entity: T) -> None:
+        """Add an entity to the index.
+
+        Args:
+            key (Any): The value of the indexed attribute of the entity.
+            entity (T): The entity to add.
+        """
+        current = self._entries.setdefault(key, entity)
+        if current is entity:
+            return
+        if type(current) is _Bucket:
+            current.append(entity)
+        else:
+            self._entries[key] = _Bucket((current, entity))
+
+    def remove(self, key: Any, entity: T) -> None:
+        """Remove an entity from the index.
+
+        Args:
+            key (Any): The value of the indexed attribute when the entity was inserted.
+            entity (T): The entity to remove.
+
+        Raises:
+            KeyError: If the entity is not indexed under this key.
+        """
+        current = self._entries[key]
+        if current is entity:
+            del self._entries[key]
+            return
+        if type(current) is _Bucket:
+            for position, candidate in enumerate(current):
+                if candidate is entity:
+                    del current[position]
+                    if len(current) == 1:
+                        self._entries[key] = current[0]
+                    return
+        raise KeyError(key)
+
+    def equal(self, key: Any) -> builtins.list[T]:
+        """Get the entities whose indexed attribute equals a key.
+
+        Args:
+            key (Any): The value to look up.
+
+        Returns:
+            builtins.list[T]: The entities, in insertion order.
+        """
+        current = self._entries.get(key)
+        if current is None:
+            return []
+        if type(current) is _Bucket:
+            return list(current)
+        return [current]
+
+    def build(self, entities: Iterable[T]) -> None:
+        """Replace the content of the index with the given entities, in bulk.
+
+        Args:
+            entities (Iterable[T]): The entities to index.
+        """
+        self._entries = {}
+        key = self.key
+        for entity in entities:
+            self.insert(key(entity), entity)
+
+
+class SortedIndex(Index[T]):
+    """Index keeping its keys ordered, for equality, range and prefix lookups.
+
+    Entities sharing a key are kept in insertion order. Lookups return lazy iterators
+    over the index: they must be consumed before the indexed entities are changed.
+
+    Example:
+        >>> index = SortedIndex("name")
+        >>> index.build(entities)
+        >>> list(index.range("a", "c"))
+        [EntityExample(name="a..."), EntityExample(name="b...")]
+        >>> list(index.prefix("ex", limit=10))
+        [EntityExample(name="example"), ...]
+
+    Attributes:
+        bucket_size (int): The number of keys per bucket after a split or a bulk build.
+    """
+
+    bucket_size = 1000
+
+    def __init__(self, attribute: str) -> None:
+        """Initialize an empty index.
+
+        Args:
+            attribute (str): The name of the indexed attribute.
+        """
+        super().__init__(attribute)
+        # Sorted buckets of keys, the entities at the same positions, and the last key
+        # of each bucket, to find the bucket of a key by bisection.
+        self._keys: list[list[Any]] = []
+        self._entities: list[list[T]] = []
+        self._maxes: list[Any] = []
+        self._length = 0
+
+    def __len__(self) -> int:
+        """Get the number of indexed entities.
+
+        Returns:
+            int: The number of indexed entities.
+        """
+        return self._length
+
+    def insert(self, key: Any, entity: T) -> None:
+        """Add an entity to the index, after the entities with the same key.
+
+        Args:
+            key (Any): The value of the indexed attribute of the entity.
+            entity (T): The entity to add.
+        """
+        maxes = self._maxes
+        self._length += 1
+        if not maxes:
+            self._keys.append([key])
+            self._entities.append([entity])
+            maxes.append(key)
+            return
+
+        bucket = bisect_right(maxes, key)
+        if bucket == len(maxes):
+            bucket -= 1
+        keys = self._keys[bucket]
+        position = bisect_right(keys, key)
+        keys.insert(position, key)
+        self._entities[bucket].insert(position, entity)
+        maxes[bucket] = keys[-1]
+
+        if len(keys) > 2 * self.bucket_size:
+            half = len(keys) // 2
+            entities = self._entities[bucket]
+            self._keys[bucket : bucket + 1] = [keys[:half], keys[half:]]
+            self._entities[bucket : bucket + 1] = [entities[:half], entities[half:]]
+            maxes[bucket : bucket + 1] = [keys[half - 1], keys[-1]]
+
+    def remove(self, key: Any, entity: T) -> None:
+        """Remove an entity from the index.
+
+        Args:
+            key (Any): The value of the indexed attribute when the entity was inserted.
+            entity (T): The entity to remove.
+
+        Raises:
+            KeyError: If the entity is not indexed under this key.
+        """
+        maxes = self._maxes
+        bucket = bisect_left(maxes, key)
+        while bucket < len(maxes):
+            keys, entities = self._keys[bucket], self._entities[bucket]
+            position = bisect_left(keys, key)
+            while position < len(keys) and keys[position] == key:
+                if entities[position] is entity:
+                    del keys[position], entities[position]
+                    self._length -= 1
+                    if keys:
+                        maxes[bucket] = keys[-1]
+                    else:
+                        del self._keys[bucket], self._entities[bucket], maxes[bucket]
+                    return
+                position += 1
+            if position < len(keys):
+                break
+            # The key may continue in the next bucket.
+            bucket += 1
+        raise KeyError(key)
+
+    def equal(self, key: Any) -> builtins.list[T]:
+        """Get the entities whose indexed attribute equals a key.
+
+        Args:
+            key (Any): The value to look up.
+
+        Returns:
+            builtins.list[T]: The entities, in insertion order.
+        """
+        return list(self.range(key, key, inclusive=True))
+
+    def range(
+        self,
+        low: Any = None,
+        high: Any = None,
+        inclusive: bool = False,
+        limit: int | None = None,
+        reverse: bool = False,
+    ) -> Iterator[T]:
+        """Iterate over the entities whose key is within bounds, in key order.
+
+        Args:
+            low (Any): The lowest key, included; None for no lower bound.
+            high (Any): The highest key, excluded unless `inclusive` is set; None for no
+                upper bound.
+            inclusive (bool): Whether to include the entities whose key equals `high`.
+            limit (int | None): The maximum number of entities to return.
+            reverse (bool): Whether to iterate from the highest key down.
+
+        Returns:
+            Iterator[T]: The entities, in ascending or descending key order.
+        """
+        start = self._position(low, bisect_left) if low is not None else (0, 0)
+        if high is None:
+            stop = (len(self._keys), 0)
+        else:
+            stop = self._position(high, bisect_right if inclusive else bisect_left)
+        slices = self._slices(start, stop)
+        if reverse:
+            entities: Iterator[T] = (entity for chunk in reversed(builtins.list(slices)) for entity in reversed(chunk))
+        else:
+            entities = (entity for chunk in slices for entity in chunk)
+        return islice(entities, limit)
+
+    def prefix(self, prefix: str, limit: int | None = None) -> Iterator[T]:
+        """Iterate over the entities whose string key starts with a prefix, in key order.
+
+        Args:
+            prefix (str): The prefix of the keys.
+            limit (int | None): The maximum number of entities to return.
+
+        Returns:
+            Iterator[T]: The entities, in key order.
+        """
+        return self.range(prefix or None, _prefix_upper_bound(prefix), limit=limit)
+
+    def build(self, entities: Iterable[T]) -> None:
+        """Replace the content of the index with the given entities, in bulk.
+
+        Sorting once is much faster than inserting the entities one at a time.
+
+        Args:
+            entities (Iterable[T]): The entities to index.
+        """
+        key = self.key
+        pairs = sorted(((key(entity), entity) for entity in entities), key=_first)
+        size = self.bucket_size
+        self._keys = [[pair[0] for pair in pairs[start : start + size]] for start in range(0, len(pairs), size)]
+        self._entities = [[pair[1] for pair in pairs[start : start + size]] for start in range(0, len(pairs), size)]
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._length = len(pairs)
+
+    def _position(self, key: Any, bisect: Any) -> tuple[int, int]:
+        """Find the bucket and the position within it where a key belongs.
+
+        Args:
+            key (Any): The key to look for.
+            bisect (Any): `bisect_left` for the position before the equal keys,
+                `bisect_right` for the position after them.
+
+        Returns:
+            tuple[int, int]: The index of the bucket and the position in the bucket, or
+            one past the last bucket if the key is after all the keys.
+        """
+        bucket = bisect(self._maxes, key)
+        if bucket == len(self._maxes):
+            return bucket, 0
+        return bucket, bisect(self._keys[bucket], key)
+
+    def _slices(self, start: tuple[int, int], stop: tuple[int, int]) -> Iterator[builtins.list[T]]:
+        """Iterate over the slices of buckets between two positions.
+
+        Args:
+            start (tuple[int, int]): The bucket and position of the first entity.
+            stop (tuple[int, int]): The bucket and position after the last entity.
+
+        Returns:
+            Iterator[builtins.list[T]]: The slices of the buckets, in key order.
+        """
+        (first, begin), (last, end) = start, stop
+        entities = self._entities
+        if (first, begin) >= (last, end):
+            return
+        if first == last:
+            yield entities[first][begin:end]
+            return
+        yield entities[first][begin:] if begin else entities[first]
+        yield from entities[first + 1 : last]
+        if last < len(entities) and end:
+            yield entities[last][:end]
+
+
+def _first(pair: tuple[Any, Any]) -> Any:
+    """Get the first element of a pair, to sort by key without comparing entities."""
+    return pair[0]
+
+
+def _prefix_upper_bound(prefix: str) -> str | None:
+    """Get the smallest string greater than all the strings starting with a prefix.
+
+    Args:
+        prefix (str): The prefix.
+
+    Returns:
+        str | None: The upper bound, or None if there is none.
+    """
+    stripped = prefix.rstrip(chr(0x10FFFF))
+    if not stripped:
+        return None
+    return stripped[:-1] + chr(ord(stripped[-1]) + 1)
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["Index", "HashIndex", "SortedIndex"]
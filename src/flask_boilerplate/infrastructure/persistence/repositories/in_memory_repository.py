@@ -0,0 +1,344 @@
+"""Module defining the in-memory repository.
+
+`InMemoryRepository` implements the `Repository` interface of the domain layer over a
+dictionary of entities keyed by identifier. It serves as a fast test double for the
+SQLAlchemy repositories, and as a cache tier holding hot entities in the process.
+
+Besides lookups by identifier, it answers lookups on other attributes through
+declarative secondary indexes:
+
+- hash indexes, for equality lookups with `find_by()`;
+- sorted indexes, for equality, range and prefix lookups with `find_by()`,
+  `find_range()` and `find_prefix()`.
+
+A lookup on an attribute without a suitable index falls back to a scan.
+
+The indexes follow `add()` and `remove()`. They also follow the changes made by the
+mutation methods of the entities, such as `EntityExample.update_name()`: the
+repository observes each entity it holds (see `Entity.attach_observer()`), and an
+entity can be held by several repositories at once. Plain attribute assignments are
+not observed; call `rebuild_indexes()` after making some.
+
+`add()` and `add_many()` are atomic: an entity whose attributes cannot be indexed, for
+instance a key that cannot be compared with the others in a sorted index, leaves the
+repository with the entities and indexes it had before the call.
+"""
+
+import builtins
+from collections.abc import Iterable
+from contextlib import suppress
+from heapq import nsmallest
+from itertools import islice
+from operator import attrgetter
+from typing import Any, TypeVar
+
+from flask_boilerplate.domain.primitives.entity import Entity
+from flask_boilerplate.domain.primitives.repository import Repository
+
+from .in_memory_indexes import HashIndex, Index, SortedIndex
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+
+
+class InMemoryRepository(Repository[T, ID]):
+    """Repository keeping its entities in memory, with secondary indexes.
+
+    Example:
+        >>> repository = InMemoryRepository[EntityExample, UUID](
+        ...     entities, hash_indexes=["name"], sorted_indexes=["name"]
+        ... )
+        >>> repository.find_by("name", "Example")
+        [EntityExample(...)]
+        >>> repository.find_prefix("name", "Ex", limit=20)
+        [EntityExample(...), ...]
+
+    Attributes:
+        id_attribute (str): The name of the identifier attribute of the entities.
+    """
+
+    def __init__(
+        self,
+        entities: Iterable[T] = (),
+        hash_indexes: Iterable[str] = (),
+        sorted_indexes: Iterable[str] = (),
+        id_attribute: str = "id",
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            entities (Iterable[T]): The initial entities, indexed in bulk.
+            hash_indexes (Iterable[str]): The attributes to index for equality lookups.
+            sorted_indexes (Iterable[str]): The attributes to index for range and prefix
+                lookups.
+            id_attribute (str): The name of the identifier attribute of the entities.
+        """
+        self.id_attribute = id_attribute
+        self._identifier = attrgetter(id_attribute)
+        self._entities: dict[ID, T] = {}
+        self._hash_indexes: dict[str, HashIndex[T]] = {name: HashIndex(name) for name in hash_indexes}
+        self._sorted_indexes: dict[str, SortedIndex[T]] = {name: SortedIndex(name) for name in sorted_indexes}
+        self._indexes: dict[str, builtins.list[Index[T]]] = {}
+        for index in [*self._hash_indexes.values(), *self._sorted_indexes.values()]:
+            self._indexes.setdefault(index.attribute, []).append(index)
+        # A single bound method, shared by all the observed entities.
+        self._observer = self._attribute_changed
+        self.add_many(entities)
+
+    def __len__(self) -> int:
+        """Get the number of entities.
+
+        Returns:
+            int: The number of entities.
+        """
+        return len(self._entities)
+
+    def add(self, entity: T) -> None:
+        """Add an entity, replacing the entity with the same identifier if any.
+
+        Args:
+            entity (T): The entity to add.
+        """
+        identifier = self._identifier(entity)
+        current = self._entities.get(identifier)
+        if current is entity:
+            return
+        if current is not None:
+            self.remove(current)
+        self._entities[identifier] = entity
+        try:
+            for name, indexes in self._indexes.items():
+                key = getattr(entity, name)
+                for index in indexes:
+                    index.insert(key, entity)
+        except BaseException:
+            self._unindex(entity)
+            del self._entities[identifier]
+            if current is not None:
+                self.add(current)
+            raise
+        if isinstance(entity, Entity):
+            entity.attach_observer(self._observer)
+
+    def add_many(self, entities: Iterable[T]) -> None:
+        """Add several entities.
+
+        When the repository is empty, the indexes are built in bulk, which is much faster
+        than adding the entities one at a time. If an entity cannot be added, the entities
+        added before it are removed, and the entities they replaced restored.
+
+        Args:
+            entities (Iterable[T]): The entities to add.
+        """
+        if self._entities:
+            added: builtins.list[tuple[T, T | None]] = []
+            try:
+                for entity in entities:
+                    replaced = self._entities.get(self._identifier(entity))
+                    self.add(entity)
+                    added.append((entity, replaced))
+            except BaseException:
+                for entity, replaced in reversed(added):
+                    self.remove(entity)
+                    if replaced is not None:
+                        self.add(replaced)
+                raise
+            return
+
+        stored, identifier, observer = self._entities, self._identifier, self._observer
+        try:
+            for entity in entities:
+                key = identifier(entity)
+                replaced = stored.get(key)
+                stored[key] = entity
+                if isinstance(entity, Entity):
+                    if isinstance(replaced, Entity) and replaced is not entity:
+                        replaced.detach_observer(observer)
+                    entity.attach_observer(observer)
+            self.rebuild_indexes()
+        except BaseException:
+            for entity in stored.values():
+                if isinstance(entity, Entity):
+                    entity.detach_observer(observer)
+            stored.clear()
+            self.rebuild_indexes()
+            raise
+
+    def get(self, id: ID) -> T | None:
+        """Retrieve an entity by its unique identifier.
+
+        Args:
+            id (ID): The unique identifier of the entity.
+
+        Returns:
+            T | None: The entity if found, otherwise None.
+        """
+        return self._entities.get(id)
+
+    def list(self, after: ID | None = None, limit: int | None = None) -> Iterable[T]:
+        """Retrieve all entities in insertion order, or a page of entities sorted by identifier.
+
+        A page is read from the sorted index of the identifier attribute if there is one,
+        and otherwise selected with a partial sort of the entities.
+
+        Args:
+            after (ID | None): The identifier after which the page starts, None for the
+                first page.
+            limit (int | None): The maximum number of entities of the page.
+
+        Returns:
+            Iterable[T]: A copy of the collection of entities, or the page.
+        """
+        if after is None and limit is None:
+            return builtins.list(self._entities.values())
+        index = self._sorted_indexes.get(self.id_attribute)
+        if index is not None:
+            # The lower bound of a range is included: skip the entity of `after` itself.
+            candidates: Iterable[T] = index.range(low=after)
+            if after is not None:
+                candidates = (entity for entity in candidates if self._identifier(entity) != after)
+            return builtins.list(islice(candidates, limit))
+        if after is not None:
+            candidates = (entity for entity in self._entities.values() if self._identifier(entity) > after)
+        else:
+            candidates = self._entities.values()
+        if limit is None:
+            return sorted(candidates, key=self._identifier)
+        return nsmallest(limit, candidates, key=self._identifier)
+
+    def remove(self, entity: T) -> None:
+        """Remove an entity; removing an entity that is not in the repository does nothing.
+
+        Args:
+            entity (T): The entity to remove.
+        """
+        current = self._entities.pop(self._identifier(entity), None)
+        if current is None:
+            return
+        for name, indexes in self._indexes.items():
+            key = getattr(current, name)
+            for index in indexes:
+                index.remove(key, current)
+        if isinstance(current, Entity):
+            current.detach_observer(self._observer)
+
+    def find_by(self, attribute: str, value: Any) -> builtins.list[T]:
+        """Retrieve the entities whose attribute equals a value.
+
+        Args:
+            attribute (str): The name of the attribute.
+            value (Any): The value to look up.
+
+        Returns:
+            builtins.list[T]: The matching entities.
+        """
+        index: Index[T] | None = self._hash_indexes.get(attribute)
+        if index is None:
+            index = self._sorted_indexes.get(attribute)
+        if index is not None:
+            return index.equal(value)
+        key = attrgetter(attribute)
+        return [entity for entity in self._entities.values() if key(entity) == value]
+
+    def find_range(
+        self,
+        attribute: str,
+        low: Any = None,
+        high: Any = None,
+        inclusive: bool = False,
+        limit: int | None = None,
+        reverse: bool = False,
+    ) -> builtins.list[T]:
+        """Retrieve the entities whose attribute is within bounds, sorted by the attribute.
+
+        Args:
+            attribute (str): The name of the attribute.
+            low (Any): The lowest value, included; None for no lower bound.
+            high (Any): The highest value, excluded unless `inclusive` is set; None for
+                no upper bound.
+            inclusive (bool): Whether to include the entities whose attribute equals `high`.
+            limit (int | None): The maximum number of entities to return.
+            reverse (bool): Whether to sort from the highest value down.
+
+        Returns:
+            builtins.list[T]: The matching entities.
+        """
+        index = self._sorted_indexes.get(attribute)
+        if index is not None:
+            return builtins.list(index.range(low, high, inclusive, limit, reverse))
+
+        key = attrgetter(attribute)
+        matching = (
+            entity
+            for entity in self._entities.values()
+            if (low is None or key(entity) >= low)
+            and (high is None or key(entity) < high or (inclusive and key(entity) == high))
+        )
+        return sorted(matching, key=key, reverse=reverse)[:limit]
+
+    def find_prefix(self, attribute: str, prefix: str, limit: int | None = None) -> builtins.list[T]:
+        """Retrieve the entities whose string attribute starts with a prefix, sorted by it.
+
+        Args:
+            attribute (str): The name of the attribute.
+            prefix (str): The prefix to look up.
+            limit (int | None): The maximum number of entities to return.
+
+        Returns:
+            builtins.list[T]: The matching entities.
+        """
+        index = self._sorted_indexes.get(attribute)
+        if index is not None:
+            return builtins.list(index.prefix(prefix, limit))
+
+        key = attrgetter(attribute)
+        matching = (entity for entity in self._entities.values() if key(entity).startswith(prefix))
+        return sorted(matching, key=key)[:limit]
+
+    def rebuild_indexes(self) -> None:
+        """Rebuild all the indexes from the current attribute values of the entities.
+
+        Call this after changing indexed attributes by plain assignment, which the
+        repository does not observe.
+        """
+        for indexes in self._indexes.values():
+            for index in indexes:
+                index.build(self._entities.values())
+
+    def _unindex(self, entity: T) -> None:
+        """Remove an entity from the indexes holding it, after a failed insertion.
+
+        Args:
+            entity (T): The entity, indexed in some of the indexes only.
+        """
+        for name, indexes in self._indexes.items():
+            key = getattr(entity, name, None)
+            for index in indexes:
+                # The indexes the insertion did not reach do not hold the entity, and
+                # reject its key if it is the one that failed.
+                with suppress(KeyError, TypeError):
+                    index.remove(key, entity)
+
+    def _attribute_changed(self, entity: Any, name: str, previous: Any) -> None:
+        """Move an entity in the indexes of an attribute changed by a mutation method.
+
+        Args:
+            entity (Any): The changed entity.
+            name (str): The name of the changed attribute.
+            previous (Any): The previous value of the attribute.
+        """
+        indexes = self._indexes.get(name)
+        if not indexes:
+            return
+        current = self._entities.get(self._identifier(entity))
+        # Only the instance held under the identifier is indexed.
+        if current is None or current is not entity:
+            return
+        key = getattr(current, name)
+        for index in indexes:
+            index.remove(previous, current)
+            index.insert(key, current)
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["InMemoryRepository"]
@@ -0,0 +1,305 @@
+"""Module defining the repository spreading the entities over several database shards.
+
+`ShardedRepository` composes one repository per shard, each on the connection of its
+database, and routes each entity to a single shard by its identifier:
+
+- the identifier is hashed with BLAKE2b into a 64-bit key, which is stable across
+  processes and Python versions, unlike `hash()`, and uniform even for time-ordered
+  identifiers such as UUIDv7;
+- the key is assigned to one of the N shards with the jump consistent hash of Lamping
+  and Veach, which moves only the entities of 1 / (N + 1) of the keys when a shard is
+  added, the minimum, where `key % N` would move almost all of them.
+
+`add()`, `get()` and `remove()` run on the shard of the entity. `get_many()`,
+`list()` and `find()` scatter the query to the shards on an executor, and gather
+their results: the pages sorted by identifier are merged with `heapq.merge()`, and
+the streams of all entities are interleaved as the batches of the shards arrive, each
+shard fetching its next batch while the previous one is consumed.
+"""
+
+import builtins
+import heapq
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from hashlib import blake2b
+from itertools import chain, islice
+from operator import attrgetter
+from typing import Any, ClassVar, TypeVar
+from uuid import UUID
+
+from flask_boilerplate.domain.primitives.repository import GetManyResult, Repository, _sort_by_attributes
+from flask_boilerplate.domain.primitives.specification import Specification
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+A = TypeVar("A")
+R = TypeVar("R")
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """Assign a 64-bit key to a bucket with the jump consistent hash.
+
+    Args:
+        key (int): The key, between 0 and 2**64 - 1.
+        buckets (int): The number of buckets.
+
+    Returns:
+        int: The bucket of the key, between 0 and `buckets - 1`.
+
+    Raises:
+        ValueError: If the number of buckets is not positive.
+    """
+    if buckets < 1:
+        raise ValueError(f"The number of buckets must be positive, got {buckets}.")
+    bucket, jump = -1, 0
+    while jump < buckets:
+        bucket = jump
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        jump = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+def shard_for(id: Any, shards: int) -> int:
+    """Get the shard of an identifier.
+
+    Args:
+        id (Any): The identifier, a UUID or any value whose `str()` is stable.
+        shards (int): The number of shards.
+
+    Returns:
+        int: The index of the shard, between 0 and `shards - 1`.
+    """
+    data = id.bytes if isinstance(id, UUID) else str(id).encode()
+    return jump_hash(int.from_bytes(blake2b(data, digest_size=8).digest()), shards)
+
+
+class ShardedRepository(Repository[T, ID]):
+    """Repository routing each entity to one of several shard repositories by its identifier.
+
+    The shard repositories must not be used by other threads while the executor runs
+    their queries, and a streamed `list()` must be fully iterated, or closed, before
+    the shards are used again.
+
+    Example:
+        >>> executor = ThreadPoolExecutor(max_workers=8)
+        >>> repository = ShardedRepository(
+        ...     [EntityExampleRepository(connection) for connection in connections], executor
+        ... )
+        >>> repository.add(entity)  # On connections[shard_for(entity.id, len(connections))].
+        >>> repository.list(limit=100)  # The first 100 entities of all the shards.
+
+    Attributes:
+        shards (list[Repository[T, ID]]): The repositories of the shards, by index.
+        executor (Executor | None): The executor running the queries of the shards
+            concurrently; None to run them one after the other.
+        id_attribute (str): The name of the identifier attribute of the entities.
+        stream_batch_size (int): The number of entities fetched at once from a shard
+            when all entities are streamed.
+    """
+
+    stream_batch_size: ClassVar[int] = 1000
+
+    def __init__(
+        self,
+        shards: Sequence[Repository[T, ID]],
+        executor: Executor | None = None,
+        id_attribute: str = "id",
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            shards (Sequence[Repository[T, ID]]): The repositories of the shards, by
+                index. Their order must not change while the shards hold entities.
+            executor (Executor | None): The executor running the queries of the shards
+                concurrently, such as a `ThreadPoolExecutor` shared by the process;
+                None to run them one after the other.
+            id_attribute (str): The name of the identifier attribute of the entities.
+
+        Raises:
+            ValueError: If there is no shard.
+        """
+        if not shards:
+            raise ValueError("A sharded repository needs at least one shard.")
+        self.shards = builtins.list(shards)
+        self.executor = executor
+        self.id_attribute = id_attribute
+        self._identifier: Callable[[T], Any] = attrgetter(id_attribute)
+
+    def shard(self, id: ID) -> Repository[T, ID]:
+        """Get the repository of the shard of an identifier.
+
+        Args:
+            id (ID): The identifier.
+
+        Returns:
+            Repository[T, ID]: The repository of its shard.
+        """
+        return self.shards[shard_for(id, len(self.shards))]
+
+    def add(self, entity: T) -> None:
+        """Add an entity to its shard.
+
+        Args:
+            entity (T): The entity to add.
+        """
+        self.shard(self._identifier(entity)).add(entity)
+
+    def get(self, id: ID) -> T | None:
+        """Retrieve an entity from its shard.
+
+        Args:
+            id (ID): The unique identifier of the entity.
+
+        Returns:
+            T | None: The entity if found, otherwise None.
+        """
+        return self.shard(id).get(id)
+
+    def get_many(self, ids: Iterable[ID]) -> GetManyResult[T, ID]:
+        """Retrieve several entities, with a single query per shard holding some of them.
+
+        Args:
+            ids (Iterable[ID]): The unique identifiers of the entities.
+
+        Returns:
+            GetManyResult[T, ID]: The entities found, in the order of their identifiers,
+                and the identifiers not found.
+        """
+        ids = builtins.list(ids)
+        groups: dict[int, builtins.list[ID]] = {}
+        for id in dict.fromkeys(ids):
+            groups.setdefault(shard_for(id, len(self.shards)), []).append(id)
+        found: dict[ID, T] = {}
+        results = self._scatter(lambda item: self.shards[item[0]].get_many(item[1]), builtins.list(groups.items()))
+        for group, result in zip(groups.values(), results, strict=True):
+            # The result holds one entity per identifier found, in the order of the
+            # identifiers.
+            absent = set(result.missing)
+            found.update(zip([id for id in group if id not in absent], result, strict=True))
+        return GetManyResult(
+            [found[id] for id in ids if id in found],
+            [id for id in dict.fromkeys(ids) if id not in found],
+        )
+
+    def list(self, after: ID | None = None, limit: int | None = None) -> Iterable[T]:
+        """Retrieve all entities of the shards, or a page of them sorted by identifier.
+
+        All entities are streamed from all the shards at once, in no particular order.
+        A page is read from each shard, and the pages are merged by identifier.
+
+        Args:
+            after (ID | None): The identifier after which the page starts, None for the
+                first page.
+            limit (int | None): The maximum number of entities of the page.
+
+        Returns:
+            Iterable[T]: The entities.
+        """
+        if after is None and limit is None:
+            return self._gather_streams()
+        pages = self._scatter(lambda shard: builtins.list(shard.list(after, limit)), self.shards)
+        return builtins.list(islice(heapq.merge(*pages, key=self._identifier), limit))
+
+    def remove(self, entity: T) -> None:
+        """Remove an entity from its shard.
+
+        Args:
+            entity (T): The entity to remove.
+        """
+        self.shard(self._identifier(entity)).remove(entity)
+
+    def find(
+        self,
+        specification: Specification[T],
+        limit: int | None = None,
+        order_by: str | Sequence[str] | None = None,
+    ) -> builtins.list[T]:
+        """Retrieve the entities satisfying a specification, from each shard at once.
+
+        Each shard applies the specification, the order and the limit, and the results
+        of the shards are sorted and limited again.
+
+        Args:
+            specification (Specification[T]): The specification to satisfy.
+            limit (int | None): The maximum number of entities to return.
+            order_by (str | Sequence[str] | None): The attribute name(s) to sort by,
+                prefixed with "-" for a descending order.
+
+        Returns:
+            builtins.list[T]: The satisfying entities.
+        """
+        results = self._scatter(lambda shard: shard.find(specification, limit, order_by), self.shards)
+        entities: Iterable[T] = chain.from_iterable(results)
+        if order_by:
+            entities = _sort_by_attributes(entities, order_by)
+        return builtins.list(islice(entities, limit))
+
+    def _scatter(self, function: Callable[[A], R], arguments: Sequence[A]) -> builtins.list[R]:
+        """Call a function on each argument on the executor, and gather the results.
+
+        A single call runs in the calling thread, sparing the round trip to the executor.
+
+        Args:
+            function (Callable[[A], R]): The function to call.
+            arguments (Sequence[A]): The arguments of the calls, such as the shards.
+
+        Returns:
+            builtins.list[R]: The results of the calls, in the order of the arguments.
+        """
+        if self.executor is None or len(arguments) < 2:
+            return builtins.list(map(function, arguments))
+        futures = [self.executor.submit(function, argument) for argument in arguments]
+        return [future.result() for future in futures]
+
+    def _gather_streams(self) -> Iterator[T]:
+        """Stream the entities of all the shards, as the batches of the shards arrive.
+
+        Yields:
+            T: The entities.
+        """
+        size = self.stream_batch_size
+        streams = [iter(shard.list()) for shard in self.shards]
+        pending: dict[Future[builtins.list[T]], Iterator[T]] = {}
+        try:
+            if self.executor is None:
+                yield from chain.from_iterable(streams)
+                return
+            for stream in streams:
+                pending[self.executor.submit(_batch, stream, size)] = stream
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stream = pending.pop(future)
+                    batch = future.result()
+                    # A short batch ends the stream of the shard. Otherwise the shard
+                    # fetches its next batch while this one is consumed.
+                    if len(batch) == size:
+                        pending[self.executor.submit(_batch, stream, size)] = stream
+                    yield from batch
+        finally:
+            # Wait for the fetches in progress, then close the streams, so that an
+            # iteration stopped early leaves no result open on the shards.
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            for stream in streams:
+                close = getattr(stream, "close", None)
+                if close is not None:
+                    close()
+
+
+def _batch(stream: Iterator[T], size: int) -> builtins.list[T]:
+    """Fetch the next batch of a stream.
+
+    Args:
+        stream (Iterator[T]): The stream.
+        size (int): The maximum number of items of the batch.
+
+    Returns:
+        builtins.list[T]: The items, fewer than `size` at the end of the stream.
+    """
+    return builtins.list(islice(stream, size))
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["ShardedRepository", "jump_hash", "shard_for"]
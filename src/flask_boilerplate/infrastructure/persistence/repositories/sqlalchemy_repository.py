@@ -0,0 +1,542 @@
+"""Module defining the base class for SQLAlchemy-backed repositories.
+
+`SqlAlchemyRepository` implements the `Repository` interface of the domain layer over
+a SQLAlchemy Core `Table` and a `Connection`. Subclasses declare the `EntityMapping`
+of their entities onto their table, or the table and how to convert between rows and
+entities.
+
+The statements of the hot paths, reading entities by identifier or by page, are built
+once per table with bound parameters, rather than once per call: SQLAlchemy then
+reuses both the statement and its compiled form, and each call only binds the values.
+
+Specifications passed to `find()` are translated into a WHERE clause by
+`translate_specification()`. The parts of a specification that cannot be translated
+are evaluated in Python over a streamed result, so that the table is never loaded as a
+whole. `list()` streams the whole table the same way, and reads pages of it with
+keyset pagination on the primary key.
+
+A repository created by a unit of work shares its `IdentityMap`: `get()` and
+`get_many()` look the entities up in the map before querying the table, and every
+entity loaded or added is registered in it, so that each identifier maps to a single
+instance within the unit of work. The stream of all the entities of `list()` is the
+exception: it reuses the entities of the map, but does not register the others, so that
+it still holds only a batch of rows at a time. `get_many()` queries the other identifiers in
+chunks sized to the parameter limit of the database. The inserts and deletes of the
+repository are recorded in the `WriteBatch` of the unit of work, and written in bulk
+when the unit of work commits, or before the repository queries the table.
+
+Entities of the identity map that track their changes (see `Entity.track_changes`)
+are written back at the same points: `collect_changes()` records an UPDATE of only
+their changed columns in the write batch, and entities without changes are skipped.
+
+Tables with a `version` column store versioned aggregates (see
+`AggregateRoot.version`): their updates and deletes are checked against the version
+the aggregate was loaded with, and raise a `ConcurrencyError` on a concurrent change.
+"""
+
+import builtins
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from functools import cache, cached_property
+from itertools import islice
+from typing import Any, ClassVar, NamedTuple, TypeVar, cast
+
+from sqlalchemy import Connection, Row, Select, Table, UnaryExpression, bindparam, delete, insert, select
+
+from flask_boilerplate.domain.errors.concurrency_error import ConcurrencyError
+from flask_boilerplate.domain.primitives.aggregate_root import AggregateRoot
+from flask_boilerplate.domain.primitives.entity import Entity
+from flask_boilerplate.domain.primitives.identity_map import IdentityMap
+from flask_boilerplate.domain.primitives.repository import GetManyResult, Repository
+from flask_boilerplate.domain.primitives.specification import Specification
+
+from ..configurations.entity_mapping import EntityMapping
+from ..parameter_limits import max_bind_parameters
+from ..specification_translator import translate_specification
+from ..write_batch import WriteBatch
+
+T = TypeVar("T")
+ID = TypeVar("ID")
+
+
+class SqlAlchemyRepository(Repository[T, ID]):
+    """Base class for repositories storing entities in a SQLAlchemy table.
+
+    Subclasses should set the `mapping` class attribute, which sets `table` too, or set
+    the `table` class attribute and implement `_to_entity()` and `_to_row()`. The table
+    must have a single-column primary key named `id`, and may have a `version` column
+    storing the `version` of versioned aggregates.
+
+    Example:
+        >>> class UserRepository(SqlAlchemyRepository[User, UUID]):
+        ...     mapping = map_imperatively(User, users_table)
+        >>> class AccountRepository(SqlAlchemyRepository[Account, UUID]):
+        ...     table = accounts_table
+        ...
+        ...     def _to_entity(self, row: Row[Any]) -> Account:
+        ...         return Account(id=row.id, owner=row.owner)
+        ...
+        ...     def _to_row(self, account: Account) -> dict[str, Any]:
+        ...         return {"id": account.id, "owner": account.owner}
+
+    Attributes:
+        mapping (EntityMapping[Any] | None): The mapping of the entities onto the table,
+            if they are converted by one.
+        table (Table): The table storing the entities.
+        stream_batch_size (int): The number of rows fetched at once when a result is
+            streamed rather than fully buffered.
+        connection (Connection): The connection the repository executes its statements on.
+        identity_map (IdentityMap | None): The identity map of the unit of work the
+            repository belongs to, if any.
+        write_batch (WriteBatch | None): The pending writes of the unit of work the
+            repository belongs to, if any. Without one, writes are executed immediately.
+    """
+
+    mapping: ClassVar[EntityMapping[Any] | None] = None
+    table: ClassVar[Table]
+    stream_batch_size: ClassVar[int] = 1000
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Set the table of the subclasses declaring only a mapping.
+
+        Args:
+            **kwargs (Any): The keyword arguments of the class definition.
+        """
+        super().__init_subclass__(**kwargs)
+        mapping = cls.__dict__.get("mapping")
+        if mapping is not None and "table" not in cls.__dict__:
+            cls.table = mapping.table
+
+    def __init__(
+        self,
+        connection: Connection,
+        identity_map: IdentityMap | None = None,
+        write_batch: WriteBatch | None = None,
+    ) -> None:
+        """Initialize the repository.
+
+        Args:
+            connection (Connection): The connection to execute statements on. Transaction
+                management is left to the caller.
+            identity_map (IdentityMap | None): The identity map of the unit of work the
+                repository belongs to, if any.
+            write_batch (WriteBatch | None): The pending writes of the unit of work the
+                repository belongs to, if any.
+        """
+        self.connection = connection
+        self.identity_map = identity_map
+        self.write_batch = write_batch
+
+    @cached_property
+    def parameter_limit(self) -> int:
+        """Get the maximum number of identifiers queried by a single statement.
+
+        Returns:
+            int: The maximum number of bound parameters of the database.
+        """
+        return max_bind_parameters(self.connection)
+
+    @property
+    def versioned(self) -> bool:
+        """Get whether the table stores versioned aggregates, in a `version` column.
+
+        Returns:
+            bool: True if the writes of the rows check their version.
+        """
+        return "version" in self.table.c
+
+    @property
+    def columns(self) -> Any:
+        """Get the columns of the table, accessible by attribute name.
+
+        Leaf specifications receive these columns in `Specification.column_expression()`.
+        Subclasses whose column names differ from the entity attribute names should
+        override this property.
+
+        Returns:
+            Any: The columns of the table.
+        """
+        return self.table.c
+
+    def _to_entity(self, row: Row[Any]) -> T:
+        """Convert a row of the table into an entity, with the mapping of the repository.
+
+        Args:
+            row (Row[Any]): The row to convert, with all the columns of the table.
+
+        Returns:
+            T: The entity.
+
+        Raises:
+            NotImplementedError: If the repository has no mapping.
+        """
+        if self.mapping is None:
+            raise NotImplementedError(f"{type(self).__name__} must declare a mapping or implement _to_entity().")
+        return cast(T, self.mapping.to_entity(row))
+
+    def _to_row(self, entity: T) -> Mapping[str, Any]:
+        """Convert an entity into the column values of its row, with the mapping of the repository.
+
+        Args:
+            entity (T): The entity to convert.
+
+        Returns:
+            Mapping[str, Any]: The column values, keyed by column name.
+
+        Raises:
+            NotImplementedError: If the repository has no mapping.
+        """
+        if self.mapping is None:
+            raise NotImplementedError(f"{type(self).__name__} must declare a mapping or implement _to_row().")
+        return self.mapping.to_row(entity)
+
+    def _identifier(self, entity: T) -> ID:
+        """Get the identifier of an entity.
+
+        The default implementation reads it through the mapping, or converts the entity
+        into its row. Subclasses can override it to read the identifier directly.
+
+        Args:
+            entity (T): The entity.
+
+        Returns:
+            ID: The identifier of the entity.
+        """
+        if self.mapping is not None:
+            return cast(ID, self.mapping.identifier(entity))
+        return cast(ID, self._to_row(entity)["id"])
+
+    def add(self, entity: T) -> None:
+        """Insert a new entity into the table, or record its insertion in the write batch.
+
+        Args:
+            entity (T): The entity to add.
+        """
+        if self.write_batch is None:
+            row = self._to_row(entity)
+            self.connection.execute(insert(self.table), [row])
+            id = row["id"]
+        else:
+            id = self._identifier(entity)
+            self.write_batch.insert(self.table, id, entity, self._to_row)
+        if self.identity_map is not None:
+            self.identity_map.add(self.table, id, entity)
+
+    def get(self, id: ID) -> T | None:
+        """Retrieve an entity by its unique identifier.
+
+        Args:
+            id (ID): The unique identifier of the entity.
+
+        Returns:
+            T | None: The entity if found, otherwise None.
+        """
+        if self.identity_map is not None:
+            entity = self.identity_map.get(self.table, id)
+            if entity is not None:
+                return cast(T, entity)
+        self._flush()
+        row = self.connection.execute(_statements(self.table).get, {"id": id}).first()
+        return None if row is None else self._loader()(row)
+
+    def get_many(self, ids: Iterable[ID]) -> GetManyResult[T, ID]:
+        """Retrieve several entities by their unique identifiers, with chunked `IN` queries.
+
+        Entities already in the identity map are not queried again. The other distinct
+        identifiers are queried in chunks of at most `parameter_limit`, so that a long
+        list of identifiers does not exceed the limit of the database.
+
+        Args:
+            ids (Iterable[ID]): The unique identifiers of the entities.
+
+        Returns:
+            GetManyResult[T, ID]: The entities found, in the order of their identifiers,
+                and the identifiers not found.
+        """
+        ids = builtins.list(ids)
+        found: dict[ID, T] = {}
+        if self.identity_map is not None:
+            for id in ids:
+                entity = self.identity_map.get(self.table, id)
+                if entity is not None:
+                    found[id] = entity
+        missing = [id for id in dict.fromkeys(ids) if id not in found]
+        if missing:
+            self._flush()
+            load = self._loader()
+            size = self.parameter_limit
+            statement = _statements(self.table).get_many
+            for start in range(0, len(missing), size):
+                for row in self.connection.execute(statement, {"ids": missing[start : start + size]}):
+                    found[row.id] = load(row)
+        return GetManyResult(
+            [found[id] for id in ids if id in found],
+            [id for id in missing if id not in found],
+        )
+
+    def list(self, after: ID | None = None, limit: int | None = None) -> Iterable[T]:
+        """Retrieve all entities from the table, or a page of them sorted by identifier.
+
+        All entities are streamed: the query runs when the iteration starts, and its rows
+        are fetched in batches of `stream_batch_size`, with a server-side cursor on the
+        drivers supporting one, so that only a batch of rows is held at a time. Within a
+        unit of work, the entities already in the identity map are returned as they are,
+        but the other ones are not registered in it: their changes are not written on
+        commit. Load the entities to change with `get()`, `get_many()`, `find()` or by
+        page, which register them.
+
+        A page is selected with `WHERE id > :after ORDER BY id LIMIT :limit`, which
+        the primary key index answers without reading the previous pages.
+
+        Args:
+            after (ID | None): The identifier after which the page starts, None for the
+                first page.
+            limit (int | None): The maximum number of entities of the page.
+
+        Returns:
+            Iterable[T]: An iterator over all entities, or the list of the page.
+        """
+        if after is None and limit is None:
+            return self._stream(select(self.table), register=False)
+        self._flush()
+        if limit is None:
+            statement = select(self.table).order_by(self.table.c.id).where(self.table.c.id > after)
+            return builtins.list(map(self._loader(), self.connection.execute(statement)))
+        statements = _statements(self.table)
+        if after is None:
+            result = self.connection.execute(statements.first_page, {"limit": limit})
+        else:
+            result = self.connection.execute(statements.page, {"after": after, "limit": limit})
+        return builtins.list(map(self._loader(), result))
+
+    def remove(self, entity: T) -> None:
+        """Delete an entity from the table, or record its deletion in the write batch.
+
+        Args:
+            entity (T): The entity to remove.
+
+        Raises:
+            ConcurrencyError: If the row of a versioned aggregate was changed or deleted
+                since it was loaded, when the deletion is executed immediately.
+        """
+        id = self._identifier(entity)
+        version: int | None = cast(Any, entity).version if self.versioned else None
+        if self.write_batch is not None:
+            self.write_batch.delete(self.table, id, version)
+        elif version is None:
+            self.connection.execute(delete(self.table).where(self.table.c.id == id))
+        else:
+            statement = delete(self.table).where(self.table.c.id == id, self.table.c.version == version)
+            if self.connection.execute(statement).rowcount != 1:
+                raise ConcurrencyError(
+                    f"Row {id} of {self.table.name!r} was changed or deleted since it was loaded.", [id]
+                )
+        if self.identity_map is not None:
+            self.identity_map.remove(self.table, id, entity)
+
+    def find(
+        self,
+        specification: Specification[T],
+        limit: int | None = None,
+        order_by: str | Sequence[str] | None = None,
+    ) -> builtins.list[T]:
+        """Retrieve the entities satisfying a specification.
+
+        The translatable part of the specification becomes the WHERE clause of a single
+        query. When a residual specification remains, the rows are streamed in batches
+        of `stream_batch_size` and filtered in Python, and the limit is applied after
+        filtering. Only the satisfying entities are registered in the identity map.
+
+        Args:
+            specification (Specification[T]): The specification to satisfy.
+            limit (int | None): The maximum number of entities to return.
+            order_by (str | Sequence[str] | None): The attribute name(s) to sort by,
+                prefixed with "-" for a descending order.
+
+        Returns:
+            builtins.list[T]: The satisfying entities.
+        """
+        self._flush()
+        criterion, residual = translate_specification(specification, self.columns)
+        statement = select(self.table)
+        if criterion is not None:
+            statement = statement.where(criterion)
+        if order_by:
+            statement = statement.order_by(*self._order_by_clauses(order_by))
+
+        if residual is None:
+            if limit is not None:
+                statement = statement.limit(limit)
+            return builtins.list(map(self._loader(), self.connection.execute(statement)))
+
+        # The scanned rows are not registered, so that the identity map only grows by
+        # the entities satisfying the specification.
+        entities: Iterator[T] = residual.compile().filter_many(self._stream(statement, register=False))
+        found = builtins.list(islice(entities, limit))
+        if self.identity_map is None:
+            return found
+        return [self.identity_map.add(self.table, self._identifier(entity), entity) for entity in found]
+
+    def collect_changes(self) -> None:
+        """Record the updates of the changed entities of the identity map in the write batch.
+
+        Only the columns of the changed attributes are updated, and the entities are
+        marked clean. Entities that do not track their changes are never updated. The
+        updates of versioned aggregates check and increment their version.
+
+        Raises:
+            ValueError: If a changed attribute is not stored in a column, so that its
+                change would be lost.
+        """
+        if self.identity_map is None or self.write_batch is None:
+            return
+        versioned = self.versioned
+        for id, entity in self.identity_map.entities(self.table).items():
+            if not isinstance(entity, (Entity, AggregateRoot)) or not entity.track_changes:
+                continue
+            changed = entity.changed_attributes()
+            if not changed:
+                continue
+            row = self._to_row(cast(T, entity))
+            columns = [self._column_for(attribute, row) for attribute in changed]
+            self.write_batch.update(
+                self.table, id, {column: row[column] for column in columns}, entity if versioned else None
+            )
+            entity.mark_clean()
+
+    def _column_for(self, attribute: str, row: Mapping[str, Any]) -> str:
+        """Get the column storing an attribute of the entities.
+
+        Args:
+            attribute (str): The name of the attribute.
+            row (Mapping[str, Any]): The row of an entity, to check the column against
+                when the repository has no mapping and the column has the attribute name.
+
+        Returns:
+            str: The name of the column.
+
+        Raises:
+            ValueError: If the attribute is not stored in a column.
+        """
+        if self.mapping is not None:
+            return self.mapping.column_for(attribute)
+        if attribute not in row:
+            raise ValueError(f"{type(self).__name__} stores no column for the changed attribute {attribute!r}.")
+        return attribute
+
+    def _stream(self, statement: Select[Any], register: bool = True) -> Iterator[T]:
+        """Stream the entities of a query, in batches of `stream_batch_size` rows.
+
+        Args:
+            statement (Select[Any]): The query selecting the rows of the entities.
+            register (bool): Whether the entities missing from the identity map are
+                registered in it.
+
+        Yields:
+            T: The entities, as their rows are fetched.
+        """
+        self._flush()
+        load = self._loader(register)
+        with self.connection.execute(statement, execution_options={"yield_per": self.stream_batch_size}) as result:
+            yield from map(load, result)
+
+    def _flush(self) -> None:
+        """Write the pending writes of the unit of work, before querying the table."""
+        if self.write_batch is None:
+            return
+        self.collect_changes()
+        if len(self.write_batch):
+            self.write_batch.flush(self.connection)
+
+    def _loader(self, register: bool = True) -> Callable[[Row[Any]], T]:
+        """Get the function converting the rows of a query into entities.
+
+        With an identity map, a row whose entity is already in the map yields that
+        entity, without being converted; other rows are converted, and registered unless
+        told otherwise.
+
+        Args:
+            register (bool): Whether the converted entities are registered in the
+                identity map.
+
+        Returns:
+            Callable[[Row[Any]], T]: The conversion function.
+        """
+        if self.identity_map is None:
+            return self._to_entity
+        entities = self.identity_map.entities(self.table)
+        to_entity = self._to_entity
+
+        if not register:
+
+            def reuse(row: Row[Any]) -> T:
+                entity = entities.get(row.id)
+                return to_entity(row) if entity is None else cast(T, entity)
+
+            return reuse
+
+        def load(row: Row[Any]) -> T:
+            entity = entities.get(row.id)
+            if entity is None:
+                entity = entities[row.id] = to_entity(row)
+            return cast(T, entity)
+
+        return load
+
+    def _order_by_clauses(self, order_by: str | Sequence[str]) -> builtins.list[UnaryExpression[Any]]:
+        """Convert attribute names into ORDER BY clauses.
+
+        Args:
+            order_by (str | Sequence[str]): The attribute name(s) to sort by, prefixed
+                with "-" for a descending order.
+
+        Returns:
+            builtins.list[UnaryExpression[Any]]: The ORDER BY clauses.
+        """
+        keys = [order_by] if isinstance(order_by, str) else order_by
+        columns = self.columns
+        return [
+            getattr(columns, key[1:]).desc() if key.startswith("-") else getattr(columns, key).asc() for key in keys
+        ]
+
+
+class _Statements(NamedTuple):
+    """Statements of the hot paths of the repositories of a table, with bound parameters.
+
+    Attributes:
+        get (Select[Any]): The row of the identifier `id`.
+        get_many (Select[Any]): The rows of the identifiers `ids`, an expanding list.
+        first_page (Select[Any]): The first `limit` rows, by identifier.
+        page (Select[Any]): The first `limit` rows after the identifier `after`.
+    """
+
+    get: Select[Any]
+    get_many: Select[Any]
+    first_page: Select[Any]
+    page: Select[Any]
+
+
+@cache
+def _statements(table: Table) -> _Statements:
+    """Build the statements of the hot paths of the repositories of a table, once.
+
+    Executing the same statement objects lets SQLAlchemy skip building them and
+    computing their cache key, on top of reusing their compiled form.
+
+    Args:
+        table (Table): The table.
+
+    Returns:
+        _Statements: The statements.
+    """
+    id = table.c.id
+    first_page = select(table).order_by(id).limit(bindparam("limit"))
+    return _Statements(
+        get=select(table).where(id == bindparam("id")),
+        get_many=select(table).where(id.in_(bindparam("ids", expanding=True))),
+        first_page=first_page,
+        page=first_page.where(id > bindparam("after")),
+    )
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["SqlAlchemyRepository"]
@@ -0,0 +1,175 @@
+"""Module defining the routing of the units of work to the primary or a read replica.
+
+The application layer separates the commands, which change the state, from the
+queries, which only read it. `RoutingUnitOfWorkFactory` opens the units of work of the
+commands on the primary database, and those of the queries on a read replica, to
+take the reads off the primary.
+
+A replica lags behind the primary, so a client reading right after its own write
+could miss it. Each commit of a command therefore makes the queries of the same
+client, identified by a key such as a user or session identifier, stick to the
+primary for `sticky_seconds`: the client reads its own writes, while the other
+clients keep reading the replica.
+
+The stickiness is kept in the memory of the process: with several workers, route the
+requests of a client to the same worker, or make `sticky_seconds` cover the lag as
+seen from any worker.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Mapping
+from typing import Any
+
+from sqlalchemy import Engine
+
+from .repositories.sqlalchemy_repository import SqlAlchemyRepository
+from .unit_of_work import SqlAlchemyUnitOfWork
+
+
+class RoutingUnitOfWorkFactory:
+    """Factory of units of work on the primary for commands, and on a replica for queries.
+
+    Example:
+        >>> units_of_work = RoutingUnitOfWorkFactory(
+        ...     primary, replica, {"entities": EntityExampleRepository}, sticky_seconds=5.0
+        ... )
+        >>> with units_of_work.for_command(key=user_id) as unit_of_work:
+        ...     unit_of_work.repositories()["entities"].add(entity)
+        ...     unit_of_work.commit()
+        >>> with units_of_work.for_query(key=user_id) as unit_of_work:  # On the primary, for 5 seconds.
+        ...     unit_of_work.repositories()["entities"].get(entity.id)
+
+    Attributes:
+        primary (Engine): The engine of the primary database, for the commands.
+        replica (Engine): The engine of the read replica, for the queries; the primary
+            if there is no replica.
+        sticky_seconds (float): The time the queries of a client stick to the primary
+            after a commit of the client, in seconds.
+        options (dict[str, Any]): The other arguments of the units of work.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replica: Engine | None,
+        repositories: Mapping[str, type[SqlAlchemyRepository[Any, Any]]],
+        sticky_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        **options: Any,
+    ) -> None:
+        """Initialize the factory.
+
+        Args:
+            primary (Engine): The engine of the primary database.
+            replica (Engine | None): The engine of the read replica, None to run the
+                queries on the primary too.
+            repositories (Mapping[str, type[SqlAlchemyRepository[Any, Any]]]): The classes
+                of the repositories of the units of work, keyed by name.
+            sticky_seconds (float): The time the queries of a client stick to the primary
+                after a commit of the client, in seconds; 0 to never stick.
+            clock (Callable[[], float]): The function returning the current time, in
+                seconds.
+            **options (Any): The other arguments of `SqlAlchemyUnitOfWork`, such as the
+                dispatcher of the domain events.
+
+        Raises:
+            ValueError: If the sticky window is negative.
+        """
+        if sticky_seconds < 0:
+            raise ValueError(f"The sticky window must not be negative, got {sticky_seconds}.")
+        self.primary = primary
+        self.replica = primary if replica is None else replica
+        self.sticky_seconds = sticky_seconds
+        self.options = options
+        self._repositories = dict(repositories)
+        self._clock = clock
+        self._lock = threading.Lock()
+        # The time each client stops sticking to the primary, by key. With a fixed sticky
+        # window and a monotonic clock, the keys are in the order they expire.
+        self._sticky_until: OrderedDict[Hashable, float] = OrderedDict()
+
+    def for_command(self, key: Hashable = None) -> SqlAlchemyUnitOfWork:
+        """Create a unit of work on the primary, whose commits make the client stick to it.
+
+        Args:
+            key (Hashable): The key of the client, None for all clients.
+
+        Returns:
+            SqlAlchemyUnitOfWork: The unit of work, to enter.
+        """
+        return _CommandUnitOfWork(self, key, self.primary, self._repositories, **self.options)
+
+    def for_query(self, key: Hashable = None) -> SqlAlchemyUnitOfWork:
+        """Create a unit of work on the replica, or on the primary after a recent write.
+
+        Args:
+            key (Hashable): The key of the client, None for all clients.
+
+        Returns:
+            SqlAlchemyUnitOfWork: The unit of work, to enter.
+        """
+        return SqlAlchemyUnitOfWork(self.engine_for_query(key), self._repositories, **self.options)
+
+    def engine_for_query(self, key: Hashable = None) -> Engine:
+        """Get the engine the queries of a client run on.
+
+        Args:
+            key (Hashable): The key of the client, None for all clients.
+
+        Returns:
+            Engine: The primary if the client, or all clients, wrote within the sticky
+                window, otherwise the replica.
+        """
+        if self.replica is self.primary:
+            return self.primary
+        now = self._clock()
+        with self._lock:
+            sticky = any(self._sticky_until.get(sticky_key, 0.0) > now for sticky_key in {key, None})
+        return self.primary if sticky else self.replica
+
+    def record_write(self, key: Hashable = None) -> None:
+        """Make the queries of a client stick to the primary for the sticky window.
+
+        The keys whose window expired are dropped from the front of the expiry order, so
+        that each write costs constant amortized time.
+
+        Args:
+            key (Hashable): The key of the client, None for all clients.
+        """
+        if self.sticky_seconds == 0:
+            return
+        now = self._clock()
+        sticky_until = self._sticky_until
+        with self._lock:
+            while sticky_until and next(iter(sticky_until.values())) <= now:
+                sticky_until.popitem(last=False)
+            sticky_until[key] = now + self.sticky_seconds
+            sticky_until.move_to_end(key)
+
+
+class _CommandUnitOfWork(SqlAlchemyUnitOfWork):
+    """Unit of work on the primary, recording its commits for the read-your-writes stickiness."""
+
+    def __init__(self, router: RoutingUnitOfWorkFactory, key: Hashable, *args: Any, **kwargs: Any) -> None:
+        """Initialize the unit of work.
+
+        Args:
+            router (RoutingUnitOfWorkFactory): The factory to record the commits in.
+            key (Hashable): The key of the client, None for all clients.
+            *args (Any): The positional arguments of `SqlAlchemyUnitOfWork`.
+            **kwargs (Any): The keyword arguments of `SqlAlchemyUnitOfWork`.
+        """
+        super().__init__(*args, **kwargs)
+        self._router = router
+        self._key = key
+
+    def commit(self) -> None:
+        """Commit, then make the queries of the client stick to the primary."""
+        super().commit()
+        self._router.record_write(self._key)
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["RoutingUnitOfWorkFactory"]
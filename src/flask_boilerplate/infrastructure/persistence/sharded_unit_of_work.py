@@ -0,0 +1,135 @@
+"""Module defining the unit of work over several database shards.
+
+`ShardedUnitOfWork` runs a `SqlAlchemyUnitOfWork` on each shard, one engine per
+database, and exposes their repositories of the same name as a single
+`ShardedRepository`, which routes each entity to its shard.
+
+Each shard keeps its own transaction, identity map and pending writes. Committing
+commits the shards one after the other, without a two-phase commit: a unit of work
+changing the aggregates of a single shard, such as a single aggregate, commits
+atomically, but one spanning several shards may be committed on some of them only if
+a commit fails. Commands should therefore change a single aggregate per unit of work.
+"""
+
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor
+from contextlib import ExitStack
+from types import TracebackType
+from typing import Any, Self
+
+from sqlalchemy import Engine
+
+from flask_boilerplate.domain.primitives.repository import Repository, UnitOfWork
+
+from .repositories.sharded_repository import ShardedRepository
+from .repositories.sqlalchemy_repository import SqlAlchemyRepository
+from .unit_of_work import SqlAlchemyUnitOfWork
+
+
+class ShardedUnitOfWork(UnitOfWork[Any, Any]):
+    """Unit of work running a `SqlAlchemyUnitOfWork` on each shard.
+
+    Example:
+        >>> executor = ThreadPoolExecutor(max_workers=16)
+        >>> with ShardedUnitOfWork(engines, {"entities": EntityExampleRepository}, executor) as unit_of_work:
+        ...     unit_of_work.repositories()["entities"].add(entity)
+        ...     unit_of_work.commit()
+
+    Attributes:
+        shards (list[SqlAlchemyUnitOfWork]): The units of work of the shards, by index.
+        executor (Executor | None): The executor running the queries of the shards
+            concurrently; None to run them one after the other.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[Engine],
+        repositories: Mapping[str, type[SqlAlchemyRepository[Any, Any]]],
+        executor: Executor | None = None,
+        **options: Any,
+    ) -> None:
+        """Initialize the unit of work, without connecting yet.
+
+        Args:
+            engines (Sequence[Engine]): The engines of the shards, by index. Their order
+                must not change while the shards hold entities.
+            repositories (Mapping[str, type[SqlAlchemyRepository[Any, Any]]]): The classes
+                of the repositories of the unit of work, keyed by name.
+            executor (Executor | None): The executor running the queries of the shards
+                concurrently, shared by the units of work of the process; None to run
+                them one after the other.
+            **options (Any): The other arguments of the `SqlAlchemyUnitOfWork` of each
+                shard, such as the dispatcher of the domain events.
+
+        Raises:
+            ValueError: If there is no shard.
+        """
+        if not engines:
+            raise ValueError("A sharded unit of work needs at least one shard.")
+        self.shards = [SqlAlchemyUnitOfWork(engine, repositories, **options) for engine in engines]
+        self.executor = executor
+        self._names = list(repositories)
+        self._repositories: dict[str, Repository[Any, Any]] = {}
+        self._exit_stack: ExitStack | None = None
+
+    def __enter__(self) -> Self:
+        """Enter the units of work of all the shards.
+
+        Returns:
+            Self: The unit of work.
+        """
+        with ExitStack() as stack:
+            for shard in self.shards:
+                stack.enter_context(shard)
+            self._exit_stack = stack.pop_all()
+        repositories = [shard.repositories() for shard in self.shards]
+        self._repositories = {
+            name: ShardedRepository([shard[name] for shard in repositories], self.executor) for name in self._names
+        }
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Roll back the uncommitted changes of the shards, and close their connections.
+
+        Args:
+            exc_type (type[BaseException] | None): The type of the exception raised in the
+                block, if any.
+            exc_value (BaseException | None): The exception raised in the block, if any.
+            traceback (TracebackType | None): The traceback of the exception, if any.
+        """
+        stack, self._exit_stack = self._exit_stack, None
+        self._repositories = {}
+        if stack is not None:
+            stack.__exit__(exc_type, exc_value, traceback)
+
+    def commit(self) -> None:
+        """Commit the shards one after the other."""
+        for shard in self.shards:
+            shard.commit()
+
+    def rollback(self) -> None:
+        """Roll back all the shards."""
+        for shard in self.shards:
+            shard.rollback()
+
+    def repositories(self) -> dict[str, Repository[Any, Any]]:
+        """Get the sharded repositories of the unit of work.
+
+        Returns:
+            dict[str, Repository[Any, Any]]: The repositories, keyed by name.
+
+        Raises:
+            RuntimeError: If the unit of work is not entered.
+        """
+        if self._exit_stack is None:
+            raise RuntimeError("The unit of work must be entered with a `with` statement first.")
+        return dict(self._repositories)
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["ShardedUnitOfWork"]
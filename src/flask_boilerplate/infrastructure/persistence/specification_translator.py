@@ -0,0 +1,89 @@
+"""Module translating domain specifications into SQLAlchemy criteria.
+
+Specification trees are pushed down to the database as a single WHERE clause whenever
+possible. Leaf specifications opt in by implementing `Specification.column_expression()`;
+`AndSpecification`, `OrSpecification` and `NotSpecification` map to `AND`, `OR` and
+`NOT`.
+
+A tree is not always fully translatable. The conjuncts of an `AndSpecification` are
+translated independently: the translatable ones restrict the query and the others are
+returned as a residual specification, to be evaluated in Python over the rows the query
+returns. An `OrSpecification` or a `NotSpecification` is only translated when all of its
+operands are, since a partial translation would discard satisfying rows.
+"""
+
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from sqlalchemy import ColumnElement, and_, not_, or_
+
+from flask_boilerplate.domain.primitives.specification import (
+    AndSpecification,
+    CompiledSpecification,
+    NotSpecification,
+    OrSpecification,
+    Specification,
+)
+
+T = TypeVar("T")
+
+
+class SpecificationTranslation(NamedTuple, Generic[T]):
+    """Result of the translation of a specification.
+
+    Attributes:
+        criterion (ColumnElement[bool] | None): The criterion to add to the WHERE clause,
+            or None if no part of the specification could be translated.
+        residual (Specification[T] | None): The part of the specification left to
+            evaluate in Python, or None if the specification was fully translated.
+    """
+
+    criterion: ColumnElement[bool] | None
+    residual: Specification[T] | None
+
+
+def translate_specification(specification: Specification[T], columns: Any) -> SpecificationTranslation[T]:
+    """Translate a specification tree into a SQLAlchemy criterion.
+
+    Args:
+        specification (Specification[T]): The specification to translate.
+        columns (Any): The columns of the queried table, accessible by attribute name.
+
+    Returns:
+        SpecificationTranslation[T]: The criterion and the residual specification.
+    """
+    if isinstance(specification, CompiledSpecification):
+        return translate_specification(specification.specification, columns)
+
+    kind = type(specification)
+    if kind is AndSpecification:
+        first = translate_specification(specification.first, columns)  # type: ignore[attr-defined]
+        second = translate_specification(specification.second, columns)  # type: ignore[attr-defined]
+        criteria = [criterion for criterion in (first.criterion, second.criterion) if criterion is not None]
+        residuals = [residual for residual in (first.residual, second.residual) if residual is not None]
+        return SpecificationTranslation(
+            and_(*criteria) if len(criteria) > 1 else (criteria[0] if criteria else None),
+            AndSpecification(*residuals) if len(residuals) > 1 else (residuals[0] if residuals else None),
+        )
+
+    if kind is OrSpecification:
+        first = translate_specification(specification.first, columns)  # type: ignore[attr-defined]
+        second = translate_specification(specification.second, columns)  # type: ignore[attr-defined]
+        fully_translated = first.residual is None and second.residual is None
+        if fully_translated and first.criterion is not None and second.criterion is not None:
+            return SpecificationTranslation(or_(first.criterion, second.criterion), None)
+        return SpecificationTranslation(None, specification)
+
+    if kind is NotSpecification:
+        inner = translate_specification(specification.specification, columns)  # type: ignore[attr-defined]
+        if inner.residual is None and inner.criterion is not None:
+            return SpecificationTranslation(not_(inner.criterion), None)
+        return SpecificationTranslation(None, specification)
+
+    criterion = specification.column_expression(columns)
+    if criterion is None:
+        return SpecificationTranslation(None, specification)
+    return SpecificationTranslation(criterion, None)
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["SpecificationTranslation", "translate_specification"]
@@ -0,0 +1,233 @@
+"""Module defining the SQLAlchemy implementation of the unit of work.
+
+`SqlAlchemyUnitOfWork` opens a connection when it is entered, and creates its
+repositories on that connection, sharing its identity map: within a transaction,
+repeated loads of an entity return the same instance without another query.
+
+The inserts and deletes of the repositories are recorded in a `WriteBatch`, and
+written in bulk, in chunks of `chunk_size` rows, when the unit of work commits. The
+entities of the identity map that track their changes are updated at the same time,
+with one executemany UPDATE per table and set of changed columns.
+
+The repositories given an `EntityCache` are wrapped in a `CachingRepository`: their
+reads by identifier are answered from the cache when possible, except for the rows
+the unit of work writes, and the entries of those rows are invalidated once it
+commits.
+
+Committing or rolling back ends the transaction and clears the identity map; the
+next statement starts a new transaction. After a commit, the domain events raised by
+the aggregates of the identity map, including those removed in the transaction, are
+dispatched; after a rollback, they are dropped.
+With an `Outbox`, the events are also inserted into the outbox table before the
+commit, in the same transaction, for an `OutboxRelay` to publish them.
+"""
+
+from collections.abc import Mapping
+from itertools import chain
+from types import TracebackType
+from typing import Any, Self
+
+from sqlalchemy import Connection, Engine
+
+from flask_boilerplate.domain.domain_events.collector import DomainEventCollector
+from flask_boilerplate.domain.domain_events.dispatcher import DomainEventDispatcher
+from flask_boilerplate.domain.primitives.aggregate_root import AggregateRoot
+from flask_boilerplate.domain.primitives.repository import Repository, UnitOfWork
+
+from .entity_cache import EntityCache
+from .outbox import Outbox
+from .repositories.caching_repository import CachingRepository
+from .repositories.sqlalchemy_repository import SqlAlchemyRepository
+from .write_batch import WriteBatch
+
+
+class SqlAlchemyUnitOfWork(UnitOfWork[Any, Any]):
+    """Unit of work running its repositories in a transaction on a single connection.
+
+    Example:
+        >>> unit_of_work = SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, dispatcher)
+        >>> with unit_of_work:
+        ...     repository = unit_of_work.repositories()["entities"]
+        ...     assert repository.get(entity_id) is repository.get(entity_id)
+        ...     unit_of_work.commit()
+        >>> unit_of_work.identity_map.hits
+        1
+
+    Attributes:
+        engine (Engine): The engine to connect to.
+        dispatcher (DomainEventDispatcher | None): The dispatcher of the domain events
+            raised by the aggregates, after a commit.
+        connection (Connection | None): The connection of the unit of work, while it is
+            entered.
+        write_batch (WriteBatch): The inserts, updates and deletes waiting for the commit.
+        caches (dict[str, EntityCache[Any, Any]]): The caches of the entities of the
+            cached repositories, keyed by repository name.
+        outbox (Outbox | None): The outbox the domain events are recorded in, if any.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        repositories: Mapping[str, type[SqlAlchemyRepository[Any, Any]]],
+        dispatcher: DomainEventDispatcher | None = None,
+        chunk_size: int = 500,
+        caches: Mapping[str, EntityCache[Any, Any]] | None = None,
+        outbox: Outbox | None = None,
+    ) -> None:
+        """Initialize the unit of work, without connecting yet.
+
+        Args:
+            engine (Engine): The engine to connect to.
+            repositories (Mapping[str, type[SqlAlchemyRepository[Any, Any]]]): The classes
+                of the repositories of the unit of work, keyed by name.
+            dispatcher (DomainEventDispatcher | None): The dispatcher of the domain events
+                raised by the aggregates, after a commit.
+            chunk_size (int): The maximum number of rows written per statement.
+            caches (Mapping[str, EntityCache[Any, Any]] | None): The caches of the
+                entities of the repositories to cache, keyed by repository name. They
+                are shared by the units of work of the process.
+            outbox (Outbox | None): The outbox to record the domain events in, within the
+                transaction of the aggregates.
+        """
+        self.engine = engine
+        self.dispatcher = dispatcher
+        self.connection: Connection | None = None
+        self.write_batch = WriteBatch(chunk_size)
+        self.caches = dict(caches or {})
+        self.outbox = outbox
+        self._repository_classes = dict(repositories)
+        self._repositories: dict[str, SqlAlchemyRepository[Any, Any]] = {}
+        self._exposed: dict[str, Repository[Any, Any]] = {}
+
+    def __enter__(self) -> Self:
+        """Connect, and create the repositories on the connection.
+
+        Returns:
+            Self: The unit of work.
+        """
+        self._open(self.engine.connect())
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Roll back the uncommitted changes, and close the connection.
+
+        Args:
+            exc_type (type[BaseException] | None): The type of the exception raised in the
+                block, if any.
+            exc_value (BaseException | None): The exception raised in the block, if any.
+            traceback (TracebackType | None): The traceback of the exception, if any.
+        """
+        try:
+            self.rollback()
+        finally:
+            self._connected().close()
+            self._release()
+
+    def commit(self) -> None:
+        """Write the pending writes and changes, commit, and clear the identity map.
+
+        With an outbox, the domain events are inserted into it before the commit. Once
+        committed, the cache entries of the written rows are invalidated, and the domain
+        events are dispatched.
+        """
+        connection = self._connected()
+        collector = DomainEventCollector(self.dispatcher)
+        if self.dispatcher is not None or self.outbox is not None:
+            self._track_aggregates(collector)
+        for repository in self._repositories.values():
+            repository.collect_changes()
+        self.write_batch.flush(connection)
+        events = None
+        if self.outbox is not None:
+            events = collector.collect()
+            self.outbox.write(connection, events)
+        connection.commit()
+        written = self.write_batch.pop_written()
+        for name, cache in self.caches.items():
+            cache.invalidate_many(written.get(self._repositories[name].table, ()))
+        self.identity_map.clear()
+        if self.dispatcher is not None:
+            if events is None:
+                collector.publish()
+            else:
+                self.dispatcher.dispatch(events)
+
+    def rollback(self) -> None:
+        """Drop the pending writes, roll back, clear the identity map and drop the domain events."""
+        collector = DomainEventCollector()
+        self._track_aggregates(collector)
+        self.write_batch.clear()
+        self._connected().rollback()
+        self.identity_map.clear()
+        collector.discard()
+
+    def repositories(self) -> dict[str, Repository[Any, Any]]:
+        """Get the repositories of the unit of work.
+
+        Returns:
+            dict[str, Repository[Any, Any]]: The repositories, keyed by name.
+
+        Raises:
+            RuntimeError: If the unit of work is not entered.
+        """
+        self._connected()
+        return dict(self._exposed)
+
+    def _open(self, connection: Connection) -> None:
+        """Create the repositories on a connection, which the unit of work then uses.
+
+        Args:
+            connection (Connection): The connection of the unit of work.
+        """
+        self.connection = connection
+        self._repositories = {
+            name: repository(connection, self.identity_map, self.write_batch)
+            for name, repository in self._repository_classes.items()
+        }
+        self._exposed = dict(self._repositories)
+        for name, cache in self.caches.items():
+            repository = self._repositories[name]
+            self._exposed[name] = CachingRepository(
+                repository, cache, self.identity_map, repository.table, write_batch=self.write_batch
+            )
+
+    def _release(self) -> None:
+        """Forget the connection and the repositories, once the connection is closed."""
+        self.connection = None
+        self._repositories = {}
+        self._exposed = {}
+
+    def _connected(self) -> Connection:
+        """Get the connection of the unit of work.
+
+        Returns:
+            Connection: The connection.
+
+        Raises:
+            RuntimeError: If the unit of work is not entered.
+        """
+        if self.connection is None:
+            raise RuntimeError("The unit of work must be entered with a `with` statement first.")
+        return self.connection
+
+    def _track_aggregates(self, collector: DomainEventCollector) -> None:
+        """Track the aggregates of the identity map, to collect their domain events.
+
+        The aggregates removed in the transaction are tracked too: their events are
+        recorded and dispatched with the deletion of their rows.
+
+        Args:
+            collector (DomainEventCollector): The collector to track the aggregates with.
+        """
+        for entity in chain(self.identity_map, self.identity_map.removed()):
+            if isinstance(entity, AggregateRoot):
+                collector.track(entity)
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["SqlAlchemyUnitOfWork"]
@@ -0,0 +1,367 @@
+"""Module defining the batch of pending writes of a unit of work.
+
+Writing each new entity with its own INSERT statement costs a round trip to the
+database per entity, which dominates the commit of a unit of work that added
+thousands of them. Within a unit of work, repositories do not write immediately:
+they record their inserts, updates and deletes in a `WriteBatch`, grouped by table.
+
+When the unit of work commits, or before a repository queries the database, the
+batch is flushed within the current transaction:
+
+- the deletes of each table are executed as `DELETE ... WHERE id IN (...)`
+  statements of at most `chunk_size` identifiers, and no more than the parameter
+  limit of the database;
+- the inserts of each table are executed as executemany INSERT statements of at
+  most `chunk_size` rows;
+- the updates are grouped by table and set of changed columns, and each group is
+  executed as executemany UPDATE statements of at most `chunk_size` rows, setting
+  only those columns.
+
+The rows of tables with a `version` column are written with optimistic concurrency
+control: their updates and deletes only apply to the row of the version the entity
+was loaded with, `UPDATE ... SET version = version + 1 WHERE id = ? AND version = ?`,
+and the flush raises a `ConcurrencyError` if a row was changed or deleted since.
+
+The rows of new entities are built when the batch is flushed, so that they include
+the changes made to the entities after they were added. Adding then removing an
+entity within the same batch writes nothing, and the updates of an entity waiting
+for its insertion are dropped.
+
+The batch remembers the identifiers of the rows it wrote until `pop_written()` is
+called, so that the unit of work can invalidate the cached entities it changed once
+its transaction is committed.
+"""
+
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from sqlalchemy import Connection, Delete, Table, Update, bindparam, delete, insert, update
+
+from flask_boilerplate.domain.errors.concurrency_error import ConcurrencyError
+
+from .parameter_limits import max_bind_parameters
+
+# The names of the parameters binding the identifier and the expected version of a
+# written row, distinct from the names of the columns.
+_ID_PARAMETER = "_id"
+_VERSION_PARAMETER = "_version"
+
+
+class WriteBatch:
+    """Inserts, updates and deletes waiting to be written, grouped by table.
+
+    Example:
+        >>> batch = WriteBatch(chunk_size=500)
+        >>> batch.insert(users_table, user.id, user, to_row)
+        >>> batch.update(users_table, renamed_user.id, {"name": renamed_user.name})
+        >>> batch.delete(users_table, other_user.id)
+        >>> batch.update(orders_table, order.id, {"status": order.status}, versioned=order)
+        >>> batch.flush(connection)
+        3
+
+    Attributes:
+        chunk_size (int): The maximum number of rows per INSERT and UPDATE, and of
+            identifiers per DELETE.
+    """
+
+    def __init__(self, chunk_size: int = 500) -> None:
+        """Initialize an empty batch.
+
+        Args:
+            chunk_size (int): The maximum number of rows per INSERT and UPDATE, and of
+                identifiers per DELETE.
+
+        Raises:
+            ValueError: If the chunk size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"The chunk size must be positive, got {chunk_size}.")
+        self.chunk_size = chunk_size
+        # The new entities of each table by identifier, with the function converting
+        # them into rows, the changed column values of each table and set of columns by
+        # identifier, the changed column values and the entity of the versioned rows of
+        # each table by identifier, and the identifiers of the rows to delete, with
+        # their expected version if they are versioned.
+        self._inserts: dict[Table, tuple[dict[Any, Any], Callable[[Any], Mapping[str, Any]]]] = {}
+        self._updates: dict[tuple[Table, tuple[str, ...]], dict[Any, dict[str, Any]]] = {}
+        self._versioned_updates: dict[Table, dict[Any, tuple[dict[str, Any], Any]]] = {}
+        self._deletes: dict[Table, dict[Any, int | None]] = {}
+        # The identifiers of the rows written since the last call to `pop_written()`.
+        self._written: dict[Table, set[Any]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of pending writes.
+
+        Returns:
+            int: The number of pending inserts, updates and deletes.
+        """
+        inserts = sum(len(entities) for entities, _ in self._inserts.values())
+        updates = sum(map(len, self._updates.values())) + sum(map(len, self._versioned_updates.values()))
+        return inserts + updates + sum(map(len, self._deletes.values()))
+
+    def insert(self, table: Table, id: Any, entity: Any, to_row: Callable[[Any], Mapping[str, Any]]) -> None:
+        """Record the insertion of a new entity.
+
+        Args:
+            table (Table): The table to insert the entity into.
+            id (Any): The identifier of the entity.
+            entity (Any): The entity to insert.
+            to_row (Callable[[Any], Mapping[str, Any]]): The function converting the entity
+                into its row, called when the batch is flushed.
+        """
+        pending = self._inserts.get(table)
+        if pending is None:
+            pending = self._inserts[table] = ({}, to_row)
+        pending[0][id] = entity
+
+    def update(self, table: Table, id: Any, values: Mapping[str, Any], versioned: Any = None) -> None:
+        """Record the update of some columns of a row.
+
+        The update is dropped if the entity is waiting for its insertion, whose row is
+        built when the batch is flushed.
+
+        Args:
+            table (Table): The table of the row.
+            id (Any): The identifier of the row.
+            values (Mapping[str, Any]): The new values of the changed columns, keyed by
+                column name.
+            versioned (Any): The entity of the row, if the table has a `version` column:
+                the row is only updated if its version is still the `version` of the
+                entity, which is incremented once the row is written.
+        """
+        pending = self._inserts.get(table)
+        if pending is not None and id in pending[0]:
+            return
+        if versioned is not None:
+            # The changes of an entity are written at once, to check its version once.
+            updates = self._versioned_updates.setdefault(table, {})
+            previous = updates.get(id)
+            updates[id] = ({**previous[0], **values} if previous else dict(values), versioned)
+            return
+        parameters = dict(values)
+        parameters[_ID_PARAMETER] = id
+        self._updates.setdefault((table, tuple(sorted(values))), {})[id] = parameters
+
+    def delete(self, table: Table, id: Any, version: int | None = None) -> None:
+        """Record the deletion of a row, or cancel the pending insertion of the entity.
+
+        Args:
+            table (Table): The table to delete the row from.
+            id (Any): The identifier of the row.
+            version (int | None): The expected version of the row, if the table has a
+                `version` column: the row is only deleted if its version is still this one.
+        """
+        pending = self._inserts.get(table)
+        if pending is not None and pending[0].pop(id, None) is not None:
+            return
+        self._versioned_updates.get(table, {}).pop(id, None)
+        self._deletes.setdefault(table, {})[id] = version
+
+    def flush(self, connection: Connection) -> int:
+        """Execute the pending writes, and empty the batch.
+
+        Deletes are executed first, so that an entity removed and then added again with
+        the same identifier is replaced, then inserts, then updates. Tables are written
+        in the order they were first written to, and deleted from in the reverse order.
+        The written rows are remembered, and the versions of the updated aggregates
+        incremented, only once all the statements succeeded.
+
+        Args:
+            connection (Connection): The connection to execute the statements on, within
+                its current transaction.
+
+        Returns:
+            int: The number of statements executed.
+
+        Raises:
+            ConcurrencyError: If a versioned row was changed or deleted since its entity
+                was loaded. The transaction should then be rolled back; the batch forgets
+                the rows written since the last call to `pop_written()`, and the versions
+                of the aggregates are left unchanged.
+        """
+        inserts, updates, deletes = self._inserts, self._updates, self._deletes
+        versioned_updates = self._versioned_updates
+        self._inserts, self._updates, self._deletes, self._versioned_updates = {}, {}, {}, {}
+        try:
+            statements = self._execute(connection, inserts, updates, versioned_updates, deletes)
+        except BaseException:
+            self._written.clear()
+            raise
+        for table, ids in deletes.items():
+            self._written.setdefault(table, set()).update(ids)
+        for table, (entities, _) in inserts.items():
+            self._written.setdefault(table, set()).update(entities)
+        for (table, _), parameters in updates.items():
+            self._written.setdefault(table, set()).update(parameters)
+        for table, versioned in versioned_updates.items():
+            self._written.setdefault(table, set()).update(versioned)
+            for _, entity in versioned.values():
+                entity.version += 1
+        return statements
+
+    def _execute(
+        self,
+        connection: Connection,
+        inserts: dict[Table, tuple[dict[Any, Any], Callable[[Any], Mapping[str, Any]]]],
+        updates: dict[tuple[Table, tuple[str, ...]], dict[Any, dict[str, Any]]],
+        versioned_updates: dict[Table, dict[Any, tuple[dict[str, Any], Any]]],
+        deletes: dict[Table, dict[Any, int | None]],
+    ) -> int:
+        """Execute the statements of pending writes, in the order of `flush()`.
+
+        Args:
+            connection (Connection): The connection to execute the statements on.
+            inserts (dict[Table, tuple[dict[Any, Any], Callable[[Any], Mapping[str, Any]]]]):
+                The new entities of each table, with the function converting them into rows.
+            updates (dict[tuple[Table, tuple[str, ...]], dict[Any, dict[str, Any]]]): The
+                parameters of the unversioned updates, by table and set of columns.
+            versioned_updates (dict[Table, dict[Any, tuple[dict[str, Any], Any]]]): The
+                changed values and the entity of the versioned updates, by table.
+            deletes (dict[Table, dict[Any, int | None]]): The identifiers of the rows to
+                delete, with their expected version, by table.
+
+        Returns:
+            int: The number of statements executed.
+
+        Raises:
+            ConcurrencyError: If a versioned row was changed or deleted since its entity
+                was loaded.
+        """
+        statements = 0
+        # The identifiers of a DELETE are bound in its IN list, within the parameter
+        # limit of the database.
+        delete_size = min(self.chunk_size, max_bind_parameters(connection))
+        for table, ids in reversed(deletes.items()):
+            unversioned = [id for id, version in ids.items() if version is None]
+            for chunk in _chunks(unversioned, delete_size):
+                connection.execute(delete(table).where(table.c.id.in_(chunk)))
+                statements += 1
+            versions = [
+                {_ID_PARAMETER: id, _VERSION_PARAMETER: version} for id, version in ids.items() if version is not None
+            ]
+            for chunk in _chunks(versions, self.chunk_size):
+                statements += _execute_versioned(
+                    connection, table, delete(table).where(*_versioned_criteria(table)), chunk
+                )
+        for table, (entities, to_row) in inserts.items():
+            rows = [to_row(entity) for entity in entities.values()]
+            for chunk in _chunks(rows, self.chunk_size):
+                connection.execute(insert(table), chunk)
+                statements += 1
+        for (table, _), parameters in updates.items():
+            # The changed columns are bound by name from each row of parameters.
+            statement = update(table).where(table.c.id == bindparam(_ID_PARAMETER))
+            for chunk in _chunks(list(parameters.values()), self.chunk_size):
+                connection.execute(statement, chunk)
+                statements += 1
+        for table, versioned in versioned_updates.items():
+            # The updates are grouped by set of changed columns, like the unversioned ones.
+            groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+            for id, (values, entity) in versioned.items():
+                row = {**values, _ID_PARAMETER: id, _VERSION_PARAMETER: entity.version}
+                groups.setdefault(tuple(sorted(values)), []).append(row)
+            increment = update(table).where(*_versioned_criteria(table)).values(version=table.c.version + 1)
+            for group in groups.values():
+                for chunk in _chunks(group, self.chunk_size):
+                    statements += _execute_versioned(connection, table, increment, chunk)
+        return statements
+
+    def is_written(self, table: Table, id: Any) -> bool:
+        """Tell whether a row is written by the current transaction.
+
+        A row is written if it has a pending write, or was written since the last call
+        to `pop_written()`.
+
+        Args:
+            table (Table): The table of the row.
+            id (Any): The identifier of the row.
+
+        Returns:
+            bool: True if the row is written, otherwise False.
+        """
+        pending = self._inserts.get(table)
+        return (
+            id in self._written.get(table, ())
+            or (pending is not None and id in pending[0])
+            or id in self._deletes.get(table, ())
+            or id in self._versioned_updates.get(table, ())
+            or any(id in rows for (updated, _), rows in self._updates.items() if updated is table)
+        )
+
+    def pop_written(self) -> dict[Table, set[Any]]:
+        """Get the identifiers of the rows written since the last call, and forget them.
+
+        Returns:
+            dict[Table, set[Any]]: The identifiers of the inserted, updated and deleted
+                rows, by table.
+        """
+        written, self._written = self._written, {}
+        return written
+
+    def clear(self) -> None:
+        """Drop the pending writes, and forget the rows written."""
+        self._inserts.clear()
+        self._updates.clear()
+        self._versioned_updates.clear()
+        self._deletes.clear()
+        self._written.clear()
+
+
+def _versioned_criteria(table: Table) -> tuple[Any, Any]:
+    """Get the criteria selecting a row by identifier and expected version.
+
+    Args:
+        table (Table): The table of the rows, with a `version` column.
+
+    Returns:
+        tuple[Any, Any]: The criteria, bound to the identifier and version parameters.
+    """
+    return table.c.id == bindparam(_ID_PARAMETER), table.c.version == bindparam(_VERSION_PARAMETER)
+
+
+def _execute_versioned(
+    connection: Connection, table: Table, statement: Update | Delete, parameters: list[dict[str, Any]]
+) -> int:
+    """Execute an UPDATE or DELETE of versioned rows, checking that each row matched.
+
+    Args:
+        connection (Connection): The connection to execute the statement on.
+        table (Table): The table of the rows.
+        statement (Update | Delete): The statement, selecting a row by identifier and
+            expected version.
+        parameters (list[dict[str, Any]]): The parameters of each row.
+
+    Returns:
+        int: The number of statements executed.
+
+    Raises:
+        ConcurrencyError: If some rows were changed or deleted since they were loaded.
+    """
+    if connection.dialect.supports_sane_multi_rowcount:
+        if connection.execute(statement, parameters).rowcount == len(parameters):
+            return 1
+        # The matched rows are already written, so the conflicting ones cannot be told
+        # apart: report all the rows of the statement.
+        conflicts = [row[_ID_PARAMETER] for row in parameters]
+    else:
+        conflicts = [row[_ID_PARAMETER] for row in parameters if connection.execute(statement, row).rowcount != 1]
+        if not conflicts:
+            return len(parameters)
+    raise ConcurrencyError(f"Rows of {table.name!r} were changed or deleted since they were loaded.", conflicts)
+
+
+def _chunks(values: list[Any], size: int) -> list[list[Any]]:
+    """Split values into consecutive chunks.
+
+    Args:
+        values (list[Any]): The values to split.
+        size (int): The maximum size of a chunk.
+
+    Returns:
+        list[list[Any]]: The chunks, none if there are no values.
+    """
+    return [values[start : start + size] for start in range(0, len(values), size)]
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["WriteBatch"]
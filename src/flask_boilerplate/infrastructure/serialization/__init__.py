@@ -0,0 +1,17 @@
+"""Module exporting the serialization layer of the infrastructure.
+
+The serialization layer writes entities, value objects and view models as JSON. The
+encoders of dataclasses are compiled in `json_encoder`, and `JsonSerializer` streams
+sequences of objects as JSON or NDJSON chunks.
+"""
+
+from .json_encoder import Encoder, encode_many, encode_value, encoder_for
+from .json_serializer import JsonSerializer
+
+__all__ = [
+    "Encoder",
+    "encode_value",
+    "encode_many",
+    "encoder_for",
+    "JsonSerializer",
+]
@@ -0,0 +1,101 @@
+"""Module defining the streaming JSON serializer of entities and view models.
+
+List endpoints used to convert every object with `to_dict()` and hand the whole list
+to `json.dumps()`, holding the dictionaries and the full response in memory at once.
+`JsonSerializer` writes the objects with their compiled encoders instead, and yields
+the response as chunks of bytes, so that a Flask response can stream them as they are
+produced.
+
+Example:
+    >>> serializer = JsonSerializer(chunk_size=500)
+    >>> return Response(serializer.iter_json(repository.list()), mimetype="application/json")
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any
+
+from .json_encoder import encode_many, encode_value
+
+
+class JsonSerializer:
+    """Serializer writing objects as JSON or NDJSON bytes, chunk by chunk.
+
+    Dataclasses, such as entities, value objects and view models, are written with
+    their compiled encoder. Other values are written as `json.dumps()` would.
+
+    Attributes:
+        chunk_size (int): The number of objects encoded into each chunk of bytes.
+        encoding (str): The encoding of the chunks.
+    """
+
+    def __init__(self, chunk_size: int = 1000, encoding: str = "utf-8") -> None:
+        """Initialize the serializer.
+
+        Args:
+            chunk_size (int): The number of objects encoded into each chunk of bytes.
+            encoding (str): The encoding of the chunks.
+
+        Raises:
+            ValueError: If the chunk size is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"The chunk size must be positive, got {chunk_size}.")
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+
+    def dumps(self, value: Any) -> bytes:
+        """Encode a single value as JSON bytes.
+
+        Args:
+            value (Any): The value to encode.
+
+        Returns:
+            bytes: The JSON document.
+        """
+        return encode_value(value).encode(self.encoding)
+
+    def iter_json(self, objects: Iterable[Any]) -> Iterator[bytes]:
+        """Encode objects as a JSON array, yielded in chunks.
+
+        Args:
+            objects (Iterable[Any]): The objects to encode. They are consumed lazily.
+
+        Yields:
+            bytes: The successive chunks of the JSON array.
+        """
+        yield b"["
+        separator = ""
+        for chunk in self._chunks(objects):
+            yield (separator + ",".join(encode_many(chunk))).encode(self.encoding)
+            separator = ","
+        yield b"]"
+
+    def iter_ndjson(self, objects: Iterable[Any]) -> Iterator[bytes]:
+        """Encode objects as newline-delimited JSON, yielded in chunks.
+
+        Args:
+            objects (Iterable[Any]): The objects to encode. They are consumed lazily.
+
+        Yields:
+            bytes: The successive chunks, each made of complete lines.
+        """
+        for chunk in self._chunks(objects):
+            yield ("\n".join(encode_many(chunk)) + "\n").encode(self.encoding)
+
+    def _chunks(self, objects: Iterable[Any]) -> Iterator[list[Any]]:
+        """Split objects into lists of at most `chunk_size` objects.
+
+        Args:
+            objects (Iterable[Any]): The objects to split.
+
+        Yields:
+            list[Any]: The successive, non-empty chunks.
+        """
+        iterator = iter(objects)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            yield chunk
+
+
+# Add the class to __all__ for re-export in the parent module.
+__all__ = ["JsonSerializer"]
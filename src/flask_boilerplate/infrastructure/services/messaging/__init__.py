@@ -0,0 +1,9 @@
+"""Module exporting the messaging services of the infrastructure.
+
+`MessagePublisher` is the interface of the adapters publishing messages to a broker,
+in batches, and `InMemoryMessagePublisher` keeps them in memory instead.
+"""
+
+from .message_publisher import InMemoryMessagePublisher, Message, MessagePublisher
+
+__all__ = ["Message", "MessagePublisher", "InMemoryMessagePublisher"]
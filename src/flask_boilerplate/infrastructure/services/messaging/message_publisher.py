@@ -0,0 +1,85 @@
+"""Module defining the publication of messages to a message broker.
+
+The domain events leave the process as `Message` objects, their JSON payload tagged
+with their topic, the name of the event. A `MessagePublisher` sends them to a broker
+in batches, so that an adapter can use the batch API of its broker, with a single
+round trip per batch.
+
+Messages are delivered at least once: a batch whose publication fails is published
+again, possibly after some of its messages reached the broker. Consumers should skip
+the messages whose `id` they already processed.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class Message:
+    """Message to publish.
+
+    Attributes:
+        id (int): The unique, increasing identifier of the message, for deduplication.
+        topic (str): The topic of the message, the name of the domain event.
+        payload (str): The JSON text of the domain event.
+        created_at (datetime): The time the message was recorded, in UTC.
+    """
+
+    id: int
+    topic: str
+    payload: str
+    created_at: datetime
+
+
+class MessagePublisher(ABC):
+    """Base interface for the publishers of messages to a broker.
+
+    Example:
+        >>> class KafkaMessagePublisher(MessagePublisher):
+        ...     def publish_batch(self, messages: Sequence[Message]) -> None:
+        ...         for message in messages:
+        ...             producer.produce(message.topic, message.payload, key=str(message.id))
+        ...         producer.flush()
+    """
+
+    @abstractmethod
+    def publish_batch(self, messages: Sequence[Message]) -> None:
+        """Publish a batch of messages, returning once the broker acknowledged them all.
+
+        Args:
+            messages (Sequence[Message]): The messages, in the order of their identifiers.
+
+        Raises:
+            Exception: If a message could not be published; the whole batch is then
+                published again later.
+        """
+        raise NotImplementedError
+
+
+class InMemoryMessagePublisher(MessagePublisher):
+    """Publisher keeping the published messages in memory, for tests and development.
+
+    Attributes:
+        messages (list[Message]): The published messages, in publication order.
+        batches (int): The number of batches published.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a publisher without messages."""
+        self.messages: list[Message] = []
+        self.batches = 0
+
+    def publish_batch(self, messages: Sequence[Message]) -> None:
+        """Keep a batch of messages.
+
+        Args:
+            messages (Sequence[Message]): The messages.
+        """
+        self.messages.extend(messages)
+        self.batches += 1
+
+
+# Add the classes to __all__ for re-export in the parent module.
+__all__ = ["Message", "MessagePublisher", "InMemoryMessagePublisher"]
@@ -0,0 +1,8 @@
+"""Module exporting the controllers of the presentation layer.
+
+Controllers expose the application over HTTP as Flask blueprints.
+"""
+
+from .entity_examples_controller import create_entity_examples_blueprint
+
+__all__ = ["create_entity_examples_blueprint"]
@@ -0,0 +1,108 @@
+"""Module defining the asynchronous Flask views of `EntityExample` entities.
+
+The views are coroutines reading the entities through an `AsyncSqlAlchemyUnitOfWork`,
+so that the database calls of a request are awaited instead of blocking the worker.
+
+Flask runs each asynchronous view in an event loop of its own (it requires the
+`asgiref` package, installed with the `async` extra). Connections must therefore not
+outlive a request: create the engine with `poolclass=NullPool`, unless the
+application is served by an ASGI server running all requests on the same loop.
+
+Example:
+    >>> engine = create_async_engine("sqlite+aiosqlite:///app.db", poolclass=NullPool)
+    >>> app.register_blueprint(create_entity_examples_blueprint(engine))
+"""
+
+from collections.abc import Mapping
+from typing import Any
+from uuid import UUID
+
+from flask import Blueprint, abort, request
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from flask_boilerplate.infrastructure.persistence.async_unit_of_work import AsyncSqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.entity_cache import EntityCache
+from flask_boilerplate.infrastructure.persistence.repositories.entity_example_repository import (
+    EntityExampleRepository,
+)
+
+# The number of entities of a page when the request does not say, and at most.
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def create_entity_examples_blueprint(
+    engine: AsyncEngine,
+    cache: EntityCache[Any, Any] | None = None,
+) -> Blueprint:
+    """Create the blueprint of the views of `EntityExample` entities.
+
+    The blueprint serves:
+
+    - `GET /entity-examples/<id>`: an entity, or a 404 error;
+    - `GET /entity-examples?ids=<id>,<id>`: several entities, with the identifiers not
+      found;
+    - `GET /entity-examples?after=<id>&limit=<n>`: a page of entities sorted by
+      identifier, with the identifier to pass as `after` to get the next page.
+
+    Args:
+        engine (AsyncEngine): The asyncio engine of the database.
+        cache (EntityCache[Any, Any] | None): The cache of the entities read by
+            identifier, if any.
+
+    Returns:
+        Blueprint: The blueprint, to register on the application.
+    """
+    blueprint = Blueprint("entity_examples", __name__, url_prefix="/entity-examples")
+    caches: Mapping[str, EntityCache[Any, Any]] = {} if cache is None else {"entities": cache}
+
+    def unit_of_work() -> AsyncSqlAlchemyUnitOfWork:
+        return AsyncSqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, caches=caches)
+
+    @blueprint.get("/<uuid:entity_id>")
+    async def get_entity_example(entity_id: UUID) -> dict[str, Any]:
+        async with unit_of_work() as work:
+            entity = await work.repositories()["entities"].get(entity_id)
+        if entity is None:
+            abort(404)
+        return {"data": entity.to_dict()}
+
+    @blueprint.get("")
+    async def list_entity_examples() -> dict[str, Any]:
+        ids = request.args.get("ids")
+        async with unit_of_work() as work:
+            repository = work.repositories()["entities"]
+            if ids is not None:
+                result = await repository.get_many(_parse_id(id) for id in ids.split(",") if id)
+                return {
+                    "data": [entity.to_dict() for entity in result],
+                    "missing": [str(id) for id in result.missing],
+                }
+            after = request.args.get("after")
+            limit = min(max(request.args.get("limit", DEFAULT_PAGE_SIZE, type=int), 1), MAX_PAGE_SIZE)
+            page = [entity async for entity in repository.list(None if after is None else _parse_id(after), limit)]
+        return {
+            "data": [entity.to_dict() for entity in page],
+            "next": str(page[-1].id) if len(page) == limit else None,
+        }
+
+    return blueprint
+
+
+def _parse_id(value: str) -> UUID:
+    """Parse an identifier of a query string, aborting with a 400 error if it is invalid.
+
+    Args:
+        value (str): The identifier.
+
+    Returns:
+        UUID: The parsed identifier.
+    """
+    try:
+        return UUID(value)
+    except ValueError:
+        abort(400, description=f"Invalid identifier: {value!r}.")
+
+
+# Add the function to __all__ for re-export in the parent module.
+__all__ = ["create_entity_examples_blueprint"]
@@ -0,0 +1,47 @@
+"""Unit tests for the retry of the operations failing on a concurrent change."""
+
+import pytest
+
+from flask_boilerplate.application.behaviors import retry_on_conflict
+from flask_boilerplate.domain.errors import ConcurrencyError
+
+
+def test_retries_with_jittered_exponential_backoff() -> None:
+    """Test that a conflicting operation is retried after growing, jittered delays."""
+    delays: list[float] = []
+    calls: list[int] = []
+
+    @retry_on_conflict(attempts=5, base_delay=0.01, max_delay=0.03, sleep=delays.append, jitter=lambda low, high: high)
+    def operation(value: int) -> int:
+        calls.append(value)
+        if len(calls) < 4:
+            raise ConcurrencyError("conflict")
+        return value * 2
+
+    assert operation(21) == 42
+    assert calls == [21] * 4
+    assert delays == [0.01, 0.02, 0.03]
+
+
+def test_gives_up_after_the_last_attempt() -> None:
+    """Test that the last conflict is raised, and that other errors are not retried."""
+    calls: list[None] = []
+
+    @retry_on_conflict(attempts=3, sleep=lambda delay: None)
+    def conflicting() -> None:
+        calls.append(None)
+        raise ConcurrencyError("conflict")
+
+    @retry_on_conflict(attempts=3, sleep=lambda delay: None)
+    def failing() -> None:
+        calls.append(None)
+        raise ValueError("invalid")
+
+    with pytest.raises(ConcurrencyError):
+        conflicting()
+    assert len(calls) == 3
+    with pytest.raises(ValueError):
+        failing()
+    assert len(calls) == 4
+    with pytest.raises(ValueError):
+        retry_on_conflict(attempts=0)
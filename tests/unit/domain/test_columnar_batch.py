@@ -0,0 +1,101 @@
+"""Unit tests for columnar batches and the vectorized evaluation of specifications."""
+
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from flask_boilerplate.domain.primitives.columnar_batch import ColumnarBatch  # noqa: E402
+from flask_boilerplate.domain.primitives.specification import Specification  # noqa: E402
+
+
+@dataclass
+class Record:
+    """Simple record evaluated by the test specifications."""
+
+    score: int
+    label: str
+
+
+class ScoreAbove(Specification[Record]):
+    """Vectorizable specification on the score."""
+
+    def __init__(self, bound: int) -> None:
+        self.bound = bound
+
+    def is_satisfied_by(self, candidate: Record) -> bool:
+        return candidate.score > self.bound
+
+    def array_mask(self, batch: ColumnarBatch[Record]) -> Any:
+        return batch.score > self.bound
+
+
+class LabelIsUpper(Specification[Record]):
+    """Specification without an array implementation, counting its evaluations."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def is_satisfied_by(self, candidate: Record) -> bool:
+        self.calls += 1
+        return candidate.label.isupper()
+
+
+def make_records() -> list[Record]:
+    """Create records covering every combination of the test specifications."""
+    return [Record(score, label) for score in range(10) for label in ("a", "B")]
+
+
+def test_from_entities_builds_one_array_per_attribute() -> None:
+    """Test the extraction of the columns of a batch."""
+    records = make_records()
+    batch = ColumnarBatch.from_entities(records, ["score", "label"], dtypes={"score": np.int32})
+
+    assert len(batch) == len(records)
+    assert batch["score"].dtype == np.int32
+    assert list(batch.label[:2]) == ["a", "B"]
+    with pytest.raises(AttributeError):
+        _ = batch.missing
+
+
+def test_batch_rejects_columns_of_different_lengths() -> None:
+    """Test that the columns of a batch are validated."""
+    with pytest.raises(ValueError):
+        ColumnarBatch({"a": np.zeros(2), "b": np.zeros(3)})
+
+
+def test_vectorized_evaluation_matches_scalar_evaluation() -> None:
+    """Test that every node kind agrees with `is_satisfied_by`."""
+    records = make_records()
+    batch = ColumnarBatch.from_entities(records, ["score", "label"])
+    spec = (ScoreAbove(2) & ~LabelIsUpper()) | (~ScoreAbove(7) & LabelIsUpper()) | ScoreAbove(8).compile()
+
+    mask = spec.evaluate_batch(batch)
+
+    assert mask.tolist() == [spec.is_satisfied_by(record) for record in records]
+
+
+def test_scalar_leaves_only_run_on_undecided_rows() -> None:
+    """Test that vectorized conjuncts and disjuncts narrow the scalar evaluations."""
+    records = make_records()
+    batch = ColumnarBatch.from_entities(records, ["score"])
+
+    upper = LabelIsUpper()
+    mask = (upper & ScoreAbove(7)).evaluate_batch(batch)
+    assert batch.select(mask) == [Record(8, "B"), Record(9, "B")]
+    assert upper.calls == 4
+
+    upper = LabelIsUpper()
+    (ScoreAbove(1) | upper).evaluate_batch(batch)
+    assert upper.calls == 4
+
+
+def test_fully_vectorized_evaluation_does_not_need_entities() -> None:
+    """Test that a batch without entities supports fully vectorizable specifications."""
+    batch: ColumnarBatch[Record] = ColumnarBatch({"score": np.arange(5)})
+
+    assert (ScoreAbove(1) & ~ScoreAbove(3)).evaluate_batch(batch).tolist() == [False, False, True, True, False]
+    with pytest.raises(ValueError):
+        LabelIsUpper().evaluate_batch(batch)
@@ -0,0 +1,173 @@
+"""Unit tests for the buffering, collection and dispatch of domain events.
+
+This module contains unit tests for the bounded event buffer of aggregate roots, the
+collector of the events raised within a unit of work, and the batch dispatcher.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, ClassVar
+from uuid import UUID
+
+import pytest
+
+from flask_boilerplate.domain.domain_events import (
+    DomainEventCollector,
+    DomainEventDispatcher,
+    EventBuffer,
+    OverflowPolicy,
+)
+from flask_boilerplate.domain.errors import DomainEventsError
+from flask_boilerplate.domain.primitives import AggregateRoot, DomainEventBase
+
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class ItemAdded(DomainEventBase):
+    """Event that never supersedes another one."""
+
+    item: str
+
+    @property
+    def event_name(self) -> str:
+        return "item_added"
+
+
+@dataclass(frozen=True)
+class Renamed(DomainEventBase):
+    """Event of which only the latest matters."""
+
+    coalesce: ClassVar[bool] = True
+
+    name: str
+
+    @property
+    def event_name(self) -> str:
+        return "renamed"
+
+
+@dataclass(slots=True)
+class Basket(AggregateRoot):
+    """Aggregate raising domain events."""
+
+    id: UUID = UUID(int=1)
+    name: str = "basket"
+
+    def add(self, item: str) -> None:
+        self.add_domain_event(ItemAdded(NOW, item))
+
+    def rename(self, name: str) -> None:
+        self.name = name
+        self.add_domain_event(Renamed(NOW, name))
+
+    def _get_identifier(self) -> UUID:
+        return self.id
+
+
+@dataclass(slots=True)
+class SmallBasket(Basket):
+    """Aggregate keeping only its latest events."""
+
+    domain_events_capacity: ClassVar[int] = 2
+    domain_events_overflow: ClassVar[OverflowPolicy] = OverflowPolicy.DROP_OLDEST
+
+
+def test_buffer_coalesces_superseded_events() -> None:
+    """Test that a coalescing event replaces the pending event of the same type."""
+    basket = Basket()
+    basket.rename("first")
+    basket.add("apple")
+    basket.rename("second")
+    basket.add("pear")
+    basket.rename("third")
+
+    assert list(basket.domain_events) == [ItemAdded(NOW, "apple"), ItemAdded(NOW, "pear"), Renamed(NOW, "third")]
+    assert basket.pull_domain_events()[-1] == Renamed(NOW, "third")
+    assert len(basket.domain_events) == 0
+
+
+def test_buffer_overflow_policies() -> None:
+    """Test the three overflow policies of a full buffer."""
+    events = [ItemAdded(NOW, str(index)) for index in range(3)]
+
+    raising = EventBuffer(capacity=2)
+    raising.append(events[0])
+    raising.append(events[1])
+    with pytest.raises(DomainEventsError):
+        raising.append(events[2])
+
+    dropping_oldest = EventBuffer(capacity=2, overflow=OverflowPolicy.DROP_OLDEST)
+    dropping_newest = EventBuffer(capacity=2, overflow=OverflowPolicy.DROP_NEWEST)
+    for event in events:
+        dropping_oldest.append(event)
+        dropping_newest.append(event)
+
+    assert dropping_oldest[:] == events[1:]
+    assert dropping_newest[:] == events[:2]
+    assert dropping_oldest.dropped == dropping_newest.dropped == 1
+    with pytest.raises(ValueError):
+        EventBuffer(capacity=0)
+
+
+def test_aggregate_buffer_configuration() -> None:
+    """Test that aggregates create their buffer lazily, with their class configuration."""
+    basket, small = Basket(), SmallBasket()
+    assert basket.pull_domain_events() == []
+    basket.clear_domain_events()
+
+    for item in ("apple", "pear", "plum"):
+        small.add(item)
+    small.rename("renamed")
+
+    assert small.domain_events.capacity == 2
+    assert [getattr(event, "item", None) for event in small.domain_events] == ["plum", None]
+    assert basket == Basket()
+
+
+def test_collector_publishes_after_commit_and_discards_after_rollback() -> None:
+    """Test that the collector drains the tracked aggregates into the dispatcher."""
+    received: list[Sequence[Any]] = []
+    dispatcher = DomainEventDispatcher()
+    dispatcher.register(ItemAdded, received.append)
+    collector = DomainEventCollector(dispatcher)
+
+    first = collector.track(Basket(id=UUID(int=1)))
+    second = collector.track(Basket(id=UUID(int=2)))
+    collector.track(first)
+    first.add("apple")
+    second.add("pear")
+    first.rename("renamed")
+
+    assert len(collector) == 2
+    events = collector.publish()
+    assert events == [ItemAdded(NOW, "apple"), Renamed(NOW, "renamed"), ItemAdded(NOW, "pear")]
+    assert received == [[ItemAdded(NOW, "apple"), ItemAdded(NOW, "pear")]]
+    assert len(collector) == 0 and len(first.domain_events) == 0
+
+    collector.track(first).add("plum")
+    collector.discard()
+    assert collector.publish() == []
+    assert len(first.domain_events) == 0
+
+    with pytest.raises(ValueError):
+        DomainEventCollector().publish()
+
+
+def test_dispatcher_batches_and_inherited_handlers() -> None:
+    """Test that handlers receive batches, including those registered for a base class."""
+    specific: list[list[str]] = []
+    generic: list[int] = []
+    dispatcher = DomainEventDispatcher(batch_size=2)
+    dispatcher.register(ItemAdded, lambda batch: specific.append([event.item for event in batch]))
+    dispatcher.register(DomainEventBase, lambda batch: generic.append(len(batch)))
+
+    events = [ItemAdded(NOW, str(index)) for index in range(5)] + [Renamed(NOW, "renamed")]
+    calls = dispatcher.dispatch(events)
+
+    assert specific == [["0", "1"], ["2", "3"], ["4"]]
+    assert generic == [2, 2, 1, 1]
+    assert calls == 7
+    with pytest.raises(ValueError):
+        DomainEventDispatcher(batch_size=0)
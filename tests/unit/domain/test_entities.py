@@ -8,6 +8,7 @@ Tests in this module ensure that entities behave as expected and enforce their
 invariants.
 """
 
+from dataclasses import dataclass
 from uuid import UUID
 
 from flask_boilerplate.domain.entities import EntityExample
@@ -216,3 +217,98 @@ def test_entity_example_str_representation() -> None:
     entity = EntityExample(id=entity_id, name=name, description=description)
     expected_str = f"EntityExample(id={entity_id}, name={name}, description={description})"
     assert str(entity) == expected_str
+
+
+def test_entity_example_is_slotted() -> None:
+    """Test that an EntityExample stores its attributes without a per-instance dict."""
+    entity = EntityExample(name="Test Entity", description="This is a test entity.")
+
+    assert not hasattr(entity, "__dict__")
+    try:
+        entity.unknown = "value"  # type: ignore[attr-defined]
+        raise AssertionError("Setting an undeclared attribute should raise an AttributeError.")
+    except AttributeError:
+        pass
+
+
+def test_entity_example_subclass_without_slots() -> None:
+    """Test that a slotted entity can still be subclassed by a regular dataclass."""
+
+    @dataclass
+    class TaggedEntity(EntityExample):
+        tag: str = "default"
+
+    entity_id = UUID("12345678-1234-5678-1234-567812345678")
+    entity = TaggedEntity(id=entity_id, name="Test Entity", description="This is a test entity.", tag="tagged")
+
+    assert entity.id == entity_id
+    assert entity.tag == "tagged"
+    assert entity == EntityExample(id=entity_id, name="Other", description="Other")
+
+
+def test_entity_example_trusted_hydration() -> None:
+    """Test that trusted hydration rebuilds entities without validating them."""
+    entity_id = UUID("12345678-1234-5678-1234-567812345678")
+    entity = EntityExample.from_primitives_trusted({"id": entity_id, "name": "", "description": "Trusted"})
+
+    assert type(entity) is EntityExample
+    assert entity.id == entity_id
+    assert entity.name == ""
+    assert entity.description == "Trusted"
+
+    entities = EntityExample.hydrate_many([
+        {"name": "First", "description": "First entity."},
+        {"name": "Second", "description": "Second entity."},
+    ])
+    assert [entity.name for entity in entities] == ["First", "Second"]
+    assert isinstance(entities[0].id, UUID)
+    assert entities[0].id != entities[1].id
+
+
+def test_entity_trusted_hydration_requires_a_dataclass() -> None:
+    """Test that trusted hydration rejects entity classes that are not dataclasses."""
+
+    class PlainEntity(EntityExample):
+        pass
+
+    try:
+        PlainEntity.hydrate_many([])
+    except TypeError:
+        raise AssertionError("A subclass of a dataclass is still a dataclass.") from None
+
+    from flask_boilerplate.domain.primitives.entity import Entity
+
+    class NotADataclass(Entity):
+        def __eq__(self, other: object) -> bool:
+            return self is other
+
+        def __hash__(self) -> int:
+            return id(self)
+
+    try:
+        NotADataclass.from_primitives_trusted({"id": UUID(int=1)})
+        raise AssertionError("Hydrating a class that is not a dataclass should raise a TypeError.")
+    except TypeError:
+        pass
+
+
+def test_entity_example_tracks_changed_attributes() -> None:
+    """Test that the mutation methods record the changed attributes until marked clean."""
+    entity = EntityExample.from_primitives_trusted({"name": "Name", "description": "Description"})
+    assert entity.changed_attributes() == frozenset()
+
+    entity.update_name("New name")
+    entity.update_description("New description")
+    assert entity.changed_attributes() == {"name", "description"}
+
+    entity.mark_clean()
+    entity.mark_clean()
+    assert entity.changed_attributes() == frozenset()
+
+    @dataclass(slots=True)
+    class UntrackedEntity(EntityExample):
+        track_changes = False
+
+    untracked = UntrackedEntity(name="Name", description="Description")
+    untracked.update_name("New name")
+    assert untracked.changed_attributes() == frozenset()
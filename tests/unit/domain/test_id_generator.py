@@ -0,0 +1,98 @@
+"""Unit tests for the generators of entity identifiers.
+
+This module contains unit tests for `UuidV7Generator`, which generates time-ordered
+identifiers, and for the module-level functions selecting the generator used by the
+entities.
+"""
+
+import itertools
+import uuid
+
+from flask_boilerplate.domain.entities import EntityExample
+from flask_boilerplate.domain.primitives.id_generator import (
+    UuidV4Generator,
+    UuidV7Generator,
+    get_id_generator,
+    new_ids,
+    set_id_generator,
+)
+
+
+def fixed_clock(*milliseconds: int) -> "itertools.cycle[int]":
+    """Build a clock returning the given times, in milliseconds, then starting over."""
+    return itertools.cycle(millisecond * 1_000_000 for millisecond in milliseconds)
+
+
+def test_uuid_v7_layout() -> None:
+    """Test that the identifiers are RFC 9562 version 7 UUIDs starting with the timestamp."""
+    clock = fixed_clock(1_700_000_000_000)
+    generator = UuidV7Generator(clock=lambda: next(clock))
+
+    identifier = generator.new_id()
+
+    assert identifier.version == 7
+    assert identifier.variant == uuid.RFC_4122
+    assert identifier.int >> 80 == 1_700_000_000_000
+    assert identifier == uuid.UUID(str(identifier))
+    assert hash(identifier) == hash(uuid.UUID(str(identifier)))
+
+
+def test_uuid_v7_is_monotonic_within_a_millisecond() -> None:
+    """Test that identifiers generated in the same millisecond are increasing."""
+    clock = fixed_clock(1_000)
+    generator = UuidV7Generator(clock=lambda: next(clock))
+
+    identifiers = [generator.new_id() for _ in range(100)] + generator.new_ids(100)
+
+    assert identifiers == sorted(identifiers)
+    assert len(set(identifiers)) == 200
+
+
+def test_uuid_v7_is_monotonic_when_the_clock_goes_backwards() -> None:
+    """Test that identifiers keep increasing when the clock goes backwards."""
+    clock = fixed_clock(2_000, 1_000, 1_500)
+    generator = UuidV7Generator(clock=lambda: next(clock))
+
+    identifiers = [generator.new_id() for _ in range(3)]
+
+    assert identifiers == sorted(identifiers)
+    assert all(identifier.int >> 80 == 2_000 for identifier in identifiers)
+
+
+def test_uuid_v7_counter_overflow_advances_the_timestamp() -> None:
+    """Test that the timestamp moves ahead of the clock when the counter overflows."""
+    clock = fixed_clock(1_000)
+    generator = UuidV7Generator(clock=lambda: next(clock), random_bytes=lambda size: bytes(size))
+
+    identifiers = generator.new_ids(0x1000 + 10)
+    identifiers.append(generator.new_id())
+
+    assert identifiers == sorted(identifiers)
+    assert len(set(identifiers)) == len(identifiers)
+    assert identifiers[0x0FFF].int >> 80 == 1_000
+    assert identifiers[0x1000].int >> 80 == 1_001
+    assert identifiers[-1].int >> 80 == 1_001
+
+
+def test_uuid_v7_batch_allocation() -> None:
+    """Test the allocation of identifiers in batches."""
+    generator = UuidV7Generator()
+
+    assert generator.new_ids(0) == []
+    first, second = generator.new_ids(500), generator.new_ids(500)
+    assert first + second == sorted(first + second)
+    assert len(set(first + second)) == 1_000
+
+
+def test_entities_use_the_configured_generator() -> None:
+    """Test that entities get their identifiers from the generator in use."""
+    assert isinstance(get_id_generator(), UuidV7Generator)
+    assert EntityExample(name="Entity", description="Entity with a v7 id.").id.version == 7
+
+    previous = set_id_generator(UuidV4Generator())
+    try:
+        assert EntityExample(name="Entity", description="Entity with a v4 id.").id.version == 4
+        assert {identifier.version for identifier in new_ids(10)} == {4}
+    finally:
+        set_id_generator(previous)
+    assert get_id_generator() is previous
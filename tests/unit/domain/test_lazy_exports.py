@@ -0,0 +1,57 @@
+"""Unit tests for the lazy re-exports of the domain packages.
+
+This module contains unit tests for `lazy_exports()`, which builds the module-level
+`__getattr__` and `__dir__` of the domain packages.
+"""
+
+import sys
+import types
+from collections.abc import Iterator
+from typing import cast
+
+import pytest
+
+from flask_boilerplate.domain.shared.lazy_exports import lazy_exports
+
+
+@pytest.fixture
+def package() -> Iterator[types.ModuleType]:
+    """Register a package re-exporting a stdlib module, and remove it afterwards.
+
+    Yields:
+        types.ModuleType: The package, with lazy exports of `textwrap`.
+    """
+    module = types.ModuleType("lazy_package")
+    sys.modules[module.__name__] = module
+    module.__getattr__, module.__dir__ = lazy_exports(  # type: ignore[method-assign]
+        module.__name__, {"dedent": "textwrap", "indent": "textwrap"}, kind="function"
+    )
+    yield module
+    del sys.modules[module.__name__]
+
+
+def test_export_is_cached_in_package_globals(package: types.ModuleType) -> None:
+    """Test that an export is imported on first access, then read from the globals."""
+    assert "dedent" not in vars(package)
+
+    dedent = package.dedent
+
+    assert dedent is sys.modules["textwrap"].dedent
+    assert vars(package)["dedent"] is dedent
+    assert "indent" not in vars(package)
+
+
+def test_dir_lists_exports_not_imported_yet(package: types.ModuleType) -> None:
+    """Test that `dir()` lists the exports before they are imported."""
+    names = dir(package)
+
+    assert {"dedent", "indent", "__name__"} <= set(names)
+    assert names == sorted(names)
+
+
+def test_unknown_names_and_invalid_types(package: types.ModuleType) -> None:
+    """Test the errors raised for an unknown name and a name that is not a string."""
+    with pytest.raises(AttributeError, match="module 'lazy_package' has no attribute 'wrap'"):
+        _ = package.wrap
+    with pytest.raises(TypeError, match="Expected a string for function name, got int"):
+        package.__getattr__(cast(str, 123))
@@ -0,0 +1,99 @@
+"""Unit tests for the default behaviour of the domain repository interface."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from uuid import UUID
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.primitives.async_repository import AsyncRepository
+from flask_boilerplate.domain.primitives.repository import Repository
+from flask_boilerplate.domain.primitives.specification import Specification
+
+
+class ListRepository(Repository[EntityExample, UUID]):
+    """Minimal repository keeping its entities in a list."""
+
+    def __init__(self, entities: Iterable[EntityExample]) -> None:
+        self.entities = list(entities)
+
+    def add(self, entity: EntityExample) -> None:
+        self.entities.append(entity)
+
+    def get(self, id: UUID) -> EntityExample | None:
+        return next((entity for entity in self.entities if entity.id == id), None)
+
+    def list(self, after: UUID | None = None, limit: int | None = None) -> Iterable[EntityExample]:
+        return self.entities
+
+    def remove(self, entity: EntityExample) -> None:
+        self.entities.remove(entity)
+
+
+class AsyncListRepository(AsyncRepository[EntityExample, UUID]):
+    """Minimal asynchronous repository keeping its entities in a list."""
+
+    def __init__(self, entities: Iterable[EntityExample]) -> None:
+        self.entities = list(entities)
+
+    async def add(self, entity: EntityExample) -> None:
+        self.entities.append(entity)
+
+    async def get(self, id: UUID) -> EntityExample | None:
+        return next((entity for entity in self.entities if entity.id == id), None)
+
+    async def list(self, after: UUID | None = None, limit: int | None = None) -> AsyncIterator[EntityExample]:
+        for entity in self.entities:
+            yield entity
+
+    async def remove(self, entity: EntityExample) -> None:
+        self.entities.remove(entity)
+
+
+class NameIn(Specification[EntityExample]):
+    """Specification satisfied by entities whose name is in a set."""
+
+    def __init__(self, *names: str) -> None:
+        self.names = set(names)
+
+    def is_satisfied_by(self, candidate: EntityExample) -> bool:
+        return candidate.name in self.names
+
+
+def test_find_filters_sorts_and_limits() -> None:
+    """Test the in-Python default implementation of `Repository.find`."""
+    repository = ListRepository(
+        EntityExample(id=UUID(int=index), name=name, description=description)
+        for index, (name, description) in enumerate([("b", "2"), ("a", "1"), ("c", "3"), ("a", "4"), ("b", "0")])
+    )
+
+    found = repository.find(NameIn("a", "b"), order_by=["name", "-description"], limit=3)
+
+    assert [entity.id for entity in found] == [UUID(int=3), UUID(int=1), UUID(int=0)]
+    assert [entity.id for entity in repository.find(NameIn("c"))] == [UUID(int=2)]
+
+
+def test_get_many_preserves_order_and_reports_missing_ids() -> None:
+    """Test the default implementation of `Repository.get_many` on top of `get`."""
+    repository = ListRepository(
+        EntityExample(id=UUID(int=index), name="name", description="description") for index in range(3)
+    )
+
+    result = repository.get_many([UUID(int=2), UUID(int=7), UUID(int=0), UUID(int=2), UUID(int=5)])
+
+    assert [entity.id.int for entity in result] == [2, 0, 2]
+    assert result.missing == [UUID(int=7), UUID(int=5)]
+
+
+def test_async_defaults_find_and_get_many() -> None:
+    """Test the default implementations of `AsyncRepository.find` and `get_many`."""
+    repository = AsyncListRepository(
+        EntityExample(id=UUID(int=index), name=name, description="description")
+        for index, name in enumerate(["b", "a", "c", "a"])
+    )
+
+    found = asyncio.run(repository.find(NameIn("a", "b"), order_by="-name", limit=2))
+    result = asyncio.run(repository.get_many([UUID(int=3), UUID(int=9), UUID(int=3)]))
+
+    assert [entity.id.int for entity in found] == [0, 1]
+    assert [entity.id.int for entity in result] == [3, 3]
+    assert result.missing == [UUID(int=9)]
@@ -0,0 +1,131 @@
+"""Unit tests for domain specifications.
+
+This module contains unit tests for the specification primitives in the domain layer,
+including the compiled evaluator produced by `Specification.compile()`.
+"""
+
+from dataclasses import dataclass
+
+from flask_boilerplate.domain.primitives.specification import CompiledSpecification, Specification
+
+
+@dataclass
+class Candidate:
+    """Simple candidate evaluated by the test specifications."""
+
+    value: int
+
+
+class GreaterThan(Specification[Candidate]):
+    """Specification satisfied by candidates whose value is greater than a bound."""
+
+    def __init__(self, bound: int, cost: float = 1.0, selectivity: float = 0.5) -> None:
+        self.bound = bound
+        self.cost = cost
+        self.selectivity = selectivity
+        self.calls = 0
+
+    def is_satisfied_by(self, candidate: Candidate) -> bool:
+        self.calls += 1
+        return candidate.value > self.bound
+
+
+class IsEven(Specification[Candidate]):
+    """Specification satisfied by candidates with an even value."""
+
+    def is_satisfied_by(self, candidate: Candidate) -> bool:
+        return candidate.value % 2 == 0
+
+
+def test_compiled_specification_matches_tree_evaluation() -> None:
+    """Test that the compiled evaluator agrees with the recursive evaluation."""
+    spec = (GreaterThan(3) & ~IsEven()) | (~~GreaterThan(8) & IsEven())
+    compiled = spec.compile()
+    for value in range(-5, 20):
+        candidate = Candidate(value)
+        assert compiled.is_satisfied_by(candidate) == spec.is_satisfied_by(candidate)
+
+
+def test_compile_flattens_nested_operators() -> None:
+    """Test that chains of AND and OR are merged and double negations removed."""
+    a, b, c, d = GreaterThan(0), GreaterThan(1), GreaterThan(2), GreaterThan(3)
+    compiled = (((a & b) & c) & ~~d).compile(reorder=False)
+    assert compiled.source == "(_p0(c) and _p1(c) and _p2(c) and _p3(c))"
+
+
+def test_compile_orders_conjuncts_by_cost_and_selectivity() -> None:
+    """Test that cheap and selective conjuncts are evaluated first."""
+    expensive = GreaterThan(0, cost=100.0, selectivity=0.5)
+    selective = GreaterThan(10, cost=1.0, selectivity=0.1)
+    compiled = (expensive & selective).compile()
+
+    compiled.is_satisfied_by(Candidate(5))
+
+    assert selective.calls == 1
+    assert expensive.calls == 0
+    assert compiled.selectivity == 0.5 * 0.1
+
+
+def test_compile_orders_disjuncts_by_cost_and_selectivity() -> None:
+    """Test that cheap and permissive disjuncts are evaluated first."""
+    strict = GreaterThan(100, cost=1.0, selectivity=0.01)
+    permissive = GreaterThan(0, cost=1.0, selectivity=0.9)
+    compiled = (strict | permissive).compile()
+
+    assert compiled.is_satisfied_by(Candidate(5)) is True
+    assert permissive.calls == 1
+    assert strict.calls == 0
+
+
+def test_compile_without_reorder_keeps_declared_order() -> None:
+    """Test that reordering can be disabled."""
+    expensive = GreaterThan(0, cost=100.0)
+    cheap = GreaterThan(10, cost=1.0)
+    compiled = (expensive & cheap).compile(reorder=False)
+
+    compiled.is_satisfied_by(Candidate(-1))
+
+    assert expensive.calls == 1
+    assert cheap.calls == 0
+
+
+def test_compiled_specification_filter_many_and_partition() -> None:
+    """Test the bulk helpers of a compiled specification."""
+    compiled = (GreaterThan(2) & IsEven()).compile()
+    candidates = [Candidate(value) for value in range(8)]
+
+    assert [c.value for c in compiled.filter_many(candidates)] == [4, 6]
+    satisfied, rejected = compiled.partition(candidates)
+    assert [c.value for c in satisfied] == [4, 6]
+    assert [c.value for c in rejected] == [0, 1, 2, 3, 5, 7]
+
+
+def test_compiled_specification_composes() -> None:
+    """Test that compiled specifications can be recompiled and combined."""
+    compiled = GreaterThan(2).compile()
+    assert compiled.compile() is compiled
+
+    combined = (compiled & IsEven()).compile()
+    assert isinstance(combined, CompiledSpecification)
+    assert combined.is_satisfied_by(Candidate(4)) is True
+    assert combined.is_satisfied_by(Candidate(1)) is False
+
+
+def test_compile_binds_shared_leaves_once() -> None:
+    """Test that a leaf used several times in a tree is bound to a single name."""
+    leaf = GreaterThan(1)
+    compiled = (leaf | (IsEven() & leaf)).compile(reorder=False)
+    assert compiled.source == "(_p0(c) or (_p1(c) and _p0(c)))"
+
+
+def test_compile_falls_back_to_the_tree_when_nested_too_deeply() -> None:
+    """Test that a tree too deep for a single expression is still compiled, and evaluated recursively."""
+    spec: Specification[Candidate] = GreaterThan(0)
+    for bound in range(1, 300):
+        spec = ~(spec & GreaterThan(-bound))
+    compiled = spec.compile()
+    for value in (-1, 1):
+        assert compiled.is_satisfied_by(Candidate(value)) == spec.is_satisfied_by(Candidate(value))
+    assert list(compiled.filter_many([Candidate(-1), Candidate(1)])) == [
+        candidate for candidate in [Candidate(-1), Candidate(1)] if spec.is_satisfied_by(candidate)
+    ]
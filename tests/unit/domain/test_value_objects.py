@@ -1,4 +1,10 @@
+import gc
+import weakref
+from dataclasses import FrozenInstanceError, dataclass
+from typing import Any
+
 from flask_boilerplate.domain.errors.value_objects_error import ValueObjectsError
+from flask_boilerplate.domain.primitives.value_object import ValueObject
 from flask_boilerplate.domain.value_objects.value_object_example import ValueObjectExample
 
 
@@ -81,3 +87,141 @@ def test_value_object_example_validate_invalid_description() -> None:
         raise AssertionError("validate() did not raise ValueObjectsError for invalid description")
     except ValueObjectsError as e:
         assert str(e) == "Description cannot be empty."
+
+
+def test_value_object_example_is_slotted_and_frozen() -> None:
+    """Test that a ValueObjectExample has no per-instance dict and stays immutable."""
+    value_object = ValueObjectExample(name="Test Value Object", description="This is a test value object.")
+
+    assert not hasattr(value_object, "__dict__")
+    try:
+        value_object.name = "Other"  # type: ignore[misc]
+        raise AssertionError("Assigning a field of a frozen value object should raise.")
+    except FrozenInstanceError:
+        pass
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class InternedValueObjectExample(ValueObjectExample):
+    """`ValueObjectExample` with interning."""
+
+    interned = True
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Quantity(ValueObject):
+    """Interned value object whose attribute may be of several equal types."""
+
+    interned = True
+
+    amount: Any
+
+    def _attributes(self) -> tuple[Any, ...]:
+        return (self.amount,)
+
+
+def test_value_object_example_is_not_interned() -> None:
+    """Test that equal ValueObjectExample instances are distinct, interning being opt-in."""
+    value_object1 = ValueObjectExample(name="Plain", description="This is a value object.")
+    value_object2 = ValueObjectExample(name="Plain", description="This is a value object.")
+
+    assert value_object1 is not value_object2
+    assert value_object1 == value_object2
+
+
+def test_interned_value_objects_share_a_single_instance() -> None:
+    """Test that equal instances of an interned class share a single instance."""
+    value_object1 = InternedValueObjectExample(name="Interned", description="This is an interned value object.")
+    value_object2 = InternedValueObjectExample(name="Interned", description="This is an interned value object.")
+    value_object3 = InternedValueObjectExample(name="Other", description="This is an interned value object.")
+
+    assert value_object1 is value_object2
+    assert value_object1 is not value_object3
+    assert InternedValueObjectExample.intern(value_object1) is value_object1
+
+
+def test_interning_keeps_the_types_of_the_attributes() -> None:
+    """Test that equal attributes of different types are not interned together."""
+    integer, real, boolean = Quantity(1), Quantity(1.0), Quantity(True)
+
+    assert type(integer.amount) is int and type(real.amount) is float and type(boolean.amount) is bool
+    assert integer is not real and integer == real and hash(integer) == hash(real)
+    assert Quantity(1.0) is real
+
+
+def test_interned_instances_are_weakly_referenced() -> None:
+    """Test that the intern table does not keep unused value objects alive."""
+    value_object = InternedValueObjectExample(name="Transient", description="This is a transient value object.")
+    reference = weakref.ref(value_object)
+
+    del value_object
+    gc.collect()
+
+    assert reference() is None
+
+
+def test_value_objects_with_unhashable_attributes_are_compared() -> None:
+    """Test that value objects holding unhashable attributes compare by attributes, without hashing."""
+
+    @dataclass(frozen=True, slots=True, eq=False)
+    class Tags(ValueObject):
+        values: list[str]
+
+        def _attributes(self) -> tuple[Any, ...]:
+            return (self.values,)
+
+    assert Tags(["a", "b"]) == Tags(["a", "b"])
+    assert Tags(["a", "b"]) != Tags(["b"])
+
+
+def test_value_object_hash_is_cached() -> None:
+    """Test that the hash of a value object is only computed once."""
+
+    @dataclass(frozen=True, slots=True, eq=False)
+    class CountingValueObject(ValueObjectExample):
+        calls = [0]
+
+        def _attributes(self) -> tuple[Any, ...]:
+            self.calls[0] += 1
+            return self.name, self.description
+
+    value_object1 = CountingValueObject(name="Counted", description="This is a counted value object.")
+    value_object2 = CountingValueObject(name="Counted", description="This is a counted value object.")
+    calls_after_validation = CountingValueObject.calls[0]
+
+    assert value_object1 is not value_object2
+    assert hash(value_object1) == hash(value_object1) == hash(("Counted", "This is a counted value object."))
+    assert CountingValueObject.calls[0] == calls_after_validation + 1
+    assert value_object1 == value_object2
+    assert value_object1 != CountingValueObject(name="Other", description="This is a counted value object.")
+    assert len({value_object1, value_object2}) == 1
+
+
+def test_value_object_trusted_hydration() -> None:
+    """Test that trusted hydration skips validation and still interns value objects."""
+    shared = InternedValueObjectExample(name="Hydrated", description="This is a hydrated value object.")
+    hydrated = InternedValueObjectExample.from_primitives_trusted({
+        "name": "Hydrated",
+        "description": "This is a hydrated value object.",
+    })
+    unvalidated = InternedValueObjectExample.from_primitives_trusted({"name": "", "description": ""})
+
+    assert hydrated is shared
+    assert unvalidated.name == ""
+    assert InternedValueObjectExample.hydrate_many([
+        {"name": "Hydrated", "description": "This is a hydrated value object."}
+    ]) == [shared]
+
+
+def test_value_object_trusted_hydration_without_interning() -> None:
+    """Test that trusted hydration of a non-interned class returns distinct frozen instances."""
+    first, second = ValueObjectExample.hydrate_many([{"name": "Plain", "description": "Plain value object."}] * 2)
+
+    assert first is not second
+    assert first == second
+    assert hash(first) == hash(("Plain", "Plain value object."))
+    try:
+        first.name = "Changed"  # type: ignore[misc]
+        raise AssertionError("Hydrated value objects should stay frozen.")
+    except FrozenInstanceError:
+        pass
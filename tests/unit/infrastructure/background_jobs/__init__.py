@@ -0,0 +1 @@
+"""Unit tests for the background jobs of the infrastructure."""
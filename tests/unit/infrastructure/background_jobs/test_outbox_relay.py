@@ -0,0 +1,184 @@
+"""Unit tests for the relay of the transactional outbox."""
+
+import logging
+import threading
+from collections.abc import Iterator, Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, func, insert, select
+from sqlalchemy.exc import OperationalError
+
+from flask_boilerplate.infrastructure.background_jobs import OutboxRelay
+from flask_boilerplate.infrastructure.persistence.configurations import metadata, outbox_messages_table
+from flask_boilerplate.infrastructure.services.messaging import InMemoryMessagePublisher, Message, MessagePublisher
+
+START = datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+
+class Clock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class FailingPublisher(MessagePublisher):
+    """Publisher failing a number of times, then keeping the messages."""
+
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.inner = InMemoryMessagePublisher()
+
+    def publish_batch(self, messages: Sequence[Message]) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("The broker is unreachable.")
+        self.inner.publish_batch(messages)
+
+
+@pytest.fixture
+def outbox_engine(tmp_path: Path) -> Iterator[Engine]:
+    """Create a SQLite file database with the application schema."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'outbox.db'}", connect_args={"timeout": 30})
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def enqueue(engine: Engine, count: int, created_at: datetime = START) -> None:
+    """Record messages in the outbox."""
+    with engine.begin() as connection:
+        connection.execute(
+            insert(outbox_messages_table),
+            [
+                {"topic": "renamed", "payload": f'{{"index":{index}}}', "created_at": created_at}
+                for index in range(count)
+            ],
+        )
+
+
+def unpublished(engine: Engine) -> int:
+    """Count the messages not published yet."""
+    with engine.connect() as connection:
+        return connection.execute(
+            select(func.count()).where(outbox_messages_table.c.published_at.is_(None))
+        ).scalar_one()
+
+
+def test_relay_publishes_batches_in_order_and_measures_the_lag(outbox_engine: Engine) -> None:
+    """Test the batches, the marks and the publish lag of a relay."""
+    enqueue(outbox_engine, 25)
+    clock = Clock()
+    clock.now = START + timedelta(seconds=2)
+    publisher = InMemoryMessagePublisher()
+    relay = OutboxRelay(outbox_engine, publisher, batch_size=10, clock=clock)
+
+    assert [relay.relay_once() for _ in range(4)] == [10, 10, 5, 0]
+
+    assert [message.id for message in publisher.messages] == list(range(1, 26))
+    assert publisher.batches == 3 and publisher.messages[0].payload == '{"index":0}'
+    assert publisher.messages[0].created_at == START
+    assert unpublished(outbox_engine) == 0
+    assert relay.metrics.snapshot() == {
+        "batches": 3,
+        "published": 25,
+        "failures": 0,
+        "errors": 0,
+        "publish_lag_seconds": 50.0,
+        "mean_publish_lag_seconds": 2.0,
+        "max_publish_lag_seconds": 2.0,
+    }
+
+
+def test_failed_batch_is_released_and_published_again(outbox_engine: Engine) -> None:
+    """Test that a batch failing to publish is claimed again at once."""
+    enqueue(outbox_engine, 3)
+    publisher = FailingPublisher(failures=1)
+    relay = OutboxRelay(outbox_engine, publisher)
+
+    with pytest.raises(ConnectionError):
+        relay.relay_once()
+    assert relay.relay_once() == 3
+
+    assert [message.id for message in publisher.inner.messages] == [1, 2, 3]
+    assert relay.metrics.failures == 1 and relay.metrics.published == 3
+
+
+def test_run_logs_and_counts_the_errors_of_the_outbox(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the relay outlives an outbox it cannot claim from, logging and counting the errors."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'empty.db'}")
+    relay = OutboxRelay(engine, InMemoryMessagePublisher(), poll_interval=0.01)
+    stop = threading.Event()
+    thread = threading.Thread(target=relay.run, args=(stop,))
+
+    with caplog.at_level(logging.ERROR):
+        thread.start()
+        try:
+            while relay.metrics.errors < 2 and thread.is_alive():
+                stop.wait(0.01)
+        finally:
+            stop.set()
+            thread.join()
+    engine.dispose()
+
+    assert relay.metrics.errors >= 2 and relay.metrics.failures == 0
+    assert caplog.records[0].message == "The outbox relay failed to relay a batch."
+    assert caplog.records[0].exc_info is not None and caplog.records[0].exc_info[0] is OperationalError
+
+
+def test_claims_expire_with_their_lease(outbox_engine: Engine) -> None:
+    """Test that the messages of a relay that stopped are claimed again once its lease expired."""
+    enqueue(outbox_engine, 4)
+    clock = Clock()
+    stopped = OutboxRelay(outbox_engine, InMemoryMessagePublisher(), batch_size=3, lease_seconds=30, clock=clock)
+    publisher = InMemoryMessagePublisher()
+    relay = OutboxRelay(outbox_engine, publisher, batch_size=10, clock=clock)
+
+    _, claimed = stopped.claim()
+    assert [message.id for message in claimed] == [1, 2, 3]
+    assert relay.relay_once() == 1
+
+    clock.now += timedelta(seconds=31)
+    assert relay.relay_once() == 3
+    assert [message.id for message in publisher.messages] == [4, 1, 2, 3]
+
+
+def test_concurrent_relays_publish_each_message_once(outbox_engine: Engine) -> None:
+    """Test that relays running at once never claim the same message."""
+    enqueue(outbox_engine, 500)
+    publishers = [InMemoryMessagePublisher() for _ in range(4)]
+    relays = [OutboxRelay(outbox_engine, publisher, batch_size=20, poll_interval=0.01) for publisher in publishers]
+    stop = threading.Event()
+    threads = [threading.Thread(target=relay.run, args=(stop,)) for relay in relays]
+    for thread in threads:
+        thread.start()
+    for _ in range(500):
+        if sum(relay.metrics.published for relay in relays) == 500:
+            break
+        stop.wait(0.01)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    ids = sorted(message.id for publisher in publishers for message in publisher.messages)
+    assert ids == list(range(1, 501))
+    assert unpublished(outbox_engine) == 0
+
+
+def test_purge_deletes_the_old_published_messages(outbox_engine: Engine) -> None:
+    """Test that only the messages published before the given age are purged."""
+    enqueue(outbox_engine, 5)
+    clock = Clock()
+    relay = OutboxRelay(outbox_engine, InMemoryMessagePublisher(), batch_size=3, clock=clock)
+    relay.relay_once()
+    clock.now += timedelta(hours=2)
+    relay.relay_once()
+
+    assert relay.purge(timedelta(hours=1)) == 3
+    with outbox_engine.connect() as connection:
+        assert connection.execute(select(func.count()).select_from(outbox_messages_table)).scalar_one() == 2
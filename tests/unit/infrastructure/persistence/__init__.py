@@ -0,0 +1 @@
+"""Unit tests for the persistence layer of the infrastructure."""
@@ -0,0 +1,77 @@
+"""Fixtures and helpers shared by the persistence unit tests.
+
+The tests run against an in-memory SQLite database created from the shared metadata.
+"""
+
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Connection, Engine, Row, create_engine
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.primitives import AggregateRoot, DomainEventBase
+from flask_boilerplate.infrastructure.persistence.configurations import entity_examples_table, metadata
+from flask_boilerplate.infrastructure.persistence.repositories import SqlAlchemyRepository
+
+
+@dataclass(frozen=True, slots=True)
+class Renamed(DomainEventBase):
+    """Event raised by a renamed aggregate."""
+
+    id: UUID
+    name: str
+
+    @property
+    def event_name(self) -> str:
+        return "renamed"
+
+
+@dataclass(slots=True)
+class Named(AggregateRoot):
+    """Aggregate raising a domain event when it is renamed, stored like `EntityExample`."""
+
+    id: UUID
+    name: str
+    description: str
+
+    def update_name(self, name: str) -> None:
+        self.name = name
+        self.add_domain_event(Renamed(datetime(2024, 1, 1, tzinfo=UTC), self.id, name))
+
+
+class NamedRepository(SqlAlchemyRepository[Named, UUID]):
+    """Repository of the aggregates, in the table of `EntityExample` entities."""
+
+    table = entity_examples_table
+
+    def _to_entity(self, row: Row[Any]) -> Named:
+        return Named(row.id, row.name, row.description)
+
+    def _to_row(self, entity: Named) -> Mapping[str, Any]:
+        return {"id": entity.id, "name": entity.name, "description": entity.description}
+
+
+def make_entity(index: int, name: str | None = None) -> EntityExample:
+    """Create an entity with a predictable identifier."""
+    return EntityExample(id=UUID(int=index), name=name or f"name-{index:03d}", description=f"description {index}")
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    """Create an in-memory SQLite engine with the application schema."""
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def connection(engine: Engine) -> Iterator[Connection]:
+    """Open a connection within a transaction rolled back after the test."""
+    with engine.connect() as connection, connection.begin() as transaction:
+        yield connection
+        transaction.rollback()
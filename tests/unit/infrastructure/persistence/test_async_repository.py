@@ -0,0 +1,95 @@
+"""Unit tests for the asynchronous SQLAlchemy repositories and unit of work."""
+
+import asyncio
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine  # noqa: E402
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample  # noqa: E402
+from flask_boilerplate.infrastructure.persistence import AsyncSqlAlchemyUnitOfWork  # noqa: E402
+from flask_boilerplate.infrastructure.persistence.configurations import metadata  # noqa: E402
+from flask_boilerplate.infrastructure.persistence.repositories import (  # noqa: E402
+    AsyncSqlAlchemyRepository,
+    EntityExampleRepository,
+)
+
+
+async def create_engine(url: str = "sqlite+aiosqlite://") -> AsyncEngine:
+    """Create an aiosqlite engine with the application schema, in memory by default."""
+    engine = create_async_engine(url)
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+    return engine
+
+
+def make_unit_of_work(engine: AsyncEngine) -> AsyncSqlAlchemyUnitOfWork:
+    """Create a unit of work with the repository of `EntityExample` entities."""
+    return AsyncSqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, chunk_size=4)
+
+
+def test_async_unit_of_work_writes_reads_and_tracks_changes() -> None:
+    """Test the operations of the asynchronous repository within a unit of work."""
+
+    async def scenario() -> None:
+        engine = await create_engine()
+        async with make_unit_of_work(engine) as unit_of_work:
+            repository = unit_of_work.repositories()["entities"]
+            for index in range(10):
+                await repository.add(EntityExample(id=UUID(int=index), name=f"name-{index}", description="description"))
+            await unit_of_work.commit()
+
+            entity = await repository.get(UUID(int=3))
+            assert entity is not None
+            entity.update_name("renamed")
+            assert await repository.get(UUID(int=3)) is entity
+            result = await repository.get_many([UUID(int=3), UUID(int=42), UUID(int=1)])
+            assert [found.id.int for found in result] == [3, 1]
+            assert result.missing == [UUID(int=42)]
+            await unit_of_work.commit()
+
+            await repository.add(EntityExample(id=UUID(int=99), name="rolled back", description="description"))
+
+        async with make_unit_of_work(engine) as unit_of_work:
+            repository = unit_of_work.repositories()["entities"]
+            assert isinstance(repository, AsyncSqlAlchemyRepository)
+            repository.stream_batch_size = 3
+            streamed = [entity async for entity in repository.list()]
+            page = [entity.id.int async for entity in repository.list(after=UUID(int=5), limit=3)]
+            # The page is registered in the identity map, the stream is not.
+            assert len(unit_of_work.identity_map) == 3
+
+        assert sorted(entity.id.int for entity in streamed) == list(range(10))
+        assert next(entity.name for entity in streamed if entity.id.int == 3) == "renamed"
+        assert page == [6, 7, 8]
+        with pytest.raises(RuntimeError):
+            unit_of_work.repositories()
+        await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_async_queries_run_concurrently_on_separate_connections(tmp_path: Path) -> None:
+    """Test that several units of work can await their queries concurrently."""
+
+    async def read(engine: AsyncEngine, index: int) -> str | None:
+        async with make_unit_of_work(engine) as unit_of_work:
+            entity = await unit_of_work.repositories()["entities"].get(UUID(int=index))
+            return None if entity is None else entity.name
+
+    async def scenario() -> list[str | None]:
+        engine = await create_engine(f"sqlite+aiosqlite:///{tmp_path / 'concurrent.db'}")
+        async with make_unit_of_work(engine) as unit_of_work:
+            await unit_of_work.repositories()["entities"].add(
+                EntityExample(id=UUID(int=1), name="name", description="description")
+            )
+            await unit_of_work.commit()
+        names = await asyncio.gather(*(read(engine, index % 3) for index in range(12)))
+        await engine.dispose()
+        return names
+
+    assert asyncio.run(scenario()) == [None, "name", None] * 4
@@ -0,0 +1,217 @@
+"""Unit tests for the chunked and resumable data backfills."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from alembic.operations import Operations
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Connection,
+    Engine,
+    Integer,
+    MetaData,
+    Table,
+    create_engine,
+    func,
+    insert,
+    select,
+    update,
+)
+
+from flask_boilerplate.infrastructure.persistence.configurations import backfill_checkpoints_table
+from flask_boilerplate.infrastructure.persistence.migrations import Backfill, BackfillProgress, run_backfill
+
+metadata = MetaData()
+items_table = Table(
+    "items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("value", Integer, nullable=False),
+    Column("doubled", Integer, nullable=True),
+    Column("hits", Integer, nullable=False, default=0),
+)
+
+# Sparse keys, so that the chunks cannot be computed from the key values.
+IDS = [index * index for index in range(1, 26)]
+
+
+class Clock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def items_engine(tmp_path: Path) -> Iterator[Engine]:
+    """Create a SQLite file database with 25 items."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'backfill.db'}")
+    metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(items_table), [{"id": id, "value": id} for id in IDS])
+    yield engine
+    engine.dispose()
+
+
+class DoubleValues:
+    """Change filling the `doubled` column, counting the updates of each row, and taking
+    `seconds` per chunk on the clock."""
+
+    def __init__(self, clock: Clock, seconds: float = 0.1, fail_at: int | None = None) -> None:
+        self.clock = clock
+        self.seconds = seconds
+        self.fail_at = fail_at
+        self.calls = 0
+
+    def __call__(self, connection: Connection, condition: ColumnElement[bool]) -> int:
+        self.calls += 1
+        changed = connection.execute(
+            update(items_table).where(condition).values(doubled=items_table.c.value * 2, hits=items_table.c.hits + 1)
+        ).rowcount
+        self.clock.now += self.seconds
+        if self.calls == self.fail_at:
+            raise RuntimeError("Interrupted.")
+        return changed
+
+
+def doubled(engine: Engine) -> tuple[int, int, int]:
+    """Count the rows backfilled, the rows backfilled more than once, and the rows left."""
+    with engine.connect() as connection:
+        return (
+            connection.execute(
+                select(func.count()).where(items_table.c.doubled == items_table.c.value * 2)
+            ).scalar_one(),
+            connection.execute(select(func.count()).where(items_table.c.hits > 1)).scalar_one(),
+            connection.execute(select(func.count()).where(items_table.c.doubled.is_(None))).scalar_one(),
+        )
+
+
+def test_backfill_commits_chunks_and_pauses_between_them(items_engine: Engine) -> None:
+    """Test the chunks, the pauses, the progress and the checkpoint of a backfill."""
+    clock = Clock()
+    pauses: list[float] = []
+    reports: list[BackfillProgress] = []
+    backfill = Backfill(
+        "double",
+        items_table,
+        DoubleValues(clock),
+        chunk_size=10,
+        pause_ratio=2.0,
+        target_chunk_seconds=None,
+        on_progress=reports.append,
+        sleep=pauses.append,
+        clock=clock,
+    )
+
+    with items_engine.connect() as connection:
+        progress = backfill.run(connection)
+        checkpoint = connection.execute(select(backfill_checkpoints_table)).one()
+
+    assert [report.rows for report in reports] == [10, 20, 25]
+    assert [report.last_id for report in reports] == [100, 400, 625]
+    # No pause after the last chunk.
+    assert pauses == pytest.approx([0.2, 0.2])
+    assert progress.chunks == 3 and progress.run_rows == 25
+    assert progress.rows_per_second == pytest.approx(25 / 0.3)
+    assert doubled(items_engine) == (25, 0, 0)
+    assert tuple(checkpoint) == ("double", "625", 25)
+
+
+def test_backfill_with_an_update_statement(items_engine: Engine) -> None:
+    """Test a backfill restricting an UPDATE statement, with its own conditions, to each chunk."""
+    statement = update(items_table).where(items_table.c.value > 100).values(doubled=items_table.c.value * 2)
+    backfill = Backfill("double", items_table, statement, chunk_size=7, pause_ratio=0)
+
+    with items_engine.connect() as connection:
+        progress = backfill.run(connection)
+
+    assert progress.rows == 15 and progress.chunks == 4
+    assert doubled(items_engine) == (15, 0, 10)
+
+
+def test_backfill_resumes_after_the_last_committed_chunk(items_engine: Engine) -> None:
+    """Test that an interrupted backfill processes each row exactly once when run again."""
+    clock = Clock()
+    backfill = Backfill("double", items_table, DoubleValues(clock, fail_at=3), chunk_size=5, pause_ratio=0, clock=clock)
+    with items_engine.connect() as connection, pytest.raises(RuntimeError):
+        backfill.run(connection)
+    # The third chunk was rolled back with its checkpoint.
+    assert doubled(items_engine) == (10, 0, 15)
+
+    backfill.change = DoubleValues(clock)
+    with items_engine.connect() as connection:
+        progress = backfill.run(connection)
+        again = backfill.run(connection)
+
+    assert progress.run_rows == 15 and progress.rows == 25
+    assert again.chunks == 0 and again.rows == 25 and again.last_id == 625
+    assert doubled(items_engine) == (25, 0, 0)
+
+
+def test_backfill_adapts_the_chunk_size_to_the_latency(items_engine: Engine) -> None:
+    """Test that slow chunks halve the size of the next ones, and fast ones double it back."""
+    clock = Clock()
+    sizes: list[int] = []
+    change = DoubleValues(clock, seconds=2.0)
+
+    def report(progress: BackfillProgress) -> None:
+        sizes.append(progress.run_rows - sum(sizes))
+        change.seconds = 2.0 if len(sizes) < 2 else 0.1
+
+    backfill = Backfill(
+        "double",
+        items_table,
+        change,
+        chunk_size=8,
+        target_chunk_seconds=1.0,
+        on_progress=report,
+        sleep=lambda seconds: None,
+        clock=clock,
+    )
+
+    with items_engine.connect() as connection:
+        backfill.run(connection)
+
+    assert sizes == [8, 4, 2, 4, 7]
+
+
+def test_backfill_validates_its_arguments(items_engine: Engine) -> None:
+    """Test the rejected tables, settings and connections."""
+    statement = update(items_table).values(doubled=0)
+    composite = Table(
+        "pairs", MetaData(), Column("a", Integer, primary_key=True), Column("b", Integer, primary_key=True)
+    )
+    with pytest.raises(ValueError):
+        Backfill("pairs", composite, statement)
+    with pytest.raises(ValueError):
+        Backfill("double", items_table, statement, chunk_size=0)
+    with pytest.raises(ValueError):
+        Backfill("double", items_table, statement, pause_ratio=-1)
+    with items_engine.connect() as connection:
+        connection.execute(select(1))
+        with pytest.raises(ValueError):
+            Backfill("double", items_table, statement).run(connection)
+
+
+def test_run_backfill_from_an_alembic_migration(items_engine: Engine) -> None:
+    """Test that a migration commits its work before the backfill, and continues after it."""
+    backfill = Backfill(
+        "double", items_table, update(items_table).values(doubled=items_table.c.value * 2), pause_ratio=0
+    )
+    with items_engine.connect() as connection:
+        context = MigrationContext.configure(connection, opts={"transactional_ddl": True})
+        with Operations.context(context), context.begin_transaction():
+            context.impl.execute(update(items_table).values(hits=1))
+            progress = run_backfill(backfill)
+            context.impl.execute(update(items_table).values(hits=2))
+
+    assert progress.rows == 25
+    with items_engine.connect() as connection:
+        assert connection.execute(select(func.sum(items_table.c.hits))).scalar_one() == 50
+    assert doubled(items_engine)[0] == 25
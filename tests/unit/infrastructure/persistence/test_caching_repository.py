@@ -0,0 +1,148 @@
+"""Unit tests for the entity cache and the caching repository decorator."""
+
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, event
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.infrastructure.persistence import EntityCache, SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.repositories import (
+    CachingRepository,
+    EntityExampleRepository,
+    InMemoryRepository,
+)
+
+from .conftest import make_entity
+
+
+class Clock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_cache_evicts_the_least_recently_used_and_expires_entries() -> None:
+    """Test the eviction, the expiry and the counters of the cache."""
+    clock = Clock()
+    cache = EntityCache[str, int](maxsize=2, ttl=10.0, negative_ttl=1.0, clock=clock)
+    cache.store(1, "one")
+    cache.store(2, "two")
+    assert cache.lookup(1) == (True, "one")
+    cache.store(3, None)
+
+    assert cache.lookup(2) == (False, None)
+    assert cache.lookup(3) == (True, None)
+    clock.now = 5.0
+    assert cache.lookup(3) == (False, None)
+    assert cache.lookup(1) == (True, "one")
+    clock.now = 10.0
+    assert cache.lookup(1) == (False, None)
+
+    assert (cache.hits, cache.misses, cache.evictions, cache.expirations) == (3, 3, 1, 2)
+    assert cache.hit_ratio == 0.5
+    assert len(cache) == 0
+    with pytest.raises(ValueError):
+        EntityCache[str, int](maxsize=0)
+
+
+def test_reads_through_and_hands_out_copies() -> None:
+    """Test that reads are cached, including the missing identifiers, as copies."""
+    cache = EntityCache[EntityExample, UUID]()
+    wrapped = InMemoryRepository[EntityExample, UUID]([make_entity(index) for index in range(3)])
+    repository = CachingRepository(wrapped, cache)
+
+    first = repository.get(UUID(int=1))
+    assert first is not None
+    first.update_name("changed by the caller")
+    assert repository.get(UUID(int=9)) is None
+    wrapped.add(make_entity(9))
+
+    again = repository.get(UUID(int=1))
+    assert again is not None and again is not first and again.name == "name-001"
+    assert repository.get(UUID(int=9)) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    result = repository.get_many([UUID(int=2), UUID(int=1), UUID(int=7), UUID(int=9)])
+    assert [entity.id.int for entity in result] == [2, 1]
+    assert result.missing == [UUID(int=7), UUID(int=9)]
+    assert repository.get_many([UUID(int=7), UUID(int=2)]).missing == [UUID(int=7)]
+    assert (cache.hits, cache.misses) == (6, 4)
+
+    repository.remove(make_entity(1))
+    repository.add(make_entity(9))
+    assert repository.get(UUID(int=1)) is None
+    assert repository.get(UUID(int=9)) == make_entity(9)
+
+
+def test_unit_of_work_invalidates_the_rows_it_writes(engine: Engine) -> None:
+    """Test that cached reads skip the database until a commit changes the entity."""
+    cache = EntityCache[EntityExample, UUID]()
+    selects: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.startswith("SELECT"):
+            selects.append(statement)
+
+    def unit_of_work() -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, caches={"entities": cache})
+
+    with unit_of_work() as uow:
+        uow.repositories()["entities"].add(make_entity(1))
+        uow.commit()
+
+    for _ in range(3):
+        with unit_of_work() as uow:
+            repository = uow.repositories()["entities"]
+            entity = repository.get(UUID(int=1))
+            assert entity is not None and repository.get(UUID(int=1)) is entity
+    assert len(selects) == 1
+
+    with unit_of_work() as uow:
+        entity = uow.repositories()["entities"].get(UUID(int=1))
+        assert entity is not None
+        entity.update_name("renamed")
+        uow.commit()
+
+    with unit_of_work() as uow:
+        entity = uow.repositories()["entities"].get(UUID(int=1))
+        assert entity is not None and entity.name == "renamed"
+    assert len(selects) == 2
+
+
+def test_rows_written_by_a_unit_of_work_bypass_the_cache(engine: Engine) -> None:
+    """Test that the uncommitted state of the rows a unit of work writes is neither cached nor shadowed."""
+    cache = EntityCache[EntityExample, UUID]()
+
+    def unit_of_work() -> SqlAlchemyUnitOfWork:
+        return SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, caches={"entities": cache})
+
+    with unit_of_work() as uow:
+        for index in (1, 2):
+            uow.repositories()["entities"].add(make_entity(index))
+        uow.commit()
+
+    with unit_of_work() as uow:
+        repository = uow.repositories()["entities"]
+        entity = repository.get(UUID(int=1))
+        assert entity is not None
+        repository.remove(entity)
+
+        assert repository.get(UUID(int=1)) is None
+        assert repository.get_many([UUID(int=1), UUID(int=2)]).missing == [UUID(int=1)]
+        assert cache.lookup(UUID(int=1)) == (False, None)
+        # The committed entity, cached by another unit of work, does not shadow the removal.
+        cache.store(UUID(int=1), make_entity(1))
+        assert repository.get(UUID(int=1)) is None
+        assert repository.get_many([UUID(int=1)]).missing == [UUID(int=1)]
+        uow.rollback()
+
+    with unit_of_work() as uow:
+        assert uow.repositories()["entities"].get(UUID(int=1)) == make_entity(1)
+    assert cache.lookup(UUID(int=1))[0]
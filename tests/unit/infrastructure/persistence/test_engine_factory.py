@@ -0,0 +1,69 @@
+"""Unit tests for the engine factory and the metrics of its pool."""
+
+import os
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from flask_boilerplate.infrastructure.persistence.engine_factory import (
+    EngineFactory,
+    InstrumentedQueuePool,
+    PoolSettings,
+    pool_settings_for_workers,
+)
+
+
+def test_pool_settings_share_the_connections_between_workers() -> None:
+    """Test that each worker keeps a connection per thread, and overflows to its share."""
+    assert pool_settings_for_workers(max_connections=40, workers=4, threads=2)[:2] == (2, 8)
+    assert pool_settings_for_workers(max_connections=10, workers=4, threads=8)[:2] == (2, 0)
+    with pytest.raises(ValueError):
+        pool_settings_for_workers(max_connections=3, workers=4)
+    with pytest.raises(ValueError):
+        pool_settings_for_workers(max_connections=10, workers=0)
+
+
+def test_metrics_record_checkouts_saturation_waits_and_churn(tmp_path: Path) -> None:
+    """Test the metrics recorded by the events of the pool."""
+    factory = EngineFactory(f"sqlite:///{tmp_path / 'app.db'}", PoolSettings(1, 1, pool_timeout=0.05))
+
+    with factory.engine.connect() as first, factory.engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        with pytest.raises(PoolTimeoutError):
+            factory.engine.connect()
+    with factory.engine.connect():
+        pass
+    metrics = factory.metrics.snapshot()
+    factory.dispose()
+
+    assert metrics["checkouts"] == 3
+    assert metrics["checked_out"] == 0
+    assert metrics["peak_checked_out"] == 2 and metrics["peak_saturation"] == 1.0
+    assert metrics["checkout_timeouts"] == 1
+    assert 0.05 <= metrics["max_checkout_wait_seconds"] <= metrics["checkout_wait_seconds"]
+    # The overflow connection is closed when it is checked in.
+    assert metrics["connects"] == 2 and metrics["closes"] == 1
+    assert factory.metrics.closes == 2
+
+
+def test_engine_is_created_again_after_a_fork(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a forked process drops the inherited connections and gets its own engine."""
+    factory = EngineFactory(f"sqlite:///{tmp_path / 'app.db'}")
+    parent = factory.engine
+    with parent.connect():
+        pass
+    assert factory.engine is parent
+    inherited = parent.pool
+    assert isinstance(inherited, InstrumentedQueuePool)
+
+    monkeypatch.setattr(os, "getpid", lambda: -1)
+    child = factory.engine
+
+    assert child is not parent
+    assert factory.metrics.connects == 0
+    # The connection of the parent is left open, for the parent to keep using it.
+    assert inherited.checkedin() == 1
+    factory.dispose()
@@ -0,0 +1,133 @@
+"""Unit tests for the SQLAlchemy repository of `EntityExample` entities."""
+
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Connection, event
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.primitives.specification import Specification
+from flask_boilerplate.infrastructure.persistence import max_bind_parameters
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+from .conftest import make_entity
+
+
+class NameStartsWith(Specification[EntityExample]):
+    """Translatable specification on the prefix of the name."""
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+
+    def is_satisfied_by(self, candidate: EntityExample) -> bool:
+        return candidate.name.startswith(self.prefix)
+
+    def column_expression(self, columns: Any) -> Any:
+        return columns.name.startswith(self.prefix, autoescape=True)
+
+
+class DescriptionEndsWithDigit(Specification[EntityExample]):
+    """Specification evaluated in Python only."""
+
+    def is_satisfied_by(self, candidate: EntityExample) -> bool:
+        return candidate.description[-1].isdigit()
+
+
+def test_add_get_list_and_remove(connection: Connection) -> None:
+    """Test the basic repository operations."""
+    repository = EntityExampleRepository(connection)
+    entity = make_entity(1)
+
+    repository.add(entity)
+
+    stored = repository.get(entity.id)
+    assert stored == entity
+    assert stored is not None and stored.name == entity.name
+    assert list(repository.list()) == [entity]
+
+    repository.remove(entity)
+
+    assert repository.get(entity.id) is None
+
+
+def test_find_with_translated_specification(connection: Connection) -> None:
+    """Test that a translatable specification is resolved by the query."""
+    repository = EntityExampleRepository(connection)
+    for index in range(10):
+        repository.add(make_entity(index, f"name-{index % 3}"))
+
+    found = repository.find(NameStartsWith("name-1"), order_by="-description", limit=2)
+
+    assert [entity.id for entity in found] == [UUID(int=7), UUID(int=4)]
+
+
+def test_find_with_residual_specification(connection: Connection, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that untranslatable conjuncts are evaluated over the streamed rows."""
+    monkeypatch.setattr(EntityExampleRepository, "stream_batch_size", 2)
+    repository = EntityExampleRepository(connection)
+    for index in range(10):
+        repository.add(EntityExample(id=UUID(int=index), name=f"name-{index % 2}", description=f"x{index}x"))
+    repository.add(EntityExample(id=UUID(int=10), name="name-0", description="x10"))
+    repository.add(EntityExample(id=UUID(int=12), name="name-0", description="x12"))
+    repository.add(EntityExample(id=UUID(int=11), name="name-1", description="x11"))
+
+    spec = NameStartsWith("name-0") & DescriptionEndsWithDigit()
+
+    assert [entity.id for entity in repository.find(spec, order_by=["name", "description"])] == [
+        UUID(int=10),
+        UUID(int=12),
+    ]
+    assert [entity.id for entity in repository.find(spec, order_by="description", limit=1)] == [UUID(int=10)]
+
+
+def test_list_streams_all_entities(connection: Connection, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that listing all entities streams them, querying when the iteration starts."""
+    monkeypatch.setattr(EntityExampleRepository, "stream_batch_size", 3)
+    repository = EntityExampleRepository(connection)
+    for index in range(10):
+        repository.add(make_entity(index))
+
+    entities = repository.list()
+    repository.add(make_entity(10))
+
+    assert not isinstance(entities, list)
+    assert sorted(entity.id.int for entity in entities) == list(range(11))
+
+
+def test_list_pages_with_keyset_pagination(connection: Connection) -> None:
+    """Test that pages follow each other by identifier, whatever the insertion order."""
+    repository = EntityExampleRepository(connection)
+    for index in [7, 2, 9, 0, 5, 1, 8, 3, 6, 4]:
+        repository.add(make_entity(index))
+
+    pages: list[list[int]] = []
+    after = None
+    while page := list(repository.list(after=after, limit=4)):
+        pages.append([entity.id.int for entity in page])
+        after = page[-1].id
+
+    assert pages == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert [entity.id.int for entity in repository.list(after=UUID(int=6))] == [7, 8, 9]
+
+
+def test_get_many_queries_chunks_within_the_parameter_limit(connection: Connection) -> None:
+    """Test that `get_many` splits the identifiers into chunks, keeping their order."""
+    repository = EntityExampleRepository(connection)
+    for index in range(10):
+        repository.add(make_entity(index))
+    repository.parameter_limit = 3
+    selects: list[str] = []
+
+    @event.listens_for(connection, "before_cursor_execute")
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        selects.append(statement)
+
+    ids = [UUID(int=index) for index in [8, 1, 42, 5, 1, 0, 9, 3, 43]]
+    result = repository.get_many(ids)
+
+    assert [entity.id.int for entity in result] == [8, 1, 5, 1, 0, 9, 3]
+    assert result.missing == [UUID(int=42), UUID(int=43)]
+    # Eight distinct identifiers, queried three at a time.
+    assert len(selects) == 3
+    assert max_bind_parameters(connection) >= 999
@@ -0,0 +1,154 @@
+"""Unit tests for the imperative mappings of entities onto tables."""
+
+from dataclasses import dataclass
+from typing import Any, ClassVar
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Column, Connection, Engine, MetaData, String, Table, Uuid, event, select
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.primitives.entity import Entity
+from flask_boilerplate.infrastructure.persistence import SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.configurations import (
+    EntityMapping,
+    entity_example_mapping,
+    entity_examples_table,
+    map_imperatively,
+    mapping_for,
+)
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository, SqlAlchemyRepository
+
+metadata = MetaData()
+users_table = Table(
+    "users",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("email_address", String(255), nullable=False),
+)
+
+
+@dataclass(slots=True)
+class User:
+    """Entity whose field names differ from the columns."""
+
+    id: UUID
+    email: str
+
+
+@dataclass(slots=True, eq=False)
+class TrackedUser(Entity):
+    """Entity tracking its changes, with a field stored under another name and one not stored."""
+
+    track_changes: ClassVar[bool] = True
+
+    id: UUID
+    email: str
+    nickname: str = ""
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, TrackedUser) and self.id == other.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def change_email(self, email: str) -> None:
+        previous, self.email = self.email, email
+        self._attribute_changed("email", previous)
+
+    def change_nickname(self, nickname: str) -> None:
+        previous, self.nickname = self.nickname, nickname
+        self._attribute_changed("nickname", previous)
+
+
+class TrackedUserRepository(SqlAlchemyRepository[TrackedUser, UUID]):
+    """Repository of the users, mapped with a renamed column."""
+
+    mapping = EntityMapping(TrackedUser, users_table, {"email_address": "email"})
+
+
+def test_mapping_converts_rows_and_entities(connection: Connection) -> None:
+    """Test the round trip of an entity through its row."""
+    entity = EntityExample(id=UUID(int=1), name="name", description="description")
+    connection.execute(entity_examples_table.insert(), entity_example_mapping.to_row(entity))
+
+    row = connection.execute(select(entity_examples_table)).one()
+    hydrated = entity_example_mapping.to_entity(row)
+
+    assert hydrated == entity and type(hydrated) is EntityExample
+    assert entity_example_mapping.identifier(entity) == entity.id
+    assert mapping_for(EntityExample) is entity_example_mapping
+
+
+def test_mapping_renames_attributes() -> None:
+    """Test the mapping of fields onto columns of another name."""
+    mapping = EntityMapping(User, users_table, {"email_address": "email"})
+    user = User(UUID(int=1), "ada@example.com")
+
+    assert mapping.to_row(user) == {"id": user.id, "email_address": "ada@example.com"}
+    assert mapping.to_entity((user.id, "ada@example.com")) == user
+
+
+def test_mapping_rejects_invalid_declarations() -> None:
+    """Test the validation of the entity class and of the mapped names."""
+    with pytest.raises(TypeError):
+        EntityMapping(object, users_table)
+    with pytest.raises(ValueError, match="no field"):
+        EntityMapping(User, users_table)
+    with pytest.raises(ValueError, match="no column"):
+        EntityMapping(User, users_table, {"email": "email"})
+    with pytest.raises(ValueError, match="already mapped"):
+        map_imperatively(EntityExample, entity_examples_table)
+
+
+def test_changes_are_written_to_the_mapped_columns(engine: Engine) -> None:
+    """Test that a changed attribute is written to the column it is mapped onto, and an unstored one is rejected."""
+    metadata.create_all(engine)
+    user_id = UUID(int=1)
+    with SqlAlchemyUnitOfWork(engine, {"users": TrackedUserRepository}) as unit_of_work:
+        unit_of_work.repositories()["users"].add(TrackedUser(user_id, "ada@example.com"))
+        unit_of_work.commit()
+        user = unit_of_work.repositories()["users"].get(user_id)
+        assert user is not None
+        user.change_email("lovelace@example.com")
+        unit_of_work.commit()
+
+        user = unit_of_work.repositories()["users"].get(user_id)
+        assert user is not None and user.email == "lovelace@example.com"
+        user.change_nickname("ada")
+        with pytest.raises(ValueError, match="nickname"):
+            unit_of_work.commit()
+
+    with engine.connect() as connection:
+        assert connection.execute(select(users_table.c.email_address)).scalar_one() == "lovelace@example.com"
+
+
+def test_repository_without_mapping_must_convert_itself(connection: Connection) -> None:
+    """Test that a repository declaring only a table must implement the conversions."""
+
+    class UserRepository(SqlAlchemyRepository[User, UUID]):
+        table = users_table
+
+    with pytest.raises(NotImplementedError):
+        UserRepository(connection).add(User(UUID(int=1), "ada@example.com"))
+
+
+def test_repository_reuses_its_compiled_statements(connection: Connection) -> None:
+    """Test that the hot queries of the repositories are compiled once per process."""
+    repository = EntityExampleRepository(connection)
+    assert repository.table is entity_examples_table
+    repository.add(EntityExample(id=UUID(int=1), name="name", description="description"))
+    compiled: list[Any] = []
+
+    @event.listens_for(connection, "before_cursor_execute")
+    def record(conn: Connection, cursor: Any, statement: str, parameters: Any, context: Any, many: bool) -> None:
+        compiled.append(context.compiled)
+
+    for _ in range(2):
+        repository.get(UUID(int=1))
+        repository.get_many([UUID(int=1), UUID(int=2)])
+        repository.list(limit=10)
+        repository.list(after=UUID(int=0), limit=10)
+
+    assert len(compiled) == 8
+    assert all(second is first for first, second in zip(compiled[:4], compiled[4:], strict=True))
@@ -0,0 +1,168 @@
+"""Unit tests for the in-memory repository and its secondary indexes."""
+
+import random
+from uuid import UUID
+
+import pytest
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.infrastructure.persistence.repositories import HashIndex, InMemoryRepository, SortedIndex
+
+from .conftest import make_entity
+
+
+def make_repository(count: int = 10) -> InMemoryRepository[EntityExample, UUID]:
+    """Create a repository indexing the names, with hash and sorted indexes."""
+    return InMemoryRepository([make_entity(index) for index in range(count)], ["name"], ["name", "description"])
+
+
+def names(entities: list[EntityExample]) -> list[str]:
+    """Get the names of entities."""
+    return [entity.name for entity in entities]
+
+
+def test_add_get_list_and_remove() -> None:
+    """Test the basic repository operations and the replacement of an identifier."""
+    repository = make_repository(3)
+    repository.add(make_entity(1, name="replaced"))
+
+    assert len(repository) == 3
+    assert repository.get(UUID(int=1)) == make_entity(1)
+    assert repository.find_by("name", "name-001") == []
+    assert names(repository.find_by("name", "replaced")) == ["replaced"]
+
+    repository.remove(make_entity(0))
+    repository.remove(make_entity(0))
+    assert repository.get(UUID(int=0)) is None
+    assert names(list(repository.list())) == ["name-002", "replaced"]
+
+
+def test_indexed_and_scanned_lookups_agree() -> None:
+    """Test that lookups give the same results with and without an index."""
+    indexed = make_repository(50)
+    scanned = InMemoryRepository[EntityExample, UUID]([make_entity(index) for index in range(50)])
+
+    for repository in (indexed, scanned):
+        assert names(repository.find_by("name", "name-007")) == ["name-007"]
+        assert names(repository.find_range("name", "name-010", "name-013")) == ["name-010", "name-011", "name-012"]
+        assert names(repository.find_range("name", "name-047", inclusive=True)) == ["name-047", "name-048", "name-049"]
+        assert names(repository.find_range("name", high="name-002", reverse=True)) == ["name-001", "name-000"]
+        assert names(repository.find_prefix("name", "name-04", limit=3)) == ["name-040", "name-041", "name-042"]
+        assert len(repository.find_prefix("name", "")) == 50
+
+
+def test_indexes_follow_mutation_methods() -> None:
+    """Test that the indexes follow the changes made by the mutation methods of entities."""
+    repository = make_repository(5)
+    entity = repository.get(UUID(int=2))
+    assert entity is not None
+
+    entity.update_name("renamed")
+    entity.update_description("changed")
+
+    assert repository.find_by("name", "name-002") == []
+    assert repository.find_by("name", "renamed") == [entity]
+    assert repository.find_prefix("name", "ren") == [entity]
+    assert repository.find_by("description", "changed") == [entity]
+
+    repository.remove(entity)
+    entity.update_name("detached")
+    assert repository.find_by("name", "detached") == []
+
+
+def test_entity_is_observed_by_several_repositories() -> None:
+    """Test that an entity held by two repositories is kept indexed in both."""
+    entity = make_entity(0)
+    primary, read_model = make_repository(0), make_repository(0)
+    primary.add(entity)
+    read_model.add(entity)
+
+    entity.update_name("renamed")
+    assert primary.find_by("name", "renamed") == read_model.find_by("name", "renamed") == [entity]
+
+    primary.remove(entity)
+    entity.update_name("again")
+    assert primary.find_by("name", "again") == []
+    assert read_model.find_by("name", "again") == [entity]
+
+
+def test_add_many_rolls_back_when_an_entity_cannot_be_indexed() -> None:
+    """Test that a failed add_many() leaves the repository, and its indexes, as they were."""
+    unorderable = make_entity(8)
+    unorderable.name = 8  # type: ignore[assignment]
+
+    empty = make_repository(0)
+    with pytest.raises(TypeError):
+        empty.add_many([make_entity(9), unorderable])
+    assert len(empty) == 0 and empty.find_by("name", "name-009") == []
+
+    repository = make_repository(3)
+    with pytest.raises(TypeError):
+        repository.add_many([make_entity(5), make_entity(1, name="replaced"), unorderable])
+    assert len(repository) == 3
+    assert sorted(names(list(repository.list()))) == ["name-000", "name-001", "name-002"]
+    assert names(repository.find_prefix("name", "")) == ["name-000", "name-001", "name-002"]
+    assert repository.find_by("name", "replaced") == [] and repository.find_by("name", "name-005") == []
+    assert repository.find_by("description", "description 8") == []
+
+
+def test_rebuild_indexes_after_plain_assignments() -> None:
+    """Test that plain attribute assignments are taken into account by a rebuild."""
+    repository = make_repository(3)
+    entity = repository.get(UUID(int=0))
+    assert entity is not None
+
+    entity.name = "assigned"
+    repository.rebuild_indexes()
+
+    assert repository.find_by("name", "assigned") == [entity]
+
+
+def test_hash_index_with_shared_keys() -> None:
+    """Test a hash index whose keys are shared by several entities."""
+    index = HashIndex[EntityExample]("name")
+    entities = [make_entity(index, name="same") for index in range(3)]
+    for entity in entities:
+        index.insert(entity.name, entity)
+
+    index.remove("same", entities[1])
+    assert index.equal("same") == [entities[0], entities[2]]
+    index.remove("same", entities[0])
+    assert index.equal("same") == [entities[2]]
+    with pytest.raises(KeyError):
+        index.remove("same", entities[0])
+    assert len(index) == 1
+
+
+def test_sorted_index_splits_buckets_and_matches_sorted_order() -> None:
+    """Test that a sorted index with small buckets stays ordered through inserts and removes."""
+    index = SortedIndex[EntityExample]("name")
+    index.bucket_size = 4
+    generator = random.Random(42)
+    entities = [make_entity(number, name=f"{generator.randrange(20):02d}") for number in range(200)]
+    for entity in entities:
+        index.insert(entity.name, entity)
+    for entity in entities[::3]:
+        index.remove(entity.name, entity)
+    remaining = [entity for position, entity in enumerate(entities) if position % 3]
+
+    expected = sorted(remaining, key=lambda entity: entity.name)
+    assert list(index.range()) == expected
+    assert list(index.range(reverse=True)) == expected[::-1]
+    assert index.equal("07") == [entity for entity in remaining if entity.name == "07"]
+    assert list(index.range("05", "08")) == [entity for entity in expected if "05" <= entity.name < "08"]
+    assert len(index) == len(remaining)
+
+
+@pytest.mark.parametrize("sorted_indexes", [(), ("id",)])
+def test_list_pages_by_identifier(sorted_indexes: tuple[str, ...]) -> None:
+    """Test keyset pagination, with and without a sorted index on the identifier."""
+    indexes = list(range(10))
+    random.Random(3).shuffle(indexes)
+    repository = InMemoryRepository[EntityExample, UUID]([make_entity(index) for index in indexes], (), sorted_indexes)
+
+    assert [entity.id.int for entity in repository.list()] == indexes
+    assert [entity.id.int for entity in repository.list(limit=3)] == [0, 1, 2]
+    assert [entity.id.int for entity in repository.list(after=UUID(int=2), limit=3)] == [3, 4, 5]
+    assert [entity.id.int for entity in repository.list(after=UUID(int=6))] == [7, 8, 9]
+    assert list(repository.list(after=UUID(int=9), limit=3)) == []
@@ -0,0 +1,148 @@
+"""Unit tests for the optimistic concurrency control of versioned aggregates."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ClassVar
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Column, Engine, Integer, MetaData, Row, String, Table, Uuid, create_engine
+
+from flask_boilerplate.domain.errors import ConcurrencyError
+from flask_boilerplate.domain.primitives import AggregateRoot
+from flask_boilerplate.infrastructure.persistence import SqlAlchemyUnitOfWork, WriteBatch
+from flask_boilerplate.infrastructure.persistence.repositories import SqlAlchemyRepository
+
+metadata = MetaData()
+accounts_table = Table(
+    "accounts",
+    metadata,
+    Column("id", Uuid, primary_key=True),
+    Column("owner", String(255), nullable=False),
+    Column("balance", Integer, nullable=False),
+    Column("version", Integer, nullable=False),
+)
+
+
+@dataclass(slots=True)
+class Account(AggregateRoot):
+    """Versioned aggregate tracking its changes."""
+
+    track_changes: ClassVar[bool] = True
+
+    id: UUID
+    owner: str
+    balance: int
+
+    def deposit(self, amount: int) -> None:
+        previous, self.balance = self.balance, self.balance + amount
+        self._attribute_changed("balance", previous)
+
+    def _get_identifier(self) -> UUID:
+        return self.id
+
+
+class AccountRepository(SqlAlchemyRepository[Account, UUID]):
+    """Repository of the accounts, in a table with a version column."""
+
+    table = accounts_table
+
+    def _to_entity(self, row: Row[Any]) -> Account:
+        return Account(row.id, row.owner, row.balance, version=row.version)
+
+    def _to_row(self, entity: Account) -> Mapping[str, Any]:
+        return {"id": entity.id, "owner": entity.owner, "balance": entity.balance, "version": entity.version}
+
+
+@pytest.fixture
+def accounts_engine(tmp_path: Path) -> Engine:
+    """Create a SQLite file database with 3 accounts, shared by several connections."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'accounts.db'}")
+    metadata.create_all(engine)
+    with make_unit_of_work(engine) as unit_of_work:
+        for index in range(3):
+            unit_of_work.repositories()["accounts"].add(Account(UUID(int=index), f"owner-{index}", 0))
+        unit_of_work.commit()
+    return engine
+
+
+def make_unit_of_work(engine: Engine) -> SqlAlchemyUnitOfWork:
+    """Create a unit of work with the repository of the accounts."""
+    return SqlAlchemyUnitOfWork(engine, {"accounts": AccountRepository})
+
+
+def deposit(engine: Engine, amounts: Mapping[int, int]) -> list[int]:
+    """Deposit amounts on accounts in a unit of work, and return their new versions."""
+    with make_unit_of_work(engine) as unit_of_work:
+        accounts = [unit_of_work.repositories()["accounts"].get(UUID(int=index)) for index in amounts]
+        for account, amount in zip(accounts, amounts.values(), strict=True):
+            assert account is not None
+            account.deposit(amount)
+        unit_of_work.commit()
+        return [account.version for account in accounts if account is not None]
+
+
+def test_versions_are_incremented_by_each_write(accounts_engine: Engine) -> None:
+    """Test that the updates of an aggregate increment its version, in memory and stored."""
+    assert deposit(accounts_engine, {0: 10, 1: 5}) == [1, 1]
+    assert deposit(accounts_engine, {0: 10}) == [2]
+
+    with make_unit_of_work(accounts_engine) as unit_of_work:
+        account = unit_of_work.repositories()["accounts"].get(UUID(int=0))
+        assert account is not None and (account.balance, account.version) == (20, 2)
+
+
+def test_concurrent_update_raises_instead_of_losing_it(accounts_engine: Engine) -> None:
+    """Test that the second of two interleaved updates of an aggregate is rejected."""
+    with make_unit_of_work(accounts_engine) as unit_of_work:
+        stale = unit_of_work.repositories()["accounts"].get(UUID(int=1))
+        assert stale is not None
+        deposit(accounts_engine, {1: 100})
+        stale.deposit(1)
+
+        with pytest.raises(ConcurrencyError) as error:
+            unit_of_work.commit()
+        assert error.value.ids == [UUID(int=1)]
+
+    with make_unit_of_work(accounts_engine) as unit_of_work:
+        account = unit_of_work.repositories()["accounts"].get(UUID(int=1))
+        assert account is not None and (account.balance, account.version) == (100, 1)
+
+
+def test_concurrent_delete_raises(accounts_engine: Engine) -> None:
+    """Test that removing an aggregate changed since it was loaded is rejected."""
+    with make_unit_of_work(accounts_engine) as unit_of_work:
+        repository = unit_of_work.repositories()["accounts"]
+        stale, fresh = repository.get(UUID(int=2)), repository.get(UUID(int=0))
+        deposit(accounts_engine, {2: 1})
+        repository.remove(stale)
+        repository.remove(fresh)
+
+        with pytest.raises(ConcurrencyError):
+            unit_of_work.commit()
+
+    with make_unit_of_work(accounts_engine) as unit_of_work:
+        repository = unit_of_work.repositories()["accounts"]
+        assert repository.get(UUID(int=0)) is not None
+        repository.remove(repository.get(UUID(int=0)))
+        unit_of_work.commit()
+        assert repository.get(UUID(int=0)) is None
+
+
+def test_failed_flush_leaves_versions_and_written_rows_unchanged(accounts_engine: Engine) -> None:
+    """Test that a conflict in a later chunk neither bumps the earlier versions nor records their rows."""
+    deposit(accounts_engine, {2: 1})
+    fresh, stale = Account(UUID(int=0), "owner-0", 1), Account(UUID(int=2), "owner-2", 1)
+    batch = WriteBatch(chunk_size=1)
+    for account in (fresh, stale):
+        batch.update(accounts_table, account.id, {"balance": account.balance}, versioned=account)
+
+    with accounts_engine.connect() as connection:
+        with pytest.raises(ConcurrencyError) as error:
+            batch.flush(connection)
+        connection.rollback()
+
+    assert error.value.ids == [UUID(int=2)]
+    assert (fresh.version, stale.version) == (0, 0)
+    assert batch.pop_written() == {}
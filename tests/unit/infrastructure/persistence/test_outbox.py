@@ -0,0 +1,89 @@
+"""Unit tests for the transactional outbox of the domain events."""
+
+import json
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Engine, Row, select
+
+from flask_boilerplate.domain.domain_events import DomainEventDispatcher
+from flask_boilerplate.infrastructure.persistence import Outbox, SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.configurations import outbox_messages_table
+
+from .conftest import Named, NamedRepository, Renamed
+
+NOW = datetime(2025, 1, 1, 12, tzinfo=UTC)
+
+
+def outbox_rows(engine: Engine) -> list[Row[Any]]:
+    """Read the messages of the outbox."""
+    with engine.connect() as connection:
+        return list(connection.execute(select(outbox_messages_table).order_by(outbox_messages_table.c.id)))
+
+
+def test_events_are_recorded_in_the_transaction_of_the_aggregates(engine: Engine) -> None:
+    """Test that the events are written with a commit only, and still dispatched in process."""
+    received: list[Sequence[Any]] = []
+    dispatcher = DomainEventDispatcher()
+    dispatcher.register(Renamed, received.append)
+    outbox = Outbox(clock=lambda: NOW)
+
+    with SqlAlchemyUnitOfWork(engine, {"named": NamedRepository}, dispatcher, outbox=outbox) as unit_of_work:
+        repository = unit_of_work.repositories()["named"]
+        aggregate = Named(UUID(int=1), "name", "description")
+        aggregate.update_name("first")
+        aggregate.update_name("second")
+        repository.add(aggregate)
+        unit_of_work.commit()
+
+        loaded = repository.get(UUID(int=1))
+        assert loaded is not None
+        loaded.update_name("discarded")
+        unit_of_work.rollback()
+
+    rows = outbox_rows(engine)
+    assert [row.topic for row in rows] == ["renamed", "renamed"]
+    assert [json.loads(row.payload)["name"] for row in rows] == ["first", "second"]
+    assert json.loads(rows[0].payload)["id"] == str(UUID(int=1))
+    assert rows[0].created_at.replace(tzinfo=UTC) == NOW
+    assert rows[0].published_at is None and rows[0].claimed_by is None
+    assert [[event.name for event in batch] for batch in received] == [["first", "second"]]
+
+
+def test_events_of_removed_aggregates_are_recorded(engine: Engine) -> None:
+    """Test that the events of the aggregates removed in a transaction are written and dispatched."""
+    received: list[Sequence[Any]] = []
+    dispatcher = DomainEventDispatcher()
+    dispatcher.register(Renamed, received.append)
+
+    with SqlAlchemyUnitOfWork(engine, {"named": NamedRepository}, dispatcher, outbox=Outbox()) as unit_of_work:
+        repository = unit_of_work.repositories()["named"]
+        repository.add(Named(UUID(int=1), "a", "description"))
+        repository.add(Named(UUID(int=2), "c", "description"))
+        unit_of_work.commit()
+
+        loaded = repository.get(UUID(int=1))
+        assert loaded is not None
+        loaded.update_name("b")
+        repository.remove(loaded)
+        # An aggregate removed without being loaded in the transaction keeps its events too.
+        unloaded = Named(UUID(int=2), "c", "description")
+        unloaded.update_name("d")
+        repository.remove(unloaded)
+        unit_of_work.commit()
+
+        assert list(repository.list()) == []
+
+    assert [json.loads(row.payload)["name"] for row in outbox_rows(engine)] == ["b", "d"]
+    assert [[event.name for event in batch] for batch in received] == [["b", "d"]]
+
+
+def test_unit_of_work_without_events_writes_no_message(engine: Engine) -> None:
+    """Test that a commit without domain events leaves the outbox empty."""
+    with SqlAlchemyUnitOfWork(engine, {"named": NamedRepository}, outbox=Outbox()) as unit_of_work:
+        unit_of_work.repositories()["named"].add(Named(UUID(int=1), "name", "description"))
+        unit_of_work.commit()
+
+    assert outbox_rows(engine) == []
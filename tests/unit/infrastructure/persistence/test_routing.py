@@ -0,0 +1,95 @@
+"""Unit tests for the routing of the units of work to the primary or a read replica."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, create_engine
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.infrastructure.persistence import RoutingUnitOfWorkFactory
+from flask_boilerplate.infrastructure.persistence.configurations import metadata
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+
+class Clock:
+    """Clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engines(tmp_path: Path) -> Iterator[tuple[Engine, Engine]]:
+    """Create a primary and a replica on two SQLite files, not replicated."""
+    primary, replica = (create_engine(f"sqlite:///{tmp_path / name}") for name in ("primary.db", "replica.db"))
+    for engine in (primary, replica):
+        metadata.create_all(engine)
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+def test_queries_read_their_writes_on_the_primary_then_the_replica(engines: tuple[Engine, Engine]) -> None:
+    """Test that the queries of a writer stick to the primary during the sticky window."""
+    primary, replica = engines
+    clock = Clock()
+    units_of_work = RoutingUnitOfWorkFactory(
+        primary, replica, {"entities": EntityExampleRepository}, sticky_seconds=5.0, clock=clock
+    )
+    entity_id = UUID(int=1)
+
+    def read(key: str) -> EntityExample | None:
+        with units_of_work.for_query(key) as unit_of_work:
+            return unit_of_work.repositories()["entities"].get(entity_id)
+
+    assert units_of_work.engine_for_query("alice") is replica
+    with units_of_work.for_command("alice") as unit_of_work:
+        assert unit_of_work.engine is primary
+        unit_of_work.repositories()["entities"].add(EntityExample(id=entity_id, name="name", description="description"))
+        unit_of_work.commit()
+
+    clock.now = 4.9
+    assert read("alice") is not None
+    assert read("bob") is None
+    clock.now = 5.0
+    assert read("alice") is None
+
+
+def test_writes_without_key_stick_all_clients(engines: tuple[Engine, Engine]) -> None:
+    """Test the stickiness of the writes made without a client key, and without a replica."""
+    primary, replica = engines
+    clock = Clock()
+    units_of_work = RoutingUnitOfWorkFactory(primary, replica, {}, sticky_seconds=1.0, clock=clock)
+
+    units_of_work.record_write()
+
+    assert units_of_work.engine_for_query("bob") is primary
+    clock.now = 1.0
+    assert units_of_work.engine_for_query("bob") is replica
+    assert RoutingUnitOfWorkFactory(primary, None, {}).engine_for_query() is primary
+    with pytest.raises(ValueError):
+        RoutingUnitOfWorkFactory(primary, replica, {}, sticky_seconds=-1.0)
+
+
+def test_expired_keys_are_dropped_on_write(engines: tuple[Engine, Engine]) -> None:
+    """Test that a write drops the expired keys only, keeping the order of expiry."""
+    primary, replica = engines
+    clock = Clock()
+    units_of_work = RoutingUnitOfWorkFactory(primary, replica, {}, sticky_seconds=1.0, clock=clock)
+    for index in range(1000):
+        clock.now = index / 1000
+        units_of_work.record_write(index)
+    units_of_work.record_write(0)
+
+    clock.now = 1.5
+    units_of_work.record_write("alice")
+
+    assert len(units_of_work._sticky_until) == 501
+    assert units_of_work.engine_for_query(0) is primary
+    assert units_of_work.engine_for_query(500) is replica
+    assert units_of_work.engine_for_query(501) is primary
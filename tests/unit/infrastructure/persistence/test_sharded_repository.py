@@ -0,0 +1,246 @@
+"""Unit tests for the sharded repository, its unit of work and the resharding."""
+
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from itertools import islice
+from pathlib import Path
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import Engine, create_engine, event, func, select
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.primitives.specification import Specification
+from flask_boilerplate.infrastructure.persistence import ShardedUnitOfWork
+from flask_boilerplate.infrastructure.persistence.configurations import entity_examples_table, metadata
+from flask_boilerplate.infrastructure.persistence.migrations import ReshardProgress, reshard, resharding
+from flask_boilerplate.infrastructure.persistence.repositories import (
+    EntityExampleRepository,
+    ShardedRepository,
+    jump_hash,
+    shard_for,
+)
+
+
+class NameStartsWith(Specification[EntityExample]):
+    """Translatable specification on the prefix of the name."""
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+
+    def is_satisfied_by(self, candidate: EntityExample) -> bool:
+        return candidate.name.startswith(self.prefix)
+
+    def column_expression(self, columns: Any) -> Any:
+        return columns.name.startswith(self.prefix, autoescape=True)
+
+
+def create_shard(path: Path) -> Engine:
+    """Create a SQLite file database with the application schema."""
+    engine = create_engine(f"sqlite:///{path}")
+    metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture
+def shards(tmp_path: Path) -> Iterator[list[Engine]]:
+    """Create three shards, and a fourth one to reshard to."""
+    engines = [create_shard(tmp_path / f"shard-{index}.db") for index in range(4)]
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    """Create the executor of the queries of the shards."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def make_entities(count: int) -> list[EntityExample]:
+    """Create entities with random identifiers."""
+    return [EntityExample(id=uuid4(), name=f"name-{index % 3}", description=f"d{index}") for index in range(count)]
+
+
+def count_rows(engine: Engine) -> int:
+    """Count the rows of a shard."""
+    with engine.connect() as connection:
+        return connection.execute(select(func.count()).select_from(entity_examples_table)).scalar_one()
+
+
+def store(engines: list[Engine], entities: list[EntityExample]) -> None:
+    """Store entities on their shards."""
+    with ShardedUnitOfWork(engines, {"entities": EntityExampleRepository}) as unit_of_work:
+        for entity in entities:
+            unit_of_work.repositories()["entities"].add(entity)
+        unit_of_work.commit()
+
+
+def test_jump_hash_is_balanced_and_moves_the_fewest_keys() -> None:
+    """Test that adding a bucket moves about 1 / (N + 1) of the keys, all to the new bucket."""
+    keys = [int.from_bytes(blake2b(str(index).encode(), digest_size=8).digest()) for index in range(10_000)]
+    before = [jump_hash(key, 4) for key in keys]
+    after = [jump_hash(key, 5) for key in keys]
+
+    assert all(count > 2200 for count in Counter(before).values())
+    moves = [(old, new) for old, new in zip(before, after, strict=True) if old != new]
+    assert 1700 < len(moves) < 2300
+    assert {new for _, new in moves} == {4}
+    assert shard_for(UUID(int=1), 3) == shard_for(UUID(int=1), 3)
+    with pytest.raises(ValueError):
+        jump_hash(1, 0)
+
+
+def test_sharded_unit_of_work_routes_the_entities(shards: list[Engine], executor: ThreadPoolExecutor) -> None:
+    """Test that each entity is stored on, and read from, its shard only."""
+    engines = shards[:3]
+    entities = make_entities(60)
+    store(engines, entities)
+
+    for index, engine in enumerate(engines):
+        expected = sum(shard_for(entity.id, 3) == index for entity in entities)
+        assert 0 < count_rows(engine) == expected
+
+    with ShardedUnitOfWork(engines, {"entities": EntityExampleRepository}, executor) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        assert isinstance(repository, ShardedRepository)
+        assert repository.get(entities[0].id) == entities[0]
+        unknown = uuid4()
+        ids = [entities[5].id, unknown, entities[1].id, entities[5].id]
+        result = repository.get_many(ids)
+        assert list(result) == [entities[5], entities[1], entities[5]]
+        assert result.missing == [unknown]
+
+        repository.remove(entities[0])
+        unit_of_work.commit()
+
+    assert sum(map(count_rows, engines)) == 59
+
+
+def test_list_scatters_and_merges_the_shards(
+    shards: list[Engine], executor: ThreadPoolExecutor, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the pages merged by identifier, the interleaved streams and the pushed-down finds."""
+    engines = shards[:3]
+    entities = make_entities(50)
+    store(engines, entities)
+    by_id = sorted(entities, key=lambda entity: entity.id)
+    monkeypatch.setattr(ShardedRepository, "stream_batch_size", 4)
+
+    with ShardedUnitOfWork(engines, {"entities": EntityExampleRepository}, executor) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        first = list(repository.list(limit=20))
+        second = list(repository.list(after=first[-1].id, limit=20))
+        assert first + second == by_id[:40]
+
+        assert sorted(repository.list(), key=lambda entity: entity.id) == by_id
+        # A stream stopped early waits for the fetches in progress.
+        stream = iter(repository.list())
+        assert len(list(islice(stream, 5))) == 5
+        stream.close()  # type: ignore[attr-defined]
+        assert repository.get(entities[0].id) == entities[0]
+
+        found = repository.find(NameStartsWith("name-1"), limit=5, order_by="-id")
+        expected = sorted((entity for entity in entities if entity.name == "name-1"), key=lambda entity: entity.id)
+        assert found == expected[::-1][:5]
+
+
+@pytest.mark.parametrize("with_executor", [True, False])
+def test_stopped_stream_closes_the_streams_of_the_shards(
+    shards: list[Engine], executor: ThreadPoolExecutor, with_executor: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that an iteration stopped early closes the streams the shards have started."""
+    store(shards[:3], make_entities(30))
+    monkeypatch.setattr(ShardedRepository, "stream_batch_size", 2)
+    started: list[EntityExampleRepository] = []
+    closed: list[EntityExampleRepository] = []
+    stream_all = EntityExampleRepository.list
+
+    def tracked_list(self: EntityExampleRepository, after: Any = None, limit: int | None = None) -> Iterator[Any]:
+        started.append(self)
+        try:
+            yield from stream_all(self, after, limit)
+        finally:
+            closed.append(self)
+
+    monkeypatch.setattr(EntityExampleRepository, "list", tracked_list)
+    connections = [engine.connect() for engine in shards[:3]]
+    repository = ShardedRepository(
+        [EntityExampleRepository(connection) for connection in connections], executor if with_executor else None
+    )
+
+    stream = iter(repository.list())
+    assert len(list(islice(stream, 3))) == 3
+    stream.close()  # type: ignore[attr-defined]
+
+    # Without an executor, the shards after the first have not started their query yet.
+    assert len(started) == (3 if with_executor else 1)
+    assert sorted(map(id, closed)) == sorted(map(id, started))
+    for connection in connections:
+        connection.close()
+
+
+def test_sharded_repository_without_executor(shards: list[Engine]) -> None:
+    """Test that the shards are queried one after the other without an executor."""
+    entities = make_entities(10)
+    store(shards[:2], entities)
+    connections = [engine.connect() for engine in shards[:2]]
+    repository = ShardedRepository([EntityExampleRepository(connection) for connection in connections])
+
+    assert sorted(repository.list(), key=lambda entity: entity.id) == sorted(entities, key=lambda entity: entity.id)
+    assert len(repository.get_many([entity.id for entity in entities])) == 10
+    for connection in connections:
+        connection.close()
+    with pytest.raises(ValueError):
+        ShardedRepository([])
+
+
+def test_reshard_deletes_within_the_parameter_limit(shards: list[Engine], monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the deletes of a chunk are split to stay within the parameter limit of the shards."""
+    monkeypatch.setattr(resharding, "max_bind_parameters", lambda connection: 5)
+    parameters: list[int] = []
+    for engine in shards:
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def record(conn: Any, cursor: Any, statement: str, values: Any, *args: Any) -> None:
+            if statement.startswith("DELETE"):
+                parameters.append(len(values))
+
+    entities = make_entities(100)
+    store(shards[:3], entities)
+
+    progress = reshard(entity_examples_table, shards[:3], shards, chunk_size=50)
+
+    assert progress.moved == count_rows(shards[3]) > 5
+    assert parameters and max(parameters) <= 5
+    assert sum(map(count_rows, shards)) == 100
+
+
+def test_reshard_moves_the_rows_whose_shard_changed(shards: list[Engine]) -> None:
+    """Test that adding a shard moves rows only to it, and that resharding again moves nothing."""
+    entities = make_entities(200)
+    store(shards[:3], entities)
+    reports: list[ReshardProgress] = []
+
+    progress = reshard(entity_examples_table, shards[:3], shards, chunk_size=30, on_progress=reports.append)
+
+    expected = sum(shard_for(entity.id, 4) == 3 for entity in entities)
+    assert progress.scanned == 200 and progress.moved == expected == count_rows(shards[3])
+    assert {report.source for report in reports} == {0, 1, 2} and reports[-1].scanned == 200
+    assert sum(map(count_rows, shards)) == 200
+    with ShardedUnitOfWork(shards, {"entities": EntityExampleRepository}) as unit_of_work:
+        result = unit_of_work.repositories()["entities"].get_many([entity.id for entity in entities])
+        assert not result.missing
+
+    again = reshard(entity_examples_table, shards, shards)
+    assert again.scanned == 200 and again.moved == 0
+
+    # Back to two shards.
+    reshard(entity_examples_table, shards, shards[:2])
+    assert count_rows(shards[2]) == count_rows(shards[3]) == 0
+    with ShardedUnitOfWork(shards[:2], {"entities": EntityExampleRepository}) as unit_of_work:
+        assert len(list(unit_of_work.repositories()["entities"].list())) == 200
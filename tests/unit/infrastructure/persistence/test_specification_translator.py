@@ -0,0 +1,85 @@
+"""Unit tests for the translation of specifications into SQLAlchemy criteria."""
+
+from typing import Any
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.primitives.specification import Specification
+from flask_boilerplate.infrastructure.persistence.configurations import entity_examples_table
+from flask_boilerplate.infrastructure.persistence.specification_translator import translate_specification
+
+
+class NameIs(Specification[EntityExample]):
+    """Translatable specification on the name of the entity."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def is_satisfied_by(self, candidate: EntityExample) -> bool:
+        return candidate.name == self.name
+
+    def column_expression(self, columns: Any) -> Any:
+        return columns.name == self.name
+
+
+class DescriptionIsUpper(Specification[EntityExample]):
+    """Specification without a column expression."""
+
+    def is_satisfied_by(self, candidate: EntityExample) -> bool:
+        return candidate.description.isupper()
+
+
+def render(criterion: Any) -> str:
+    """Render a criterion with its parameters inlined."""
+    return str(criterion.compile(compile_kwargs={"literal_binds": True}))
+
+
+def test_translate_fully_translatable_tree() -> None:
+    """Test that And, Or and Not nodes over translatable leaves become one criterion."""
+    spec = (NameIs("a") | NameIs("b")) & ~NameIs("c")
+
+    criterion, residual = translate_specification(spec, entity_examples_table.c)
+
+    assert residual is None
+    assert render(criterion) == (
+        "(entity_examples.name = 'a' OR entity_examples.name = 'b') AND entity_examples.name != 'c'"
+    )
+
+
+def test_translate_and_splits_untranslatable_conjuncts() -> None:
+    """Test that untranslatable conjuncts are returned as the residual specification."""
+    untranslatable = DescriptionIsUpper()
+    spec = NameIs("a") & untranslatable
+
+    criterion, residual = translate_specification(spec, entity_examples_table.c)
+
+    assert render(criterion) == "entity_examples.name = 'a'"
+    assert residual is untranslatable
+
+
+def test_translate_or_with_untranslatable_operand_is_residual() -> None:
+    """Test that a partially translatable disjunction is evaluated in Python."""
+    spec = NameIs("a") | DescriptionIsUpper()
+
+    criterion, residual = translate_specification(spec, entity_examples_table.c)
+
+    assert criterion is None
+    assert residual is spec
+
+
+def test_translate_not_with_untranslatable_operand_is_residual() -> None:
+    """Test that the negation of an untranslatable specification is evaluated in Python."""
+    spec = NameIs("a") & ~DescriptionIsUpper()
+
+    criterion, residual = translate_specification(spec, entity_examples_table.c)
+
+    assert render(criterion) == "entity_examples.name = 'a'"
+    assert residual is not None
+    assert residual.is_satisfied_by(EntityExample(name="a", description="lower")) is True
+
+
+def test_translate_compiled_specification() -> None:
+    """Test that compiled specifications are translated through their source tree."""
+    criterion, residual = translate_specification((NameIs("a") & NameIs("a")).compile(), entity_examples_table.c)
+
+    assert residual is None
+    assert render(criterion) == "entity_examples.name = 'a' AND entity_examples.name = 'a'"
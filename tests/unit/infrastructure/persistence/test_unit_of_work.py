@@ -0,0 +1,155 @@
+"""Unit tests for the SQLAlchemy unit of work and its identity map."""
+
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Engine, event
+
+from flask_boilerplate.domain.domain_events import DomainEventDispatcher
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.primitives import IdentityMap
+from flask_boilerplate.domain.primitives.specification import Specification
+from flask_boilerplate.infrastructure.persistence import SqlAlchemyUnitOfWork
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+from .conftest import Named, NamedRepository, Renamed, make_entity
+
+
+class DescriptionEndsWith(Specification[EntityExample]):
+    """Specification evaluated in Python only."""
+
+    def __init__(self, suffix: str) -> None:
+        self.suffix = suffix
+
+    def is_satisfied_by(self, candidate: EntityExample) -> bool:
+        return candidate.description.endswith(self.suffix)
+
+
+def make_unit_of_work(engine: Engine, dispatcher: DomainEventDispatcher | None = None) -> SqlAlchemyUnitOfWork:
+    """Create a unit of work with the repository of `EntityExample` entities."""
+    return SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository, "named": NamedRepository}, dispatcher)
+
+
+def count_selects(engine: Engine) -> list[str]:
+    """Record the SELECT statements executed on an engine."""
+    statements: list[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        if statement.startswith("SELECT"):
+            statements.append(statement)
+
+    return statements
+
+
+def test_repeated_loads_return_the_same_instance(engine: Engine) -> None:
+    """Test that repeated loads within a unit of work hit the identity map."""
+    with make_unit_of_work(engine) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        for index in range(3):
+            repository.add(EntityExample(id=UUID(int=index), name=f"name-{index}", description="description"))
+        unit_of_work.commit()
+        selects = count_selects(engine)
+
+        first = repository.get(UUID(int=1))
+        assert repository.get(UUID(int=1)) is first
+        assert repository.get_many([UUID(int=2), UUID(int=1), UUID(int=9)])[1] is first
+        assert next(entity for entity in repository.list() if entity.id == UUID(int=1)) is first
+
+        assert len(selects) == 3
+        assert "IN" in selects[1]
+        assert (unit_of_work.identity_map.hits, unit_of_work.identity_map.misses) == (2, 3)
+
+
+def test_streamed_list_does_not_fill_the_identity_map(engine: Engine) -> None:
+    """Test that streaming all entities reuses the registered ones without registering the others."""
+    with make_unit_of_work(engine) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        for index in range(5):
+            repository.add(EntityExample(id=UUID(int=index), name=f"name-{index}", description="description"))
+        unit_of_work.commit()
+
+        loaded = repository.get(UUID(int=3))
+        streamed = {entity.id.int: entity for entity in repository.list()}
+
+        assert len(streamed) == 5 and streamed[3] is loaded
+        assert len(unit_of_work.identity_map) == 1
+        assert len(list(repository.list(limit=5))) == len(unit_of_work.identity_map) == 5
+
+
+def test_filtered_find_registers_the_matches_only(engine: Engine) -> None:
+    """Test that a specification filtered in Python registers the satisfying entities, not the scanned ones."""
+    with make_unit_of_work(engine) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        for index in range(50):
+            repository.add(make_entity(index))
+        unit_of_work.commit()
+
+        loaded = repository.get(UUID(int=17))
+        found = repository.find(DescriptionEndsWith("7"))
+
+        assert [entity.id.int for entity in found] == [7, 17, 27, 37, 47]
+        assert found[1] is loaded
+        assert len(unit_of_work.identity_map) == len(found)
+        assert repository.get(UUID(int=27)) is found[2]
+
+
+def test_identity_map_is_cleared_on_commit_and_rollback(engine: Engine) -> None:
+    """Test that a new transaction loads fresh instances."""
+    with make_unit_of_work(engine) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        entity = EntityExample(id=UUID(int=1), name="name", description="description")
+        repository.add(entity)
+        assert repository.get(entity.id) is entity
+
+        unit_of_work.commit()
+        assert len(unit_of_work.identity_map) == 0
+        loaded = repository.get(entity.id)
+        assert loaded is not entity and loaded == entity
+
+        unit_of_work.rollback()
+        assert repository.get(entity.id) is not loaded
+
+    with pytest.raises(RuntimeError):
+        unit_of_work.repositories()
+
+
+def test_domain_events_are_published_after_commit_only(engine: Engine) -> None:
+    """Test that the events of the loaded aggregates are dispatched after a commit."""
+    received: list[Sequence[Any]] = []
+    dispatcher = DomainEventDispatcher()
+    dispatcher.register(Renamed, received.append)
+
+    with make_unit_of_work(engine, dispatcher) as unit_of_work:
+        repository = unit_of_work.repositories()["named"]
+        repository.add(Named(UUID(int=1), "name", "description"))
+        unit_of_work.commit()
+
+        entity = repository.get(UUID(int=1))
+        assert entity is not None
+        entity.update_name("discarded")
+        unit_of_work.rollback()
+
+        entity = repository.get(UUID(int=1))
+        assert entity is not None
+        entity.update_name("published")
+        unit_of_work.commit()
+
+    assert [[event.name for event in batch] for batch in received] == [["published"]]
+
+
+def test_identity_map_counters_and_kinds() -> None:
+    """Test the identity map on its own."""
+    identity_map = IdentityMap()
+    entity = EntityExample(id=UUID(int=1), name="name", description="description")
+
+    assert identity_map.add("entities", entity.id, entity) is entity
+    assert identity_map.add("entities", entity.id, EntityExample("other", "other", entity.id)) is entity
+    assert identity_map.get("others", entity.id) is None
+    assert identity_map.get("entities", entity.id) is entity
+    identity_map.remove("entities", entity.id)
+    assert identity_map.get("entities", entity.id) is None
+
+    assert (identity_map.hits, identity_map.misses, len(identity_map)) == (1, 2, 0)
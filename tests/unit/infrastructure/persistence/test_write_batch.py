@@ -0,0 +1,149 @@
+"""Unit tests for the bulk writes of the unit of work."""
+
+import sqlite3
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Connection, Engine, event, func, select
+
+from flask_boilerplate.infrastructure.persistence import SqlAlchemyUnitOfWork, WriteBatch
+from flask_boilerplate.infrastructure.persistence.configurations.entity_example_configuration import (
+    entity_examples_table,
+)
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository
+
+from .conftest import make_entity
+
+
+def record_statements(engine: Engine) -> list[tuple[str, bool]]:
+    """Record the statements executed on an engine, and whether they were executemany."""
+    statements: list[tuple[str, bool]] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+        statements.append((statement.split()[0], executemany))
+
+    return statements
+
+
+def count_rows(connection: Connection) -> int:
+    """Count the rows of the table of `EntityExample` entities."""
+    return connection.execute(select(func.count()).select_from(entity_examples_table)).scalar_one()
+
+
+def test_commit_writes_in_chunks(engine: Engine) -> None:
+    """Test that the new and removed entities are written in chunks on commit."""
+    with SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, chunk_size=4) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        for index in range(10):
+            repository.add(make_entity(index))
+        unit_of_work.commit()
+
+        statements = record_statements(engine)
+        for index in range(5):
+            repository.remove(make_entity(index))
+        for index in range(10, 15):
+            repository.add(make_entity(index))
+        assert len(unit_of_work.write_batch) == 10
+        unit_of_work.commit()
+
+        # Two DELETE ... IN statements for 5 identifiers, and an executemany INSERT of 4
+        # rows followed by a single-row INSERT.
+        assert statements == [("DELETE", False), ("DELETE", False), ("INSERT", True), ("INSERT", False)]
+        assert unit_of_work.connection is not None
+        assert count_rows(unit_of_work.connection) == 10
+
+
+def test_deletes_stay_within_the_parameter_limit(engine: Engine) -> None:
+    """Test that the IN lists of the deletes are split at the parameter limit of the database."""
+    with SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        for index in range(10):
+            repository.add(make_entity(index))
+        unit_of_work.commit()
+
+        assert unit_of_work.connection is not None
+        dbapi_connection = unit_of_work.connection.connection.dbapi_connection
+        dbapi_connection.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 4)  # type: ignore[union-attr]
+        statements = record_statements(engine)
+        for index in range(10):
+            repository.remove(make_entity(index))
+        unit_of_work.commit()
+
+        assert statements == [("DELETE", False)] * 3
+        assert count_rows(unit_of_work.connection) == 0
+
+
+def test_pending_writes_are_flushed_before_queries_and_dropped_on_rollback(engine: Engine) -> None:
+    """Test that queries see the pending writes, and that a rollback drops them."""
+    with SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        entity = make_entity(1)
+        repository.add(entity)
+        entity.update_name("renamed before the flush")
+
+        assert [found.name for found in repository.list()] == ["renamed before the flush"]
+
+        repository.add(make_entity(2))
+        unit_of_work.rollback()
+        assert len(unit_of_work.write_batch) == 0
+        assert list(repository.list()) == []
+
+
+def test_removing_a_pending_entity_writes_nothing(connection: Connection) -> None:
+    """Test that adding then removing an entity cancels its insertion."""
+    batch = WriteBatch(chunk_size=2)
+    repository = EntityExampleRepository(connection, write_batch=batch)
+    repository.add(make_entity(1))
+    repository.remove(make_entity(1))
+
+    assert len(batch) == 0
+    assert batch.flush(connection) == 0
+    with pytest.raises(ValueError):
+        WriteBatch(chunk_size=0)
+
+
+def test_commit_updates_only_the_changed_columns(engine: Engine) -> None:
+    """Test that changed entities are updated per set of columns, and unchanged ones skipped."""
+    with SqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}, chunk_size=2) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        for index in range(6):
+            repository.add(make_entity(index))
+        unit_of_work.commit()
+
+        entities = repository.get_many([UUID(int=index) for index in range(6)])
+        statements = record_statements(engine)
+        for entity in entities[:3]:
+            entity.update_name(f"renamed {entity.id.int}")
+        for entity in entities[3:5]:
+            entity.update_description("changed")
+        new_entity = make_entity(6)
+        repository.add(new_entity)
+        new_entity.update_name("renamed before its insertion")
+        unit_of_work.commit()
+
+        # One INSERT, then the three renamed entities in two chunks, and the two entities
+        # whose description changed in a single executemany UPDATE.
+        assert statements == [("INSERT", False), ("UPDATE", True), ("UPDATE", False), ("UPDATE", True)]
+        assert not any(entity.changed_attributes() for entity in [*entities, new_entity])
+        rows = {row.id.int: row for row in unit_of_work.connection.execute(select(entity_examples_table))}  # type: ignore[union-attr]
+        assert [rows[index].name for index in range(7)] == [
+            "renamed 0",
+            "renamed 1",
+            "renamed 2",
+            "name-003",
+            "name-004",
+            "name-005",
+            "renamed before its insertion",
+        ]
+        assert [rows[index].description for index in (2, 3, 4, 5)] == [
+            "description 2",
+            "changed",
+            "changed",
+            "description 5",
+        ]
+
+        statements.clear()
+        unit_of_work.commit()
+        assert statements == []
@@ -0,0 +1 @@
+"""Unit tests for the serialization layer of the infrastructure."""
@@ -0,0 +1,189 @@
+"""Unit tests for the compiled JSON encoders and the streaming JSON serializer."""
+
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+from typing import Any
+
+import pytest
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample
+from flask_boilerplate.domain.value_objects.value_object_example import ValueObjectExample
+from flask_boilerplate.infrastructure.serialization import JsonSerializer, encode_value, encoder_for
+
+
+class Status(enum.Enum):
+    """Enumeration encoded by its value."""
+
+    ACTIVE = "active"
+    ARCHIVED = "archived"
+
+
+class Permission(enum.IntFlag):
+    """Flag enumeration whose composite values are not members."""
+
+    READ = 1
+    WRITE = 2
+
+
+@dataclasses.dataclass
+class Grant:
+    """View model with a flag field."""
+
+    permission: Permission
+
+
+@dataclasses.dataclass
+class Tag:
+    """Nested view model."""
+
+    label: str
+
+
+@dataclasses.dataclass
+class ItemViewModel:
+    """View model using every fast path of the compiled encoders."""
+
+    id: uuid.UUID
+    name: str
+    status: Status
+    created_at: datetime.datetime
+    day: datetime.date
+    count: int
+    ratio: float
+    enabled: bool
+    note: str | None = None
+    tags: list[Tag] = dataclasses.field(default_factory=list)
+    extra: Any = None
+    computed: str = dataclasses.field(default="", init=False)
+
+
+def as_primitives(item: ItemViewModel) -> dict[str, Any]:
+    """Convert a view model as `to_dict()` would, with `json.dumps()`-compatible values."""
+    return {
+        "id": str(item.id),
+        "name": item.name,
+        "status": item.status.value,
+        "created_at": item.created_at.isoformat(),
+        "day": item.day.isoformat(),
+        "count": item.count,
+        "ratio": item.ratio,
+        "enabled": item.enabled,
+        "note": item.note,
+        "tags": [{"label": tag.label} for tag in item.tags],
+        "extra": item.extra,
+    }
+
+
+def make_item(index: int) -> ItemViewModel:
+    """Build a view model with distinct values."""
+    return ItemViewModel(
+        id=uuid.UUID(int=index),
+        name=f'Item é"{index}"\n',
+        status=Status.ACTIVE if index % 2 else Status.ARCHIVED,
+        created_at=datetime.datetime(2024, 1, 1, 12, 30, tzinfo=datetime.UTC) + datetime.timedelta(hours=index),
+        day=datetime.date(2024, 1, 1),
+        count=index,
+        ratio=index / 3,
+        enabled=bool(index % 2),
+        note=None if index % 2 else "note",
+        tags=[Tag("a"), Tag("b")] if index % 3 == 0 else [],
+        extra={"key": [1, 2.5, None, True]} if index % 4 == 0 else None,
+    )
+
+
+def test_compiled_encoder_matches_json_dumps() -> None:
+    """Test that the compiled encoder writes the same document as `json.dumps()`."""
+    for index in range(10):
+        item = make_item(index)
+        assert encoder_for(ItemViewModel)(item) == json.dumps(as_primitives(item), separators=(",", ":"))
+
+
+def test_compiled_encoder_falls_back_on_unexpected_types() -> None:
+    """Test that values not matching their annotation are encoded by their runtime type."""
+    item = make_item(1)
+    item.name = None  # type: ignore[assignment]
+    item.count = True
+    item.ratio = float("nan")
+
+    document = encoder_for(ItemViewModel)(item)
+
+    assert '"name":null' in document
+    assert '"count":true' in document
+    assert '"ratio":NaN' in document
+
+
+def test_compiled_encoder_encodes_composite_flags() -> None:
+    """Test that a composite flag value, missing from the table of members, falls back."""
+    encode = encoder_for(Grant)
+
+    assert encode(Grant(Permission.READ)) == '{"permission":1}'
+    assert encode(Grant(Permission.READ | Permission.WRITE)) == json.dumps({"permission": 3}, separators=(",", ":"))
+
+
+def test_encode_value_coerces_keys_like_json_dumps() -> None:
+    """Test that non-string mapping keys are written as `json.dumps()` writes them."""
+    mapping = {True: 1, False: 2, None: 3, 4: 4, 2.5: 5, float("inf"): 6, "text": 7}
+
+    assert encode_value(mapping) == json.dumps(mapping, separators=(",", ":"))
+    assert encode_value({uuid.UUID(int=1): 1}) == f'{{"{uuid.UUID(int=1)}":1}}'
+
+
+def test_encoders_of_the_domain_objects() -> None:
+    """Test the encoding of entities and value objects."""
+    entity = EntityExample(name="Entity", description="An entity.")
+    value_object = ValueObjectExample(name="Value", description="A value object.")
+
+    assert json.loads(encode_value(entity)) == {"name": "Entity", "description": "An entity.", "id": str(entity.id)}
+    assert json.loads(encode_value(value_object)) == {"name": "Value", "description": "A value object."}
+
+
+def test_encode_value_rejects_unknown_types() -> None:
+    """Test that values unknown to JSON raise a TypeError, as with `json.dumps()`."""
+    with pytest.raises(TypeError):
+        encode_value(object())
+    with pytest.raises(TypeError):
+        encoder_for(dict)
+
+
+def test_serializer_streams_json_in_chunks() -> None:
+    """Test that a JSON array is produced chunk by chunk, with lazily consumed input."""
+    items = [make_item(index) for index in range(25)]
+    consumed = []
+
+    def produce() -> Any:
+        for item in items:
+            consumed.append(item)
+            yield item
+
+    chunks = JsonSerializer(chunk_size=10).iter_json(produce())
+    assert next(chunks) == b"["
+    first = next(chunks)
+    assert len(consumed) == 10
+
+    document = b"[" + first + b"".join(chunks)
+    assert len(consumed) == 25
+    assert json.loads(document) == [as_primitives(item) for item in items]
+    assert b"".join(JsonSerializer().iter_json([])) == b"[]"
+
+
+def test_serializer_streams_ndjson() -> None:
+    """Test that NDJSON chunks are made of complete lines, including mixed types."""
+    items: list[Any] = [make_item(index) for index in range(5)] + [{"plain": "mapping"}, 3]
+    chunks = list(JsonSerializer(chunk_size=2).iter_ndjson(items))
+
+    assert len(chunks) == 4
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    lines = b"".join(chunks).splitlines()
+    assert [json.loads(line) for line in lines] == [as_primitives(item) for item in items[:5]] + [
+        {"plain": "mapping"},
+        3,
+    ]
+
+
+def test_serializer_rejects_invalid_chunk_size() -> None:
+    """Test that the chunk size must be positive."""
+    with pytest.raises(ValueError):
+        JsonSerializer(chunk_size=0)
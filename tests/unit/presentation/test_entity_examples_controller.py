@@ -0,0 +1,69 @@
+"""Unit tests for the asynchronous Flask views of `EntityExample` entities."""
+
+import asyncio
+from pathlib import Path
+from uuid import UUID
+
+import pytest
+
+pytest.importorskip("aiosqlite")
+pytest.importorskip("asgiref")
+
+from flask import Flask  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+from flask_boilerplate.domain.entities.entity_example import EntityExample  # noqa: E402
+from flask_boilerplate.infrastructure.persistence import AsyncSqlAlchemyUnitOfWork  # noqa: E402
+from flask_boilerplate.infrastructure.persistence.configurations import metadata  # noqa: E402
+from flask_boilerplate.infrastructure.persistence.repositories import EntityExampleRepository  # noqa: E402
+from flask_boilerplate.presentation.controllers import create_entity_examples_blueprint  # noqa: E402
+
+
+async def populate(engine: AsyncEngine, count: int) -> None:
+    """Create the schema, and add `count` entities."""
+    async with engine.begin() as connection:
+        await connection.run_sync(metadata.create_all)
+    async with AsyncSqlAlchemyUnitOfWork(engine, {"entities": EntityExampleRepository}) as unit_of_work:
+        repository = unit_of_work.repositories()["entities"]
+        for index in range(count):
+            await repository.add(EntityExample(id=UUID(int=index), name=f"name-{index}", description="description"))
+        await unit_of_work.commit()
+
+
+@pytest.fixture
+def app(tmp_path: Path) -> Flask:
+    """Create an application serving the views on a database of 5 entities."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'app.db'}", poolclass=NullPool)
+    asyncio.run(populate(engine, 5))
+    app = Flask(__name__)
+    app.register_blueprint(create_entity_examples_blueprint(engine))
+    return app
+
+
+def test_get_entity_example(app: Flask) -> None:
+    """Test reading an entity by identifier."""
+    client = app.test_client()
+
+    response = client.get(f"/entity-examples/{UUID(int=2)}")
+
+    assert response.status_code == 200
+    assert response.json == {"data": {"id": str(UUID(int=2)), "name": "name-2", "description": "description"}}
+    assert client.get(f"/entity-examples/{UUID(int=42)}").status_code == 404
+
+
+def test_list_entity_examples_by_ids_and_pages(app: Flask) -> None:
+    """Test reading several entities by identifier, and paginating them."""
+    client = app.test_client()
+
+    by_ids = client.get(f"/entity-examples?ids={UUID(int=3)},{UUID(int=42)}").json
+    first = client.get("/entity-examples?limit=3").json
+    assert first is not None
+    second = client.get(f"/entity-examples?limit=3&after={first['next']}").json
+
+    assert by_ids is not None and [entity["name"] for entity in by_ids["data"]] == ["name-3"]
+    assert by_ids["missing"] == [str(UUID(int=42))]
+    assert [entity["name"] for entity in first["data"]] == ["name-0", "name-1", "name-2"]
+    assert second is not None and [entity["name"] for entity in second["data"]] == ["name-3", "name-4"]
+    assert second["next"] is None
+    assert client.get("/entity-examples?after=invalid").status_code == 400
@@ -0,0 +1,153 @@
+"""Unit tests for the import time of the application.
+
+Every gunicorn worker imports the application before serving its first request. This
+module runs fresh interpreters, with bytecode caches as in a deployed image, and checks
+that:
+
+- importing the domain packages stays within a budget, and does not pull in the
+  persistence and web dependencies;
+- starting a worker, that is importing the persistence layer and the views and
+  registering the blueprint on a Flask application, stays within a budget. Flask and
+  SQLAlchemy are imported before the timer starts, so that the budget covers the code
+  of the application only. It is skipped without the dependencies of the `async`
+  extra, which the views need.
+
+The budgets, in milliseconds, can be adjusted for slow machines with the
+`IMPORT_TIME_BUDGET_MS` and `WORKER_STARTUP_BUDGET_MS` environment variables.
+"""
+
+import os
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+DOMAIN_PACKAGES = [
+    "flask_boilerplate.domain.entities",
+    "flask_boilerplate.domain.enums",
+    "flask_boilerplate.domain.primitives",
+    "flask_boilerplate.domain.value_objects",
+]
+
+IMPORT_TIME_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", "150"))
+WORKER_STARTUP_BUDGET_MS = float(os.environ.get("WORKER_STARTUP_BUDGET_MS", "200"))
+
+# The startup of a worker, printing its duration in milliseconds.
+WORKER_STARTUP = """
+import time
+import flask, sqlalchemy, sqlalchemy.ext.asyncio
+start = time.perf_counter()
+from flask_boilerplate.infrastructure.persistence import SqlAlchemyUnitOfWork
+from flask_boilerplate.presentation.controllers.entity_examples_controller import create_entity_examples_blueprint
+app = flask.Flask("worker")
+engine = sqlalchemy.ext.asyncio.create_async_engine("sqlite+aiosqlite://")
+app.register_blueprint(create_entity_examples_blueprint(engine))
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+@pytest.fixture(scope="module")
+def environment(tmp_path_factory: pytest.TempPathFactory) -> dict[str, str]:
+    """Get the environment of the interpreters, writing their bytecode caches to a temporary directory."""
+    environment = {
+        **os.environ,
+        "PYTHONPATH": str(SRC),
+        "PYTHONPYCACHEPREFIX": str(tmp_path_factory.mktemp("pycache")),
+    }
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    return environment
+
+
+def import_times(code: str, environment: dict[str, str]) -> dict[str, tuple[int, int]]:
+    """Run code in a fresh interpreter, and measure the modules it imports.
+
+    Args:
+        code (str): The code to run.
+        environment (dict[str, str]): The environment variables of the interpreter.
+
+    Returns:
+        dict[str, tuple[int, int]]: The self and cumulative import times of each top-level
+        import made by the code, in microseconds, in import order.
+    """
+    startup = _parse_importtime("pass", environment)
+    return {name: times for name, times in _parse_importtime(code, environment).items() if name not in startup}
+
+
+def _parse_importtime(code: str, environment: dict[str, str]) -> dict[str, tuple[int, int]]:
+    """Parse the top-level entries of the `-X importtime` report of some code.
+
+    Args:
+        code (str): The code to run.
+        environment (dict[str, str]): The environment variables of the interpreter.
+
+    Returns:
+        dict[str, tuple[int, int]]: The self and cumulative import times of each module
+        imported at the top level, in microseconds.
+    """
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        env=environment,
+        text=True,
+    )
+    times: dict[str, tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line.removeprefix("import time:").split("|")
+        # Nested imports are indented; their time is included in their importer's.
+        if not name.startswith("  "):
+            times[name.strip()] = (int(self_time), int(cumulative))
+    return times
+
+
+def test_domain_packages_import_within_budget(environment: dict[str, str]) -> None:
+    """Test that a worker imports the domain packages within the budget."""
+    code = "; ".join(f"import {package}" for package in DOMAIN_PACKAGES)
+
+    # Keep the fastest of a few runs, the first one populates the bytecode caches.
+    total_ms = min(
+        sum(cumulative for _, cumulative in import_times(code, environment).values()) / 1000 for _ in range(3)
+    )
+
+    assert total_ms <= IMPORT_TIME_BUDGET_MS, (
+        f"Importing the domain packages took {total_ms:.1f} ms, over the budget of {IMPORT_TIME_BUDGET_MS:.0f} ms."
+    )
+
+
+def test_worker_starts_within_budget(environment: dict[str, str]) -> None:
+    """Test that a worker imports the application and registers its views within the budget."""
+    # The views run on an async engine, from the optional `async` extra.
+    pytest.importorskip("aiosqlite")
+    pytest.importorskip("asgiref")
+
+    def run() -> float:
+        result = subprocess.run(  # nosec B603
+            [sys.executable, "-c", WORKER_STARTUP], capture_output=True, check=True, env=environment, text=True
+        )
+        return float(result.stdout)
+
+    # Keep the fastest of a few runs, the first one populates the bytecode caches.
+    startup_ms = min(run() for _ in range(3))
+
+    assert startup_ms <= WORKER_STARTUP_BUDGET_MS, (
+        f"Starting a worker took {startup_ms:.1f} ms, over the budget of {WORKER_STARTUP_BUDGET_MS:.0f} ms."
+    )
+
+
+def test_domain_packages_defer_their_submodules(environment: dict[str, str]) -> None:
+    """Test that importing the domain packages imports neither their exports nor heavy dependencies."""
+    code = "; ".join(f"import {package}" for package in DOMAIN_PACKAGES) + "; import sys; print(*sys.modules)"
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code], capture_output=True, check=True, env=environment, text=True
+    )
+    modules = set(result.stdout.split())
+
+    assert set(DOMAIN_PACKAGES) <= modules
+    assert "flask_boilerplate.domain.entities.entity_example" not in modules
+    assert "flask_boilerplate.domain.primitives.specification" not in modules
+    assert not modules & {"flask", "numpy", "sqlalchemy"}